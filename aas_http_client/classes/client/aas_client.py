@@ -2,17 +2,24 @@
 
 import json
 import logging
+import os
+import threading
 import time
+import weakref
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 import requests
 from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, ValidationError
 from requests import Session
-from requests.auth import HTTPBasicAuth
+from requests.adapters import HTTPAdapter
+from requests.auth import AuthBase, HTTPBasicAuth
 
+from aas_http_client.classes.client.capabilities import Capability, ProfileCache, ServerProfile, detect_server_profile
 from aas_http_client.classes.client.implementations import (
     AuthMethod,
+    BearerTokenAuth,
     ExperimentalImplementation,
     ShellRegistryImplementation,
     ShellRepoImplementation,
@@ -21,6 +28,7 @@ from aas_http_client.classes.client.implementations import (
     TokenData,
     get_token,
 )
+from aas_http_client.classes.client.load_balancer import BalancingAdapter, LoadBalancer, LoadBalancing
 from aas_http_client.classes.Configuration.config_classes import AuthenticationConfig
 from aas_http_client.utilities.http_helper import (
     STATUS_CODE_200,
@@ -31,6 +39,9 @@ from aas_http_client.utilities.http_helper import (
 
 _logger = logging.getLogger(__name__)
 
+# Initialized clients, used to rebuild sessions and locks in forked child processes
+_initialized_clients: "weakref.WeakValueDictionary[int, AasHttpClient]" = weakref.WeakValueDictionary()
+
 
 class AASConnectionError(ConnectionError):
     """Exception raised for errors in the AAS connection.
@@ -51,6 +62,55 @@ class AASConnectionError(ConnectionError):
         self.status_code = next(iter(errors), None)  # Get the first status code if available
 
 
+@dataclass(frozen=True)
+class ClientSecrets:
+    """Holds the secrets of a client separately from its configuration.
+
+    The secrets are excluded from the representation to avoid leaking them into logs.
+    """
+
+    basic_auth_password: str = field(default="", repr=False)
+    o_auth_client_secret: str = field(default="", repr=False)
+    bearer_auth_token: str = field(default="", repr=False)
+
+
+@dataclass(frozen=True)
+class ClientSpec:
+    """Lightweight picklable specification of an AasHttpClient.
+
+    A spec can be sent to worker processes (e.g. 'multiprocessing' or 'ProcessPoolExecutor')
+    and turned back into a client with 'create_by_spec' without testing the server connection again.
+    """
+
+    configuration: dict[str, Any]
+    secrets: ClientSecrets = field(default_factory=ClientSecrets)
+    token: TokenData | None = None
+
+    def create_client(self) -> "AasHttpClient":
+        """Create an initialized client from the spec.
+
+        :return: An initialized AasHttpClient instance
+        """
+        return create_by_spec(self)
+
+
+@dataclass
+class SharedTransport:
+    """Connection pools, load balancer and capability profile of a server, shared by several clients.
+
+    Created by 'AasHttpClient.share_transport' and passed to 'AasHttpClient.initialize' of other clients of the
+    same server, e.g. the clients of several tenants with different credentials.
+
+    :param adapters: Transport adapters by URL prefix, mounted into the sessions of all sharing clients
+    :param balancer: Load balancer of the replicas of the server, if any
+    :param profile_cache: Cache of the capability profile of the server
+    """
+
+    adapters: dict[str, HTTPAdapter]
+    balancer: LoadBalancer | None = None
+    profile_cache: ProfileCache = field(default_factory=ProfileCache)
+
+
 class AasHttpClient(BaseModel):
     """Represents a AasHttpClient to communicate with a REST API."""
 
@@ -66,8 +126,44 @@ class AasHttpClient(BaseModel):
     connection_time_out: int = Field(default=100, alias="ConnectionTimeOut", description="Connection timeout for HTTP requests.")
     ssl_verify: bool = Field(default=True, alias="SslVerify", description="Enable SSL verification.")
     trust_env: bool = Field(default=True, alias="TrustEnv", description="Trust environment variables.")
+    thread_local_sessions: bool = Field(
+        default=False, alias="ThreadLocalSessions", description="If enabled, each thread uses its own HTTP session (thread-local session pool)."
+    )
+    max_workers: int = Field(default=8, ge=1, alias="MaxWorkers", description="Maximum number of concurrent requests of aggregate API calls.")
+    base_urls: list[str] = Field(
+        default_factory=list,
+        alias="BaseUrls",
+        description="Base URLs of replicas of the AAS server, requests are distributed across 'BaseUrl' and all replicas.",
+    )
+    load_balancing: LoadBalancing = Field(
+        default=LoadBalancing.round_robin,
+        alias="LoadBalancing",
+        description="Distribution of the requests across the replicas: RoundRobin, LeastOutstanding or Latency.",
+    )
+    health_check_interval: float = Field(
+        default=0,
+        ge=0,
+        alias="HealthCheckInterval",
+        description="Interval in seconds of active health checks of the replicas, 0 disables active checks.",
+    )
+    hedge_percentile: float = Field(
+        default=0,
+        ge=0,
+        lt=100,
+        alias="HedgePercentile",
+        description="Percentile of recent GET response times after which a GET request is sent a second time, 0 disables hedging.",
+    )
+    hedge_budget: float = Field(
+        default=0.05, ge=0, le=1, alias="HedgeBudget", description="Maximum ratio of hedged GET requests to all GET requests."
+    )
+    capability_probing: bool = Field(
+        default=True,
+        alias="CapabilityProbing",
+        description="If enabled, unsupported endpoints of the server are detected once and replaced by supported alternatives.",
+    )
     _session: Session | None = PrivateAttr(default=None)
     _auth_method: AuthMethod = PrivateAttr(default=AuthMethod.basic_auth)
+    _auth: AuthBase | None = PrivateAttr(default=None)
     encoded_ids: bool = Field(default=True, alias="EncodedIds", description="If enabled, all IDs used in API requests have to be base64-encoded.")
     shells: ShellRepoImplementation | None = Field(default=None)
     submodels: SubmodelRepoImplementation | None = Field(default=None)
@@ -75,37 +171,104 @@ class AasHttpClient(BaseModel):
     experimental: ExperimentalImplementation | None = Field(default=None)
     submodel_registry: SubmodelRegistryImplementation | None = Field(default=None)
     _cached_token: TokenData | None = PrivateAttr(default=None)
-
-    def initialize(self):
-        """Initialize the AasHttpClient with the given URL, username and password."""
+    _token_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _session_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _thread_local: threading.local = PrivateAttr(default_factory=threading.local)
+    _thread_sessions: list[Session] = PrivateAttr(default_factory=list)
+    _balancer: LoadBalancer | None = PrivateAttr(default=None)
+    _profile_cache: ProfileCache = PrivateAttr(default_factory=ProfileCache)
+    _transport: SharedTransport | None = PrivateAttr(default=None)
+
+    def initialize(self, transport: SharedTransport | None = None):
+        """Initialize the AasHttpClient with the given URL, username and password.
+
+        :param transport: Transport of another client of the same server to share, defaults to an own transport
+        """
         if self.base_url.endswith("/"):
             self.base_url = self.base_url[:-1]
-
-        self._session = requests.Session()
+        self.base_urls = [base_url.rstrip("/") for base_url in self.base_urls]
 
         self._handle_auth_method()
+        if transport is None:
+            self._balancer = self._create_balancer()
+        else:
+            self._transport = transport
+            self._balancer = transport.balancer
+            self._profile_cache = transport.profile_cache
+
+        self._session = self._create_session()
+        _initialized_clients[id(self)] = self
+
+        self.shells = ShellRepoImplementation(self)
+        self.submodels = SubmodelRepoImplementation(self)
+        self.shell_registry = ShellRegistryImplementation(self)
+        self.submodel_registry = SubmodelRegistryImplementation(self)
+        self.experimental = ExperimentalImplementation(self)
+
+    def _create_balancer(self) -> LoadBalancer | None:
+        """Create the load balancer of the replicas and start the active health checks.
+
+        :return: The load balancer or None if neither replicas are configured nor hedging is enabled
+        """
+        replicas = [base_url for base_url in self.base_urls if base_url != self.base_url]
+        if not replicas and self.hedge_percentile <= 0:
+            return None
 
-        self._session.verify = self.ssl_verify
-        self._session.trust_env = self.trust_env
+        balancer = LoadBalancer([self.base_url, *replicas], self.load_balancing, self.hedge_percentile, self.hedge_budget)
+        if self.health_check_interval > 0:
+            balancer.start_health_checks(self.health_check_interval, self._check_replica)
+
+        return balancer
+
+    def _check_replica(self, base_url: str) -> bool:
+        """Check whether a replica is answering requests.
+
+        :param base_url: Base URL of the replica
+        :return: True if the replica answered without server error, False otherwise
+        """
+        session = self._create_session(balanced=False)
+        try:
+            response = session.get(f"{base_url}/description", timeout=min(self.time_out, 10))
+            return response.status_code < 500
+        except requests.exceptions.RequestException:
+            return False
+        finally:
+            session.close()
+
+    def _create_session(self, *, balanced: bool = True) -> Session:
+        """Create a new HTTP session configured with the client settings.
+
+        :param balanced: If enabled and replicas are configured, requests to the base URL are distributed across the replicas
+        :return: The configured requests.Session object
+        """
+        session = requests.Session()
+
+        if self._transport is not None:
+            for prefix, adapter in self._transport.adapters.items():
+                session.mount(prefix, adapter)
+        elif balanced and self._balancer is not None:
+            session.mount(f"{self.base_url}/", BalancingAdapter(self._balancer, self.base_url))
+
+        session.auth = self._auth
+        session.verify = self.ssl_verify
+        session.trust_env = self.trust_env
 
         if self.https_proxy:
-            self._session.proxies.update({"https": self.https_proxy})
+            session.proxies.update({"https": self.https_proxy})
         if self.http_proxy:
-            self._session.proxies.update({"http": self.http_proxy})
+            session.proxies.update({"http": self.http_proxy})
 
-        self._session.headers.update(
+        session.headers.update(
             {
                 "Accept": "*/*",
                 "User-Agent": "python-requests/2.32.5",
-                "Connection": "close",
             }
         )
+        if self._transport is None:
+            # the connections of a shared transport are kept open for the clients of the other tenants
+            session.headers["Connection"] = "close"
 
-        self.shells = ShellRepoImplementation(self)
-        self.submodels = SubmodelRepoImplementation(self)
-        self.shell_registry = ShellRegistryImplementation(self)
-        self.submodel_registry = SubmodelRegistryImplementation(self)
-        self.experimental = ExperimentalImplementation(self)
+        return session
 
     def get_auth_method(self) -> AuthMethod:
         """Get the authentication method used by the client.
@@ -114,33 +277,160 @@ class AasHttpClient(BaseModel):
         """
         return self._auth_method
 
+    def get_load_balancer(self) -> LoadBalancer | None:
+        """Get the load balancer distributing the requests across the replicas.
+
+        :return: The load balancer or None if no replicas are configured
+        """
+        return self._balancer
+
+    def share_transport(self) -> SharedTransport:
+        """Create a transport to share the connection pools, load balancer and capability profile of the client.
+
+        Clients initialized with the transport send their requests through the same connection pools and do not
+        detect the capabilities of the server again.
+
+        :return: Transport to pass to 'initialize' of other clients of the server
+        :raises ValueError: If the client is not initialized
+        """
+        if self._session is None:
+            raise ValueError("Client is not initialized. Call 'initialize()' method of the client before sharing its transport.")
+
+        if self._transport is not None:
+            return self._transport
+
+        adapters: dict[str, HTTPAdapter] = {
+            "https://": HTTPAdapter(pool_maxsize=self.max_workers),
+            "http://": HTTPAdapter(pool_maxsize=self.max_workers),
+        }
+        if self._balancer is not None:
+            adapters[f"{self.base_url}/"] = BalancingAdapter(self._balancer, self.base_url)
+
+        return SharedTransport(adapters=adapters, balancer=self._balancer, profile_cache=self._profile_cache)
+
+    def get_server_profile(self, *, refresh: bool = False) -> ServerProfile:
+        """Get the capabilities of the server, detected on the first call.
+
+        :param refresh: If enabled, the capabilities are detected again
+        :return: Profile of the server, without unsupported endpoints if 'CapabilityProbing' is disabled
+        """
+        return self._profile_cache.get(lambda: detect_server_profile(self) if self.capability_probing else ServerProfile(), refresh=refresh)
+
+    def supports(self, capability: Capability) -> bool:
+        """Check whether the server provides an endpoint.
+
+        :param capability: Endpoint to check
+        :return: True if the endpoint is provided or unknown, False otherwise
+        """
+        return self.get_server_profile().supports(capability)
+
+    def set_unsupported(self, capability: Capability) -> None:
+        """Mark an endpoint as not provided by the server, e.g. after it was answered with 405.
+
+        :param capability: Endpoint the server does not provide
+        """
+        self._profile_cache.set_unsupported(capability)
+        _logger.info(f"Server '{self.base_url}' does not provide '{capability}', using an alternative.")
+
     def get_session(self) -> Session | None:
         """Get the HTTP session used by the client.
 
+        If thread-local sessions are enabled, each calling thread gets its own session.
+
         :return: The requests.Session object used for HTTP communication
         """
-        return self._session
+        if not self.thread_local_sessions or self._session is None:
+            return self._session
+
+        session: Session | None = getattr(self._thread_local, "session", None)
+        if session is None:
+            session = self._create_session()
+            self._thread_local.session = session
+            with self._session_lock:
+                self._thread_sessions.append(session)
+
+        return session
+
+    def close(self):
+        """Close all HTTP sessions of the client and release their connections."""
+        with self._session_lock:
+            sessions = self._thread_sessions
+            self._thread_sessions = []
+            self._thread_local = threading.local()
+
+        if self._session:
+            sessions.append(self._session)
+
+        for session in sessions:
+            if self._transport is not None:
+                # the shared adapters stay open for the other clients of the transport
+                for prefix in self._transport.adapters:
+                    session.adapters.pop(prefix, None)
+            session.close()
+
+        if self._balancer is not None and self._transport is None:
+            self._balancer.stop_health_checks()
+
+    def to_spec(self) -> ClientSpec:
+        """Create a picklable specification of the client containing its configuration and secrets.
+
+        :return: ClientSpec of the client
+        """
+        configuration = self.model_dump(by_alias=True, exclude={"shells", "submodels", "shell_registry", "experimental", "submodel_registry"})
+        secrets = ClientSecrets(
+            basic_auth_password=self.auth_settings.basic_auth.get_password(),
+            o_auth_client_secret=self.auth_settings.o_auth.get_client_secret(),
+            bearer_auth_token=self.auth_settings.bearer_auth.get_token(),
+        )
+        return ClientSpec(configuration=configuration, secrets=secrets, token=self._cached_token)
+
+    def __reduce__(self):
+        """Pickle the client by its spec instead of its live sessions and locks."""
+        return (create_by_spec, (self.to_spec(),))
+
+    def _reset_after_fork(self):
+        """Replace sessions and locks inherited from the parent process.
+
+        Connections of inherited sessions belong to the parent process and are dropped without closing them.
+        """
+        self._token_lock = threading.Lock()
+        self._session_lock = threading.Lock()
+        self._thread_local = threading.local()
+        self._thread_sessions = []
+        self._profile_cache = ProfileCache(self._profile_cache.profile)
+        if self._session is not None:
+            # shared transports are not rebuilt, each client in the child process gets its own transport
+            self._transport = None
+            # the health check thread does not exist in the child process
+            self._balancer = self._create_balancer()
+            self._session = self._create_session()
 
     def _handle_auth_method(self):
-        """Handles the authentication method based on the provided settings."""
+        """Handles the authentication method based on the provided settings.
+
+        Credentials are injected per request by the session's auth handler, so sessions never carry
+        authorization headers that would have to be mutated on token refresh.
+        """
         if self.auth_settings.o_auth.is_active():
             self._auth_method = AuthMethod.o_auth
             _logger.debug(
                 f"Authentication method: OAuth | '{self.auth_settings.o_auth.client_id}' | '{self.auth_settings.o_auth.token_url}' | '{self.auth_settings.o_auth.grant_type}'"
             )
+            self._auth = BearerTokenAuth(self.set_token)
 
         elif self.auth_settings.basic_auth.is_active():
             self._auth_method = AuthMethod.basic_auth
             _logger.debug(f"Authentication method: Basic Auth | '{self.auth_settings.basic_auth.username}'")
-            self._session.auth = HTTPBasicAuth(self.auth_settings.basic_auth.username, self.auth_settings.basic_auth.get_password())
+            self._auth = HTTPBasicAuth(self.auth_settings.basic_auth.username, self.auth_settings.basic_auth.get_password())
 
         elif self.auth_settings.bearer_auth.is_active():
             self._auth_method = AuthMethod.bearer
             _logger.debug("Authentication method: Bearer Token")
-            self._session.headers.update({"Authorization": f"Bearer {self.auth_settings.bearer_auth.get_token()}"})
+            self._auth = BearerTokenAuth(self.auth_settings.bearer_auth.get_token)
 
         else:
             self._auth_method = AuthMethod.No
+            self._auth = None
             _logger.debug("Authentication method: No Authentication")
 
     def get_root(self) -> dict | None:
@@ -152,7 +442,8 @@ class AasHttpClient(BaseModel):
 
         :return: Response data as a dictionary containing shell information, or None if an error occurred
         """
-        if not self._session:
+        session = self.get_session()
+        if not session:
             _logger.error("HTTP session is not initialized. Call 'initialize()' method before making API calls.")
             return None
 
@@ -167,10 +458,10 @@ class AasHttpClient(BaseModel):
         error_messages: dict[int, str] = {}
 
         for url in urls:
-            _logger.debug(f"Testing connectivity with URL: {url}")
+            _logger.debug("Testing connectivity with URL: %s", url)
             try:
-                response = self._session.get(url, timeout=10)
-                _logger.debug(f"Call REST API url '{response.url}'")
+                response = session.get(url, timeout=10)
+                _logger.debug("Call REST API url '%s'", response.url)
 
                 if response.status_code == STATUS_CODE_200:
                     content = response.content.decode("utf-8")
@@ -180,12 +471,15 @@ class AasHttpClient(BaseModel):
                     error_messages.update({response.status_code: response.reason})
 
             except requests.exceptions.RequestException as e:
-                _logger.error(f"Error call REST API: {e}")
+                _logger.error("Error call REST API: %s", e)
 
         raise AASConnectionError("Failed to connect to AAS server API", error_messages)
 
     def set_token(self) -> str | None:
-        """Set authentication token in session headers based on configured authentication method.
+        """Get a valid access token for the configured authentication method, requesting a new one if the cached token expired.
+
+        The token is not stored in the session headers but injected into each request by the session's
+        auth handler. Concurrent calls request at most one new token.
 
         :return: The access token if set, otherwise None
         """
@@ -196,20 +490,24 @@ class AasHttpClient(BaseModel):
         if self._auth_method != AuthMethod.o_auth:
             return None
 
-        now = time.time()
         # Check if cached token exists and is not expired
-        if self._cached_token and self._cached_token.token_expiry > now:
-            return self._cached_token.access_token
+        cached_token = self._cached_token
+        if cached_token and cached_token.token_expiry > time.time():
+            return cached_token.access_token
+
+        with self._token_lock:
+            # Another thread may have refreshed the token while waiting for the lock
+            cached_token = self._cached_token
+            if cached_token and cached_token.token_expiry > time.time():
+                return cached_token.access_token
 
-        # Obtain new token
-        token_data = get_token(self.auth_settings.o_auth, self.ssl_verify)
+            # Obtain new token
+            token_data = get_token(self.auth_settings.o_auth, self.ssl_verify)
 
-        if token_data and token_data.access_token:
-            # Cache the token data
-            self._cached_token = token_data
-            # Update session headers with the new token
-            self._session.headers.update({"Authorization": f"Bearer {self._cached_token.access_token}"})
-            return self._cached_token.access_token
+            if token_data and token_data.access_token:
+                # Cache the token data
+                self._cached_token = token_data
+                return token_data.access_token
 
         return None
 
@@ -219,20 +517,21 @@ class AasHttpClient(BaseModel):
         :param end_point_url: The endpoint URL to send the GET request to.
         :return: The base URL of the AAS server.
         """
-        if not self._session:
+        session = self.get_session()
+        if not session:
             _logger.error("HTTP session is not initialized. Call 'initialize()' method before making API calls.")
             return None
 
         try:
-            response = self._session.get(end_point_url, timeout=self.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            response = session.get(end_point_url, timeout=self.time_out)
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code == STATUS_CODE_200:
                 content = response.content.decode("utf-8")
                 return json.loads(content)
 
         except requests.exceptions.RequestException as e:
-            _logger.debug(f"Error call REST API: {e}")
+            _logger.debug("Error call REST API: %s", e)
 
         return None
 
@@ -243,20 +542,21 @@ class AasHttpClient(BaseModel):
         :param request_body: The request body to send with the PUT request.
         :return: The base URL of the AAS server.
         """
-        if not self._session:
+        session = self.get_session()
+        if not session:
             _logger.error("HTTP session is not initialized. Call 'initialize()' method before making API calls.")
             return None
 
         try:
-            response = self._session.put(end_point_url, json=request_body, timeout=self.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            response = session.put(end_point_url, json=request_body, timeout=self.time_out)
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code not in (STATUS_CODE_200, STATUS_CODE_201, STATUS_CODE_204):
                 content = response.content.decode("utf-8")
                 return json.loads(content)
 
         except requests.exceptions.RequestException as e:
-            _logger.debug(f"Error call REST API: {e}")
+            _logger.debug("Error call REST API: %s", e)
 
         return None
 
@@ -267,20 +567,21 @@ class AasHttpClient(BaseModel):
         :param request_body: The request body to send with the POST request.
         :return: The base URL of the AAS server.
         """
-        if not self._session:
+        session = self.get_session()
+        if not session:
             _logger.error("HTTP session is not initialized. Call 'initialize()' method before making API calls.")
             return None
 
         try:
-            response = self._session.post(end_point_url, json=request_body, timeout=self.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            response = session.post(end_point_url, json=request_body, timeout=self.time_out)
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code not in (STATUS_CODE_201, STATUS_CODE_200, STATUS_CODE_202):
                 content = response.content.decode("utf-8")
                 return json.loads(content)
 
         except requests.exceptions.RequestException as e:
-            _logger.debug(f"Error call REST API: {e}")
+            _logger.debug("Error call REST API: %s", e)
 
         return None
 
@@ -291,20 +592,21 @@ class AasHttpClient(BaseModel):
         :param request_body: The request body to send with the PATCH request.
         :return: The base URL of the AAS server.
         """
-        if not self._session:
+        session = self.get_session()
+        if not session:
             _logger.error("HTTP session is not initialized. Call 'initialize()' method before making API calls.")
             return None
 
         try:
-            response = self._session.patch(end_point_url, json=request_body, timeout=self.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            response = session.patch(end_point_url, json=request_body, timeout=self.time_out)
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code not in (STATUS_CODE_200, STATUS_CODE_204):
                 content = response.content.decode("utf-8")
                 return json.loads(content)
 
         except requests.exceptions.RequestException as e:
-            _logger.debug(f"Error call REST API: {e}")
+            _logger.debug("Error call REST API: %s", e)
 
         return None
 
@@ -314,24 +616,35 @@ class AasHttpClient(BaseModel):
         :param end_point_url: The endpoint URL to send the DELETE request to.
         :return: The base URL of the AAS server.
         """
-        if not self._session:
+        session = self.get_session()
+        if not session:
             _logger.error("HTTP session is not initialized. Call 'initialize()' method before making API calls.")
             return None
 
         try:
-            response = self._session.delete(end_point_url, timeout=self.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            response = session.delete(end_point_url, timeout=self.time_out)
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code not in (STATUS_CODE_200, STATUS_CODE_204, STATUS_CODE_202):
                 content = response.content.decode("utf-8")
                 return json.loads(content)
 
         except requests.exceptions.RequestException as e:
-            _logger.debug(f"Error call REST API: {e}")
+            _logger.debug("Error call REST API: %s", e)
 
         return None
 
 
+def _reset_clients_after_fork():
+    """Rebuild the sessions of all initialized clients in a forked child process."""
+    for client in list(_initialized_clients.values()):
+        client._reset_after_fork()  # noqa: SLF001
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_clients_after_fork)
+
+
 def create_by_url(  # noqa: PLR0913
     base_url: str,
     basic_auth_username: str = "",
@@ -432,6 +745,27 @@ def create_by_config(
     return _create_client(configuration, basic_auth_password, o_auth_client_secret, bearer_auth_token)
 
 
+def create_by_spec(spec: ClientSpec) -> AasHttpClient:
+    """Create a HTTP client for a AAS server connection from a client spec.
+
+    The connection to the server is not tested again, as the spec is created from an already connected client.
+
+    :param spec: Client spec created by 'AasHttpClient.to_spec()'
+    :return: An initialized AasHttpClient instance
+    :raises ValidationError: If the configuration of the spec is invalid
+    """
+    client = AasHttpClient.model_validate(spec.configuration)
+
+    client.auth_settings.basic_auth.set_password(spec.secrets.basic_auth_password)
+    client.auth_settings.o_auth.set_client_secret(spec.secrets.o_auth_client_secret)
+    client.auth_settings.bearer_auth.set_token(spec.secrets.bearer_auth_token)
+
+    client.initialize()
+    client._cached_token = spec.token  # noqa: SLF001
+
+    return client
+
+
 def _create_client(config_dict: dict, basic_auth_password: str, o_auth_client_secret: str, bearer_auth_token: str) -> AasHttpClient | None:
     """Create and initialize an AAS HTTP client from configuration dictionary.
 
@@ -476,6 +810,16 @@ def _create_client(config_dict: dict, basic_auth_password: str, o_auth_client_se
     return client
 
 
+def check_connection(client: AasHttpClient) -> bool:
+    """Test the connection of an initialized client to the AAS server API, retrying for 'ConnectionTimeOut' seconds.
+
+    :param client: The initialized AasHttpClient instance to test the connection for
+    :return: True if connection is successful, False otherwise
+    :raises TimeoutError: If connection attempts fail for the entire timeout duration
+    """
+    return __connect_to_api(client)
+
+
 def __connect_to_api(client: AasHttpClient) -> bool:
     """Test the connection to the AAS server API with retry logic.
 
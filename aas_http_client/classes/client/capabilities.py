@@ -0,0 +1,158 @@
+"""Detection of the capabilities of an AAS server, so that unsupported endpoints are not requested."""
+
+import dataclasses
+import logging
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING
+
+import requests
+
+if TYPE_CHECKING:
+    from aas_http_client.classes.client.aas_client import AasHttpClient
+
+from aas_http_client.utilities.encoder import encode_base_64
+from aas_http_client.utilities.http_helper import STATUS_CODE_200, STATUS_CODE_405, STATUS_CODE_501
+
+_logger = logging.getLogger(__name__)
+
+# id of a shell and submodel that does not exist, so probe requests cannot change anything
+_PROBE_IDENTIFIER = encode_base_64("urn:aas-http-client:capability-probe")
+
+# status codes of servers that do not provide an endpoint or method
+UNSUPPORTED_STATUS_CODES = (STATUS_CODE_405, STATUS_CODE_501)
+
+
+class Capability(Enum):
+    """Endpoints not provided by all AAS servers, for which the client has an alternative."""
+
+    patch_submodel = "PATCH /submodels/{submodelIdentifier}"
+    put_submodel_through_shell = "PUT /shells/{aasIdentifier}/submodels/{submodelIdentifier}"
+
+    def __str__(self) -> str:
+        """String representation of the Capability enum."""
+        return self.value
+
+    @property
+    def method(self) -> str:
+        """HTTP method of the endpoint."""
+        return self.value.split(" ", 1)[0]
+
+    @property
+    def path(self) -> str:
+        """Path of the endpoint, with the identifiers replaced by the id of a non-existing object."""
+        path = self.value.split(" ", 1)[1]
+        return path.replace("{aasIdentifier}", _PROBE_IDENTIFIER).replace("{submodelIdentifier}", _PROBE_IDENTIFIER)
+
+
+@dataclass(frozen=True)
+class ServerProfile:
+    """Represents the capabilities of an AAS server.
+
+    :param profiles: Service specification profiles the server declares in its '/description'
+    :param server: Value of the 'Server' header of the '/description' response, if any
+    :param unsupported: Endpoints the server does not provide
+    """
+
+    profiles: tuple[str, ...] = ()
+    server: str = ""
+    unsupported: frozenset[Capability] = frozenset()
+
+    def supports(self, capability: Capability) -> bool:
+        """Check whether the server provides an endpoint.
+
+        :param capability: Endpoint to check
+        :return: True if the endpoint is provided or unknown, False if it is not provided
+        """
+        return capability not in self.unsupported
+
+    def without(self, capability: Capability) -> "ServerProfile":
+        """Create a copy of the profile with an endpoint marked as not provided.
+
+        :param capability: Endpoint the server does not provide
+        :return: New server profile
+        """
+        return dataclasses.replace(self, unsupported=self.unsupported | {capability})
+
+
+class ProfileCache:
+    """Thread-safe holder of the profile of a server, shared by all clients of the server."""
+
+    def __init__(self, profile: ServerProfile | None = None):
+        """Initializes the cache.
+
+        :param profile: Known profile of the server, detected on first use if None
+        """
+        self._lock = threading.Lock()
+        self._profile = profile
+
+    @property
+    def profile(self) -> ServerProfile | None:
+        """Cached profile of the server, None if not detected yet."""
+        return self._profile
+
+    def get(self, detect: Callable[[], ServerProfile], *, refresh: bool = False) -> ServerProfile:
+        """Get the profile of the server, detecting it if not cached yet.
+
+        :param detect: Function detecting the profile, called by one thread while the others wait for its result
+        :param refresh: If enabled, the profile is detected again
+        :return: Profile of the server
+        """
+        with self._lock:
+            if self._profile is None or refresh:
+                self._profile = detect()
+
+            return self._profile
+
+    def set_unsupported(self, capability: Capability) -> None:
+        """Mark an endpoint as not provided by the server.
+
+        :param capability: Endpoint the server does not provide
+        """
+        with self._lock:
+            self._profile = (self._profile or ServerProfile()).without(capability)
+
+
+def detect_server_profile(client: "AasHttpClient") -> ServerProfile:
+    """Detect the capabilities of the server of a client.
+
+    The declared profiles are read from '/description'. Each endpoint of 'Capability' is then requested once for
+    a shell and submodel that do not exist: servers providing the endpoint answer with 404, others with 405 or 501.
+    Endpoints whose probe fails for other reasons are considered to be provided.
+
+    :param client: Initialized client of the server
+    :return: Profile of the server
+    """
+    session = client.get_session()
+    if session is None:
+        raise ValueError("HTTP session is not initialized. Call 'initialize()' method of the client before detecting the server profile.")
+
+    client.set_token()
+    timeout = min(client.time_out, 10)
+    profiles: tuple[str, ...] = ()
+    server = ""
+
+    try:
+        response = session.get(f"{client.base_url}/description", timeout=timeout)
+        if response.status_code == STATUS_CODE_200:
+            profiles = tuple(response.json().get("profiles") or ())
+            server = response.headers.get("Server", "")
+    except (requests.exceptions.RequestException, ValueError, AttributeError) as e:
+        _logger.debug(f"Failed to read the description of '{client.base_url}': {e}")
+
+    unsupported: set[Capability] = set()
+    for capability in Capability:
+        try:
+            response = session.request(capability.method, f"{client.base_url}{capability.path}", json={}, timeout=timeout)
+        except requests.exceptions.RequestException as e:
+            _logger.debug(f"Probe of '{capability}' failed: {e}")
+            continue
+
+        if response.status_code in UNSUPPORTED_STATUS_CODES:
+            unsupported.add(capability)
+
+    profile = ServerProfile(profiles=profiles, server=server, unsupported=frozenset(unsupported))
+    _logger.info(f"Server '{client.base_url}' does not provide: {', '.join(str(capability) for capability in unsupported) or '-'}.")
+    return profile
@@ -0,0 +1,144 @@
+"""Management of the clients of several tenants sharing the connection pools of their servers."""
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Self
+
+from aas_http_client.classes.client.aas_client import AasHttpClient, SharedTransport, check_connection
+from aas_http_client.classes.Configuration.config_classes import AuthenticationConfig
+
+_logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Server:
+    """Shared state of the clients of one server."""
+
+    client: AasHttpClient
+    transport: SharedTransport
+    connected: bool = False
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class ClientManager:
+    """Hands out clients of several tenants that share the connection pools of their servers.
+
+    The clients of all tenants of a server send their requests through the same transport adapters and share the
+    load balancer and the capability profile of the server, while each tenant has its own credentials and token
+    cache. The connection to a server is tested once, with the credentials of the first tenant requesting a client
+    for it. Further clients are created without requests to the server and are cached per tenant and server.
+    """
+
+    def __init__(self, configuration: dict | None = None):
+        """Initializes the manager with the settings common to all clients.
+
+        :param configuration: Client settings as for 'create_by_dict' (e.g. 'TimeOut', 'BaseUrls'), without 'BaseUrl' and 'AuthenticationSettings'
+        """
+        self._configuration = {key: value for key, value in (configuration or {}).items() if key not in ("BaseUrl", "AuthenticationSettings")}
+        self._lock = threading.Lock()
+        self._servers: dict[str, _Server] = {}
+        self._clients: dict[tuple[str, str], AasHttpClient] = {}
+
+    def __enter__(self) -> Self:
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Exit the context manager and close all clients."""
+        self.close()
+
+    def get_client(
+        self,
+        tenant: str,
+        base_url: str,
+        auth_settings: AuthenticationConfig | None = None,
+        basic_auth_password: str = "",
+        o_auth_client_secret: str = "",
+        bearer_auth_token: str = "",
+    ) -> AasHttpClient | None:
+        """Get the client of a tenant for a server, creating it on the first call.
+
+        :param tenant: Name of the tenant
+        :param base_url: Base URL of the AAS server
+        :param auth_settings: Authentication settings of the tenant, defaults to no authentication
+        :param basic_auth_password: Password for the basic authentication, defaults to ""
+        :param o_auth_client_secret: Client secret for OAuth authentication, defaults to ""
+        :param bearer_auth_token: Bearer token for authentication, defaults to ""
+        :return: Initialized client of the tenant or None if the connection to the server failed
+        :raises TimeoutError: If the connection to the server times out
+        """
+        base_url = base_url.rstrip("/")
+        key = (tenant, base_url)
+        client = self._clients.get(key)
+        if client is not None:
+            return client
+
+        server = self._get_server(base_url)
+        client = AasHttpClient.model_validate({**self._configuration, "BaseUrl": base_url})
+        if auth_settings is not None:
+            client.auth_settings = auth_settings.model_copy(deep=True)
+        client.auth_settings.basic_auth.set_password(basic_auth_password)
+        client.auth_settings.o_auth.set_client_secret(o_auth_client_secret)
+        client.auth_settings.bearer_auth.set_token(bearer_auth_token)
+        client.initialize(server.transport)
+
+        if not server.connected:
+            with server.lock:
+                if not server.connected and not check_connection(client):
+                    client.close()
+                    return None
+                server.connected = True
+
+        with self._lock:
+            existing = self._clients.setdefault(key, client)
+
+        if existing is not client:
+            client.close()
+
+        return existing
+
+    def remove_client(self, tenant: str, base_url: str) -> None:
+        """Close and remove the client of a tenant for a server, e.g. after its credentials changed.
+
+        :param tenant: Name of the tenant
+        :param base_url: Base URL of the AAS server
+        """
+        with self._lock:
+            client = self._clients.pop((tenant, base_url.rstrip("/")), None)
+
+        if client is not None:
+            client.close()
+
+    def close(self) -> None:
+        """Close the clients of all tenants and the connection pools of all servers."""
+        with self._lock:
+            clients = list(self._clients.values())
+            servers = list(self._servers.values())
+            self._clients.clear()
+            self._servers.clear()
+
+        for client in clients:
+            client.close()
+
+        for server in servers:
+            server.client.close()
+            for adapter in server.transport.adapters.values():
+                adapter.close()
+
+    def _get_server(self, base_url: str) -> _Server:
+        """Get the shared state of a server, creating its transport on the first call.
+
+        :param base_url: Base URL of the AAS server
+        :return: Shared state of the server
+        """
+        with self._lock:
+            server = self._servers.get(base_url)
+            if server is None:
+                # the client owning the transport is not used for requests of a tenant
+                client = AasHttpClient.model_validate({**self._configuration, "BaseUrl": base_url})
+                client.initialize()
+                server = _Server(client=client, transport=client.share_transport())
+                self._servers[base_url] = server
+
+            return server
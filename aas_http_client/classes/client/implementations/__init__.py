@@ -1,6 +1,6 @@
 """Client Implementations Module."""
 
-from aas_http_client.classes.client.implementations.authentication import AuthMethod, TokenData, get_token
+from aas_http_client.classes.client.implementations.authentication import AuthMethod, BearerTokenAuth, TokenData, get_token
 from aas_http_client.classes.client.implementations.experimental_implementation import ExperimentalImplementation
 from aas_http_client.classes.client.implementations.shell_implementation import ShellRepoImplementation
 from aas_http_client.classes.client.implementations.shell_registry_implementation import ShellRegistryImplementation
@@ -9,6 +9,7 @@ from aas_http_client.classes.client.implementations.sm_registry_implementation i
 
 __all__ = [
     "AuthMethod",
+    "BearerTokenAuth",
     "ExperimentalImplementation",
     "ShellRegistryImplementation",
     "ShellRepoImplementation",
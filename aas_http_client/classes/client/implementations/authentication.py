@@ -3,10 +3,12 @@
 import json
 import logging
 import time
+from collections.abc import Callable
 from enum import Enum
 
 import requests
-from requests.auth import HTTPBasicAuth
+from requests.auth import AuthBase, HTTPBasicAuth
+from requests.models import PreparedRequest
 
 from aas_http_client.classes.Configuration.config_classes import OAuth
 from aas_http_client.utilities.http_helper import log_response
@@ -36,7 +38,36 @@ class TokenData:
         self.token_expiry: float = token_expiry
 
 
-def get_token(o_auth_configuration: OAuth, ssl_verify: bool) -> TokenData | None:
+class BearerTokenAuth(AuthBase):
+    """Injects a bearer token into each request instead of storing it in the session headers.
+
+    The token is requested from the token provider for every request, so a token refresh is
+    visible to all threads and sessions without mutating shared state.
+    """
+
+    def __init__(self, token_provider: Callable[[], str | None], header_name: str = "Authorization"):
+        """Initializes the BearerTokenAuth with the given parameters.
+
+        :param token_provider: Callable returning the current access token or None
+        :param header_name: Name of the header to set, defaults to "Authorization"
+        """
+        self._token_provider = token_provider
+        self._header_name = header_name or "Authorization"
+
+    def __call__(self, request: PreparedRequest) -> PreparedRequest:
+        """Sets the authorization header of the given request.
+
+        :param request: Request to authenticate
+        :return: The authenticated request
+        """
+        token = self._token_provider()
+        if token:
+            request.headers[self._header_name] = f"Bearer {token}"
+
+        return request
+
+
+def get_token(o_auth_configuration: OAuth, ssl_verify: bool) -> TokenData | None:  # noqa: FBT001
     """Get token based on the provided OAuth configuration.
 
     :param auth_configuration: Authentication configuration
@@ -60,13 +91,13 @@ def get_token(o_auth_configuration: OAuth, ssl_verify: bool) -> TokenData | None
         )
 
     if not token:
-        _logger.error(f"Failed to receive token from endpoint '{o_auth_configuration.token_url}'")
+        _logger.error("Failed to receive token from endpoint '%s'", o_auth_configuration.token_url)
         return None
 
     return token
 
 
-def get_token_by_basic_auth(endpoint: str, username: str, password: str, timeout=200, ssl_verify=True) -> TokenData | None:
+def get_token_by_basic_auth(endpoint: str, username: str, password: str, timeout=200, ssl_verify=True) -> TokenData | None:  # noqa: FBT002
     """Get token from a specific authentication service provider by basic authentication.
 
     :param endpoint: Get token endpoint for the authentication service provider
@@ -83,7 +114,7 @@ def get_token_by_basic_auth(endpoint: str, username: str, password: str, timeout
     return __get_token_from_endpoint(endpoint, data, auth, timeout, ssl_verify)
 
 
-def get_token_by_password(endpoint: str, username: str, password: str, timeout=200, ssl_verify=True) -> TokenData | None:
+def get_token_by_password(endpoint: str, username: str, password: str, timeout=200, ssl_verify=True) -> TokenData | None:  # noqa: FBT002
     """Get token from a specific authentication service provider by username and password.
 
     :param endpoint: Get token endpoint for the authentication service provider
@@ -99,7 +130,11 @@ def get_token_by_password(endpoint: str, username: str, password: str, timeout=2
 
 
 def __get_token_from_endpoint(
-    endpoint: str, data: dict[str, str], auth: HTTPBasicAuth | None = None, timeout: int = 200, ssl_verify: bool = True
+    endpoint: str,
+    data: dict[str, str],
+    auth: HTTPBasicAuth | None = None,
+    timeout: int = 200,
+    ssl_verify: bool = True,  # noqa: FBT001, FBT002
 ) -> TokenData | None:
     """Get token from a specific authentication service provider.
 
@@ -111,14 +146,14 @@ def __get_token_from_endpoint(
     """
     try:
         response = requests.post(endpoint, auth=auth, data=data, timeout=timeout, verify=ssl_verify)
-        _logger.debug(f"Call REST API url '{response.url}'")
+        _logger.debug("Call REST API url '%s'", response.url)
 
         if response.status_code != 200:
             log_response(response)
             return None
 
     except requests.exceptions.RequestException as e:
-        _logger.error(f"Error call REST API: {e}")
+        _logger.error("Error call REST API: %s", e)
         return None
 
     content = response.content.decode("utf-8")
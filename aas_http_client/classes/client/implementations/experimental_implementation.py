@@ -3,7 +3,7 @@
 import logging
 import mimetypes
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from aas_http_client.classes.client.aas_client import AasHttpClient
@@ -29,13 +29,19 @@ class ExperimentalImplementation(BaseModel):
         """Initializes the ExperimentalImplementation with the given client."""
         self._client = client
 
-        session = client.get_session()
-        if session is None:
+        if client.get_session() is None:
             raise ValueError(
                 "HTTP session is not initialized in the client. Call 'initialize()' method of the client before creating SubmodelRegistryImplementation instance."
             )
 
-        self._session: requests.Session = session
+    @property
+    def _session(self) -> requests.Session:
+        """HTTP session of the client for the calling thread."""
+        session = self._client.get_session()
+        if session is None:
+            raise ValueError("HTTP session is not initialized in the client. Call 'initialize()' method of the client before making API calls.")
+
+        return session
 
     # GET /submodels/{submodelIdentifier}/submodel-elements/{idShortPath}/attachment
     def get_file_by_path_submodel_repo(self, submodel_identifier: str, id_short_path: str) -> bytes | None:
@@ -54,13 +60,13 @@ class ExperimentalImplementation(BaseModel):
 
         try:
             response = self._session.get(url, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code == STATUS_CODE_404:
                 _logger.warning(
                     f"Submodel with id '{submodel_identifier}' or Submodel element with IDShort path '{id_short_path}' or file content not found."
                 )
-                _logger.debug(response.text)
+                log_response(response, log_level=logging.DEBUG)
                 return None
 
             if response.status_code != STATUS_CODE_200:
@@ -68,7 +74,7 @@ class ExperimentalImplementation(BaseModel):
                 return None
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error calling REST API: {e}")
+            _logger.error("Error calling REST API: %s", e)
             return None
 
         return response.content
@@ -83,7 +89,7 @@ class ExperimentalImplementation(BaseModel):
         :return: Attachment data as bytes or None if an error occurred
         """
         if file.exists() is False or not file.is_file():
-            _logger.error(f"Attachment file '{file}' does not exist.")
+            _logger.error("Attachment file '%s' does not exist.", file)
             return False
 
         if not self._client.encoded_ids:
@@ -100,11 +106,11 @@ class ExperimentalImplementation(BaseModel):
                 files = {"file": (file.name, f, mime_type or "application/octet-stream")}
                 response = self._session.post(url, files=files, timeout=self._client.time_out)
 
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code == STATUS_CODE_404:
-                _logger.warning(f"Submodel with id '{submodel_identifier}' or Submodel element with IDShort path '{id_short_path}' not found.")
-                _logger.debug(response.text)
+                _logger.warning("Submodel with id '%s' or Submodel element with IDShort path '%s' not found.", submodel_identifier, id_short_path)
+                log_response(response, log_level=logging.DEBUG)
                 return False
 
             # original dotnet server delivers 200 instead of 204
@@ -113,7 +119,7 @@ class ExperimentalImplementation(BaseModel):
                 return False
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return False
 
         return True
@@ -128,7 +134,7 @@ class ExperimentalImplementation(BaseModel):
         :return: Attachment data as bytes or None if an error occurred
         """
         if file.exists() is False or not file.is_file():
-            _logger.error(f"Attachment file '{file}' does not exist.")
+            _logger.error("Attachment file '%s' does not exist.", file)
             return False
 
         if not self._client.encoded_ids:
@@ -145,11 +151,61 @@ class ExperimentalImplementation(BaseModel):
                 files = {"file": (file.name, f, mime_type or "application/octet-stream")}
                 response = self._session.put(url, files=files, timeout=self._client.time_out)
 
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
+
+            if response.status_code == STATUS_CODE_404:
+                _logger.warning("Submodel with id '%s' or Submodel element with IDShort path '%s' not found.", submodel_identifier, id_short_path)
+                log_response(response, log_level=logging.DEBUG)
+                return False
+
+            # original dotnet server delivers 200 instead of 204
+            if response.status_code not in (STATUS_CODE_200, STATUS_CODE_204):
+                log_response(response)
+                return False
+
+        except requests.exceptions.RequestException as e:
+            _logger.error("Error call REST API: %s", e)
+            return False
+
+        return True
+
+    # PUT /submodels/{submodelIdentifier}/submodel-elements/{idShortPath}/attachment
+    def put_file_by_path_submodel_repo_stream(
+        self, submodel_identifier: str, id_short_path: str, file_name: str, file_octet_stream: Any, mime_type: str = "application/octet-stream"
+    ) -> bool:
+        """Uploads file content from memory to an existing submodel element at a specified path within submodel elements hierarchy.
+
+        Experimental feature - may not be supported by all servers.
+
+        :param submodel_identifier: The Submodels unique id
+        :param id_short_path: IdShort path to the submodel element (dot-separated)
+        :param file_name: The name of the file
+        :param file_octet_stream: The octet stream of the file (bytes or file-like object)
+        :param mime_type: The MIME type of the file (e.g., "application/pdf")
+        :return: True if the upload was successful, False otherwise
+        """
+        if file_name is None or file_name == "" or file_octet_stream is None or mime_type is None or mime_type == "":
+            _logger.error("Attachment file '%s' does not exist.", file_name)
+            return False
+
+        if not self._client.encoded_ids:
+            submodel_identifier = encode_base_64(submodel_identifier)
+
+        url = f"{self._client.base_url}/submodels/{submodel_identifier}/submodel-elements/{id_short_path}/attachment"
+
+        params = {"fileName": file_name}
+
+        self._client.set_token()
+
+        try:
+            files: dict[str, tuple[str, Any, str]] = {"file": (file_name, file_octet_stream, mime_type)}
+            response = self._session.put(url, files=files, params=params, timeout=self._client.time_out)
+
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code == STATUS_CODE_404:
-                _logger.warning(f"Submodel with id '{submodel_identifier}' or Submodel element with IDShort path '{id_short_path}' not found.")
-                _logger.debug(response.text)
+                _logger.warning("Submodel with id '%s' or Submodel element with IDShort path '%s' not found.", submodel_identifier, id_short_path)
+                log_response(response, log_level=logging.DEBUG)
                 return False
 
             # original dotnet server delivers 200 instead of 204
@@ -158,7 +214,7 @@ class ExperimentalImplementation(BaseModel):
                 return False
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return False
 
         return True
@@ -180,10 +236,10 @@ class ExperimentalImplementation(BaseModel):
 
         try:
             response = self._session.delete(url, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code == 404:
-                _logger.warning(f"Submodel with id '{submodel_identifier}' or Submodel element with IDShort path '{id_short_path}' not found.")
+                _logger.warning("Submodel with id '%s' or Submodel element with IDShort path '%s' not found.", submodel_identifier, id_short_path)
                 return False
 
             if response.status_code != STATUS_CODE_200:
@@ -191,7 +247,7 @@ class ExperimentalImplementation(BaseModel):
                 return False
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error calling REST API: {e}")
+            _logger.error("Error calling REST API: %s", e)
             return False
 
         return True
@@ -12,7 +12,9 @@ from pydantic import BaseModel
 if TYPE_CHECKING:
     from aas_http_client.classes.client.aas_client import AasHttpClient
 
-from aas_http_client.utilities.encoder import encode_base_64
+from aas_http_client.classes.client.capabilities import UNSUPPORTED_STATUS_CODES, Capability
+from aas_http_client.utilities.concurrency import run_concurrently
+from aas_http_client.utilities.encoder import decode_base_64, encode_base_64
 from aas_http_client.utilities.http_helper import (
     STATUS_CODE_200,
     STATUS_CODE_201,
@@ -31,13 +33,19 @@ class ShellRepoImplementation(BaseModel):
         """Initializes the ShellImplementation with the given parameters."""
         self._client = client
 
-        session = client.get_session()
-        if session is None:
+        if client.get_session() is None:
             raise ValueError(
                 "HTTP session is not initialized in the client. Call 'initialize()' method of the client before creating SubmodelRegistryImplementation instance."
             )
 
-        self._session: requests.Session = session
+    @property
+    def _session(self) -> requests.Session:
+        """HTTP session of the client for the calling thread."""
+        session = self._client.get_session()
+        if session is None:
+            raise ValueError("HTTP session is not initialized in the client. Call 'initialize()' method of the client before making API calls.")
+
+        return session
 
     # GET /shells/{aasIdentifier}
     def get_asset_administration_shell_by_id(self, aas_identifier: str) -> dict | None:
@@ -55,11 +63,11 @@ class ShellRepoImplementation(BaseModel):
 
         try:
             response = self._session.get(url, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code == STATUS_CODE_404:
-                _logger.warning(f"Asset Administration Shell with id '{aas_identifier}' not found.")
-                _logger.debug(response.text)
+                _logger.warning("Asset Administration Shell with id '%s' not found.", aas_identifier)
+                log_response(response, log_level=logging.DEBUG)
                 return None
 
             if response.status_code != STATUS_CODE_200:
@@ -67,7 +75,7 @@ class ShellRepoImplementation(BaseModel):
                 return None
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return None
 
         content = response.content.decode("utf-8")
@@ -90,11 +98,11 @@ class ShellRepoImplementation(BaseModel):
 
         try:
             response = self._session.put(url, json=request_body, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code == STATUS_CODE_404:
-                _logger.warning(f"Asset Administration Shell with id '{aas_identifier}' not found.")
-                _logger.debug(response.text)
+                _logger.warning("Asset Administration Shell with id '%s' not found.", aas_identifier)
+                log_response(response, log_level=logging.DEBUG)
                 return False
 
             if response.status_code is not STATUS_CODE_204:
@@ -102,7 +110,7 @@ class ShellRepoImplementation(BaseModel):
                 return False
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return False
 
         return True
@@ -123,11 +131,11 @@ class ShellRepoImplementation(BaseModel):
 
         try:
             response = self._session.delete(url, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code == STATUS_CODE_404:
-                _logger.warning(f"Asset Administration Shell with id '{aas_identifier}' not found.")
-                _logger.debug(response.text)
+                _logger.warning("Asset Administration Shell with id '%s' not found.", aas_identifier)
+                log_response(response, log_level=logging.DEBUG)
                 return False
 
             if response.status_code != STATUS_CODE_204:
@@ -135,7 +143,7 @@ class ShellRepoImplementation(BaseModel):
                 return False
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return False
 
         return True
@@ -156,11 +164,11 @@ class ShellRepoImplementation(BaseModel):
 
         try:
             response = self._session.get(url, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code == STATUS_CODE_404:
-                _logger.warning(f"Asset Administration Shell with id '{aas_identifier}' or thumbnail file not found.")
-                _logger.debug(response.text)
+                _logger.warning("Asset Administration Shell with id '%s' or thumbnail file not found.", aas_identifier)
+                log_response(response, log_level=logging.DEBUG)
                 return None
 
             if response.status_code != STATUS_CODE_200:
@@ -168,7 +176,7 @@ class ShellRepoImplementation(BaseModel):
                 return None
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return None
 
         return response.content
@@ -182,7 +190,7 @@ class ShellRepoImplementation(BaseModel):
         :return: True if the update was successful, False otherwise
         """
         if file.exists() is False or not file.is_file():
-            _logger.error(f"Attachment file '{file}' does not exist.")
+            _logger.error("Attachment file '%s' does not exist.", file)
             return False
 
         mime_type, _ = mimetypes.guess_type(file)
@@ -205,7 +213,7 @@ class ShellRepoImplementation(BaseModel):
         :return: True if the update was successful, False otherwise
         """
         if file_name is None or file_name == "" or file_octet_stream is None or mime_type is None or mime_type == "":
-            _logger.error(f"Attachment file '{file_name}' does not exist.")
+            _logger.error("Attachment file '%s' does not exist.", file_name)
             return False
 
         if not self._client.encoded_ids:
@@ -221,11 +229,11 @@ class ShellRepoImplementation(BaseModel):
             files: dict[str, tuple[str, Any, str]] = {"file": (file_name, file_octet_stream, mime_type)}
             response = self._session.put(url, files=files, params=params, timeout=self._client.time_out)
 
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code == STATUS_CODE_404:
-                _logger.warning(f"Asset Administration Shell with id '{aas_identifier}' not found.")
-                _logger.debug(response.text)
+                _logger.warning("Asset Administration Shell with id '%s' not found.", aas_identifier)
+                log_response(response, log_level=logging.DEBUG)
                 return False
 
             # original dotnet server delivers 200 instead of 204
@@ -234,7 +242,7 @@ class ShellRepoImplementation(BaseModel):
                 return False
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return False
 
         return True
@@ -255,11 +263,11 @@ class ShellRepoImplementation(BaseModel):
 
         try:
             response = self._session.delete(url, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code == STATUS_CODE_404:
-                _logger.warning(f"Asset Administration Shell with id '{aas_identifier}' or thumbnail file not found.")
-                _logger.debug(response.text)
+                _logger.warning("Asset Administration Shell with id '%s' or thumbnail file not found.", aas_identifier)
+                log_response(response, log_level=logging.DEBUG)
                 return False
 
             if response.status_code != STATUS_CODE_200:
@@ -267,7 +275,7 @@ class ShellRepoImplementation(BaseModel):
                 return False
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return False
 
         return True
@@ -304,14 +312,14 @@ class ShellRepoImplementation(BaseModel):
 
         try:
             response = self._session.get(url, timeout=self._client.time_out, params=params)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code != STATUS_CODE_200:
                 log_response(response)
                 return None
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return None
 
         content = response.content.decode("utf-8")
@@ -330,14 +338,14 @@ class ShellRepoImplementation(BaseModel):
 
         try:
             response = self._session.post(url, json=request_body, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code != STATUS_CODE_201:
                 log_response(response)
                 return None
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return None
 
         content = response.content.decode("utf-8")
@@ -367,11 +375,11 @@ class ShellRepoImplementation(BaseModel):
 
         try:
             response = self._session.get(url, timeout=self._client.time_out, params=params)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code == STATUS_CODE_404:
-                _logger.warning(f"Asset Administration Shell with id '{aas_identifier}' not found.")
-                _logger.debug(response.text)
+                _logger.warning("Asset Administration Shell with id '%s' not found.", aas_identifier)
+                log_response(response, log_level=logging.DEBUG)
                 return None
 
             if response.status_code != STATUS_CODE_200:
@@ -379,7 +387,7 @@ class ShellRepoImplementation(BaseModel):
                 return None
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return None
 
         content = response.content.decode("utf-8")
@@ -402,11 +410,11 @@ class ShellRepoImplementation(BaseModel):
 
         try:
             response = self._session.post(url, json=request_body, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code == STATUS_CODE_404:
-                _logger.warning(f"Asset Administration Shell with id '{aas_identifier}' not found.")
-                _logger.debug(response.text)
+                _logger.warning("Asset Administration Shell with id '%s' not found.", aas_identifier)
+                log_response(response, log_level=logging.DEBUG)
                 return None
 
             if response.status_code != STATUS_CODE_201:
@@ -414,7 +422,7 @@ class ShellRepoImplementation(BaseModel):
                 return None
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return None
 
         content = response.content.decode("utf-8")
@@ -438,11 +446,11 @@ class ShellRepoImplementation(BaseModel):
 
         try:
             response = self._session.delete(url, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code == STATUS_CODE_404:
-                _logger.warning(f"Asset Administration Shell with id '{aas_identifier}' or submodel with id '{submodel_identifier}' not found.")
-                _logger.debug(response.text)
+                _logger.warning("Asset Administration Shell with id '%s' or submodel with id '%s' not found.", aas_identifier, submodel_identifier)
+                log_response(response, log_level=logging.DEBUG)
                 return False
 
             if response.status_code not in (STATUS_CODE_204, STATUS_CODE_200):
@@ -450,22 +458,27 @@ class ShellRepoImplementation(BaseModel):
                 return False
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return False
 
         return True
 
-    # not supported by Java Server
-
     # PUT /shells/{aasIdentifier}/submodels/{submodelIdentifier}
     def put_submodel_by_id_aas_repository(self, aas_identifier: str, submodel_identifier: str, request_body: dict) -> bool:
         """Updates the Submodel.
 
+        Servers without this endpoint (e.g. BaSyx Java server) are detected once, the Submodel is then put
+        to the Submodel repository endpoint of the same server if the AAS references it.
+
         :param aas_identifier: ID of the AAS to update the submodel for
         :param submodel_identifier: ID of the submodel to update
         :param request_body: Json data to the Submodel to put
         :return: True if the update was successful, False otherwise
         """
+        if not self._client.supports(Capability.put_submodel_through_shell):
+            return self._put_submodel(aas_identifier, submodel_identifier, request_body)
+
+        identifiers = (aas_identifier, submodel_identifier)
         if not self._client.encoded_ids:
             aas_identifier = encode_base_64(aas_identifier)
             submodel_identifier = encode_base_64(submodel_identifier)
@@ -476,11 +489,15 @@ class ShellRepoImplementation(BaseModel):
 
         try:
             response = self._session.put(url, json=request_body, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
+
+            if response.status_code in UNSUPPORTED_STATUS_CODES:
+                self._client.set_unsupported(Capability.put_submodel_through_shell)
+                return self._put_submodel(*identifiers, request_body)
 
             if response.status_code == STATUS_CODE_404:
-                _logger.warning(f"Asset Administration Shell with id '{aas_identifier}' or submodel with id '{submodel_identifier}' not found.")
-                _logger.debug(response.text)
+                _logger.warning("Asset Administration Shell with id '%s' or submodel with id '%s' not found.", aas_identifier, submodel_identifier)
+                log_response(response, log_level=logging.DEBUG)
                 return False
 
             if response.status_code != STATUS_CODE_204:
@@ -488,11 +505,34 @@ class ShellRepoImplementation(BaseModel):
                 return False
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return False
 
         return True
 
+    def _put_submodel(self, aas_identifier: str, submodel_identifier: str, request_body: dict) -> bool:
+        """Put the Submodel to the Submodel repository endpoint of the server if the AAS references it.
+
+        :param aas_identifier: ID of the AAS to update the submodel for
+        :param submodel_identifier: ID of the submodel to update
+        :param request_body: Json data to the Submodel to put
+        :return: True if the update was successful, False otherwise
+        """
+        if not self._client.submodels:
+            _logger.error("Submodel API is not initialized in the client. Call 'initialize()' method of the client before calling this method.")
+            return False
+
+        shell = self.get_asset_administration_shell_by_id(aas_identifier)
+        if shell is None:
+            return False
+
+        submodel_id = decode_base_64(submodel_identifier) if self._client.encoded_ids else submodel_identifier
+        if submodel_id not in _get_submodel_ids(shell):
+            _logger.warning("Submodel with id '%s' is not referenced by Asset Administration Shell with id '%s'.", submodel_id, shell.get("id"))
+            return False
+
+        return self._client.submodels.put_submodels_by_id(submodel_identifier, request_body)
+
     # GET /shells/{aasIdentifier}/$reference
     def get_asset_administration_shell_by_id_reference_aas_repository(self, aas_identifier: str) -> dict | None:
         """Returns a specific Asset Administration Shell as a Reference.
@@ -509,11 +549,11 @@ class ShellRepoImplementation(BaseModel):
 
         try:
             response = self._session.get(url, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code == STATUS_CODE_404:
-                _logger.warning(f"Asset Administration Shell with id '{aas_identifier}' not found.")
-                _logger.debug(response.text)
+                _logger.warning("Asset Administration Shell with id '%s' not found.", aas_identifier)
+                log_response(response, log_level=logging.DEBUG)
                 return None
 
             if response.status_code != STATUS_CODE_200:
@@ -521,7 +561,7 @@ class ShellRepoImplementation(BaseModel):
                 return None
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return None
 
         ref_dict_string = response.content.decode("utf-8")
@@ -545,11 +585,11 @@ class ShellRepoImplementation(BaseModel):
 
         try:
             response = self._session.get(url, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code == STATUS_CODE_404:
-                _logger.warning(f"Asset Administration Shell with id '{aas_identifier}' or submodel with id '{submodel_identifier}' not found.")
-                _logger.debug(response.text)
+                _logger.warning("Asset Administration Shell with id '%s' or submodel with id '%s' not found.", aas_identifier, submodel_identifier)
+                log_response(response, log_level=logging.DEBUG)
                 return None
 
             if response.status_code != STATUS_CODE_200:
@@ -557,8 +597,63 @@ class ShellRepoImplementation(BaseModel):
                 return None
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return None
 
         content = response.content.decode("utf-8")
         return json.loads(content)
+
+    # GET /shells/{aasIdentifier} + GET /submodels/{submodelIdentifier}
+    def get_asset_administration_shell_with_submodels(self, aas_identifier: str, level: str = "", extent: str = "") -> dict | None:
+        """Returns a specific Asset Administration Shell together with all its referenced Submodels.
+
+        The Submodels are requested concurrently with up to 'MaxWorkers' parallel requests.
+
+        :param aas_identifier: The Asset Administration Shells unique id
+        :param level: Determines the structural depth of the submodel content. Available values : deep, core
+        :param extent: Determines to which extent the submodels are serialized. Available values : withBlobValue, withoutBlobValue
+        :return: Dictionary with the shell data ('shell'), the submodel data in reference order ('submodels')
+            and the IDs of submodels that could not be retrieved ('missing') or None if the shell could not be retrieved
+        """
+        if not self._client.submodels:
+            _logger.error("Submodel API is not initialized in the client. Call 'initialize()' method of the client before calling this method.")
+            return None
+
+        shell = self.get_asset_administration_shell_by_id(aas_identifier)
+        if shell is None:
+            return None
+
+        submodel_ids = _get_submodel_ids(shell)
+        submodel_api = self._client.submodels
+
+        def get_submodel(submodel_id: str) -> dict | None:
+            identifier = encode_base_64(submodel_id) if self._client.encoded_ids else submodel_id
+            return submodel_api.get_submodel_by_id(identifier, level, extent)
+
+        results = run_concurrently(get_submodel, submodel_ids, self._client.max_workers)
+
+        submodels = [submodel for submodel in results if submodel is not None]
+        missing = [submodel_id for submodel_id, submodel in zip(submodel_ids, results, strict=True) if submodel is None]
+        if missing:
+            _logger.warning("%s of %s submodels of shell '%s' could not be retrieved.", len(missing), len(submodel_ids), shell.get("id"))
+
+        return {"shell": shell, "submodels": submodels, "missing": missing}
+
+
+def _get_submodel_ids(shell: dict) -> list[str]:
+    """Get the IDs of all submodels referenced in the given shell data.
+
+    :param shell: Asset Administration Shell data
+    :return: Unique submodel IDs in reference order
+    """
+    submodel_ids: list[str] = []
+    for reference in shell.get("submodels", []):
+        keys = reference.get("keys", [])
+        if len(keys) < 1 or keys[0].get("type") != "Submodel":
+            _logger.warning("Submodel reference %s does not start with SUBMODEL key type.", reference)
+            continue
+
+        if keys[0].get("value") not in submodel_ids:
+            submodel_ids.append(keys[0]["value"])
+
+    return submodel_ids
@@ -29,13 +29,19 @@ class ShellRegistryImplementation(BaseModel):
         """Initializes the ShellRegistryImplementation with the given parameters."""
         self._client = client
 
-        session = client.get_session()
-        if session is None:
+        if client.get_session() is None:
             raise ValueError(
                 "HTTP session is not initialized in the client. Call 'initialize()' method of the client before creating SubmodelRegistryImplementation instance."
             )
 
-        self._session: requests.Session = session
+    @property
+    def _session(self) -> requests.Session:
+        """HTTP session of the client for the calling thread."""
+        session = self._client.get_session()
+        if session is None:
+            raise ValueError("HTTP session is not initialized in the client. Call 'initialize()' method of the client before making API calls.")
+
+        return session
 
     # GET /shell-descriptors/{aasIdentifier}
     def get_asset_administration_shell_descriptor_by_id(self, aas_identifier: str) -> dict | None:
@@ -53,11 +59,11 @@ class ShellRegistryImplementation(BaseModel):
 
         try:
             response = self._session.get(url, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code == STATUS_CODE_404:
-                _logger.warning(f"Asset Administration Shell Descriptor with id '{aas_identifier}' not found.")
-                _logger.debug(response.text)
+                _logger.warning("Asset Administration Shell Descriptor with id '%s' not found.", aas_identifier)
+                log_response(response, log_level=logging.DEBUG)
                 return None
 
             if response.status_code != STATUS_CODE_200:
@@ -65,7 +71,7 @@ class ShellRegistryImplementation(BaseModel):
                 return None
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return None
 
         content = response.content.decode("utf-8")
@@ -88,11 +94,11 @@ class ShellRegistryImplementation(BaseModel):
 
         try:
             response = self._session.put(url, json=request_body, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code == STATUS_CODE_404:
-                _logger.warning(f"Asset Administration Shell Descriptor with id '{aas_identifier}' not found.")
-                _logger.debug(response.text)
+                _logger.warning("Asset Administration Shell Descriptor with id '%s' not found.", aas_identifier)
+                log_response(response, log_level=logging.DEBUG)
                 return False
 
             if response.status_code != STATUS_CODE_204:
@@ -100,7 +106,7 @@ class ShellRegistryImplementation(BaseModel):
                 return False
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return False
 
         return True
@@ -121,11 +127,11 @@ class ShellRegistryImplementation(BaseModel):
 
         try:
             response = self._session.delete(url, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code == STATUS_CODE_404:
-                _logger.warning(f"Asset Administration Shell Descriptor with id '{aas_identifier}' not found.")
-                _logger.debug(response.text)
+                _logger.warning("Asset Administration Shell Descriptor with id '%s' not found.", aas_identifier)
+                log_response(response, log_level=logging.DEBUG)
                 return False
 
             if response.status_code != STATUS_CODE_204:
@@ -133,7 +139,7 @@ class ShellRegistryImplementation(BaseModel):
                 return False
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return False
 
         return True
@@ -156,11 +162,11 @@ class ShellRegistryImplementation(BaseModel):
 
         try:
             response = self._session.get(url, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code == STATUS_CODE_404:
-                _logger.warning(f"Submodel Descriptor with id '{submodel_identifier}' or submodel with id '{submodel_identifier}' not found.")
-                _logger.debug(response.text)
+                _logger.warning("Submodel Descriptor with id '%s' or submodel with id '%s' not found.", submodel_identifier, submodel_identifier)
+                log_response(response, log_level=logging.DEBUG)
                 return None
 
             if response.status_code != STATUS_CODE_200:
@@ -168,7 +174,7 @@ class ShellRegistryImplementation(BaseModel):
                 return None
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return None
 
         content = response.content.decode("utf-8")
@@ -193,11 +199,11 @@ class ShellRegistryImplementation(BaseModel):
 
         try:
             response = self._session.put(url, json=request_body, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code == STATUS_CODE_404:
-                _logger.warning(f"Submodel Descriptor with id '{submodel_identifier}' or submodel with id '{submodel_identifier}' not found.")
-                _logger.debug(response.text)
+                _logger.warning("Submodel Descriptor with id '%s' or submodel with id '%s' not found.", submodel_identifier, submodel_identifier)
+                log_response(response, log_level=logging.DEBUG)
                 return False
 
             if response.status_code != STATUS_CODE_204:
@@ -205,7 +211,7 @@ class ShellRegistryImplementation(BaseModel):
                 return False
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return False
 
         return True
@@ -228,11 +234,11 @@ class ShellRegistryImplementation(BaseModel):
 
         try:
             response = self._session.delete(url, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code == STATUS_CODE_404:
-                _logger.warning(f"Submodel Descriptor with id '{submodel_identifier}' or submodel with id '{submodel_identifier}' not found.")
-                _logger.debug(response.text)
+                _logger.warning("Submodel Descriptor with id '%s' or submodel with id '%s' not found.", submodel_identifier, submodel_identifier)
+                log_response(response, log_level=logging.DEBUG)
                 return False
 
             if response.status_code != STATUS_CODE_204:
@@ -240,7 +246,7 @@ class ShellRegistryImplementation(BaseModel):
                 return False
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return False
 
         return True
@@ -273,14 +279,14 @@ class ShellRegistryImplementation(BaseModel):
 
         try:
             response = self._session.get(url, params=params, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code != STATUS_CODE_200:
                 log_response(response)
                 return None
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return None
 
         content = response.content.decode("utf-8")
@@ -299,14 +305,14 @@ class ShellRegistryImplementation(BaseModel):
 
         try:
             response = self._session.post(url, json=request_body, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code != STATUS_CODE_201:
                 log_response(response)
                 return None
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return None
 
         content = response.content.decode("utf-8")
@@ -324,14 +330,14 @@ class ShellRegistryImplementation(BaseModel):
 
         try:
             response = self._session.delete(url, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code != STATUS_CODE_204:
                 log_response(response)
                 return False
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return False
 
         return True
@@ -352,11 +358,11 @@ class ShellRegistryImplementation(BaseModel):
 
         try:
             response = self._session.get(url, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code == STATUS_CODE_404:
-                _logger.warning(f"Shell Descriptor with id '{aas_identifier}' not found.")
-                _logger.debug(response.text)
+                _logger.warning("Shell Descriptor with id '%s' not found.", aas_identifier)
+                log_response(response, log_level=logging.DEBUG)
                 return None
 
             if response.status_code != STATUS_CODE_200:
@@ -364,7 +370,7 @@ class ShellRegistryImplementation(BaseModel):
                 return None
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return None
 
         content = response.content.decode("utf-8")
@@ -387,11 +393,11 @@ class ShellRegistryImplementation(BaseModel):
 
         try:
             response = self._session.post(url, json=request_body, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code == STATUS_CODE_404:
-                _logger.warning(f"Shell Descriptor with id '{aas_identifier}' not found.")
-                _logger.debug(response.text)
+                _logger.warning("Shell Descriptor with id '%s' not found.", aas_identifier)
+                log_response(response, log_level=logging.DEBUG)
                 return None
 
             if response.status_code != STATUS_CODE_201:
@@ -399,7 +405,7 @@ class ShellRegistryImplementation(BaseModel):
                 return None
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return None
 
         content = response.content.decode("utf-8")
@@ -418,14 +424,14 @@ class ShellRegistryImplementation(BaseModel):
 
         try:
             response = self._session.post(url, json=request_body, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code != STATUS_CODE_200:
                 log_response(response)
                 return None
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return None
 
         content = response.content.decode("utf-8")
@@ -443,14 +449,14 @@ class ShellRegistryImplementation(BaseModel):
 
         try:
             response = self._session.get(url, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code != STATUS_CODE_200:
                 log_response(response)
                 return None
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return None
 
         content = response.content.decode("utf-8")
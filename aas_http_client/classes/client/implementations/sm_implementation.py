@@ -2,7 +2,12 @@
 
 import json
 import logging
-from typing import TYPE_CHECKING
+import math
+import threading
+import warnings
+from collections import OrderedDict
+from functools import partial
+from typing import TYPE_CHECKING, Any
 
 import requests
 from pydantic import BaseModel
@@ -10,17 +15,30 @@ from pydantic import BaseModel
 if TYPE_CHECKING:
     from aas_http_client.classes.client.aas_client import AasHttpClient
 
+from aas_http_client.classes.client.capabilities import UNSUPPORTED_STATUS_CODES, Capability
+from aas_http_client.utilities.concurrency import run_concurrently
 from aas_http_client.utilities.encoder import encode_base_64
+from aas_http_client.utilities.hashing import CHILD_KEYS
 from aas_http_client.utilities.http_helper import (
     STATUS_CODE_200,
     STATUS_CODE_201,
+    STATUS_CODE_202,
     STATUS_CODE_204,
+    STATUS_CODE_302,
+    STATUS_CODE_304,
     STATUS_CODE_404,
     log_response,
 )
+from aas_http_client.utilities.id_short_path import find_value
 
 _logger = logging.getLogger(__name__)
 
+# transfer size that outweighs the latency of a round trip when reading multiple values
+_VALUE_ONLY_BYTES_PER_ROUND_TRIP = 256 * 1024
+
+# number of submodels whose ValueOnly size is remembered, the least recently used sizes are dropped
+_MAX_VALUE_ONLY_SIZES = 10000
+
 
 class SubmodelRepoImplementation(BaseModel):
     """Implementation of Submodel related API calls."""
@@ -28,14 +46,22 @@ class SubmodelRepoImplementation(BaseModel):
     def __init__(self, client: "AasHttpClient"):
         """Initializes the SmImplementation with the given parameters."""
         self._client = client
+        self._value_only_sizes: OrderedDict[str, int] = OrderedDict()
+        self._value_only_sizes_lock = threading.Lock()
 
-        session = client.get_session()
-        if session is None:
+        if client.get_session() is None:
             raise ValueError(
                 "HTTP session is not initialized in the client. Call 'initialize()' method of the client before creating SubmodelRegistryImplementation instance."
             )
 
-        self._session: requests.Session = session
+    @property
+    def _session(self) -> requests.Session:
+        """HTTP session of the client for the calling thread."""
+        session = self._client.get_session()
+        if session is None:
+            raise ValueError("HTTP session is not initialized in the client. Call 'initialize()' method of the client before making API calls.")
+
+        return session
 
     # GET /submodels/{submodelIdentifier}
     def get_submodel_by_id(self, submodel_identifier: str, level: str = "", extent: str = "") -> dict | None:
@@ -61,11 +87,11 @@ class SubmodelRepoImplementation(BaseModel):
 
         try:
             response = self._session.get(url, params=params, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code == STATUS_CODE_404:
-                _logger.warning(f"Submodel with id '{submodel_identifier}' not found.")
-                _logger.debug(response.text)
+                _logger.warning("Submodel with id '%s' not found.", submodel_identifier)
+                log_response(response, log_level=logging.DEBUG)
                 return None
 
             if response.status_code != STATUS_CODE_200:
@@ -73,7 +99,7 @@ class SubmodelRepoImplementation(BaseModel):
                 return None
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return None
 
         content = response.content.decode("utf-8")
@@ -96,11 +122,11 @@ class SubmodelRepoImplementation(BaseModel):
 
         try:
             response = self._session.put(url, json=request_body, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code == STATUS_CODE_404:
-                _logger.warning(f"Submodel with id '{submodel_identifier}' not found.")
-                _logger.debug(response.text)
+                _logger.warning("Submodel with id '%s' not found.", submodel_identifier)
+                log_response(response, log_level=logging.DEBUG)
                 return False
 
             if response.status_code != STATUS_CODE_204:
@@ -108,7 +134,7 @@ class SubmodelRepoImplementation(BaseModel):
                 return False
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return False
 
         return True
@@ -129,11 +155,11 @@ class SubmodelRepoImplementation(BaseModel):
 
         try:
             response = self._session.delete(url, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code == STATUS_CODE_404:
-                _logger.warning(f"Submodel with id '{submodel_identifier}' not found.")
-                _logger.debug(response.text)
+                _logger.warning("Submodel with id '%s' not found.", submodel_identifier)
+                log_response(response, log_level=logging.DEBUG)
                 return False
 
             if response.status_code != STATUS_CODE_204:
@@ -141,7 +167,7 @@ class SubmodelRepoImplementation(BaseModel):
                 return False
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return False
 
         return True
@@ -173,11 +199,11 @@ class SubmodelRepoImplementation(BaseModel):
 
         try:
             response = self._session.get(url, params=params, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code == STATUS_CODE_404:
-                _logger.warning(f"Submodel with id '{submodel_identifier}' or Submodel element with IDShort path '{id_short_path}' not found.")
-                _logger.debug(response.text)
+                _logger.warning("Submodel with id '%s' or Submodel element with IDShort path '%s' not found.", submodel_identifier, id_short_path)
+                log_response(response, log_level=logging.DEBUG)
                 return None
 
             if response.status_code != STATUS_CODE_200:
@@ -185,7 +211,7 @@ class SubmodelRepoImplementation(BaseModel):
                 return None
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return None
 
         content = response.content.decode("utf-8")
@@ -214,11 +240,11 @@ class SubmodelRepoImplementation(BaseModel):
 
         try:
             response = self._session.put(url, json=request_body, params=params, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code == STATUS_CODE_404:
-                _logger.warning(f"Submodel with id '{submodel_identifier}' or Submodel element with IDShort path '{id_short_path}' not found.")
-                _logger.debug(response.text)
+                _logger.warning("Submodel with id '%s' or Submodel element with IDShort path '%s' not found.", submodel_identifier, id_short_path)
+                log_response(response, log_level=logging.DEBUG)
                 return False
 
             if response.status_code != STATUS_CODE_204:
@@ -226,7 +252,7 @@ class SubmodelRepoImplementation(BaseModel):
                 return False
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return False
 
         return True
@@ -259,11 +285,11 @@ class SubmodelRepoImplementation(BaseModel):
 
         try:
             response = self._session.post(url, json=request_body, params=params, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code == STATUS_CODE_404:
-                _logger.warning(f"Submodel with id '{submodel_identifier}' or Submodel element with IDShort path '{id_short_path}' not found.")
-                _logger.debug(response.text)
+                _logger.warning("Submodel with id '%s' or Submodel element with IDShort path '%s' not found.", submodel_identifier, id_short_path)
+                log_response(response, log_level=logging.DEBUG)
                 return None
 
             if response.status_code != STATUS_CODE_201:
@@ -271,7 +297,7 @@ class SubmodelRepoImplementation(BaseModel):
                 return None
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return None
 
         content = response.content.decode("utf-8")
@@ -293,11 +319,11 @@ class SubmodelRepoImplementation(BaseModel):
         self._client.set_token()
         try:
             response = self._session.delete(url, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code == STATUS_CODE_404:
-                _logger.warning(f"Submodel with id '{submodel_identifier}' or Submodel element with IDShort path '{id_short_path}' not found.")
-                _logger.debug(response.text)
+                _logger.warning("Submodel with id '%s' or Submodel element with IDShort path '%s' not found.", submodel_identifier, id_short_path)
+                log_response(response, log_level=logging.DEBUG)
                 return False
 
             if response.status_code != STATUS_CODE_204:
@@ -305,7 +331,7 @@ class SubmodelRepoImplementation(BaseModel):
                 return False
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return False
 
         return True
@@ -344,14 +370,14 @@ class SubmodelRepoImplementation(BaseModel):
 
         try:
             response = self._session.get(url, params=params, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code != STATUS_CODE_200:
                 log_response(response)
                 return None
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return None
 
         content = response.content.decode("utf-8")
@@ -370,14 +396,14 @@ class SubmodelRepoImplementation(BaseModel):
 
         try:
             response = self._session.post(url, json=request_body, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code != STATUS_CODE_201:
                 log_response(response)
                 return None
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return None
 
         content = response.content.decode("utf-8")
@@ -415,14 +441,14 @@ class SubmodelRepoImplementation(BaseModel):
 
         try:
             response = self._session.get(url, params=params, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code != STATUS_CODE_200:
                 log_response(response)
                 return None
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return None
 
         content = response.content.decode("utf-8")
@@ -445,29 +471,39 @@ class SubmodelRepoImplementation(BaseModel):
 
         try:
             response = self._session.post(url, json=request_body, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code != STATUS_CODE_201:
                 log_response(response)
                 return None
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return None
 
         content = response.content.decode("utf-8")
         return json.loads(content)
 
     # POST /submodels/{submodelIdentifier}/submodel-elements/{idShortPath}/invoke
-    def invoke_operation_submodel_repo(self, submodel_identifier: str, id_short_path: str, request_body: dict, async_: str = "async") -> dict | None:
+    def invoke_operation_submodel_repo(
+        self, submodel_identifier: str, id_short_path: str, request_body: dict, async_: str | None = None
+    ) -> dict | None:
         """Synchronously invokes an Operation at a specified path.
 
         :param submodel_identifier: The Submodels unique id
         :param id_short_path: IdShort path to the operation element (dot-separated)
         :param request_body: Input parameters for the operation
-        :param async_: Determines whether an operation invocation is performed asynchronously or synchronously
+        :param async_: Deprecated and not evaluated, use 'invoke_operation_async_submodel_repo' for asynchronous invocations
         :return: Operation result or None if an error occurred
         """
+        if async_ is not None:
+            warnings.warn(
+                "The 'async_' argument of 'invoke_operation_submodel_repo' is not evaluated and will be removed. "
+                "Use 'invoke_operation_async_submodel_repo' for asynchronous invocations.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+
         if not self._client.encoded_ids:
             submodel_identifier = encode_base_64(submodel_identifier)
 
@@ -477,14 +513,128 @@ class SubmodelRepoImplementation(BaseModel):
 
         try:
             response = self._session.post(url, json=request_body, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
+
+            if response.status_code != STATUS_CODE_200:
+                log_response(response)
+                return None
+
+        except requests.exceptions.RequestException as e:
+            _logger.error("Error call REST API: %s", e)
+            return None
+
+        content = response.content.decode("utf-8")
+        return json.loads(content)
+
+    # POST /submodels/{submodelIdentifier}/submodel-elements/{idShortPath}/invoke-async
+    def invoke_operation_async_submodel_repo(self, submodel_identifier: str, id_short_path: str, request_body: dict) -> str | None:
+        """Asynchronously invokes an Operation at a specified path.
+
+        :param submodel_identifier: The Submodels unique id
+        :param id_short_path: IdShort path to the operation element (dot-separated)
+        :param request_body: Input parameters for the operation
+        :return: Handle id of the invocation or None if an error occurred
+        """
+        if not self._client.encoded_ids:
+            submodel_identifier = encode_base_64(submodel_identifier)
+
+        url = f"{self._client.base_url}/submodels/{submodel_identifier}/submodel-elements/{id_short_path}/invoke-async"
+
+        self._client.set_token()
+
+        try:
+            response = self._session.post(url, json=request_body, timeout=self._client.time_out)
+            _logger.debug("Call REST API url '%s'", response.url)
+
+            if response.status_code != STATUS_CODE_202:
+                log_response(response)
+                return None
+
+        except requests.exceptions.RequestException as e:
+            _logger.error("Error call REST API: %s", e)
+            return None
+
+        # the location of the operation status ends with the handle id
+        location = response.headers.get("Location", "").rstrip("/")
+        if not location:
+            _logger.error("Asynchronous invocation of operation '%s' returned no handle.", id_short_path)
+            return None
+
+        return location.rsplit("/", 1)[-1]
+
+    # GET /submodels/{submodelIdentifier}/submodel-elements/{idShortPath}/operation-status/{handleId}
+    def get_operation_async_status_submodel_repo(self, submodel_identifier: str, id_short_path: str, handle_id: str) -> dict | None:
+        """Returns the status of an asynchronously invoked Operation.
+
+        A finished operation is reported as completed, whether it actually succeeded is part of the operation result.
+
+        :param submodel_identifier: The Submodels unique id
+        :param id_short_path: IdShort path to the operation element (dot-separated)
+        :param handle_id: Handle id of the invocation
+        :return: Operation status (with 'executionState' "Completed" once the result is available) or None if an error occurred
+        """
+        if not self._client.encoded_ids:
+            submodel_identifier = encode_base_64(submodel_identifier)
+
+        url = f"{self._client.base_url}/submodels/{submodel_identifier}/submodel-elements/{id_short_path}/operation-status/{handle_id}"
+
+        self._client.set_token()
+
+        try:
+            # the server redirects to the operation result when the operation is finished
+            response = self._session.get(url, allow_redirects=False, timeout=self._client.time_out)
+            _logger.debug("Call REST API url '%s'", response.url)
+
+            if response.status_code == STATUS_CODE_302:
+                return {"executionState": "Completed"}
+
+            if response.status_code == STATUS_CODE_404:
+                _logger.warning("Operation with IDShort path '%s' or handle '%s' not found.", id_short_path, handle_id)
+                log_response(response, log_level=logging.DEBUG)
+                return None
+
+            if response.status_code != STATUS_CODE_200:
+                log_response(response)
+                return None
+
+        except requests.exceptions.RequestException as e:
+            _logger.error("Error call REST API: %s", e)
+            return None
+
+        content = response.content.decode("utf-8")
+        return json.loads(content)
+
+    # GET /submodels/{submodelIdentifier}/submodel-elements/{idShortPath}/operation-results/{handleId}
+    def get_operation_async_result_submodel_repo(self, submodel_identifier: str, id_short_path: str, handle_id: str) -> dict | None:
+        """Returns the result of an asynchronously invoked Operation.
+
+        :param submodel_identifier: The Submodels unique id
+        :param id_short_path: IdShort path to the operation element (dot-separated)
+        :param handle_id: Handle id of the invocation
+        :return: Operation result or None if an error occurred
+        """
+        if not self._client.encoded_ids:
+            submodel_identifier = encode_base_64(submodel_identifier)
+
+        url = f"{self._client.base_url}/submodels/{submodel_identifier}/submodel-elements/{id_short_path}/operation-results/{handle_id}"
+
+        self._client.set_token()
+
+        try:
+            response = self._session.get(url, timeout=self._client.time_out)
+            _logger.debug("Call REST API url '%s'", response.url)
+
+            if response.status_code == STATUS_CODE_404:
+                _logger.warning("Operation with IDShort path '%s' or handle '%s' not found.", id_short_path, handle_id)
+                log_response(response, log_level=logging.DEBUG)
+                return None
 
             if response.status_code != STATUS_CODE_200:
                 log_response(response)
                 return None
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return None
 
         content = response.content.decode("utf-8")
@@ -507,14 +657,14 @@ class SubmodelRepoImplementation(BaseModel):
 
         try:
             response = self._session.get(url, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code != STATUS_CODE_200:
                 log_response(response)
                 return None
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return None
 
         content = response.content.decode("utf-8")
@@ -545,11 +695,11 @@ class SubmodelRepoImplementation(BaseModel):
 
         try:
             response = self._session.patch(url, json=value, params=params, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code == STATUS_CODE_404:
-                _logger.warning(f"Submodel with id '{submodel_identifier}' or Submodel element with IDShort path '{id_short_path}' not found.")
-                _logger.debug(response.text)
+                _logger.warning("Submodel with id '%s' or Submodel element with IDShort path '%s' not found.", submodel_identifier, id_short_path)
+                log_response(response, log_level=logging.DEBUG)
                 return False
 
             if response.status_code != STATUS_CODE_204:
@@ -557,7 +707,7 @@ class SubmodelRepoImplementation(BaseModel):
                 return False
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return False
 
         return True
@@ -586,11 +736,11 @@ class SubmodelRepoImplementation(BaseModel):
 
         try:
             response = self._session.get(url, params=params, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code == STATUS_CODE_404:
-                _logger.warning(f"Submodel with id '{submodel_identifier}' not found.")
-                _logger.debug(response.text)
+                _logger.warning("Submodel with id '%s' not found.", submodel_identifier)
+                log_response(response, log_level=logging.DEBUG)
                 return None
 
             if response.status_code != STATUS_CODE_200:
@@ -598,12 +748,59 @@ class SubmodelRepoImplementation(BaseModel):
                 return None
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return None
 
+        if not level and not extent:
+            self._set_value_only_size(submodel_identifier, len(response.content))
+
         content = response.content.decode("utf-8")
         return json.loads(content)
 
+    # GET /submodels/{submodelIdentifier}/$value
+    def get_submodel_by_id_value_only_if_modified(self, submodel_identifier: str, etag: str = "") -> dict | None:
+        """Returns a specific Submodel in the ValueOnly representation if it was modified since the given entity tag.
+
+        Servers that do not support conditional requests always return the Submodel value.
+
+        :param submodel_identifier: The Submodels unique id
+        :param etag: Entity tag of the last response, defaults to "" (unconditional request)
+        :return: Dictionary with the Submodel value ('value', None if not modified) and the entity tag of the response ('etag', "" if not supported)
+            or None if an error occurred
+        """
+        if not self._client.encoded_ids:
+            submodel_identifier = encode_base_64(submodel_identifier)
+
+        url = f"{self._client.base_url}/submodels/{submodel_identifier}/$value"
+        headers = {"If-None-Match": etag} if etag else {}
+
+        self._client.set_token()
+
+        try:
+            response = self._session.get(url, headers=headers, timeout=self._client.time_out)
+            _logger.debug("Call REST API url '%s'", response.url)
+
+            if response.status_code == STATUS_CODE_304:
+                return {"value": None, "etag": etag}
+
+            if response.status_code == STATUS_CODE_404:
+                _logger.warning("Submodel with id '%s' not found.", submodel_identifier)
+                log_response(response, log_level=logging.DEBUG)
+                return None
+
+            if response.status_code != STATUS_CODE_200:
+                log_response(response)
+                return None
+
+        except requests.exceptions.RequestException as e:
+            _logger.error("Error call REST API: %s", e)
+            return None
+
+        self._set_value_only_size(submodel_identifier, len(response.content))
+
+        content = response.content.decode("utf-8")
+        return {"value": json.loads(content), "etag": response.headers.get("ETag", "")}
+
     # PATCH /submodels/{submodelIdentifier}/$value
     def patch_submodel_by_id_value_only(self, submodel_identifier: str, request_body: dict, level: str = "") -> bool:
         """Updates the values of an existing Submodel.
@@ -626,11 +823,11 @@ class SubmodelRepoImplementation(BaseModel):
 
         try:
             response = self._session.patch(url, json=request_body, params=params, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code == STATUS_CODE_404:
-                _logger.warning(f"Submodel with id '{submodel_identifier}' not found.")
-                _logger.debug(response.text)
+                _logger.warning("Submodel with id '%s' not found.", submodel_identifier)
+                log_response(response, log_level=logging.DEBUG)
                 return False
 
             if response.status_code != STATUS_CODE_204:
@@ -638,7 +835,7 @@ class SubmodelRepoImplementation(BaseModel):
                 return False
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return False
 
         return True
@@ -664,11 +861,11 @@ class SubmodelRepoImplementation(BaseModel):
 
         try:
             response = self._session.get(url, params=params, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code == STATUS_CODE_404:
-                _logger.warning(f"Submodel with id '{submodel_identifier}' not found.")
-                _logger.debug(response.text)
+                _logger.warning("Submodel with id '%s' not found.", submodel_identifier)
+                log_response(response, log_level=logging.DEBUG)
                 return None
 
             if response.status_code != STATUS_CODE_200:
@@ -676,21 +873,26 @@ class SubmodelRepoImplementation(BaseModel):
                 return None
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return None
 
         content = response.content.decode("utf-8")
         return json.loads(content)
 
-    # not supported by Java Server
-
     # PATCH /submodels/{submodelIdentifier}
     def patch_submodel_by_id(self, submodel_identifier: str, submodel_data: dict) -> bool:
         """Updates an existing Submodel.
 
+        Servers without this endpoint (e.g. BaSyx Java and Python servers) are detected once, the Submodel is
+        then updated by reading it, merging 'submodel_data' into it and putting it back (see '_merge_submodel').
+
         :param submodel_identifier: The Submodels unique id
         :return: True if the patch was successful, False otherwise
         """
+        if not self._client.supports(Capability.patch_submodel):
+            return self._patch_submodel_by_put(submodel_identifier, submodel_data)
+
+        identifier = submodel_identifier
         if not self._client.encoded_ids:
             submodel_identifier = encode_base_64(submodel_identifier)
 
@@ -700,11 +902,15 @@ class SubmodelRepoImplementation(BaseModel):
 
         try:
             response = self._session.patch(url, json=submodel_data, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
+
+            if response.status_code in UNSUPPORTED_STATUS_CODES:
+                self._client.set_unsupported(Capability.patch_submodel)
+                return self._patch_submodel_by_put(identifier, submodel_data)
 
             if response.status_code == STATUS_CODE_404:
-                _logger.warning(f"Submodel with id '{submodel_identifier}' not found.")
-                _logger.debug(response.text)
+                _logger.warning("Submodel with id '%s' not found.", submodel_identifier)
+                log_response(response, log_level=logging.DEBUG)
                 return False
 
             if response.status_code != STATUS_CODE_204:
@@ -712,7 +918,150 @@ class SubmodelRepoImplementation(BaseModel):
                 return False
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return False
 
         return True
+
+    def _patch_submodel_by_put(self, submodel_identifier: str, submodel_data: dict) -> bool:
+        """Apply the fields of a Submodel to the stored Submodel with GET and PUT.
+
+        :param submodel_identifier: The Submodels unique id
+        :param submodel_data: Json data of the fields to update
+        :return: True if the update was successful, False otherwise
+        """
+        submodel = self.get_submodel_by_id(submodel_identifier)
+        if submodel is None:
+            return False
+
+        return self.put_submodels_by_id(submodel_identifier, _merge_submodel(submodel, submodel_data))
+
+    def get_values(self, submodel_identifier: str, id_short_paths: list[str]) -> dict[str, Any]:
+        """Returns the values of multiple SubmodelElements of a Submodel with as few round trips as possible.
+
+        The values are either requested per element with up to 'MaxWorkers' parallel requests or extracted from
+        the ValueOnly representation of the whole Submodel. The whole Submodel is requested if the requests per
+        element would need more than one round of parallel requests, or if the size of the Submodel (known from
+        previous ValueOnly requests) is small compared to the latency of the saved round trips.
+
+        :param submodel_identifier: The Submodels unique id
+        :param id_short_paths: IdShort paths to the submodel elements (dot-separated)
+        :return: Dictionary of IdShort paths and values, values that could not be retrieved are missing
+        """
+        paths = list(dict.fromkeys(id_short_paths))
+
+        if self._use_value_only_submodel(submodel_identifier, len(paths)):
+            content = self.get_submodel_by_id_value_only(submodel_identifier)
+            if content is None:
+                return {}
+
+            values = {}
+            for path in paths:
+                try:
+                    values[path] = find_value(content, path)
+                except KeyError:
+                    _logger.warning("Submodel element with IDShort path '%s' not found in submodel '%s'.", path, submodel_identifier)
+            return values
+
+        get_value = partial(self.get_submodel_element_by_path_value_only_submodel_repo, submodel_identifier)
+        results = run_concurrently(get_value, paths, self._client.max_workers)
+        return {path: value for path, value in zip(paths, results, strict=True) if value is not None}
+
+    def _use_value_only_submodel(self, submodel_identifier: str, path_count: int) -> bool:
+        """Decide whether reading the whole Submodel is faster than reading the values per element.
+
+        :param submodel_identifier: The Submodels unique id
+        :param path_count: Number of values to read
+        :return: True if the ValueOnly representation of the Submodel should be requested
+        """
+        if path_count < 2:
+            return False
+
+        rounds = math.ceil(path_count / self._client.max_workers)
+        key = submodel_identifier if self._client.encoded_ids else encode_base_64(submodel_identifier)
+        with self._value_only_sizes_lock:
+            size = self._value_only_sizes.get(key)
+            if size is not None:
+                self._value_only_sizes.move_to_end(key)
+
+        if size is None:
+            return rounds > 1
+
+        return size <= rounds * _VALUE_ONLY_BYTES_PER_ROUND_TRIP
+
+    def _set_value_only_size(self, submodel_identifier: str, size: int) -> None:
+        """Remember the size of the ValueOnly representation of a Submodel.
+
+        :param submodel_identifier: The Submodels unique id (encoded)
+        :param size: Size of the ValueOnly representation in bytes
+        """
+        with self._value_only_sizes_lock:
+            self._value_only_sizes[submodel_identifier] = size
+            self._value_only_sizes.move_to_end(submodel_identifier)
+            while len(self._value_only_sizes) > _MAX_VALUE_ONLY_SIZES:
+                self._value_only_sizes.popitem(last=False)
+
+
+def _merge_submodel(submodel: dict, changes: dict) -> dict:
+    """Merge the fields of a partial Submodel into a Submodel, as a PATCH request would.
+
+    Fields contained in the changes replace the fields of the Submodel (also with empty values), fields set to
+    None are removed. Submodel elements are merged by idShort: changed elements are merged recursively, new
+    elements are appended and elements not contained in the changes are kept. The elements of a
+    SubmodelElementList have no idShort and are replaced as a whole.
+
+    :param submodel: Submodel data
+    :param changes: Json data of the fields to update
+    :return: Merged Submodel data, with the id of the Submodel
+    """
+    merged = _merge_fields(submodel, changes, "submodelElements")
+    merged["id"] = submodel["id"]
+    return merged
+
+
+def _merge_fields(data: dict, changes: dict, child_key: str | None) -> dict:
+    """Merge the fields of a partial Submodel or SubmodelElement.
+
+    :param data: Submodel or SubmodelElement data
+    :param changes: Json data of the fields to update
+    :param child_key: Key holding the child elements merged by idShort, None if there are none
+    :return: Merged data
+    """
+    merged = dict(data)
+    for key, value in changes.items():
+        if value is None:
+            merged.pop(key, None)
+        elif key == child_key and isinstance(value, list):
+            merged[key] = _merge_elements(data.get(key) or [], value)
+        else:
+            merged[key] = value
+
+    return merged
+
+
+def _merge_elements(elements: list[dict], changes: list[dict]) -> list[dict]:
+    """Merge SubmodelElements by idShort.
+
+    :param elements: SubmodelElement data
+    :param changes: Json data of the changed and new SubmodelElements
+    :return: Merged SubmodelElement data
+    """
+    merged = list(elements)
+    positions = {element["idShort"]: index for index, element in enumerate(merged) if element.get("idShort")}
+
+    for change in changes:
+        index = positions.get(change.get("idShort"))
+        if index is None:
+            if change.get("idShort"):
+                positions[change["idShort"]] = len(merged)
+            merged.append(change)
+            continue
+
+        element = merged[index]
+        model_type = change.get("modelType", element.get("modelType"))
+        if model_type != element.get("modelType"):
+            merged[index] = change
+        else:
+            merged[index] = _merge_fields(element, change, None if model_type == "SubmodelElementList" else CHILD_KEYS.get(model_type))
+
+    return merged
@@ -30,13 +30,19 @@ class SubmodelRegistryImplementation(BaseModel):
         """Initializes the SubmodelRegistryImplementation with the given client."""
         self._client = client
 
-        session = client.get_session()
-        if session is None:
+        if client.get_session() is None:
             raise ValueError(
                 "HTTP session is not initialized in the client. Call 'initialize()' method of the client before creating SubmodelRegistryImplementation instance."
             )
 
-        self._session: requests.Session = session
+    @property
+    def _session(self) -> requests.Session:
+        """HTTP session of the client for the calling thread."""
+        session = self._client.get_session()
+        if session is None:
+            raise ValueError("HTTP session is not initialized in the client. Call 'initialize()' method of the client before making API calls.")
+
+        return session
 
     # GET /submodel-descriptors/{submodelIdentifier}
     def get_submodel_descriptor_by_id(self, submodel_identifier: str) -> dict | None:
@@ -54,11 +60,11 @@ class SubmodelRegistryImplementation(BaseModel):
 
         try:
             response = self._session.get(url, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code == STATUS_CODE_404:
-                _logger.warning(f"Submodel Descriptor with id '{submodel_identifier}' not found.")
-                _logger.debug(response.text)
+                _logger.warning("Submodel Descriptor with id '%s' not found.", submodel_identifier)
+                log_response(response, log_level=logging.DEBUG)
                 return None
 
             if response.status_code != STATUS_CODE_200:
@@ -66,7 +72,7 @@ class SubmodelRegistryImplementation(BaseModel):
                 return None
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return None
 
         content = response.content.decode("utf-8")
@@ -89,11 +95,11 @@ class SubmodelRegistryImplementation(BaseModel):
 
         try:
             response = self._session.put(url, json=request_body, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code == STATUS_CODE_404:
-                _logger.warning(f"Submodel Descriptor with id '{submodel_identifier}' not found.")
-                _logger.debug(response.text)
+                _logger.warning("Submodel Descriptor with id '%s' not found.", submodel_identifier)
+                log_response(response, log_level=logging.DEBUG)
                 return False
 
             if response.status_code != STATUS_CODE_204:
@@ -101,7 +107,7 @@ class SubmodelRegistryImplementation(BaseModel):
                 return False
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return False
 
         return True
@@ -122,11 +128,11 @@ class SubmodelRegistryImplementation(BaseModel):
 
         try:
             response = self._session.delete(url, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code == STATUS_CODE_404:
-                _logger.warning(f"Submodel Descriptor with id '{submodel_identifier}' not found.")
-                _logger.debug(response.text)
+                _logger.warning("Submodel Descriptor with id '%s' not found.", submodel_identifier)
+                log_response(response, log_level=logging.DEBUG)
                 return False
 
             if response.status_code != STATUS_CODE_204:
@@ -134,7 +140,7 @@ class SubmodelRegistryImplementation(BaseModel):
                 return False
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return False
 
         return True
@@ -159,14 +165,14 @@ class SubmodelRegistryImplementation(BaseModel):
 
         try:
             response = self._session.get(url, params=params, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code != STATUS_CODE_200:
                 log_response(response)
                 return None
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return None
 
         content = response.content.decode("utf-8")
@@ -185,14 +191,14 @@ class SubmodelRegistryImplementation(BaseModel):
 
         try:
             response = self._session.post(url, json=request_body, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code != STATUS_CODE_201:
                 log_response(response)
                 return None
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return None
 
         content = response.content.decode("utf-8")
@@ -210,14 +216,14 @@ class SubmodelRegistryImplementation(BaseModel):
 
         try:
             response = self._session.delete(url, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code != STATUS_CODE_204:
                 log_response(response)
                 return False
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return False
 
         return True
@@ -234,14 +240,14 @@ class SubmodelRegistryImplementation(BaseModel):
 
         try:
             response = self._session.get(url, timeout=self._client.time_out)
-            _logger.debug(f"Call REST API url '{response.url}'")
+            _logger.debug("Call REST API url '%s'", response.url)
 
             if response.status_code != STATUS_CODE_200:
                 log_response(response)
                 return None
 
         except requests.exceptions.RequestException as e:
-            _logger.error(f"Error call REST API: {e}")
+            _logger.error("Error call REST API: %s", e)
             return None
 
         content = response.content.decode("utf-8")
@@ -0,0 +1,375 @@
+"""Load balancing and failover of requests across replicas of an AAS server."""
+
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass
+from enum import Enum
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.models import PreparedRequest, Response
+
+_logger = logging.getLogger(__name__)
+
+# methods that can be sent to another replica after a failure without changing the result
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+# status codes of replicas that are down or overloaded, other errors are answers of a healthy replica
+_FAILOVER_STATUS_CODES = frozenset({502, 503, 504})
+# consecutive failures after which a replica is ejected
+_MAX_FAILURES = 3
+# time in seconds an ejected replica is skipped unless an active health check succeeds earlier
+_EJECT_TIME = 30.0
+# weight of the last request in the moving average of the latency
+_LATENCY_WEIGHT = 0.3
+# number of recent GET response times the hedge delay is calculated from
+_LATENCY_WINDOW = 1000
+# minimum number of response times before requests are hedged
+_MIN_LATENCY_SAMPLES = 20
+# number of new response times after which the hedge delay is calculated again
+_HEDGE_DELAY_REFRESH = 32
+
+
+class LoadBalancing(Enum):
+    """Determines how requests are distributed across the replicas."""
+
+    round_robin = "RoundRobin"
+    least_outstanding = "LeastOutstanding"
+    latency = "Latency"
+
+    def __str__(self) -> str:
+        """String representation of the LoadBalancing enum."""
+        return self.value
+
+
+@dataclass
+class ReplicaState:
+    """Health and load of a replica.
+
+    :param base_url: Base URL of the replica
+    :param outstanding: Number of requests in progress
+    :param latency: Moving average of the response time in seconds, 0 if unknown
+    :param failures: Number of consecutive failed requests
+    :param ejected_until: Monotonic time until the replica is skipped, 0 if the replica is healthy
+    """
+
+    base_url: str
+    outstanding: int = 0
+    latency: float = 0.0
+    failures: int = 0
+    ejected_until: float = 0.0
+
+
+class LoadBalancer:
+    """Selects the replica for each request and keeps track of the health of the replicas.
+
+    Replicas are checked passively: after several consecutive connection errors or 502, 503 or 504 responses a
+    replica is ejected for some time. With active health checks, each replica is requested periodically in a
+    background thread and ejected or readmitted depending on the result. If all replicas are ejected, they are
+    tried anyway, starting with the one ejected first.
+
+    The response times of recent GET requests are kept to determine the delay after which GET requests are hedged
+    (see 'BalancingAdapter'). The number of hedged requests is limited to the 'hedge_budget' ratio of all GET requests.
+    """
+
+    def __init__(
+        self, base_urls: list[str], strategy: LoadBalancing = LoadBalancing.round_robin, hedge_percentile: float = 0.0, hedge_budget: float = 0.05
+    ):
+        """Initializes the load balancer with the given replicas.
+
+        :param base_urls: Base URLs of the replicas
+        :param strategy: Distribution of the requests, defaults to round robin
+        :param hedge_percentile: Percentile of the GET response times after which a GET request is hedged, 0 disables hedging
+        :param hedge_budget: Maximum ratio of hedged to all GET requests, defaults to 0.05
+        :raises ValueError: If no replica is given
+        """
+        if not base_urls:
+            raise ValueError("At least one replica is required for load balancing.")
+
+        self.strategy = strategy
+        self.hedge_percentile = hedge_percentile
+        self.hedge_budget = hedge_budget
+        self.hedged_requests = 0
+        self._lock = threading.Lock()
+        self._replicas = {base_url: ReplicaState(base_url) for base_url in base_urls}
+        self._counter = 0
+        self._stop = threading.Event()
+        self._health_thread: threading.Thread | None = None
+        self._latencies: deque[float] = deque(maxlen=_LATENCY_WINDOW)
+        self._new_latencies = 0
+        self._hedge_delay: float | None = None
+        self._get_requests = 0
+
+    @property
+    def replicas(self) -> list[ReplicaState]:
+        """Snapshot of the states of all replicas."""
+        with self._lock:
+            return [ReplicaState(**vars(replica)) for replica in self._replicas.values()]
+
+    def select(self, exclude: set[str] | None = None) -> str | None:
+        """Select the replica for the next request.
+
+        :param exclude: Base URLs of replicas not to select, e.g. the replicas that already failed for the request
+        :return: Base URL of the selected replica or None if all replicas are excluded
+        """
+        now = time.monotonic()
+        with self._lock:
+            candidates = [replica for replica in self._replicas.values() if replica.base_url not in (exclude or ())]
+            if not candidates:
+                return None
+
+            healthy = [replica for replica in candidates if replica.ejected_until <= now]
+            if not healthy:
+                return min(candidates, key=lambda replica: replica.ejected_until).base_url
+
+            # rotating the candidates spreads the requests among replicas with equal score
+            self._counter += 1
+            offset = self._counter % len(healthy)
+            healthy = healthy[offset:] + healthy[:offset]
+
+            if self.strategy == LoadBalancing.least_outstanding:
+                return min(healthy, key=lambda replica: replica.outstanding).base_url
+            if self.strategy == LoadBalancing.latency:
+                return min(healthy, key=lambda replica: replica.latency * (replica.outstanding + 1)).base_url
+
+            return healthy[0].base_url
+
+    def has_candidates(self, exclude: set[str]) -> bool:
+        """Whether replicas remain to fail over to.
+
+        :param exclude: Base URLs of the replicas that already failed
+        :return: True if at least one other replica exists
+        """
+        return any(base_url not in exclude for base_url in self._replicas)
+
+    def begin(self, base_url: str) -> None:
+        """Register a request sent to a replica.
+
+        :param base_url: Base URL of the replica
+        """
+        with self._lock:
+            self._replicas[base_url].outstanding += 1
+
+    def end(self, base_url: str, elapsed: float, *, success: bool, method: str = "") -> None:
+        """Register the result of a request sent to a replica.
+
+        :param base_url: Base URL of the replica
+        :param elapsed: Response time of the request in seconds
+        :param success: Whether the replica answered the request
+        :param method: HTTP method of the request, response times of GET requests determine the hedge delay
+        """
+        with self._lock:
+            replica = self._replicas[base_url]
+            replica.outstanding -= 1
+            if success:
+                replica.latency = elapsed if not replica.latency else (1 - _LATENCY_WEIGHT) * replica.latency + _LATENCY_WEIGHT * elapsed
+                if method == "GET":
+                    self._latencies.append(elapsed)
+                    self._new_latencies += 1
+            self._update_health(replica, success=success)
+
+    def get_hedge_delay(self) -> float | None:
+        """Register a GET request and get the time after which it is hedged.
+
+        :return: Delay in seconds or None if hedging is disabled or too few response times are known
+        """
+        if self.hedge_percentile <= 0:
+            return None
+
+        with self._lock:
+            self._get_requests += 1
+            if len(self._latencies) < _MIN_LATENCY_SAMPLES:
+                return None
+
+            if self._hedge_delay is None or self._new_latencies >= _HEDGE_DELAY_REFRESH:
+                ordered = sorted(self._latencies)
+                self._hedge_delay = ordered[min(int(len(ordered) * self.hedge_percentile / 100), len(ordered) - 1)]
+                self._new_latencies = 0
+
+            return self._hedge_delay
+
+    def acquire_hedge(self) -> bool:
+        """Reserve a hedged request within the hedge budget.
+
+        :return: True if the request may be hedged, False if the budget is exhausted
+        """
+        with self._lock:
+            if self.hedged_requests + 1 > self.hedge_budget * self._get_requests:
+                return False
+
+            self.hedged_requests += 1
+            return True
+
+    def report(self, base_url: str, *, success: bool) -> None:
+        """Register the result of a health check of a replica.
+
+        :param base_url: Base URL of the replica
+        :param success: Whether the replica is healthy
+        """
+        with self._lock:
+            replica = self._replicas[base_url]
+            if not success:
+                # a failed health check ejects the replica immediately
+                replica.failures = max(replica.failures, _MAX_FAILURES - 1)
+            self._update_health(replica, success=success)
+
+    def start_health_checks(self, interval: float, check: Callable[[str], bool]) -> None:
+        """Start checking the health of all replicas periodically in a background thread.
+
+        :param interval: Time in seconds between the checks
+        :param check: Function returning whether the replica with the given base URL is healthy
+        """
+        if self._health_thread is not None:
+            return
+
+        self._health_thread = threading.Thread(
+            target=self._run_health_checks, args=(interval, check), name="aas-http-client-health-check", daemon=True
+        )
+        self._health_thread.start()
+
+    def stop_health_checks(self) -> None:
+        """Stop the active health checks."""
+        self._stop.set()
+        if self._health_thread is not None and self._health_thread is not threading.current_thread():
+            self._health_thread.join(timeout=1)
+        self._health_thread = None
+
+    def _run_health_checks(self, interval: float, check: Callable[[str], bool]) -> None:
+        while not self._stop.wait(interval):
+            for base_url in list(self._replicas):
+                try:
+                    healthy = check(base_url)
+                except Exception as e:
+                    _logger.debug(f"Health check of '{base_url}' failed: {e}")
+                    healthy = False
+                self.report(base_url, success=healthy)
+
+    def _update_health(self, replica: ReplicaState, *, success: bool) -> None:
+        if success:
+            if replica.ejected_until:
+                _logger.info(f"Replica '{replica.base_url}' is healthy again.")
+            replica.failures = 0
+            replica.ejected_until = 0.0
+            return
+
+        replica.failures += 1
+        if replica.failures >= _MAX_FAILURES:
+            if not replica.ejected_until:
+                _logger.warning(f"Replica '{replica.base_url}' ejected after {replica.failures} consecutive failures.")
+            replica.ejected_until = time.monotonic() + _EJECT_TIME
+
+
+class BalancingAdapter(HTTPAdapter):
+    """Transport adapter sending the requests for a base URL to the replica selected by the load balancer.
+
+    Idempotent requests (GET, HEAD, OPTIONS, PUT, DELETE) with a replayable body are repeated on another replica
+    if the connection fails or the replica answers with 502, 503 or 504.
+
+    If hedging is enabled, GET requests that are not answered within the configured percentile of recent response
+    times are sent a second time, to another replica if available, and the first answer is used. The response of
+    the other request is closed when it arrives, as requests in progress cannot be aborted.
+    """
+
+    def __init__(self, balancer: LoadBalancer, base_url: str):
+        """Initializes the adapter.
+
+        :param balancer: Load balancer selecting the replicas
+        :param base_url: Base URL the adapter is mounted for, replaced by the base URL of the selected replica
+        """
+        super().__init__()
+        self._balancer = balancer
+        self._base_url = base_url
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:  # type: ignore[override]
+        """Send the request to a replica, failing over to other replicas for idempotent requests.
+
+        :param request: Prepared request addressed to the base URL
+        :return: Response of the replica
+        """
+        path = str(request.url)[len(self._base_url) :]
+        hedge_delay = self._balancer.get_hedge_delay() if request.method == "GET" else None
+        if hedge_delay is None:
+            return self._send(request, path, set(), kwargs)
+
+        hedge_request = request.copy()
+        tried: set[str] = set()
+        primary = _run_in_thread(self._send, request, path, tried, kwargs)
+        if wait([primary], timeout=hedge_delay).done or not self._balancer.acquire_hedge():
+            return primary.result()
+
+        # the hedged request avoids the replica of the first request if others are available
+        _logger.debug(f"Request not answered within {hedge_delay:.3f} seconds, hedging.")
+        pending = {primary, _run_in_thread(self._send, hedge_request, path, set(tried), kwargs)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    for other in pending:
+                        other.add_done_callback(_close_response)
+                    return future.result()
+
+        return primary.result()
+
+    def _send(self, request: PreparedRequest, path: str, tried: set[str], kwargs: dict) -> Response:
+        """Send the request to a replica, failing over to other replicas for idempotent requests.
+
+        :param request: Prepared request
+        :param path: Path of the request following the base URL
+        :param tried: Base URLs of the replicas not to select, the selected replicas are added
+        :param kwargs: Arguments of the transport adapter (e.g. timeout)
+        :return: Response of the replica
+        """
+        can_fail_over = request.method in _IDEMPOTENT_METHODS and (request.body is None or isinstance(request.body, (bytes, str)))
+
+        while True:
+            base_url = self._balancer.select(tried) or next(iter(tried), self._base_url)
+            tried.add(base_url)
+            request.url = f"{base_url}{path}"
+
+            self._balancer.begin(base_url)
+            started = time.monotonic()
+            try:
+                response = super().send(request, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                self._balancer.end(base_url, time.monotonic() - started, success=False)
+                if not can_fail_over or not self._balancer.has_candidates(tried):
+                    raise
+                _logger.debug(f"Request to replica '{base_url}' failed, failing over.")
+                continue
+
+            failed = response.status_code in _FAILOVER_STATUS_CODES
+            self._balancer.end(base_url, time.monotonic() - started, success=not failed, method=str(request.method))
+            if failed and can_fail_over and self._balancer.has_candidates(tried):
+                _logger.debug(f"Replica '{base_url}' answered with status code {response.status_code}, failing over.")
+                response.close()
+                continue
+
+            return response
+
+
+def _run_in_thread(function: Callable, *args) -> Future:
+    """Call a function in a new daemon thread.
+
+    A thread per call avoids that hedged requests queue behind each other in a thread pool.
+
+    :param function: Function to call
+    :return: Future of the result of the function
+    """
+    future: Future = Future()
+
+    def run() -> None:
+        try:
+            future.set_result(function(*args))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name="aas-http-client-hedge", daemon=True).start()
+    return future
+
+
+def _close_response(future: Future) -> None:
+    if future.exception() is None:
+        future.result().close()
@@ -0,0 +1,226 @@
+"""Bulk import of AAS environments and AASX packages."""
+
+import io
+import logging
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path, PurePosixPath
+
+from basyx.aas import model
+from basyx.aas.adapter import aasx
+from basyx.aas.adapter.json import read_aas_json_file
+
+from aas_http_client.classes.client.aas_client import AasHttpClient
+from aas_http_client.utilities.concurrency import run_concurrently
+from aas_http_client.utilities.encoder import encode_base_64
+from aas_http_client.utilities.sdk_tools import convert_to_dict as _to_dict
+from aas_http_client.utilities.sdk_tools import iter_submodel_elements
+
+_logger = logging.getLogger(__name__)
+
+
+class ImportStatus(Enum):
+    """Result status of an imported object."""
+
+    created = "created"
+    updated = "updated"
+    failed = "failed"
+    skipped = "skipped"
+
+    def __str__(self) -> str:
+        """String representation of the ImportStatus enum."""
+        return self.value
+
+
+@dataclass(frozen=True)
+class ImportResult:
+    """Represents the import result of a single object."""
+
+    identifier: str
+    kind: str
+    status: ImportStatus
+    id_short_path: str | None = None
+
+
+@dataclass
+class ImportReport:
+    """Represents the results of a bulk import."""
+
+    results: list[ImportResult] = field(default_factory=list)
+
+    @property
+    def succeeded(self) -> list[ImportResult]:
+        """Results of all objects that were created or updated."""
+        return [result for result in self.results if result.status in (ImportStatus.created, ImportStatus.updated)]
+
+    @property
+    def failed(self) -> list[ImportResult]:
+        """Results of all objects that could not be imported."""
+        return [result for result in self.results if result.status in (ImportStatus.failed, ImportStatus.skipped)]
+
+    @property
+    def success(self) -> bool:
+        """Whether all objects were imported."""
+        return not self.failed
+
+
+@dataclass(frozen=True)
+class _AttachmentTask:
+    submodel_id: str
+    id_short_path: str
+    file_name: str
+    content: bytes
+    content_type: str
+
+
+class BulkImporter:
+    """Uploads the content of AAS environments and AASX packages to a server.
+
+    Submodels are uploaded first, followed by the shells and the attachments of File elements.
+    Within each phase the uploads run concurrently with up to 'MaxWorkers' parallel requests.
+    """
+
+    def __init__(self, client: AasHttpClient, *, upsert: bool = True, max_workers: int | None = None):
+        """Initializes the importer with the given client.
+
+        :param client: Initialized AAS HTTP client
+        :param upsert: If enabled, objects that already exist on the server are replaced, defaults to True
+        :param max_workers: Maximum number of concurrent uploads, defaults to the 'MaxWorkers' setting of the client
+        """
+        self._client = client
+        self.upsert = upsert
+        self.max_workers = max_workers or client.max_workers
+
+    def import_file(self, file: Path) -> ImportReport:
+        """Imports a JSON environment file or an AASX package.
+
+        :param file: Path to a '.json' or '.aasx' file
+        :return: Import report with one result per object
+        :raises ValueError: If the file type is not supported
+        """
+        if file.exists() is False or not file.is_file():
+            raise ValueError(f"Import file '{file}' does not exist.")
+
+        suffix = file.suffix.lower()
+
+        if suffix == ".json":
+            with file.open("r", encoding="utf-8-sig") as f:
+                return self.import_object_store(read_aas_json_file(f))
+
+        if suffix == ".aasx":
+            object_store = model.DictObjectStore()
+            file_store = aasx.DictSupplementaryFileContainer()
+            with aasx.AASXReader(file) as reader:
+                reader.read_into(object_store, file_store)
+            return self.import_object_store(object_store, file_store)
+
+        raise ValueError(f"File type '{file.suffix}' is not supported. Use '.json' or '.aasx' files.")
+
+    def import_object_store(
+        self, object_store: model.AbstractObjectStore, file_store: aasx.AbstractSupplementaryFileContainer | None = None
+    ) -> ImportReport:
+        """Imports all shells and submodels of an object store.
+
+        :param object_store: Object store containing the shells and submodels to import
+        :param file_store: Supplementary files of an AASX package, uploaded as attachments of the referencing File elements
+        :return: Import report with one result per object
+        """
+        if not self._client.shells or not self._client.submodels or not self._client.experimental:
+            raise ValueError("Client is not initialized. Call 'initialize()' method of the client before importing.")
+
+        shells = [item for item in object_store if isinstance(item, model.AssetAdministrationShell)]
+        submodels = [item for item in object_store if isinstance(item, model.Submodel)]
+        _logger.info(f"Import {len(shells)} shells and {len(submodels)} submodels.")
+
+        report = ImportReport()
+        report.results.extend(run_concurrently(self._import_submodel, submodels, self.max_workers))
+
+        uploaded = {result.identifier for result in report.succeeded}
+        attachments: list[_AttachmentTask] = []
+        for submodel in submodels:
+            for task in _collect_attachments(submodel, file_store):
+                if submodel.id in uploaded:
+                    attachments.append(task)
+                else:
+                    report.results.append(ImportResult(task.submodel_id, "Attachment", ImportStatus.skipped, task.id_short_path))
+
+        # shells and attachments only depend on the submodels
+        tasks: list[model.AssetAdministrationShell | _AttachmentTask] = [*shells, *attachments]
+        report.results.extend(run_concurrently(self._import_task, tasks, self.max_workers))
+
+        if not report.success:
+            _logger.warning(f"{len(report.failed)} of {len(report.results)} objects could not be imported.")
+
+        return report
+
+    def _import_task(self, task: model.AssetAdministrationShell | _AttachmentTask) -> ImportResult:
+        if isinstance(task, _AttachmentTask):
+            return self._import_attachment(task)
+
+        return self._import_shell(task)
+
+    def _import_submodel(self, submodel: model.Submodel) -> ImportResult:
+        api = self._client.submodels
+        request_body = _to_dict(submodel)
+
+        if api is None or request_body is None:
+            return ImportResult(submodel.id, "Submodel", ImportStatus.failed)
+
+        if api.post_submodel(request_body) is not None:
+            return ImportResult(submodel.id, "Submodel", ImportStatus.created)
+
+        if self.upsert and api.put_submodels_by_id(self._identifier(submodel.id), request_body):
+            return ImportResult(submodel.id, "Submodel", ImportStatus.updated)
+
+        return ImportResult(submodel.id, "Submodel", ImportStatus.failed)
+
+    def _import_shell(self, shell: model.AssetAdministrationShell) -> ImportResult:
+        api = self._client.shells
+        request_body = _to_dict(shell)
+
+        if api is None or request_body is None:
+            return ImportResult(shell.id, "AssetAdministrationShell", ImportStatus.failed)
+
+        if api.post_asset_administration_shell(request_body) is not None:
+            return ImportResult(shell.id, "AssetAdministrationShell", ImportStatus.created)
+
+        if self.upsert and api.put_asset_administration_shell_by_id(self._identifier(shell.id), request_body):
+            return ImportResult(shell.id, "AssetAdministrationShell", ImportStatus.updated)
+
+        return ImportResult(shell.id, "AssetAdministrationShell", ImportStatus.failed)
+
+    def _import_attachment(self, task: _AttachmentTask) -> ImportResult:
+        api = self._client.experimental
+
+        if api is not None and api.put_file_by_path_submodel_repo_stream(
+            self._identifier(task.submodel_id), task.id_short_path, task.file_name, task.content, task.content_type
+        ):
+            return ImportResult(task.submodel_id, "Attachment", ImportStatus.updated, task.id_short_path)
+
+        return ImportResult(task.submodel_id, "Attachment", ImportStatus.failed, task.id_short_path)
+
+    def _identifier(self, identifier: str) -> str:
+        return encode_base_64(identifier) if self._client.encoded_ids else identifier
+
+
+def _collect_attachments(submodel: model.Submodel, file_store: aasx.AbstractSupplementaryFileContainer | None) -> list[_AttachmentTask]:
+    """Collect the supplementary files referenced by File elements of the given submodel.
+
+    :param submodel: Submodel to search for File elements
+    :param file_store: Supplementary files of an AASX package
+    :return: Attachment uploads of the submodel
+    """
+    if file_store is None:
+        return []
+
+    tasks = []
+    for path, element in iter_submodel_elements(submodel):
+        if not isinstance(element, model.File) or not element.value or element.value not in file_store:
+            continue
+
+        stream = io.BytesIO()
+        file_store.write_file(element.value, stream)
+        content_type = file_store.get_content_type(element.value) or element.content_type or "application/octet-stream"
+        tasks.append(_AttachmentTask(submodel.id, path, PurePosixPath(element.value).name, stream.getvalue(), content_type))
+
+    return tasks
@@ -0,0 +1,181 @@
+"""Minimal delta updates of submodels based on Merkle hash trees."""
+
+import logging
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+from aas_http_client.classes.client.aas_client import AasHttpClient
+from aas_http_client.classes.client.implementations import SubmodelRepoImplementation
+from aas_http_client.utilities.encoder import encode_base_64
+from aas_http_client.utilities.hashing import CHILD_KEYS, HashTree, create_hash_tree
+from aas_http_client.utilities.id_short_path import create_value_only_body, iter_element_data, split_value_only_batch
+
+_logger = logging.getLogger(__name__)
+
+
+class DeltaKind(Enum):
+    """Kind of a delta operation."""
+
+    replace_submodel = "replace_submodel"
+    put_element = "put_element"
+    post_element = "post_element"
+    delete_element = "delete_element"
+    patch_value = "patch_value"
+
+    def __str__(self) -> str:
+        """String representation of the DeltaKind enum."""
+        return self.value
+
+
+@dataclass(frozen=True)
+class DeltaOperation:
+    """Represents a single API call of a delta update.
+
+    :param kind: Kind of the operation
+    :param path: IdShort path of the element, of the parent element for 'post_element' and "" for the submodel
+    :param body: Request body (element data, value or submodel data)
+    """
+
+    kind: DeltaKind
+    path: str
+    body: Any = None
+
+
+def plan_delta(local: dict, remote: HashTree, local_tree: HashTree | None = None) -> list[DeltaOperation]:
+    """Determine the API calls required to update the remote submodel to the local submodel data.
+
+    Changed Property values are patched, other changed elements are replaced, added and removed elements of
+    collections are posted and deleted. Changes of the submodel itself or of the order of list items replace
+    the submodel or the list.
+
+    :param local: Local submodel data
+    :param remote: Hash tree of the remote submodel
+    :param local_tree: Hash tree of the local submodel data, calculated if not given
+    :return: List of operations, empty if both submodels are equal
+    """
+    local_tree = local_tree or create_hash_tree(local)
+
+    if local_tree.root == remote.root:
+        return []
+
+    if local_tree.metadata[""] != remote.metadata.get(""):
+        return [DeltaOperation(DeltaKind.replace_submodel, "", local)]
+
+    elements = dict(iter_element_data(local.get("submodelElements") or []))
+    planner = _Planner(elements, local_tree, remote)
+    planner.diff_children("", is_list=False)
+    return planner.operations
+
+
+class _Planner:
+    def __init__(self, elements: dict[str, dict], local: HashTree, remote: HashTree):
+        self.elements = elements
+        self.local = local
+        self.remote = remote
+        self.local_children = local.get_children()
+        self.remote_children = remote.get_children()
+        self.operations: list[DeltaOperation] = []
+
+    def diff_children(self, path: str, *, is_list: bool) -> None:
+        local_children = self.local_children.get(path, [])
+        remote_children = self.remote_children.get(path, [])
+
+        if is_list:
+            if local_children != remote_children:
+                self.operations.append(DeltaOperation(DeltaKind.put_element, path, self.elements[path]))
+                return
+        else:
+            local_set = set(local_children)
+            for child in remote_children:
+                if child not in local_set:
+                    self.operations.append(DeltaOperation(DeltaKind.delete_element, child))
+
+            remote_set = set(remote_children)
+            for child in local_children:
+                if child not in remote_set:
+                    self.operations.append(DeltaOperation(DeltaKind.post_element, path, self.elements[child]))
+
+        for child in local_children:
+            if child in self.remote.hashes and self.local.hashes[child] != self.remote.hashes[child]:
+                self.diff_element(child)
+
+    def diff_element(self, path: str) -> None:
+        element = self.elements[path]
+        model_type = element.get("modelType", "")
+
+        # the value of a container itself (e.g. the globalAssetId of an Entity) can only be changed by replacing it
+        if self.local.metadata[path] != self.remote.metadata.get(path) or (
+            model_type in CHILD_KEYS and self.local.values[path] != self.remote.values.get(path)
+        ):
+            self.operations.append(DeltaOperation(DeltaKind.put_element, path, element))
+            return
+
+        if model_type not in CHILD_KEYS:
+            if model_type == "Property" and isinstance(element.get("value"), str):
+                self.operations.append(DeltaOperation(DeltaKind.patch_value, path, element["value"]))
+            else:
+                self.operations.append(DeltaOperation(DeltaKind.put_element, path, element))
+            return
+
+        count = len(self.operations)
+        self.diff_children(path, is_list=model_type == "SubmodelElementList")
+
+        # only the order of the children changed
+        if len(self.operations) == count:
+            self.operations.append(DeltaOperation(DeltaKind.put_element, path, element))
+
+
+def apply_delta(
+    client: AasHttpClient,
+    submodel_identifier: str,
+    operations: list[DeltaOperation],
+    *,
+    batch_values: bool = True,
+    container_types: dict[str, str] | None = None,
+) -> bool:
+    """Execute the operations of a delta update.
+
+    :param client: Initialized AAS HTTP client
+    :param submodel_identifier: The Submodels unique id (decoded)
+    :param operations: Operations created by 'plan_delta'
+    :param batch_values: If enabled, multiple value changes are sent in a single value-only PATCH of the submodel, defaults to True
+    :param container_types: Model types of the container elements of the local submodel (see 'get_container_types'),
+        only values of elements below SubmodelElementCollections of known type are batched
+    :return: True if all operations were successful, False otherwise
+    """
+    api = client.submodels
+    if api is None:
+        _logger.error("Submodel API is not initialized in the client. Call 'initialize()' method of the client before calling this method.")
+        return False
+
+    identifier = encode_base_64(submodel_identifier) if client.encoded_ids else submodel_identifier
+
+    values = {operation.path: operation.body for operation in operations if operation.kind == DeltaKind.patch_value}
+    batch, _ = split_value_only_batch(values, container_types or {})
+    if batch_values and len(batch) > 1:
+        if not api.patch_submodel_by_id_value_only(identifier, create_value_only_body(batch)):
+            return False
+        operations = [operation for operation in operations if operation.kind != DeltaKind.patch_value or operation.path not in batch]
+
+    for operation in operations:
+        if not _apply_operation(api, identifier, operation):
+            _logger.warning(f"Delta operation '{operation.kind}' on path '{operation.path}' of submodel '{submodel_identifier}' failed.")
+            return False
+
+    return True
+
+
+def _apply_operation(api: SubmodelRepoImplementation, identifier: str, operation: DeltaOperation) -> bool:
+    if operation.kind == DeltaKind.replace_submodel:
+        return api.put_submodels_by_id(identifier, operation.body)
+    if operation.kind == DeltaKind.put_element:
+        return api.put_submodel_element_by_path_submodel_repo(identifier, operation.path, operation.body)
+    if operation.kind == DeltaKind.delete_element:
+        return api.delete_submodel_element_by_path_submodel_repo(identifier, operation.path)
+    if operation.kind == DeltaKind.patch_value:
+        return api.patch_submodel_element_by_path_value_only_submodel_repo(identifier, operation.path, operation.body)
+    if operation.path:
+        return api.post_submodel_element_by_path_submodel_repo(identifier, operation.path, operation.body) is not None
+
+    return api.post_submodel_element_submodel_repo(identifier, operation.body) is not None
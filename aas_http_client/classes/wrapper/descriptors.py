@@ -0,0 +1,226 @@
+"""Lightweight classes of the shell and submodel descriptors of the AAS registry API.
+
+The Python SDK has no descriptor classes, so descriptors are parsed into these slotted classes. Only the fields
+needed to locate and filter shells and submodels are typed, nested structures (e.g. references, descriptions) are
+kept as the received JSON data. Strings repeated in every descriptor (interfaces, protocols) are interned.
+"""
+
+import sys
+from dataclasses import dataclass
+
+_EMPTY: tuple = ()
+
+
+@dataclass(frozen=True, slots=True)
+class DescriptorEndpoint:
+    """Endpoint of a shell or submodel descriptor.
+
+    :param interface: Interface of the endpoint (e.g. 'SUBMODEL-3.0')
+    :param href: Address of the shell or submodel
+    :param endpoint_protocol: Protocol of the endpoint (e.g. 'HTTP')
+    :param endpoint_protocol_version: Versions of the protocol
+    :param subprotocol: Subprotocol of the endpoint
+    :param subprotocol_body: Body of the subprotocol
+    :param subprotocol_body_encoding: Encoding of the subprotocol body
+    :param security_attributes: Security attributes data of the endpoint
+    """
+
+    interface: str
+    href: str
+    endpoint_protocol: str | None = None
+    endpoint_protocol_version: tuple[str, ...] = _EMPTY
+    subprotocol: str | None = None
+    subprotocol_body: str | None = None
+    subprotocol_body_encoding: str | None = None
+    security_attributes: tuple[dict, ...] = _EMPTY
+
+    def to_dict(self) -> dict:
+        """Serialize the endpoint to the data of the registry API.
+
+        :return: Endpoint data
+        """
+        information: dict = {"href": self.href}
+        _set(information, "endpointProtocol", self.endpoint_protocol)
+        _set(information, "endpointProtocolVersion", list(self.endpoint_protocol_version))
+        _set(information, "subprotocol", self.subprotocol)
+        _set(information, "subprotocolBody", self.subprotocol_body)
+        _set(information, "subprotocolBodyEncoding", self.subprotocol_body_encoding)
+        _set(information, "securityAttributes", list(self.security_attributes))
+        return {"interface": self.interface, "protocolInformation": information}
+
+
+@dataclass(frozen=True, slots=True)
+class SubmodelDescriptor:
+    """Descriptor of a submodel.
+
+    :param id: Unique id of the submodel
+    :param endpoints: Endpoints of the submodel
+    :param id_short: IdShort of the submodel
+    :param semantic_id: SemanticId data of the submodel
+    :param supplemental_semantic_id: Supplemental semanticIds data of the submodel
+    :param description: Description data of the submodel
+    :param display_name: Display name data of the submodel
+    :param administration: Administrative information data of the submodel
+    :param extensions: Extensions data of the submodel
+    """
+
+    id: str
+    endpoints: tuple[DescriptorEndpoint, ...] = _EMPTY
+    id_short: str | None = None
+    semantic_id: dict | None = None
+    supplemental_semantic_id: tuple[dict, ...] = _EMPTY
+    description: tuple[dict, ...] = _EMPTY
+    display_name: tuple[dict, ...] = _EMPTY
+    administration: dict | None = None
+    extensions: tuple[dict, ...] = _EMPTY
+
+    @property
+    def semantic_id_value(self) -> str | None:
+        """Value of the last key of the semanticId or None if the submodel has no semanticId."""
+        keys = (self.semantic_id or {}).get("keys") or []
+        return keys[-1].get("value") if keys else None
+
+    def to_dict(self) -> dict:
+        """Serialize the descriptor to the data of the registry API.
+
+        :return: Submodel Descriptor data
+        """
+        data: dict = {"id": self.id, "endpoints": [endpoint.to_dict() for endpoint in self.endpoints]}
+        _set(data, "idShort", self.id_short)
+        _set(data, "semanticId", self.semantic_id)
+        _set(data, "supplementalSemanticId", list(self.supplemental_semantic_id))
+        _set(data, "description", list(self.description))
+        _set(data, "displayName", list(self.display_name))
+        _set(data, "administration", self.administration)
+        _set(data, "extensions", list(self.extensions))
+        return data
+
+
+@dataclass(frozen=True, slots=True)
+class ShellDescriptor:
+    """Descriptor of an Asset Administration Shell.
+
+    :param id: Unique id of the shell
+    :param endpoints: Endpoints of the shell
+    :param id_short: IdShort of the shell
+    :param global_asset_id: Global id of the asset
+    :param asset_kind: Kind of the asset (e.g. 'Instance')
+    :param asset_type: Type of the asset
+    :param specific_asset_ids: Specific asset ids data
+    :param submodel_descriptors: Descriptors of the submodels of the shell
+    :param description: Description data of the shell
+    :param display_name: Display name data of the shell
+    :param administration: Administrative information data of the shell
+    :param extensions: Extensions data of the shell
+    """
+
+    id: str
+    endpoints: tuple[DescriptorEndpoint, ...] = _EMPTY
+    id_short: str | None = None
+    global_asset_id: str | None = None
+    asset_kind: str | None = None
+    asset_type: str | None = None
+    specific_asset_ids: tuple[dict, ...] = _EMPTY
+    submodel_descriptors: tuple[SubmodelDescriptor, ...] = _EMPTY
+    description: tuple[dict, ...] = _EMPTY
+    display_name: tuple[dict, ...] = _EMPTY
+    administration: dict | None = None
+    extensions: tuple[dict, ...] = _EMPTY
+
+    def get_submodel_descriptor(self, submodel_identifier: str) -> SubmodelDescriptor | None:
+        """Get the descriptor of a submodel of the shell.
+
+        :param submodel_identifier: The Submodels unique id (decoded)
+        :return: Submodel Descriptor or None if the shell has no such submodel
+        """
+        return next((descriptor for descriptor in self.submodel_descriptors if descriptor.id == submodel_identifier), None)
+
+    def to_dict(self) -> dict:
+        """Serialize the descriptor to the data of the registry API.
+
+        :return: Asset Administration Shell Descriptor data
+        """
+        data: dict = {"id": self.id, "endpoints": [endpoint.to_dict() for endpoint in self.endpoints]}
+        _set(data, "idShort", self.id_short)
+        _set(data, "globalAssetId", self.global_asset_id)
+        _set(data, "assetKind", self.asset_kind)
+        _set(data, "assetType", self.asset_type)
+        _set(data, "specificAssetIds", list(self.specific_asset_ids))
+        _set(data, "submodelDescriptors", [descriptor.to_dict() for descriptor in self.submodel_descriptors])
+        _set(data, "description", list(self.description))
+        _set(data, "displayName", list(self.display_name))
+        _set(data, "administration", self.administration)
+        _set(data, "extensions", list(self.extensions))
+        return data
+
+
+def parse_endpoint(data: dict) -> DescriptorEndpoint:
+    """Create an endpoint from the data of the registry API.
+
+    :param data: Endpoint data
+    :return: Endpoint
+    """
+    information = data.get("protocolInformation") or {}
+    protocol = information.get("endpointProtocol")
+    return DescriptorEndpoint(
+        interface=sys.intern(data.get("interface") or ""),
+        href=information.get("href") or "",
+        endpoint_protocol=sys.intern(protocol) if protocol else None,
+        endpoint_protocol_version=tuple(sys.intern(version) for version in information.get("endpointProtocolVersion") or _EMPTY),
+        subprotocol=information.get("subprotocol"),
+        subprotocol_body=information.get("subprotocolBody"),
+        subprotocol_body_encoding=information.get("subprotocolBodyEncoding"),
+        security_attributes=tuple(information.get("securityAttributes") or _EMPTY),
+    )
+
+
+def parse_submodel_descriptor(data: dict) -> SubmodelDescriptor:
+    """Create a submodel descriptor from the data of the registry API.
+
+    :param data: Submodel Descriptor data
+    :return: Submodel Descriptor
+    :raises KeyError: If the data has no id
+    """
+    get = data.get
+    return SubmodelDescriptor(
+        id=data["id"],
+        endpoints=tuple(parse_endpoint(endpoint) for endpoint in get("endpoints") or _EMPTY),
+        id_short=get("idShort"),
+        semantic_id=get("semanticId"),
+        supplemental_semantic_id=tuple(get("supplementalSemanticId") or _EMPTY),
+        description=tuple(get("description") or _EMPTY),
+        display_name=tuple(get("displayName") or _EMPTY),
+        administration=get("administration"),
+        extensions=tuple(get("extensions") or _EMPTY),
+    )
+
+
+def parse_shell_descriptor(data: dict) -> ShellDescriptor:
+    """Create a shell descriptor from the data of the registry API.
+
+    :param data: Asset Administration Shell Descriptor data
+    :return: Asset Administration Shell Descriptor
+    :raises KeyError: If the data of the shell or one of its submodels has no id
+    """
+    get = data.get
+    asset_kind = get("assetKind")
+    return ShellDescriptor(
+        id=data["id"],
+        endpoints=tuple(parse_endpoint(endpoint) for endpoint in get("endpoints") or _EMPTY),
+        id_short=get("idShort"),
+        global_asset_id=get("globalAssetId"),
+        asset_kind=sys.intern(asset_kind) if asset_kind else None,
+        asset_type=get("assetType"),
+        specific_asset_ids=tuple(get("specificAssetIds") or _EMPTY),
+        submodel_descriptors=tuple(parse_submodel_descriptor(descriptor) for descriptor in get("submodelDescriptors") or _EMPTY),
+        description=tuple(get("description") or _EMPTY),
+        display_name=tuple(get("displayName") or _EMPTY),
+        administration=get("administration"),
+        extensions=tuple(get("extensions") or _EMPTY),
+    )
+
+
+def _set(data: dict, key: str, value: object) -> None:
+    # optional fields are omitted instead of serialized as null or empty list
+    if value:
+        data[key] = value
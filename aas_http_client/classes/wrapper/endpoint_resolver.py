@@ -0,0 +1,361 @@
+"""Resolution of shell and submodel endpoints via the registry, with cached descriptors and pooled clients."""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Self
+
+from aas_http_client.classes.client.aas_client import AasHttpClient, ClientSpec, create_by_spec
+from aas_http_client.utilities.encoder import encode_base_64
+from aas_http_client.utilities.http_helper import STATUS_CODE_500
+
+_logger = logging.getLogger(__name__)
+
+# path segments of the AAS API following the base URL of a repository
+_API_SEGMENTS = ("/shells/", "/submodels/")
+
+# maximum number of descriptors and failed lookups kept per cache
+DEFAULT_MAX_CACHED_DESCRIPTORS = 10000
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    """Repository endpoint of a shell or submodel, resolved from its descriptor.
+
+    :param base_url: Base URL of the repository (e.g. 'https://repo.example.com/api/v3.0')
+    :param href: Address of the shell or submodel as given in the descriptor
+    :param interface: Interface of the endpoint (e.g. 'SUBMODEL-3.0')
+    """
+
+    base_url: str
+    href: str
+    interface: str
+
+
+class _TtlCache:
+    """Thread-safe cache whose entries expire after a time to live, None values are cached as misses.
+
+    Expired entries are removed when they are read or when the cache is full, the least recently used entries
+    are removed if the cache is still full.
+    """
+
+    def __init__(self, ttl: float, negative_ttl: float, max_size: int = DEFAULT_MAX_CACHED_DESCRIPTORS):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Any) -> tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            if entry[0] < time.monotonic():
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+            return True, entry[1]
+
+    def put(self, key: Any, value: Any) -> None:
+        ttl = self.ttl if value is not None else self.negative_ttl
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                now = time.monotonic()
+                for expired in [cached for cached, (expires, _) in self._entries.items() if expires < now]:
+                    del self._entries[expired]
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Any) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class EndpointResolver:
+    """Resolves where shells and submodels are served and routes requests to the matching repository.
+
+    Shell and submodel descriptors are fetched from the registry of the given client and kept for 'ttl' seconds,
+    failed lookups (e.g. unknown ids) for 'negative_ttl' seconds. Submodel endpoints are taken from the submodel
+    descriptors contained in the shell descriptor, so resolving all submodels of a shell costs one registry request
+    per 'ttl'. One client is kept per repository and shared by all requests routed to it. If a resolved repository
+    can not be reached or answers with a server error, the descriptor is fetched again and the request is repeated
+    once if the endpoint changed. Other errors (e.g. 404 for an id unknown to the repository) are returned as they are.
+    """
+
+    def __init__(
+        self,
+        registry_client: AasHttpClient,
+        ttl: float = 60.0,
+        negative_ttl: float = 5.0,
+        client_factory: Callable[[str], AasHttpClient | None] | None = None,
+        max_cached_descriptors: int = DEFAULT_MAX_CACHED_DESCRIPTORS,
+    ):
+        """Initializes the resolver with the client of the registry.
+
+        :param registry_client: Initialized AAS HTTP client of the shell and submodel registry
+        :param ttl: Time in seconds a descriptor is kept, defaults to 60.0
+        :param negative_ttl: Time in seconds a failed lookup is kept, defaults to 5.0
+        :param client_factory: Function creating the client for a repository base URL, defaults to the settings and credentials of the registry client
+        :param max_cached_descriptors: Maximum number of shell and of submodel descriptors kept, defaults to 10000
+        """
+        if not registry_client.shell_registry:
+            raise ValueError("Client is not initialized. Call 'initialize()' method of the client before resolving endpoints.")
+
+        self._registry = registry_client
+        self._client_factory = client_factory or self._create_client
+        self.registry_requests = 0
+
+        self._shell_descriptors = _TtlCache(ttl, negative_ttl, max_cached_descriptors)
+        self._submodel_descriptors = _TtlCache(ttl, negative_ttl, max_cached_descriptors)
+        self._lock = threading.Lock()
+        self._clients: dict[str, AasHttpClient] = {}
+        # status code of the last response received by the repository clients in the current thread
+        self._last_status = threading.local()
+
+    def __enter__(self) -> Self:
+        """Enter the context of the resolver."""
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Close all repository clients."""
+        self.close()
+
+    def get_shell_descriptor(self, aas_identifier: str) -> dict | None:
+        """Returns the descriptor of a shell, from the cache if possible.
+
+        :param aas_identifier: The Asset Administration Shells unique id (decoded)
+        :return: Asset Administration Shell Descriptor data or None if the shell is not registered or the registry failed
+        """
+        found, descriptor = self._shell_descriptors.get(aas_identifier)
+        if found:
+            return descriptor
+
+        registry = self._registry.shell_registry
+        descriptor = None
+        if registry is not None:
+            with self._lock:
+                self.registry_requests += 1
+            descriptor = registry.get_asset_administration_shell_descriptor_by_id(self._encode(self._registry, aas_identifier))
+
+        self._shell_descriptors.put(aas_identifier, descriptor)
+        return descriptor
+
+    def get_submodel_descriptor(self, aas_identifier: str | None, submodel_identifier: str) -> dict | None:
+        """Returns the descriptor of a submodel, from the cache if possible.
+
+        The descriptor is taken from the shell descriptor if the shell is given and lists the submodel,
+        otherwise it is fetched from the submodel registry.
+
+        :param aas_identifier: The Asset Administration Shells unique id (decoded) or None if the shell is unknown
+        :param submodel_identifier: The Submodels unique id (decoded)
+        :return: Submodel Descriptor data or None if the submodel is not registered or the registry failed
+        """
+        if aas_identifier is not None:
+            shell_descriptor = self.get_shell_descriptor(aas_identifier) or {}
+            for descriptor in shell_descriptor.get("submodelDescriptors") or []:
+                if descriptor.get("id") == submodel_identifier:
+                    return descriptor
+
+        found, descriptor = self._submodel_descriptors.get(submodel_identifier)
+        if found:
+            return descriptor
+
+        registry = self._registry.submodel_registry
+        descriptor = None
+        if registry is not None:
+            with self._lock:
+                self.registry_requests += 1
+            descriptor = registry.get_submodel_descriptor_by_id(self._encode(self._registry, submodel_identifier))
+
+        self._submodel_descriptors.put(submodel_identifier, descriptor)
+        return descriptor
+
+    def resolve_shell(self, aas_identifier: str) -> Endpoint | None:
+        """Resolve the repository endpoint of a shell.
+
+        :param aas_identifier: The Asset Administration Shells unique id (decoded)
+        :return: Endpoint or None if the shell could not be resolved
+        """
+        return _select_endpoint(self.get_shell_descriptor(aas_identifier), "AAS")
+
+    def resolve_submodel(self, aas_identifier: str | None, submodel_identifier: str) -> Endpoint | None:
+        """Resolve the repository endpoint of a submodel.
+
+        :param aas_identifier: The Asset Administration Shells unique id (decoded) or None if the shell is unknown
+        :param submodel_identifier: The Submodels unique id (decoded)
+        :return: Endpoint or None if the submodel could not be resolved
+        """
+        return _select_endpoint(self.get_submodel_descriptor(aas_identifier, submodel_identifier), "SUBMODEL")
+
+    def get_client(self, base_url: str) -> AasHttpClient | None:
+        """Returns the client of a repository, creating it on first use.
+
+        :param base_url: Base URL of the repository
+        :return: Initialized client or None if the client could not be created
+        """
+        with self._lock:
+            client = self._clients.get(base_url)
+            if client is not None:
+                return client
+
+        client = self._client_factory(base_url)
+        if client is None:
+            return None
+
+        with self._lock:
+            # another thread may have created a client meanwhile
+            existing = self._clients.setdefault(base_url, client)
+
+        if existing is not client:
+            client.close()
+        elif (session := client.get_session()) is not None:
+            session.hooks["response"].append(self._record_status)
+
+        return existing
+
+    def get_asset_administration_shell_by_id(self, aas_identifier: str) -> dict | None:
+        """Returns a specific Asset Administration Shell from the repository it is registered for.
+
+        :param aas_identifier: The Asset Administration Shells unique id (decoded)
+        :return: Asset Administration Shells data or None if an error occurred
+        """
+
+        def get(client: AasHttpClient) -> dict | None:
+            return client.shells.get_asset_administration_shell_by_id(self._encode(client, aas_identifier)) if client.shells else None
+
+        return self._route(lambda: self.resolve_shell(aas_identifier), lambda: self._shell_descriptors.pop(aas_identifier), get)
+
+    def get_submodel_by_id(self, aas_identifier: str | None, submodel_identifier: str, level: str = "", extent: str = "") -> dict | None:
+        """Returns a specific Submodel from the repository it is registered for.
+
+        :param aas_identifier: The Asset Administration Shells unique id (decoded) or None if the shell is unknown
+        :param submodel_identifier: The Submodels unique id (decoded)
+        :param level: Determines the structural depth of the respective resource content. Available values : deep, core
+        :param extent: Determines to which extent the resource is being serialized. Available values : withBlobValue, withoutBlobValue
+        :return: Submodel data or None if an error occurred
+        """
+
+        def get(client: AasHttpClient) -> dict | None:
+            identifier = self._encode(client, submodel_identifier)
+            return client.submodels.get_submodel_by_id(identifier, level, extent) if client.submodels else None
+
+        def invalidate() -> None:
+            self._submodel_descriptors.pop(submodel_identifier)
+            if aas_identifier is not None:
+                self._shell_descriptors.pop(aas_identifier)
+
+        return self._route(lambda: self.resolve_submodel(aas_identifier, submodel_identifier), invalidate, get)
+
+    def invalidate(self) -> None:
+        """Discard all cached descriptors and failed lookups."""
+        self._shell_descriptors.clear()
+        self._submodel_descriptors.clear()
+
+    def close(self) -> None:
+        """Close the clients of all repositories."""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+
+        for client in clients:
+            client.close()
+
+    def _route(
+        self,
+        resolve: Callable[[], Endpoint | None],
+        invalidate: Callable[[], None],
+        request: Callable[[AasHttpClient], dict | None],
+    ) -> dict | None:
+        """Send a request to the resolved repository, resolving the endpoint again if the request fails.
+
+        :param resolve: Function resolving the endpoint
+        :param invalidate: Function discarding the cached descriptors of the endpoint
+        :param request: Function sending the request with the client of the repository
+        :return: Response data or None if an error occurred
+        """
+        endpoint = resolve()
+        client = self.get_client(endpoint.base_url) if endpoint is not None else None
+        if endpoint is None or client is None:
+            return None
+
+        self._last_status.value = None
+        result = request(client)
+        if result is not None:
+            return result
+
+        # the repository answered, so the endpoint is still valid (e.g. 404 for an id the repository does not know)
+        status = self._last_status.value
+        if status is not None and status < STATUS_CODE_500:
+            return None
+
+        invalidate()
+        retry_endpoint = resolve()
+        if retry_endpoint is None or retry_endpoint.base_url == endpoint.base_url:
+            return None
+
+        _logger.info(f"Endpoint moved from '{endpoint.base_url}' to '{retry_endpoint.base_url}', repeating the request.")
+        client = self.get_client(retry_endpoint.base_url)
+        return request(client) if client is not None else None
+
+    def _record_status(self, response: Any, *args, **kwargs) -> None:  # noqa: ARG002
+        self._last_status.value = response.status_code
+
+    def _create_client(self, base_url: str) -> AasHttpClient | None:
+        """Create a client for a repository with the settings and credentials of the registry client.
+
+        :param base_url: Base URL of the repository
+        :return: Initialized client
+        """
+        spec = self._registry.to_spec()
+        # the token and the replicas of the registry are not passed on, as they are not valid for the repository
+        return create_by_spec(ClientSpec(configuration={**spec.configuration, "BaseUrl": base_url, "BaseUrls": []}, secrets=spec.secrets))
+
+    @staticmethod
+    def _encode(client: AasHttpClient, identifier: str) -> str:
+        return encode_base_64(identifier) if client.encoded_ids else identifier
+
+
+def _select_endpoint(descriptor: dict | None, interface_prefix: str) -> Endpoint | None:
+    """Select the endpoint of a descriptor, preferring endpoints with the given interface.
+
+    :param descriptor: Shell or submodel descriptor data
+    :param interface_prefix: Prefix of the preferred interface (e.g. 'SUBMODEL' for 'SUBMODEL-3.0')
+    :return: Endpoint or None if the descriptor has no endpoint with an address
+    """
+    if descriptor is None:
+        return None
+
+    endpoints = [endpoint for endpoint in descriptor.get("endpoints") or [] if (endpoint.get("protocolInformation") or {}).get("href")]
+    endpoints.sort(key=lambda endpoint: not str(endpoint.get("interface", "")).startswith(interface_prefix))
+    if not endpoints:
+        _logger.warning(f"Descriptor '{descriptor.get('id')}' has no endpoint.")
+        return None
+
+    href = endpoints[0]["protocolInformation"]["href"]
+    return Endpoint(base_url=repository_base_url(href), href=href, interface=endpoints[0].get("interface", ""))
+
+
+def repository_base_url(href: str) -> str:
+    """Get the base URL of the repository from the address of a shell or submodel.
+
+    :param href: Address of the shell or submodel (e.g. 'https://repo.example.com/api/submodels/<encoded id>')
+    :return: Base URL of the repository (e.g. 'https://repo.example.com/api')
+    """
+    positions = [position for segment in _API_SEGMENTS if (position := href.find(segment)) >= 0]
+    if not positions:
+        return href.rstrip("/")
+
+    return href[: min(positions)]
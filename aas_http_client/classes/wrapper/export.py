@@ -0,0 +1,295 @@
+"""Streaming export of AAS repositories to NDJSON files and AASX packages."""
+
+import base64
+import hashlib
+import io
+import json
+import logging
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from basyx.aas import model
+from basyx.aas.adapter import aasx
+
+from aas_http_client.classes.client.aas_client import AasHttpClient
+from aas_http_client.classes.wrapper.pagination import iter_pages
+from aas_http_client.utilities.checkpoint import Checkpoint
+from aas_http_client.utilities.concurrency import iter_prefetched, run_concurrently
+from aas_http_client.utilities.encoder import encode_base_64
+from aas_http_client.utilities.id_short_path import iter_file_elements
+from aas_http_client.utilities.sdk_tools import convert_to_object as _to_object
+from aas_http_client.utilities.sdk_tools import iter_submodel_elements
+
+_logger = logging.getLogger(__name__)
+
+
+class ExportCollection(Enum):
+    """Collections of a repository or registry that can be exported."""
+
+    shells = "AssetAdministrationShell"
+    submodels = "Submodel"
+    shell_descriptors = "AssetAdministrationShellDescriptor"
+    submodel_descriptors = "SubmodelDescriptor"
+
+    def __str__(self) -> str:
+        """String representation of the ExportCollection enum."""
+        return self.value
+
+
+@dataclass
+class ExportSummary:
+    """Represents the result of an export."""
+
+    counts: dict[str, int] = field(default_factory=dict)
+    complete: bool = True
+
+
+@dataclass(frozen=True)
+class _Attachment:
+    id_short_path: str
+    content: bytes
+    content_type: str
+    file_name: str
+
+
+class RepositoryExporter:
+    """Exports the content of an AAS repository page by page.
+
+    Only one page (and the attachments of one submodel) is held in memory. The next page is fetched
+    while the current one is written, attachments are fetched with up to 'MaxWorkers' parallel requests.
+    """
+
+    def __init__(
+        self,
+        client: AasHttpClient,
+        collections: list[ExportCollection] | None = None,
+        page_size: int = 100,
+        *,
+        include_attachments: bool = False,
+        max_workers: int | None = None,
+    ):
+        """Initializes the exporter with the given client.
+
+        :param client: Initialized AAS HTTP client
+        :param collections: Collections to export, defaults to shells and submodels
+        :param page_size: Number of objects requested per page, defaults to 100
+        :param include_attachments: If enabled, the files of File elements are exported too, defaults to False
+        :param max_workers: Maximum number of concurrent attachment downloads, defaults to the 'MaxWorkers' setting of the client
+        """
+        self._client = client
+        self.collections = collections or [ExportCollection.shells, ExportCollection.submodels]
+        self.page_size = page_size
+        self.include_attachments = include_attachments
+        self.max_workers = max_workers or client.max_workers
+
+    def export_ndjson(self, file: Path, checkpoint_file: Path | None = None) -> ExportSummary:
+        """Exports the repository to a newline-delimited JSON file with one record per line.
+
+        Each record contains the object type ('kind') and the object data ('data').
+        Attachments are written as records of kind 'Attachment' with base64-encoded content.
+
+        :param file: Path to the NDJSON file
+        :param checkpoint_file: Path to a checkpoint file. If it exists, the export is resumed from the checkpoint.
+            The file is removed after a complete export.
+        :return: Summary of the export
+        """
+        checkpoint = Checkpoint.load(checkpoint_file) if checkpoint_file else None
+
+        if checkpoint is not None and file.exists():
+            _logger.info(f"Resume export to '{file}' at collection '{checkpoint.collection}' (offset {checkpoint.offset}).")
+            stream = file.open("r+b")
+            stream.truncate(checkpoint.offset)
+            stream.seek(checkpoint.offset)
+        else:
+            checkpoint = Checkpoint()
+            stream = file.open("wb")
+
+        summary = ExportSummary()
+
+        with stream:
+            for collection in self.collections:
+                cursor = checkpoint.start(str(collection))
+                if cursor is None:
+                    continue
+
+                for page, next_cursor in self._iter_pages(collection, cursor):
+                    if page is None:
+                        summary.complete = False
+                        return summary
+
+                    self._write_ndjson_page(stream, collection, page, summary)
+
+                    checkpoint.advance(next_cursor, stream.tell())
+                    if checkpoint_file:
+                        checkpoint.save(checkpoint_file)
+
+        if checkpoint_file:
+            checkpoint_file.unlink(missing_ok=True)
+
+        return summary
+
+    def _write_ndjson_page(self, stream: BinaryIO, collection: ExportCollection, page: list[dict], summary: ExportSummary) -> None:
+        """Write the objects of a page (and their attachments) as NDJSON records.
+
+        :param stream: Binary stream of the NDJSON file
+        :param collection: Collection of the page
+        :param page: Objects of the page
+        :param summary: Summary to count the written records in
+        """
+
+        def write(kind: str, data: dict) -> None:
+            stream.write(json.dumps({"kind": kind, "data": data}, separators=(",", ":")).encode("utf-8") + b"\n")
+            summary.counts[kind] = summary.counts.get(kind, 0) + 1
+
+        for item in page:
+            write(str(collection), item)
+            if collection == ExportCollection.submodels and self.include_attachments:
+                for attachment in self._get_attachments(item):
+                    write("Attachment", _attachment_record(item, attachment))
+
+        stream.flush()
+
+    def export_aasx(self, file: Path | BinaryIO) -> ExportSummary:
+        """Exports the shells and submodels of the repository into an AASX package.
+
+        Each object is written into its own part of the package, attachments are added as supplementary files.
+        Descriptors can not be stored in AASX packages and are skipped.
+
+        :param file: Path or binary stream of the AASX package
+        :return: Summary of the export
+        """
+        summary = ExportSummary()
+        # the files of one object are held in the store until the object is written
+        file_store = aasx.DictSupplementaryFileContainer()
+        part_names: set[str] = set()
+
+        with aasx.AASXWriter(file) as writer:
+            for collection in self.collections:
+                if collection not in (ExportCollection.shells, ExportCollection.submodels):
+                    _logger.warning(f"Collection '{collection}' can not be exported into an AASX package.")
+                    continue
+
+                for page, _ in self._iter_pages(collection, ""):
+                    if page is None:
+                        summary.complete = False
+                        return summary
+
+                    for item in page:
+                        identifiable = _to_object(item)
+                        if not isinstance(identifiable, (model.AssetAdministrationShell, model.Submodel)):
+                            summary.complete = False
+                            continue
+
+                        if isinstance(identifiable, model.Submodel) and self.include_attachments:
+                            summary.complete &= self._add_attachments(identifiable, item, file_store, part_names)
+
+                        index = summary.counts.get(str(collection), 0)
+                        part_name = f"/aasx/data/{collection.name}_{index:06d}.json"
+                        writer.write_all_aas_objects(part_name, model.DictObjectStore([identifiable]), file_store, write_json=True)
+                        summary.counts[str(collection)] = index + 1
+
+                        for name in list(file_store):
+                            file_store.delete_file(name)
+
+        return summary
+
+    def _add_attachments(self, submodel: model.Submodel, data: dict, file_store: aasx.DictSupplementaryFileContainer, part_names: set[str]) -> bool:
+        """Download the files of the File elements of a submodel and add them to the file store of the package.
+
+        :param submodel: Submodel object whose File elements are pointed to the added files
+        :param data: Submodel data
+        :param file_store: File store of the AASX package
+        :param part_names: Names of the supplementary files already added to the package
+        :return: True if all downloaded files were added, False otherwise
+        """
+        added = [_add_supplementary_file(submodel, attachment, file_store, part_names) for attachment in self._get_attachments(data)]
+        return all(added)
+
+    def _iter_pages(self, collection: ExportCollection, cursor: str) -> Iterator[tuple[list[dict] | None, str]]:
+        """Iterate over the pages of a collection while prefetching the next page.
+
+        :param collection: Collection to iterate over
+        :param cursor: Cursor of the first page
+        :return: Iterator of the page results (None if a page could not be retrieved) and the cursor of the next page
+        """
+        return iter_prefetched(iter_pages(self._get_fetch_function(collection), cursor))
+
+    def _get_fetch_function(self, collection: ExportCollection) -> Callable[[str], dict | None]:
+        client = self._client
+
+        if collection == ExportCollection.shells and client.shells:
+            return lambda cursor: client.shells.get_all_asset_administration_shells(limit=self.page_size, cursor=cursor)  # type: ignore[union-attr]
+        if collection == ExportCollection.submodels and client.submodels:
+            return lambda cursor: client.submodels.get_all_submodels(limit=self.page_size, cursor=cursor)  # type: ignore[union-attr]
+        if collection == ExportCollection.shell_descriptors and client.shell_registry:
+            return lambda cursor: client.shell_registry.get_all_asset_administration_shell_descriptors(limit=self.page_size, cursor=cursor)  # type: ignore[union-attr]
+        if collection == ExportCollection.submodel_descriptors and client.submodel_registry:
+            return lambda cursor: client.submodel_registry.get_all_submodel_descriptors(limit=self.page_size, cursor=cursor)  # type: ignore[union-attr]
+
+        raise ValueError(f"API for collection '{collection}' is not initialized. Call 'initialize()' method of the client before exporting.")
+
+    def _get_attachments(self, submodel: dict) -> list[_Attachment]:
+        """Download the files of all File elements of a submodel.
+
+        :param submodel: Submodel data
+        :return: Downloaded attachments
+        """
+        api = self._client.experimental
+        files = list(iter_file_elements(submodel))
+        if api is None or not files:
+            return []
+
+        identifier = encode_base_64(submodel["id"]) if self._client.encoded_ids else submodel["id"]
+
+        def download(item: tuple[str, dict]) -> _Attachment | None:
+            path, element = item
+            content = api.get_file_by_path_submodel_repo(identifier, path)
+            if content is None:
+                return None
+
+            file_name = Path(str(element.get("value") or path)).name
+            return _Attachment(path, content, element.get("contentType") or "application/octet-stream", file_name)
+
+        return [attachment for attachment in run_concurrently(download, files, self.max_workers) if attachment is not None]
+
+
+def _attachment_record(submodel: dict, attachment: _Attachment) -> dict[str, Any]:
+    return {
+        "submodelId": submodel["id"],
+        "idShortPath": attachment.id_short_path,
+        "contentType": attachment.content_type,
+        "fileName": attachment.file_name,
+        "content": base64.b64encode(attachment.content).decode("ascii"),
+    }
+
+
+def _add_supplementary_file(
+    submodel: model.Submodel, attachment: _Attachment, file_store: aasx.DictSupplementaryFileContainer, part_names: set[str]
+) -> bool:
+    """Add an attachment to the file store and point the File element of the submodel to it.
+
+    Files of the same name in different File elements are stored in different folders of the package, named by
+    a hash of the submodel id and the idShort path.
+
+    :param submodel: Submodel containing the File element
+    :param attachment: Downloaded attachment
+    :param file_store: File store of the AASX package
+    :param part_names: Names of the supplementary files already added to the package, extended by the new name
+    :return: True if the file was added, False if its name is already used by another file of the package
+    """
+    digest = hashlib.sha256(f"{submodel.id}\0{attachment.id_short_path}".encode()).hexdigest()[:16]
+    name = f"/aasx/files/{digest}/{attachment.file_name}"
+    if name in part_names:
+        _logger.error(f"Attachment '{attachment.id_short_path}' of submodel '{submodel.id}' conflicts with the file '{name}' and is not exported.")
+        return False
+
+    for path, element in iter_submodel_elements(submodel):
+        if path == attachment.id_short_path and isinstance(element, model.File):
+            element.value = file_store.add_file(name, io.BytesIO(attachment.content), attachment.content_type)
+            part_names.add(element.value)
+            break
+
+    return True
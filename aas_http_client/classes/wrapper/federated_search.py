@@ -0,0 +1,156 @@
+"""Search for shell descriptors in several registries at once."""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from aas_http_client.classes.client.aas_client import AasHttpClient
+from aas_http_client.classes.wrapper.descriptors import ShellDescriptor, parse_shell_descriptor
+
+_logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FederatedSearchResult:
+    """Represents the merged results of a federated search.
+
+    :param results: Found descriptors in the order they were received, descriptors found in several registries are contained once
+    :param failed: Base URLs of the registries whose search failed
+    :param unfinished: Base URLs of the registries not searched to the last page due to the deadline or the limit
+    """
+
+    results: list[ShellDescriptor] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)
+    unfinished: list[str] = field(default_factory=list)
+
+    @property
+    def complete(self) -> bool:
+        """Whether all registries were searched successfully to the last page."""
+        return not self.failed and not self.unfinished
+
+
+class _SearchState:
+    """Results and progress of a search shared between the registry workers."""
+
+    def __init__(self, base_urls: list[str], limit: int):
+        self.limit = limit
+        self.lock = threading.Lock()
+        # set when the search is finished, i.e. all registries were searched or the limit was reached
+        self.done = threading.Event()
+        self.results: dict[str, ShellDescriptor] = {}
+        self.failed: list[str] = []
+        self.running = set(base_urls)
+
+    def add(self, hits: list[dict]) -> None:
+        with self.lock:
+            for hit in hits:
+                identifier = hit.get("id") if isinstance(hit, dict) else None
+                if identifier is None or identifier in self.results:
+                    continue
+                try:
+                    self.results[identifier] = parse_shell_descriptor(hit)
+                except (AttributeError, KeyError, TypeError):
+                    _logger.warning(f"Skipping invalid shell descriptor '{identifier}'.")
+
+            if self.limit and len(self.results) >= self.limit:
+                self.done.set()
+
+    def finish(self, base_url: str, *, failed: bool) -> None:
+        with self.lock:
+            self.running.discard(base_url)
+            if failed:
+                self.failed.append(base_url)
+            if not self.running:
+                self.done.set()
+
+
+class FederatedSearch:
+    """Searches shell descriptors in several registries concurrently and merges the results.
+
+    The query is sent to the '/search' endpoint of every registry in parallel, each registry is paged through
+    with the 'page' parameter of the search request until it returns a page with fewer hits than the page size
+    or all of its 'total' hits were read. The search returns as soon as all registries are finished, 'limit'
+    descriptors were found or the 'timeout' is exceeded, so its duration is that of the slowest registry.
+    Requests still running when the search returns are not waited for and their results are discarded.
+    """
+
+    def __init__(self, registry_clients: list[AasHttpClient], page_size: int = 100):
+        """Initializes the search with the clients of the registries.
+
+        :param registry_clients: Initialized AAS HTTP clients of the shell registries
+        :param page_size: Number of descriptors requested per page, defaults to 100
+        """
+        if any(not client.shell_registry for client in registry_clients):
+            raise ValueError("Client is not initialized. Call 'initialize()' method of the client before searching.")
+
+        self._clients = list(registry_clients)
+        self.page_size = page_size
+
+    def search(self, query: dict | None = None, sort_by: dict | None = None, limit: int = 0, timeout: float = 0.0) -> FederatedSearchResult:
+        """Search all registries for shell descriptors matching the query.
+
+        :param query: Query of the search request (e.g. {'path': 'idShort', 'value': 'motor', 'queryType': 'match'}), all descriptors if None
+        :param sort_by: Sorting of the search request, applied per registry
+        :param limit: Maximum number of descriptors to find, 0 for all
+        :param timeout: Time in seconds after which the search returns the results found so far, 0 for no deadline
+        :return: Merged search result
+        """
+        if not self._clients:
+            return FederatedSearchResult()
+
+        base_urls = [client.base_url for client in self._clients]
+        state = _SearchState(base_urls, limit)
+
+        executor = ThreadPoolExecutor(max_workers=len(self._clients), thread_name_prefix="aas-http-client-search")
+        try:
+            for client in self._clients:
+                executor.submit(self._search_registry, client, query, sort_by, state)
+
+            if not state.done.wait(timeout if timeout > 0 else None):
+                _logger.warning(f"Search deadline of {timeout} seconds exceeded, returning the results found so far.")
+        finally:
+            # stops requesting further pages, requests in progress finish in the background
+            state.done.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        with state.lock:
+            results = list(state.results.values())
+            return FederatedSearchResult(
+                results=results[:limit] if limit else results,
+                failed=list(state.failed),
+                unfinished=[base_url for base_url in base_urls if base_url in state.running],
+            )
+
+    def _search_registry(self, client: AasHttpClient, query: dict | None, sort_by: dict | None, state: _SearchState) -> None:
+        """Page through the search results of one registry.
+
+        :param client: Client of the registry
+        :param query: Query of the search request
+        :param sort_by: Sorting of the search request
+        :param state: Shared state of the search
+        """
+        registry = client.shell_registry
+        index = 0
+
+        while not state.done.is_set():
+            body: dict = {"page": {"index": index, "size": self.page_size}}
+            if query:
+                body["query"] = query
+            if sort_by:
+                body["sortBy"] = sort_by
+
+            content = registry.search(body) if registry else None
+            if content is None:
+                _logger.error(f"Search in registry '{client.base_url}' failed.")
+                state.finish(client.base_url, failed=True)
+                return
+
+            hits = content.get("hits") or []
+            state.add(hits)
+
+            index += 1
+            total = content.get("total")
+            if len(hits) < self.page_size or (total is not None and index * self.page_size >= total):
+                state.finish(client.base_url, failed=False)
+                return
@@ -0,0 +1,212 @@
+"""Blob elements whose value is fetched from the server on first access."""
+
+import base64
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from functools import partial
+from typing import cast
+
+from basyx.aas import model
+
+from aas_http_client.classes.client.aas_client import AasHttpClient
+from aas_http_client.utilities.encoder import encode_base_64
+
+_logger = logging.getLogger(__name__)
+
+
+class BlobCache:
+    """Thread-safe LRU cache of fetched Blob values, bounded by the total size of the values in bytes."""
+
+    def __init__(self, max_size: int):
+        """Initializes an empty cache.
+
+        :param max_size: Maximum total size of the cached values in bytes, larger values are not cached
+        """
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._values: OrderedDict[tuple[str, str], bytes] = OrderedDict()
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Number of cached values."""
+        return len(self._values)
+
+    @property
+    def size(self) -> int:
+        """Total size of the cached values in bytes."""
+        return self._size
+
+    def get(self, submodel_identifier: str, id_short_path: str) -> bytes | None:
+        """Get a cached value and mark it as recently used.
+
+        :param submodel_identifier: The Submodels unique id (decoded)
+        :param id_short_path: IdShort path of the Blob element
+        :return: Cached value or None if the value is not cached
+        """
+        key = (submodel_identifier, id_short_path)
+        with self._lock:
+            value = self._values.get(key)
+            if value is not None:
+                self._values.move_to_end(key)
+            return value
+
+    def put(self, submodel_identifier: str, id_short_path: str, value: bytes) -> None:
+        """Cache a value, removing the least recently used values if the cache is full.
+
+        :param submodel_identifier: The Submodels unique id (decoded)
+        :param id_short_path: IdShort path of the Blob element
+        :param value: Value of the Blob element
+        """
+        if len(value) > self.max_size:
+            return
+
+        key = (submodel_identifier, id_short_path)
+        with self._lock:
+            previous = self._values.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+
+            self._values[key] = value
+            self._size += len(value)
+
+            while self._size > self.max_size:
+                _, removed = self._values.popitem(last=False)
+                self._size -= len(removed)
+
+    def invalidate(self, submodel_identifier: str) -> None:
+        """Remove all cached values of a submodel.
+
+        :param submodel_identifier: The Submodels unique id (decoded)
+        """
+        with self._lock:
+            for key in [key for key in self._values if key[0] == submodel_identifier]:
+                self._size -= len(self._values.pop(key))
+
+    def clear(self) -> None:
+        """Remove all cached values."""
+        with self._lock:
+            self._values.clear()
+            self._size = 0
+
+
+class LazyBlob(model.Blob):
+    """Blob whose value is fetched from the server when it is read for the first time.
+
+    Instances are created from Blobs received without value by 'make_lazy'. Assigning a value replaces the
+    value without a request. Serializing the element reads the value, so sending a submodel fetches all values that
+    were not read yet and the Blobs are not emptied on the server.
+    """
+
+    _loader: Callable[[], bytes | None] | None
+    _blob_value: bytes | None
+    _lock: threading.Lock
+
+    @property
+    def value(self) -> bytes | None:  # type: ignore[override]
+        """Value of the Blob, fetched from the server on first access.
+
+        :raises RuntimeError: If the value could not be fetched, the next access fetches it again
+        """
+        with self._lock:
+            if self._loader is not None:
+                self._blob_value = self._loader()
+                self._loader = None
+            return self._blob_value
+
+    @value.setter
+    def value(self, value: bytes | None) -> None:
+        with self._lock:
+            self._loader = None
+            self._blob_value = value
+
+    def set_loader(self, loader: Callable[[], bytes | None]) -> None:
+        """Fetch the value with the given function on next access, discarding the current value.
+
+        :param loader: Function returning the value of the Blob, raises RuntimeError if the value could not be fetched
+        """
+        if "_lock" not in vars(self):
+            self._lock = threading.Lock()
+
+        with self._lock:
+            self._loader = loader
+            self._blob_value = None
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the value was fetched or assigned."""
+        return self._loader is None
+
+
+def make_lazy(blob: model.Blob, loader: Callable[[], bytes | None]) -> LazyBlob:
+    """Convert a Blob received without value into a LazyBlob.
+
+    The Blob is converted in place, so it keeps its parent and its position in the submodel.
+
+    :param blob: Blob element without value
+    :param loader: Function returning the value of the Blob, raises RuntimeError if the value could not be fetched
+    :return: The converted Blob
+    """
+    value = vars(blob).pop("value", None)
+    blob.__class__ = LazyBlob
+    lazy = cast("LazyBlob", blob)
+    lazy.set_loader(loader)
+    if value is not None:
+        lazy.value = value
+    return lazy
+
+
+def make_lazy_blobs(
+    client: AasHttpClient,
+    submodel_identifier: str,
+    elements: Iterable[tuple[str, model.SubmodelElement]],
+    cache: BlobCache | None = None,
+) -> int:
+    """Convert all Blobs without value into LazyBlobs fetching their value from the given submodel.
+
+    :param client: Initialized AAS HTTP client
+    :param submodel_identifier: The Submodels unique id (decoded)
+    :param elements: Tuples of the IdShort path and the submodel element, e.g. from 'iter_submodel_elements'
+    :param cache: Cache for fetched values, values are not cached if not set
+    :return: Number of converted Blobs
+    """
+    count = 0
+    for id_short_path, element in elements:
+        if isinstance(element, model.Blob) and not isinstance(element, LazyBlob) and element.value is None:
+            make_lazy(element, partial(fetch_blob_value, client, submodel_identifier, id_short_path, cache))
+            count += 1
+
+    return count
+
+
+def fetch_blob_value(client: AasHttpClient, submodel_identifier: str, id_short_path: str, cache: BlobCache | None = None) -> bytes | None:
+    """Fetch the value of a Blob element.
+
+    :param client: Initialized AAS HTTP client
+    :param submodel_identifier: The Submodels unique id (decoded)
+    :param id_short_path: IdShort path of the Blob element
+    :param cache: Cache for fetched values, values are not cached if not set
+    :return: Value of the Blob or None if the Blob has no value
+    :raises RuntimeError: If the value could not be fetched
+    """
+    if cache is not None and (value := cache.get(submodel_identifier, id_short_path)) is not None:
+        return value
+
+    content = None
+    if client.submodels is not None:
+        identifier = encode_base_64(submodel_identifier) if client.encoded_ids else submodel_identifier
+        content = client.submodels.get_submodel_element_by_path_submodel_repo(identifier, id_short_path, extent="withBlobValue")
+
+    if content is None:
+        raise RuntimeError(f"Value of Blob '{id_short_path}' in submodel '{submodel_identifier}' could not be fetched.")
+
+    if not content.get("value"):
+        return None
+
+    value = base64.b64decode(content["value"])
+    if cache is not None:
+        cache.put(submodel_identifier, id_short_path, value)
+
+    _logger.debug(f"Fetched value of Blob '{id_short_path}' in submodel '{submodel_identifier}' ({len(value)} bytes).")
+    return value
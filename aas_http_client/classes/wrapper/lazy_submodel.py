@@ -0,0 +1,258 @@
+"""Lazily loaded view of large submodels, expanding elements level by level on demand."""
+
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from aas_http_client.classes.client.aas_client import AasHttpClient
+from aas_http_client.utilities.concurrency import run_concurrently
+from aas_http_client.utilities.encoder import encode_base_64
+from aas_http_client.utilities.hashing import CHILD_KEYS
+from aas_http_client.utilities.id_short_path import child_path, parent_path, split_path
+
+_logger = logging.getLogger(__name__)
+
+_SUBMODEL_CHILD_KEY = "submodelElements"
+
+
+class SubmodelNode:
+    """Node of a LazySubmodel, either the submodel itself or one of its submodel elements.
+
+    The data of a node does not contain its child elements, they are fetched when the children are traversed.
+    """
+
+    def __init__(self, view: "LazySubmodel", id_short_path: str, data: dict):
+        """Initializes the node.
+
+        :param view: View the node belongs to
+        :param id_short_path: IdShort path of the element, "" for the submodel
+        :param data: Submodel or submodel element data without child elements
+        """
+        self._view = view
+        self.id_short_path = id_short_path
+        self.data = data
+
+    def __repr__(self) -> str:
+        """String representation of the SubmodelNode."""
+        return f"SubmodelNode({self.id_short_path!r}, {self.model_type})"
+
+    def __iter__(self) -> Iterator["SubmodelNode"]:
+        """Iterate over the child nodes, fetching them if necessary."""
+        return iter(self.children)
+
+    def __getitem__(self, key: str | int) -> "SubmodelNode":
+        """Get a child node by IdShort or, for SubmodelElementLists, by index."""
+        return self.child(key)
+
+    @property
+    def id_short(self) -> str | None:
+        """IdShort of the submodel or element."""
+        return self.data.get("idShort")
+
+    @property
+    def model_type(self) -> str:
+        """Model type of the submodel or element (e.g. 'SubmodelElementCollection')."""
+        return self.data.get("modelType", "")
+
+    @property
+    def value(self) -> Any:
+        """Value of the element, None for the submodel and elements with child elements."""
+        return self.data.get("value")
+
+    @property
+    def has_children(self) -> bool:
+        """Whether the node can contain child elements."""
+        return self.model_type == "Submodel" or self.model_type in CHILD_KEYS
+
+    @property
+    def children(self) -> list["SubmodelNode"]:
+        """Child nodes, fetched with one request on first access."""
+        if not self.has_children:
+            return []
+
+        return self._view.children(self.id_short_path)
+
+    def child(self, key: str | int) -> "SubmodelNode":
+        """Get a child node.
+
+        :param key: IdShort of the child element or index of the item of a SubmodelElementList
+        :return: Child node
+        :raises KeyError: If the node has no such child element
+        """
+        path = child_path(self.id_short_path, None, key, in_list=True) if isinstance(key, int) else child_path(self.id_short_path, key, 0)
+        for node in self.children:
+            if node.id_short_path == path:
+                return node
+
+        raise KeyError(path)
+
+
+class LazySubmodel:
+    """View of a submodel that fetches its elements level by level when they are traversed.
+
+    Expanding a node requests it with level 'core', so only its direct children are transferred, without their
+    descendants. Traversing a branch of a huge submodel therefore only fetches the elements along the branch and
+    their siblings. The children of at most 'max_expanded' nodes are kept (least recently used), evicted nodes
+    are fetched again when traversed. With 'prefetch_siblings', the following sibling elements with children
+    are expanded together with a node in parallel requests, as browsing often continues with the next element.
+    """
+
+    def __init__(self, client: AasHttpClient, submodel_identifier: str, max_expanded: int = 1000, prefetch_siblings: int = 0):
+        """Initializes the view, the submodel is fetched on first access.
+
+        :param client: Initialized AAS HTTP client
+        :param submodel_identifier: The Submodels unique id (decoded)
+        :param max_expanded: Maximum number of nodes whose children are kept, defaults to 1000
+        :param prefetch_siblings: Number of following sibling elements expanded together with a node, defaults to 0
+        """
+        if not client.submodels:
+            raise ValueError("Client is not initialized. Call 'initialize()' method of the client before loading submodels.")
+
+        self._client = client
+        self.submodel_identifier = submodel_identifier
+        self.max_expanded = max_expanded
+        self.prefetch_siblings = prefetch_siblings
+        self.request_count = 0
+
+        self._lock = threading.Lock()
+        self._root: SubmodelNode | None = None
+        self._expanded: OrderedDict[str, list[tuple[str, dict]]] = OrderedDict()
+
+    @property
+    def root(self) -> SubmodelNode:
+        """Node of the submodel, fetched on first access.
+
+        :raises RuntimeError: If the submodel could not be fetched
+        """
+        if self._root is None:
+            self._expand([""])
+
+        if self._root is None:
+            raise RuntimeError(f"Submodel '{self.submodel_identifier}' could not be fetched.")
+
+        return self._root
+
+    def get(self, id_short_path: str) -> SubmodelNode:
+        """Get the node of a submodel element, expanding all nodes along the path.
+
+        :param id_short_path: IdShort path of the submodel element (e.g. 'collection.list[2].property')
+        :return: Node of the submodel element
+        :raises KeyError: If the submodel contains no such element
+        """
+        node = self.root
+        for segment in split_path(id_short_path):
+            node = node.child(segment)
+
+        return node
+
+    def children(self, id_short_path: str) -> list[SubmodelNode]:
+        """Get the child nodes of the submodel or a submodel element, fetching them if they are not kept.
+
+        :param id_short_path: IdShort path of the submodel element, "" for the submodel
+        :return: Child nodes
+        :raises RuntimeError: If the element could not be fetched
+        """
+        with self._lock:
+            children = self._expanded.get(id_short_path)
+            if children is not None:
+                self._expanded.move_to_end(id_short_path)
+
+        if children is None:
+            children = self._expand(self._with_siblings(id_short_path)).get(id_short_path)
+
+        if children is None:
+            raise RuntimeError(f"Element '{id_short_path}' of submodel '{self.submodel_identifier}' could not be fetched.")
+
+        return [SubmodelNode(self, path, data) for path, data in children]
+
+    def prefetch(self, id_short_paths: Iterable[str]) -> None:
+        """Expand the given nodes with parallel requests, as a hint that they will be traversed soon.
+
+        :param id_short_paths: IdShort paths of the submodel elements, "" for the submodel
+        """
+        with self._lock:
+            paths = [path for path in dict.fromkeys(id_short_paths) if path not in self._expanded]
+
+        self._expand(paths)
+
+    def invalidate(self) -> None:
+        """Discard all fetched nodes, so they are fetched again when traversed."""
+        with self._lock:
+            self._root = None
+            self._expanded.clear()
+
+    def _with_siblings(self, id_short_path: str) -> list[str]:
+        """Get the path and the paths of the following siblings to prefetch.
+
+        :param id_short_path: IdShort path of the element to expand
+        :return: IdShort paths of the elements to expand
+        """
+        if self.prefetch_siblings <= 0 or not id_short_path:
+            return [id_short_path]
+
+        with self._lock:
+            siblings = self._expanded.get(parent_path(id_short_path)) or []
+            paths = [path for path, _ in siblings]
+            if id_short_path not in paths:
+                return [id_short_path]
+
+            following = siblings[paths.index(id_short_path) + 1 :]
+            prefetch = [path for path, data in following if data.get("modelType") in CHILD_KEYS and path not in self._expanded]
+
+        return [id_short_path, *prefetch[: self.prefetch_siblings]]
+
+    def _expand(self, id_short_paths: list[str]) -> dict[str, list[tuple[str, dict]]]:
+        """Fetch the given nodes with level 'core' and keep their children.
+
+        :param id_short_paths: IdShort paths of the elements, "" for the submodel
+        :return: Children of the fetched nodes, nodes that could not be fetched are missing
+        """
+        results = run_concurrently(self._fetch, id_short_paths, self._client.max_workers)
+
+        expanded: dict[str, list[tuple[str, dict]]] = {}
+        with self._lock:
+            self.request_count += len(id_short_paths)
+            for path, data in zip(id_short_paths, results, strict=True):
+                if data is None:
+                    continue
+
+                model_type = data.get("modelType", "")
+                key = _SUBMODEL_CHILD_KEY if not path else CHILD_KEYS.get(model_type)
+                if not path:
+                    self._root = SubmodelNode(self, "", _without_children(data))
+
+                children = data.get(key) if key else None
+                in_list = model_type == "SubmodelElementList"
+                expanded[path] = [
+                    (child_path(path, child.get("idShort"), index, in_list=in_list), _without_children(child))
+                    for index, child in enumerate(children or [])
+                ]
+                self._expanded[path] = expanded[path]
+                self._expanded.move_to_end(path)
+
+            while len(self._expanded) > self.max_expanded:
+                self._expanded.popitem(last=False)
+
+        _logger.debug(f"Expanded {len(expanded)} of {len(id_short_paths)} nodes of submodel '{self.submodel_identifier}'.")
+        return expanded
+
+    def _fetch(self, id_short_path: str) -> dict | None:
+        api = self._client.submodels
+        if api is None:
+            return None
+
+        identifier = encode_base_64(self.submodel_identifier) if self._client.encoded_ids else self.submodel_identifier
+        if not id_short_path:
+            return api.get_submodel_by_id(identifier, level="core")
+
+        return api.get_submodel_element_by_path_submodel_repo(identifier, id_short_path, level="core")
+
+
+def _without_children(data: dict) -> dict:
+    key = _SUBMODEL_CHILD_KEY if data.get("modelType") == "Submodel" else CHILD_KEYS.get(data.get("modelType", ""))
+    if key is None:
+        return data
+
+    return {name: value for name, value in data.items() if name != key}
@@ -0,0 +1,266 @@
+"""Asynchronous invocation of operations with status polling."""
+
+import logging
+import threading
+import time
+from collections.abc import Iterable
+from enum import Enum
+from functools import partial
+
+from aas_http_client.classes.client.aas_client import AasHttpClient
+from aas_http_client.utilities.concurrency import run_concurrently
+from aas_http_client.utilities.encoder import encode_base_64
+
+_logger = logging.getLogger(__name__)
+
+
+class ExecutionState(Enum):
+    """Execution state of an asynchronously invoked operation."""
+
+    initiated = "Initiated"
+    running = "Running"
+    completed = "Completed"
+    canceled = "Canceled"
+    failed = "Failed"
+    timeout = "Timeout"
+
+    def __str__(self) -> str:
+        """String representation of the ExecutionState enum."""
+        return self.value
+
+
+_FINAL_STATES = (ExecutionState.completed, ExecutionState.canceled, ExecutionState.failed, ExecutionState.timeout)
+
+# notified when a handle is canceled, wakes up waiting threads
+_canceled = threading.Condition()
+
+
+class OperationHandle:
+    """Handle of an asynchronously invoked operation.
+
+    The status is polled with an exponential backoff starting at 'poll_interval' seconds up to 'max_poll_interval'
+    seconds. Canceling a handle stops waiting for the operation on the client side, the operation itself is not
+    aborted on the server, as the AAS API provides no cancel request.
+    """
+
+    def __init__(
+        self,
+        client: AasHttpClient,
+        submodel_identifier: str,
+        id_short_path: str,
+        handle_id: str,
+        poll_interval: float = 0.5,
+        max_poll_interval: float = 10.0,
+    ):
+        """Initializes the handle of an invoked operation.
+
+        :param client: Initialized AAS HTTP client
+        :param submodel_identifier: The Submodels unique id (decoded)
+        :param id_short_path: IdShort path to the operation element (dot-separated)
+        :param handle_id: Handle id returned by the asynchronous invocation
+        :param poll_interval: Time in seconds until the first status request, defaults to 0.5
+        :param max_poll_interval: Maximum time in seconds between two status requests, defaults to 10.0
+        """
+        self._client = client
+        self.submodel_identifier = submodel_identifier
+        self.id_short_path = id_short_path
+        self.handle_id = handle_id
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+
+        self.state = ExecutionState.initiated
+        self.result: dict | None = None
+
+        self._lock = threading.Lock()
+        self._delay = poll_interval
+        self._next_poll = time.monotonic() + poll_interval
+
+    def __repr__(self) -> str:
+        """String representation of the OperationHandle."""
+        return f"OperationHandle({self.submodel_identifier!r}, {self.id_short_path!r}, {self.handle_id!r}, state={self.state})"
+
+    @property
+    def done(self) -> bool:
+        """Whether the operation reached a final state."""
+        return self.state in _FINAL_STATES
+
+    @property
+    def next_poll(self) -> float:
+        """Time (see 'time.monotonic') at which the status should be requested next."""
+        return self._next_poll
+
+    def poll(self) -> ExecutionState:
+        """Request the current status of the operation and, if it is finished, its result.
+
+        Each request doubles the time until the next poll, up to 'max_poll_interval' seconds.
+
+        :return: Execution state of the operation
+        """
+        if self.done:
+            return self.state
+
+        self._delay = min(self._delay * 2, self.max_poll_interval)
+        self._next_poll = time.monotonic() + self._delay
+
+        api = self._client.submodels
+        if api is None:
+            return self.state
+
+        identifier = encode_base_64(self.submodel_identifier) if self._client.encoded_ids else self.submodel_identifier
+        status = api.get_operation_async_status_submodel_repo(identifier, self.id_short_path, self.handle_id)
+        if status is None:
+            return self.state
+
+        try:
+            state = ExecutionState(status.get("executionState"))
+        except ValueError:
+            _logger.warning(f"Operation '{self.id_short_path}' returned unknown execution state '{status.get('executionState')}'.")
+            return self.state
+
+        result = None
+        if state in _FINAL_STATES:
+            result = api.get_operation_async_result_submodel_repo(identifier, self.id_short_path, self.handle_id)
+            state = self._get_final_state(state, result)
+
+        with self._lock:
+            # the handle may have been canceled meanwhile
+            if not self.done:
+                self.result = result
+                self.state = state
+
+        return self.state
+
+    def _get_final_state(self, state: ExecutionState, result: dict | None) -> ExecutionState:
+        """Determine the final state of the operation from its result.
+
+        Servers redirecting to the result report every finished operation as completed, the actual state is part of the result.
+
+        :param state: Final state reported by the status request
+        :param result: Operation result
+        :return: Execution state of the result if set, failed if the result is not successful
+        """
+        if result is None:
+            return state
+
+        if result.get("executionState"):
+            try:
+                state = ExecutionState(result["executionState"])
+            except ValueError:
+                _logger.warning(f"Operation '{self.id_short_path}' returned unknown execution state '{result['executionState']}'.")
+
+        if state == ExecutionState.completed and result.get("success") is False:
+            return ExecutionState.failed
+
+        return state
+
+    def wait(self, timeout: float | None = None) -> dict | None:
+        """Wait until the operation is finished.
+
+        :param timeout: Maximum time in seconds to wait, waits without limit if not set
+        :return: Operation result or None if the operation did not finish successfully or the timeout was reached
+        """
+        wait_all([self], timeout)
+        return self.result if self.state == ExecutionState.completed else None
+
+    def cancel(self) -> None:
+        """Stop waiting for the operation; pending 'wait' calls return immediately."""
+        with self._lock:
+            if self.done:
+                return
+            self.state = ExecutionState.canceled
+
+        with _canceled:
+            _canceled.notify_all()
+
+
+def invoke_operation_async(
+    client: AasHttpClient,
+    submodel_identifier: str,
+    id_short_path: str,
+    request_body: dict,
+    poll_interval: float = 0.5,
+    max_poll_interval: float = 10.0,
+) -> OperationHandle | None:
+    """Invoke an operation asynchronously.
+
+    :param client: Initialized AAS HTTP client
+    :param submodel_identifier: The Submodels unique id (decoded)
+    :param id_short_path: IdShort path to the operation element (dot-separated)
+    :param request_body: Input parameters for the operation
+    :param poll_interval: Time in seconds until the first status request, defaults to 0.5
+    :param max_poll_interval: Maximum time in seconds between two status requests, defaults to 10.0
+    :return: Handle of the invocation or None if the operation could not be invoked
+    """
+    if client.submodels is None:
+        _logger.error("Submodel API is not initialized in the client. Call 'initialize()' method of the client before calling this method.")
+        return None
+
+    identifier = encode_base_64(submodel_identifier) if client.encoded_ids else submodel_identifier
+    handle_id = client.submodels.invoke_operation_async_submodel_repo(identifier, id_short_path, request_body)
+    if handle_id is None:
+        return None
+
+    return OperationHandle(client, submodel_identifier, id_short_path, handle_id, poll_interval, max_poll_interval)
+
+
+def wait_all(handles: Iterable[OperationHandle], timeout: float | None = None, max_workers: int | None = None) -> None:
+    """Wait until all operations are finished.
+
+    The status of all handles is polled from the calling thread, using up to 'max_workers' parallel requests for
+    handles that are due at the same time, so waiting for many long-running operations does not block a thread per operation.
+
+    :param handles: Handles of the invoked operations
+    :param timeout: Maximum time in seconds to wait, waits without limit if not set
+    :param max_workers: Maximum number of concurrent status requests, defaults to the 'MaxWorkers' setting of the client of the first handle
+    """
+    pending = [handle for handle in handles if not handle.done]
+    if not pending:
+        return
+
+    deadline = None if timeout is None else time.monotonic() + timeout
+    workers = max_workers or pending[0]._client.max_workers  # noqa: SLF001
+
+    while pending:
+        now = time.monotonic()
+        if deadline is not None and now >= deadline:
+            _logger.info(f"{len(pending)} operations did not finish within {timeout} seconds.")
+            return
+
+        run_concurrently(OperationHandle.poll, [handle for handle in pending if handle.next_poll <= now], workers)
+        pending = [handle for handle in pending if not handle.done]
+
+        if pending:
+            next_poll = min(handle.next_poll for handle in pending)
+            if deadline is not None:
+                next_poll = min(next_poll, deadline)
+            with _canceled:
+                _canceled.wait_for(partial(_any_done, pending), max(next_poll - time.monotonic(), 0))
+            pending = [handle for handle in pending if not handle.done]
+
+
+def _any_done(handles: list[OperationHandle]) -> bool:
+    return any(handle.done for handle in handles)
+
+
+def run_operations(
+    client: AasHttpClient, invocations: Iterable[tuple[str, str, dict]], timeout: float | None = None, poll_interval: float = 0.5
+) -> list[OperationHandle | None]:
+    """Invoke many operations asynchronously and wait until all are finished.
+
+    The invocations are sent with up to 'MaxWorkers' parallel requests, afterwards the status of all operations is
+    polled from the calling thread.
+
+    :param client: Initialized AAS HTTP client
+    :param invocations: Tuples of the Submodels unique id (decoded), the IdShort path to the operation element and the input parameters
+    :param timeout: Maximum time in seconds to wait for the operations, waits without limit if not set
+    :param poll_interval: Time in seconds until the first status request, defaults to 0.5
+    :return: Handles with state and result in the order of the invocations, None for operations that could not be invoked
+    """
+
+    def invoke(invocation: tuple[str, str, dict]) -> OperationHandle | None:
+        submodel_identifier, id_short_path, request_body = invocation
+        return invoke_operation_async(client, submodel_identifier, id_short_path, request_body, poll_interval=poll_interval)
+
+    handles = run_concurrently(invoke, invocations, client.max_workers)
+    wait_all([handle for handle in handles if handle is not None], timeout)
+    return handles
@@ -1,9 +1,11 @@
 """Pagination wrapper classes for AAS HTTP Client."""
 
 import logging
+from collections.abc import Callable, Iterator
 
 from basyx.aas import model
 
+from aas_http_client.classes.wrapper.descriptors import ShellDescriptor, SubmodelDescriptor, parse_shell_descriptor, parse_submodel_descriptor
 from aas_http_client.utilities.sdk_tools import convert_to_object
 
 _logger = logging.getLogger(__name__)
@@ -90,9 +92,25 @@ class ShellDescriptorPaginatedData:
     """Class representing paginated data for Shell Descriptors."""
 
     paging_metadata: PagingMetadata
-    results: list[model.SubmodelElement]
+    results: list[ShellDescriptor]
 
-    def __init__(self, cursor: str, results: list[model.SubmodelElement]) -> None:
+    def __init__(self, cursor: str, results: list[ShellDescriptor]) -> None:
+        """Initialize a paginated data object.
+
+        :param paging_metadata: Paging metadata
+        :param results: list of results
+        """
+        self.paging_metadata = PagingMetadata(cursor)
+        self.results = results
+
+
+class SubmodelDescriptorPaginatedData:
+    """Class representing paginated data for Submodel Descriptors."""
+
+    paging_metadata: PagingMetadata
+    results: list[SubmodelDescriptor]
+
+    def __init__(self, cursor: str, results: list[SubmodelDescriptor]) -> None:
         """Initialize a paginated data object.
 
         :param paging_metadata: Paging metadata
@@ -207,38 +225,49 @@ def create_submodel_element_paging_data(content: dict) -> SubmodelElementPaginat
     )
 
 
-def create_shell_descriptor_paging_data(content: dict) -> SubmodelElementPaginatedData | None:
-    """Create a SubmodelElementPaginatedData object from a dictionary.
+def create_shell_descriptor_paging_data(content: dict) -> ShellDescriptorPaginatedData | None:
+    """Create a ShellDescriptorPaginatedData object from a dictionary.
 
-    :param content: Dictionary containing paginated submodel element data
-    :return: SubmodelElementPaginatedData object
+    :param content: Dictionary containing paginated shell descriptor data
+    :return: ShellDescriptorPaginatedData object
     """
-    sme_list: list[model.SubmodelElement] = []
-
     results: list = content.get("result", [])
     if not results or len(results) == 0:
-        _logger.warning("No shells found on server.")
-        return SubmodelElementPaginatedData(cursor="", results=[])
-
-    for result in results:
-        if not isinstance(result, dict):
-            _logger.error(f"Invalid shell data: {result}")
-            return None
-
-        sme = convert_to_object(result)
+        _logger.warning("No shell descriptors found on server.")
+        return ShellDescriptorPaginatedData(cursor="", results=[])
+
+    try:
+        descriptor_list = [parse_shell_descriptor(result) for result in results]
+    except (AttributeError, KeyError, TypeError):
+        _logger.error("Invalid shell descriptor data received from server.")
+        return None
+
+    return ShellDescriptorPaginatedData(
+        cursor=content.get("paging_metadata", {}).get("cursor", ""),
+        results=descriptor_list,
+    )
 
-        if sme:
-            sme_list.append(sme)
 
-    cursor = ""
-    paging_metadata_dict = content.get("paging_metadata", {})
+def create_submodel_descriptor_paging_data(content: dict) -> SubmodelDescriptorPaginatedData | None:
+    """Create a SubmodelDescriptorPaginatedData object from a dictionary.
 
-    if "cursor" in paging_metadata_dict:
-        cursor = paging_metadata_dict["cursor"]
-
-    return SubmodelElementPaginatedData(
-        cursor=cursor,
-        results=sme_list,
+    :param content: Dictionary containing paginated submodel descriptor data
+    :return: SubmodelDescriptorPaginatedData object
+    """
+    results: list = content.get("result", [])
+    if not results or len(results) == 0:
+        _logger.warning("No submodel descriptors found on server.")
+        return SubmodelDescriptorPaginatedData(cursor="", results=[])
+
+    try:
+        descriptor_list = [parse_submodel_descriptor(result) for result in results]
+    except (AttributeError, KeyError, TypeError):
+        _logger.error("Invalid submodel descriptor data received from server.")
+        return None
+
+    return SubmodelDescriptorPaginatedData(
+        cursor=content.get("paging_metadata", {}).get("cursor", ""),
+        results=descriptor_list,
     )
 
 
@@ -275,3 +304,24 @@ def create_reference_paging_data(content: dict) -> ReferencePaginatedData | None
         cursor=cursor,
         results=ref_list,
     )
+
+
+def iter_pages(fetch: Callable[[str], dict | None], cursor: str = "") -> Iterator[tuple[list[dict] | None, str]]:
+    """Iterate over the pages of a paginated API call.
+
+    :param fetch: Function requesting the page for the given cursor and returning the response data
+    :param cursor: Cursor of the first page, defaults to the first page of the listing
+    :return: Iterator of the page results (None if a page could not be retrieved, which ends the iteration) and the cursor of the next page
+    """
+    while True:
+        content = fetch(cursor)
+        if content is None:
+            _logger.error(f"Failed to retrieve page with cursor '{cursor}'.")
+            yield None, cursor
+            return
+
+        cursor = content.get("paging_metadata", {}).get("cursor", "")
+        yield content.get("result", []), cursor
+
+        if not cursor:
+            return
@@ -0,0 +1,262 @@
+"""Synchronization of shell and submodel registries with the contents of an AAS repository."""
+
+import logging
+from functools import partial
+
+from aas_http_client.classes.client.aas_client import AasHttpClient
+from aas_http_client.classes.wrapper.descriptors import (
+    DescriptorEndpoint,
+    ShellDescriptor,
+    SubmodelDescriptor,
+    parse_shell_descriptor,
+    parse_submodel_descriptor,
+)
+from aas_http_client.classes.wrapper.pagination import iter_pages
+from aas_http_client.classes.wrapper.replication import ReplicationAction, ReplicationReport, ReplicationResult
+from aas_http_client.utilities.concurrency import RateLimiter, iter_prefetched, run_concurrently
+from aas_http_client.utilities.encoder import encode_base_64
+from aas_http_client.utilities.hashing import content_hash
+
+_logger = logging.getLogger(__name__)
+
+_SUBMODEL_DESCRIPTORS = "SubmodelDescriptor"
+_SHELL_DESCRIPTORS = "AssetAdministrationShellDescriptor"
+
+
+class RegistrySync:
+    """Registers the shells and submodels of a repository in the shell and submodel registry.
+
+    Descriptors are derived from the repository listings, with endpoints pointing to the repository and the
+    submodel descriptors of each shell taken from its submodel references. Submodels are synchronized before
+    shells. Each registry collection is listed once and compared to the derived descriptors to decide whether a
+    descriptor has to be created, updated or can be skipped. The repository is read page by page in a background
+    thread while the descriptors of the current page are written with up to 'max_workers' parallel requests,
+    limited to 'requests_per_second' writes.
+    """
+
+    def __init__(
+        self,
+        repository: AasHttpClient,
+        registry: AasHttpClient,
+        repository_url: str = "",
+        *,
+        delete: bool = False,
+        page_size: int = 100,
+        max_workers: int | None = None,
+        requests_per_second: float = 0.0,
+    ):
+        """Initializes the synchronization with the given clients.
+
+        :param repository: Initialized client of the repository
+        :param registry: Initialized client of the shell and submodel registry
+        :param repository_url: Base URL of the repository used in the endpoints of the descriptors, defaults to the base URL of the repository client
+        :param delete: If enabled, descriptors pointing to the repository whose shell or submodel no longer exists are deleted, defaults to False
+        :param page_size: Number of objects requested per page, defaults to 100
+        :param max_workers: Maximum number of concurrent writes, defaults to the 'MaxWorkers' setting of the registry client
+        :param requests_per_second: Maximum number of writes per second, 0 for no limit
+        """
+        self._repository = repository
+        self._registry = registry
+        self.repository_url = (repository_url or repository.base_url).rstrip("/")
+        self.delete = delete
+        self.page_size = page_size
+        self.max_workers = max_workers or registry.max_workers
+        self._limiter = RateLimiter(requests_per_second, burst=self.max_workers)
+
+    def diff(self) -> ReplicationReport:
+        """Determines the changes required to synchronize the registries without writing anything (dry run).
+
+        :return: Report with the required action per descriptor
+        """
+        return self._run(dry_run=True)
+
+    def sync(self) -> ReplicationReport:
+        """Synchronizes the registries with the repository.
+
+        :return: Report with the applied action per descriptor
+        """
+        return self._run(dry_run=False)
+
+    def _run(self, *, dry_run: bool) -> ReplicationReport:
+        if not self._repository.shells or not self._repository.submodels:
+            raise ValueError("Client is not initialized. Call 'initialize()' method of the client before synchronizing.")
+        if not self._registry.shell_registry or not self._registry.submodel_registry:
+            raise ValueError("Client is not initialized. Call 'initialize()' method of the client before synchronizing.")
+
+        report = ReplicationReport()
+        submodel_descriptors: dict[str, SubmodelDescriptor] = {}
+
+        for kind in (_SUBMODEL_DESCRIPTORS, _SHELL_DESCRIPTORS):
+            if not self._sync_collection(kind, dry_run=dry_run, submodel_descriptors=submodel_descriptors, report=report):
+                report.complete = False
+                return report
+
+        if report.failed:
+            _logger.warning(f"{len(report.failed)} of {len(report.results)} descriptors could not be synchronized.")
+
+        return report
+
+    def _sync_collection(self, kind: str, *, dry_run: bool, submodel_descriptors: dict[str, SubmodelDescriptor], report: ReplicationReport) -> bool:
+        """Synchronize all descriptors of a registry collection.
+
+        :param kind: Type of the descriptors to synchronize
+        :param dry_run: If enabled, the required actions are only determined
+        :param submodel_descriptors: Derived submodel descriptors by submodel id, filled while synchronizing the submodels
+        :param report: Report to add the results to
+        :return: True if the repository and the registry were listed completely, False otherwise
+        """
+        registered = self._get_registered_descriptors(kind)
+        if registered is None:
+            return False
+
+        sync_descriptor = partial(self._sync_descriptor, kind, registered=registered, dry_run=dry_run)
+        repository_ids: set[str] = set()
+
+        for page, _ in iter_prefetched(iter_pages(self._fetch_repository_function(kind)), depth=2):
+            if page is None:
+                return False
+
+            if kind == _SUBMODEL_DESCRIPTORS:
+                descriptors: list = [self._derive_submodel_descriptor(item) for item in page]
+                submodel_descriptors.update((descriptor.id, descriptor) for descriptor in descriptors)
+            else:
+                descriptors = [self._derive_shell_descriptor(item, submodel_descriptors) for item in page]
+
+            repository_ids.update(descriptor.id for descriptor in descriptors)
+            report.results.extend(run_concurrently(sync_descriptor, descriptors, self.max_workers))
+
+        if self.delete:
+            stale_ids = [identifier for identifier, (_, in_repository) in registered.items() if in_repository and identifier not in repository_ids]
+            report.results.extend(run_concurrently(partial(self._delete, kind, dry_run=dry_run), stale_ids, self.max_workers))
+
+        return True
+
+    def _get_registered_descriptors(self, kind: str) -> dict[str, tuple[str, bool]] | None:
+        """List a registry collection.
+
+        :param kind: Type of the descriptors to list
+        :return: Descriptor ids with content hash and whether an endpoint points to the repository, None if the registry could not be listed
+        """
+        parse = parse_submodel_descriptor if kind == _SUBMODEL_DESCRIPTORS else parse_shell_descriptor
+        prefix = f"{self.repository_url}/"
+        registered: dict[str, tuple[str, bool]] = {}
+
+        for page, _ in iter_prefetched(iter_pages(self._fetch_registry_function(kind))):
+            if page is None:
+                return None
+
+            for item in page:
+                try:
+                    descriptor = parse(item)
+                except (KeyError, TypeError, AttributeError) as e:
+                    _logger.warning("Skipping malformed descriptor '%s' of '%s': %s", item.get("id") if isinstance(item, dict) else item, kind, e)
+                    continue
+
+                in_repository = any(endpoint.href.startswith(prefix) for endpoint in descriptor.endpoints)
+                # hashing the parsed descriptor ignores fields the registry adds
+                registered[descriptor.id] = (content_hash(descriptor.to_dict(), ignore_empty=True), in_repository)
+
+        return registered
+
+    def _derive_submodel_descriptor(self, submodel: dict) -> SubmodelDescriptor:
+        href = f"{self.repository_url}/submodels/{encode_base_64(submodel['id'])}"
+        return SubmodelDescriptor(
+            id=submodel["id"],
+            endpoints=(DescriptorEndpoint(interface="SUBMODEL-3.0", href=href, endpoint_protocol="HTTP"),),
+            id_short=submodel.get("idShort"),
+            semantic_id=submodel.get("semanticId"),
+            supplemental_semantic_id=tuple(submodel.get("supplementalSemanticIds") or ()),
+            description=tuple(submodel.get("description") or ()),
+            display_name=tuple(submodel.get("displayName") or ()),
+            administration=submodel.get("administration"),
+        )
+
+    def _derive_shell_descriptor(self, shell: dict, submodel_descriptors: dict[str, SubmodelDescriptor]) -> ShellDescriptor:
+        href = f"{self.repository_url}/shells/{encode_base_64(shell['id'])}"
+        asset_information = shell.get("assetInformation") or {}
+        submodel_ids = [reference["keys"][-1]["value"] for reference in shell.get("submodels") or [] if reference.get("keys")]
+
+        return ShellDescriptor(
+            id=shell["id"],
+            endpoints=(DescriptorEndpoint(interface="AAS-3.0", href=href, endpoint_protocol="HTTP"),),
+            id_short=shell.get("idShort"),
+            global_asset_id=asset_information.get("globalAssetId"),
+            asset_kind=asset_information.get("assetKind"),
+            asset_type=asset_information.get("assetType"),
+            specific_asset_ids=tuple(asset_information.get("specificAssetIds") or ()),
+            # references to submodels of other repositories are not registered, as their endpoint is unknown
+            submodel_descriptors=tuple(submodel_descriptors[identifier] for identifier in submodel_ids if identifier in submodel_descriptors),
+            description=tuple(shell.get("description") or ()),
+            display_name=tuple(shell.get("displayName") or ()),
+            administration=shell.get("administration"),
+        )
+
+    def _sync_descriptor(
+        self, kind: str, descriptor: ShellDescriptor | SubmodelDescriptor, *, registered: dict[str, tuple[str, bool]], dry_run: bool
+    ) -> ReplicationResult:
+        data = descriptor.to_dict()
+        registered_hash = registered.get(descriptor.id, (None, False))[0]
+
+        if registered_hash is None:
+            action = ReplicationAction.create
+        elif registered_hash == content_hash(data, ignore_empty=True):
+            action = ReplicationAction.skip
+        else:
+            action = ReplicationAction.update
+
+        if dry_run or action == ReplicationAction.skip:
+            return ReplicationResult(descriptor.id, kind, action)
+
+        self._limiter.acquire()
+        return ReplicationResult(descriptor.id, kind, action, self._write(kind, data, action))
+
+    def _write(self, kind: str, data: dict, action: ReplicationAction) -> bool:
+        shell_registry = self._registry.shell_registry
+        submodel_registry = self._registry.submodel_registry
+        if shell_registry is None or submodel_registry is None:
+            return False
+
+        identifier = _encoded_identifier(self._registry, data["id"])
+
+        if kind == _SUBMODEL_DESCRIPTORS:
+            if action == ReplicationAction.create:
+                return submodel_registry.post_submodel_descriptor(data) is not None
+            return submodel_registry.put_submodel_descriptor_by_id(identifier, data)
+
+        if action == ReplicationAction.create:
+            return shell_registry.post_asset_administration_shell_descriptor(data) is not None
+        return shell_registry.put_asset_administration_shell_descriptor_by_id(identifier, data)
+
+    def _delete(self, kind: str, identifier: str, *, dry_run: bool) -> ReplicationResult:
+        shell_registry = self._registry.shell_registry
+        submodel_registry = self._registry.submodel_registry
+        if dry_run or shell_registry is None or submodel_registry is None:
+            return ReplicationResult(identifier, kind, ReplicationAction.delete, success=dry_run)
+
+        self._limiter.acquire()
+        encoded_identifier = _encoded_identifier(self._registry, identifier)
+        if kind == _SUBMODEL_DESCRIPTORS:
+            success = submodel_registry.delete_submodel_descriptor_by_id(encoded_identifier)
+        else:
+            success = shell_registry.delete_asset_administration_shell_descriptor_by_id(encoded_identifier)
+
+        return ReplicationResult(identifier, kind, ReplicationAction.delete, success)
+
+    def _fetch_repository_function(self, kind: str):
+        if kind == _SUBMODEL_DESCRIPTORS:
+            # the submodel elements are not needed for the descriptors
+            return lambda cursor: self._repository.submodels.get_all_submodels(limit=self.page_size, cursor=cursor, level="core")  # type: ignore[union-attr]
+
+        return lambda cursor: self._repository.shells.get_all_asset_administration_shells(limit=self.page_size, cursor=cursor)  # type: ignore[union-attr]
+
+    def _fetch_registry_function(self, kind: str):
+        if kind == _SUBMODEL_DESCRIPTORS:
+            return lambda cursor: self._registry.submodel_registry.get_all_submodel_descriptors(limit=self.page_size, cursor=cursor)  # type: ignore[union-attr]
+
+        return lambda cursor: self._registry.shell_registry.get_all_asset_administration_shell_descriptors(  # type: ignore[union-attr]
+            limit=self.page_size, cursor=cursor
+        )
+
+
+def _encoded_identifier(client: AasHttpClient, identifier: str) -> str:
+    return encode_base_64(identifier) if client.encoded_ids else identifier
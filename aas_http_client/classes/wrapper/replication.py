@@ -0,0 +1,312 @@
+"""Replication of shells and submodels between AAS repositories."""
+
+import logging
+from dataclasses import dataclass, field
+from enum import Enum
+from functools import partial
+from pathlib import Path, PurePosixPath
+
+from aas_http_client.classes.client.aas_client import AasHttpClient
+from aas_http_client.classes.wrapper.pagination import iter_pages
+from aas_http_client.utilities.checkpoint import Checkpoint
+from aas_http_client.utilities.concurrency import iter_prefetched, run_concurrently
+from aas_http_client.utilities.encoder import encode_base_64
+from aas_http_client.utilities.hashing import content_hash
+from aas_http_client.utilities.id_short_path import iter_file_elements
+
+_logger = logging.getLogger(__name__)
+
+_SUBMODELS = "Submodel"
+_SHELLS = "AssetAdministrationShell"
+
+
+class ReplicationAction(Enum):
+    """Action required to replicate an object to the target."""
+
+    create = "create"
+    update = "update"
+    skip = "skip"
+    delete = "delete"
+
+    def __str__(self) -> str:
+        """String representation of the ReplicationAction enum."""
+        return self.value
+
+
+@dataclass(frozen=True)
+class ReplicationResult:
+    """Represents the replication result of a single object.
+
+    :param identifier: Unique id of the object
+    :param kind: Type of the object ('AssetAdministrationShell' or 'Submodel')
+    :param action: Action required for the object
+    :param success: Whether the action was applied, always True for a dry run
+    """
+
+    identifier: str
+    kind: str
+    action: ReplicationAction
+    success: bool = True
+
+
+@dataclass
+class ReplicationReport:
+    """Represents the results of a replication."""
+
+    results: list[ReplicationResult] = field(default_factory=list)
+    complete: bool = True
+
+    def get_results(self, action: ReplicationAction) -> list[ReplicationResult]:
+        """Returns the results of all objects with the given action.
+
+        :param action: Action to filter by
+        :return: List of results
+        """
+        return [result for result in self.results if result.action == action]
+
+    @property
+    def failed(self) -> list[ReplicationResult]:
+        """Results of all objects whose action could not be applied."""
+        return [result for result in self.results if not result.success]
+
+
+class Replicator:
+    """Copies shells and submodels (including their submodel references, thumbnails and attachments) between repositories.
+
+    Submodels are replicated before shells. The source is read page by page in a background thread while the
+    objects of the current page are written with up to 'MaxWorkers' parallel requests. The target is listed once
+    per collection to decide whether an object has to be created, updated or (in incremental mode) skipped.
+    """
+
+    def __init__(
+        self,
+        source: AasHttpClient,
+        target: AasHttpClient,
+        *,
+        incremental: bool = True,
+        mirror: bool = False,
+        include_thumbnails: bool = False,
+        include_attachments: bool = False,
+        page_size: int = 100,
+        max_workers: int | None = None,
+    ):
+        """Initializes the replicator with the given clients.
+
+        :param source: Initialized client of the source repository
+        :param target: Initialized client of the target repository
+        :param incremental: If enabled, objects with equal content hash on source and target are skipped, defaults to True
+        :param mirror: If enabled, objects that only exist on the target are deleted, defaults to False
+        :param include_thumbnails: If enabled, the thumbnails of written shells are copied, defaults to False
+        :param include_attachments: If enabled, the files of File elements of written submodels are copied, defaults to False
+        :param page_size: Number of objects requested per page, defaults to 100
+        :param max_workers: Maximum number of concurrent writes, defaults to the 'MaxWorkers' setting of the target client
+        """
+        self._source = source
+        self._target = target
+        self.incremental = incremental
+        self.mirror = mirror
+        self.include_thumbnails = include_thumbnails
+        self.include_attachments = include_attachments
+        self.page_size = page_size
+        self.max_workers = max_workers or target.max_workers
+
+    def diff(self) -> ReplicationReport:
+        """Determines the actions required to replicate the source to the target without writing anything (dry run).
+
+        :return: Report with the required action per object
+        """
+        return self._run(dry_run=True, checkpoint_file=None)
+
+    def replicate(self, checkpoint_file: Path | None = None) -> ReplicationReport:
+        """Replicates the source to the target.
+
+        :param checkpoint_file: Path to a checkpoint file. If it exists, the replication is resumed from the checkpoint.
+            The file is removed after a complete replication.
+        :return: Report with the applied action per object
+        """
+        return self._run(dry_run=False, checkpoint_file=checkpoint_file)
+
+    def _run(self, *, dry_run: bool, checkpoint_file: Path | None) -> ReplicationReport:
+        for client in (self._source, self._target):
+            if not client.shells or not client.submodels:
+                raise ValueError("Client is not initialized. Call 'initialize()' method of the client before replicating.")
+
+        checkpoint = (Checkpoint.load(checkpoint_file) if checkpoint_file else None) or Checkpoint()
+        report = ReplicationReport()
+
+        for kind in (_SUBMODELS, _SHELLS):
+            resumed = checkpoint.collection == kind
+            cursor = checkpoint.start(kind)
+            if cursor is None:
+                continue
+
+            if not self._replicate_collection(kind, cursor, dry_run=dry_run, checkpoint=checkpoint, checkpoint_file=checkpoint_file, report=report):
+                report.complete = False
+                return report
+
+            if self.mirror and resumed and cursor:
+                _logger.warning(f"Mirror deletion of '{kind}' skipped, as the replication was resumed within the collection.")
+
+        if checkpoint_file and not dry_run:
+            checkpoint_file.unlink(missing_ok=True)
+
+        if report.failed:
+            _logger.warning(f"{len(report.failed)} of {len(report.results)} objects could not be replicated.")
+
+        return report
+
+    def _replicate_collection(
+        self, kind: str, cursor: str, *, dry_run: bool, checkpoint: Checkpoint, checkpoint_file: Path | None, report: ReplicationReport
+    ) -> bool:
+        """Replicate all objects of a collection, starting at the given cursor.
+
+        :param kind: Type of the objects to replicate
+        :param cursor: Cursor of the first source page
+        :param dry_run: If enabled, the required actions are only determined
+        :param checkpoint: Checkpoint to advance after each page
+        :param checkpoint_file: Path to save the checkpoint to
+        :param report: Report to add the results to
+        :return: True if all pages were read from source and target, False otherwise
+        """
+        target_hashes = self._get_target_hashes(kind)
+        if target_hashes is None:
+            return False
+
+        replicate_item = partial(self._replicate_item, kind, target_hashes=target_hashes, dry_run=dry_run)
+        source_ids: set[str] = set()
+
+        for page, next_cursor in iter_prefetched(iter_pages(self._fetch_function(self._source, kind), cursor), depth=2):
+            if page is None:
+                return False
+
+            source_ids.update(item["id"] for item in page)
+            report.results.extend(run_concurrently(replicate_item, page, self.max_workers))
+
+            checkpoint.advance(next_cursor)
+            if checkpoint_file and not dry_run:
+                checkpoint.save(checkpoint_file)
+
+        # objects of pages replicated before a resume are unknown, so only complete listings are mirrored
+        if self.mirror and not cursor:
+            extra_ids = [identifier for identifier in target_hashes if identifier not in source_ids]
+            report.results.extend(run_concurrently(partial(self._delete, kind, dry_run=dry_run), extra_ids, self.max_workers))
+
+        return True
+
+    def _get_target_hashes(self, kind: str) -> dict[str, str] | None:
+        """List the target collection and calculate the content hash of each object.
+
+        :param kind: Type of the objects to list
+        :return: Dictionary of object ids and content hashes or None if the target could not be listed
+        """
+        hashes: dict[str, str] = {}
+        for page, _ in iter_prefetched(iter_pages(self._fetch_function(self._target, kind))):
+            if page is None:
+                return None
+
+            hashes.update({item["id"]: content_hash(item, ignore_empty=True) for item in page})
+
+        return hashes
+
+    def _replicate_item(self, kind: str, item: dict, target_hashes: dict[str, str], *, dry_run: bool) -> ReplicationResult:
+        identifier = item["id"]
+        target_hash = target_hashes.get(identifier)
+
+        if target_hash is None:
+            action = ReplicationAction.create
+        elif self.incremental and target_hash == content_hash(item, ignore_empty=True):
+            action = ReplicationAction.skip
+        else:
+            action = ReplicationAction.update
+
+        if dry_run or action == ReplicationAction.skip:
+            return ReplicationResult(identifier, kind, action)
+
+        success = self._write(kind, item, action)
+        if success and kind == _SUBMODELS and self.include_attachments:
+            success = self._copy_attachments(item)
+        if success and kind == _SHELLS and self.include_thumbnails:
+            success = self._copy_thumbnail(item)
+
+        return ReplicationResult(identifier, kind, action, success)
+
+    def _write(self, kind: str, item: dict, action: ReplicationAction) -> bool:
+        shells = self._target.shells
+        submodels = self._target.submodels
+        if shells is None or submodels is None:
+            return False
+
+        identifier = _encoded_identifier(self._target, item["id"])
+
+        if kind == _SUBMODELS:
+            if action == ReplicationAction.create:
+                return submodels.post_submodel(item) is not None
+            return submodels.put_submodels_by_id(identifier, item)
+
+        if action == ReplicationAction.create:
+            return shells.post_asset_administration_shell(item) is not None
+        return shells.put_asset_administration_shell_by_id(identifier, item)
+
+    def _delete(self, kind: str, identifier: str, *, dry_run: bool) -> ReplicationResult:
+        if dry_run or self._target.shells is None or self._target.submodels is None:
+            return ReplicationResult(identifier, kind, ReplicationAction.delete, success=dry_run)
+
+        encoded_identifier = _encoded_identifier(self._target, identifier)
+        if kind == _SUBMODELS:
+            success = self._target.submodels.delete_submodel_by_id(encoded_identifier)
+        else:
+            success = self._target.shells.delete_asset_administration_shell_by_id(encoded_identifier)
+
+        return ReplicationResult(identifier, kind, ReplicationAction.delete, success)
+
+    def _copy_attachments(self, submodel: dict) -> bool:
+        source_api = self._source.experimental
+        target_api = self._target.experimental
+        if source_api is None or target_api is None:
+            return False
+
+        source_identifier = _encoded_identifier(self._source, submodel["id"])
+        target_identifier = _encoded_identifier(self._target, submodel["id"])
+
+        success = True
+        for path, element in iter_file_elements(submodel):
+            if not element.get("value") or str(element["value"]).startswith(("http://", "https://")):
+                continue
+
+            content = source_api.get_file_by_path_submodel_repo(source_identifier, path)
+            if content is None:
+                # the submodel is replicated without the file, so it is reported as failed
+                _logger.warning(f"Attachment '{path}' of submodel '{submodel['id']}' could not be downloaded.")
+                success = False
+                continue
+
+            file_name = PurePosixPath(str(element["value"])).name
+            content_type = element.get("contentType") or "application/octet-stream"
+            success = target_api.put_file_by_path_submodel_repo_stream(target_identifier, path, file_name, content, content_type) and success
+
+        return success
+
+    def _copy_thumbnail(self, shell: dict) -> bool:
+        thumbnail = shell.get("assetInformation", {}).get("defaultThumbnail")
+        if not thumbnail or self._source.shells is None or self._target.shells is None:
+            return True
+
+        content = self._source.shells.get_thumbnail_aas_repository(_encoded_identifier(self._source, shell["id"]))
+        if content is None:
+            return True
+
+        file_name = PurePosixPath(str(thumbnail.get("path") or "thumbnail")).name
+        content_type = thumbnail.get("contentType") or "application/octet-stream"
+        return self._target.shells.put_thumbnail_aas_repository_stream(
+            _encoded_identifier(self._target, shell["id"]), file_name, content, content_type
+        )
+
+    def _fetch_function(self, client: AasHttpClient, kind: str):
+        if kind == _SUBMODELS:
+            return lambda cursor: client.submodels.get_all_submodels(limit=self.page_size, cursor=cursor)  # type: ignore[union-attr]
+
+        return lambda cursor: client.shells.get_all_asset_administration_shells(limit=self.page_size, cursor=cursor)  # type: ignore[union-attr]
+
+
+def _encoded_identifier(client: AasHttpClient, identifier: str) -> str:
+    return encode_base_64(identifier) if client.encoded_ids else identifier
@@ -2,6 +2,8 @@
 
 import json
 import logging
+import warnings
+from collections.abc import Callable, Iterator
 from enum import Enum
 from pathlib import Path
 from typing import Any
@@ -11,18 +13,35 @@ from basyx.aas import model
 
 from aas_http_client.classes.client.aas_client import AasHttpClient, _create_client
 from aas_http_client.classes.wrapper.attachment import Attachment
+from aas_http_client.classes.wrapper.bulk_import import BulkImporter, ImportReport
+from aas_http_client.classes.wrapper.delta import DeltaKind, apply_delta, plan_delta
+from aas_http_client.classes.wrapper.descriptors import ShellDescriptor, SubmodelDescriptor, parse_shell_descriptor, parse_submodel_descriptor
+from aas_http_client.classes.wrapper.lazy_blob import BlobCache, make_lazy_blobs
+from aas_http_client.classes.wrapper.lazy_submodel import LazySubmodel
+from aas_http_client.classes.wrapper.operations import OperationHandle, invoke_operation_async
 from aas_http_client.classes.wrapper.pagination import (
     ReferencePaginatedData,
+    ShellDescriptorPaginatedData,
     ShellPaginatedData,
+    SubmodelDescriptorPaginatedData,
     SubmodelElementPaginatedData,
     SubmodelPaginatedData,
     create_reference_paging_data,
+    create_shell_descriptor_paging_data,
     create_shell_paging_data,
+    create_submodel_descriptor_paging_data,
     create_submodel_element_paging_data,
     create_submodel_paging_data,
+    iter_pages,
 )
+from aas_http_client.classes.wrapper.shell_bundle import ShellBundle
+from aas_http_client.classes.wrapper.submodel_index import SubmodelIndex
+from aas_http_client.utilities.encoder import decode_base_64
+from aas_http_client.utilities.hashing import HashTree, create_hash_tree
+from aas_http_client.utilities.id_short_path import get_container_types
 from aas_http_client.utilities.sdk_tools import convert_to_dict as _to_dict
 from aas_http_client.utilities.sdk_tools import convert_to_object as _to_object
+from aas_http_client.utilities.sdk_tools import iter_element_tree, iter_submodel_elements
 
 _logger = logging.getLogger(__name__)
 
@@ -106,6 +125,7 @@ class SdkWrapper:
 
     _client: AasHttpClient
     base_url: str = ""
+    max_delta_operations: int = 20
 
     def __init__(self, configuration: dict, basic_auth_password: str = "", o_auth_client_secret: str = "", bearer_auth_token: str = ""):
         """Initializes the wrapper with the given configuration.
@@ -122,6 +142,13 @@ class SdkWrapper:
 
         self._client = client
         self.base_url = client.base_url
+        self._change_tracking = False
+        self._snapshots: dict[str, HashTree] = {}
+        self._lazy_blobs = False
+        self._blob_cache: BlobCache | None = None
+        self._element_index = False
+        self._index_max_age = 30.0
+        self._indexes: dict[str, SubmodelIndex] = {}
 
     def set_encoded_ids(self, encoded_ids: IdEncoding):
         """Sets whether to use encoded IDs for API requests.
@@ -143,6 +170,92 @@ class SdkWrapper:
 
         return IdEncoding.decoded
 
+    def set_change_tracking(self, *, enabled: bool, max_delta_operations: int = 20):
+        """Sets whether submodel updates only send the changes since the submodel was fetched.
+
+        If enabled, a hash tree snapshot of each submodel fetched by 'get_submodel_by_id' or created by 'post_submodel'
+        is kept. 'put_submodels_by_id' and 'patch_submodel_by_id' compare the submodel with its snapshot and send only
+        the changed values and elements. Without snapshot or if the diff is large, the complete submodel is sent.
+
+        :param enabled: If enabled, changes of submodels are tracked
+        :param max_delta_operations: Maximum number of requests of a delta update before the complete submodel is sent, defaults to 20
+        """
+        self._change_tracking = enabled
+        self.max_delta_operations = max_delta_operations
+
+        if not enabled:
+            self._snapshots.clear()
+
+    def get_change_tracking(self) -> bool:
+        """Gets whether changes of submodels are tracked.
+
+        :return: True if changes are tracked, False otherwise
+        """
+        return self._change_tracking
+
+    def set_lazy_blobs(self, *, enabled: bool, cache_size: int = 0):
+        """Sets whether Blob values are only fetched when they are read.
+
+        If enabled, 'get_submodel_by_id' and 'get_submodel_element_by_path_submodel_repo' request 'withoutBlobValue'
+        unless another extent is given. The value of each returned Blob is fetched with a separate request on first
+        access. Submodels read this way are not tracked for changes, as the snapshot would fetch all Blob values.
+
+        :param enabled: If enabled, Blob values are fetched on first access
+        :param cache_size: Maximum total size in bytes of fetched Blob values kept for later reads, defaults to 0 (no cache)
+        """
+        self._lazy_blobs = enabled
+        self._blob_cache = BlobCache(cache_size) if enabled and cache_size > 0 else None
+
+    def get_lazy_blobs(self) -> bool:
+        """Gets whether Blob values are fetched on first access.
+
+        :return: True if Blob values are fetched on first access, False otherwise
+        """
+        return self._lazy_blobs
+
+    def set_element_index(self, *, enabled: bool, max_age: float = 30.0):
+        """Sets whether element reads are served from an index of the last fetched submodel.
+
+        If enabled, an index of each submodel fetched by 'get_submodel_by_id' is kept. For 'max_age' seconds,
+        'get_submodel_element_by_path_submodel_repo' returns the indexed element without request. Updating an
+        element value through the wrapper updates the index, other changes through the wrapper discard it.
+        Elements served from the index are shared between calls, changes must be sent to the server.
+
+        :param enabled: If enabled, element reads are served from the index
+        :param max_age: Time in seconds an index is used after the submodel was fetched, defaults to 30.0
+        """
+        self._element_index = enabled
+        self._index_max_age = max_age
+
+        if not enabled:
+            self._indexes.clear()
+
+    def get_element_index(self) -> bool:
+        """Gets whether element reads are served from an index of the last fetched submodel.
+
+        :return: True if element reads are served from the index, False otherwise
+        """
+        return self._element_index
+
+    def get_submodel_index(self, submodel_identifier: str) -> SubmodelIndex | None:
+        """Returns an index of the elements of a Submodel for lookups by IdShort path, semanticId and type.
+
+        The kept index is returned if it is not older than 'max_age' (see 'set_element_index'), otherwise the Submodel is fetched.
+
+        :param submodel_identifier: ID of the Submodel to index
+        :return: Index of the Submodel or None if an error occurred
+        """
+        index = self._fresh_index(submodel_identifier)
+        if index is not None:
+            return index
+
+        submodel = self.get_submodel_by_id(submodel_identifier)
+        if not isinstance(submodel, model.Submodel):
+            return None
+
+        index = self._indexes.get(submodel.id)
+        return index if index is not None else SubmodelIndex(submodel)
+
     def get_client(self) -> AasHttpClient:
         """Returns the underlying AAS HTTP client.
 
@@ -150,6 +263,20 @@ class SdkWrapper:
         """
         return self._client
 
+    def bulk_import(self, source: model.AbstractObjectStore | Path, *, upsert: bool = True) -> ImportReport:
+        """Uploads all shells, submodels and attachments of an object store, a JSON environment or an AASX package.
+
+        :param source: Object store or path to a '.json' or '.aasx' file
+        :param upsert: If enabled, objects that already exist on the server are replaced, defaults to True
+        :return: Import report with one result per object
+        """
+        importer = BulkImporter(self._client, upsert=upsert)
+
+        if isinstance(source, Path):
+            return importer.import_file(source)
+
+        return importer.import_object_store(source)
+
     # endregion
 
     # region shells
@@ -173,6 +300,36 @@ class SdkWrapper:
 
         return _to_object(content)
 
+    # GET /shells/{aasIdentifier} + GET /submodels/{submodelIdentifier}
+    def get_asset_administration_shell_with_submodels(
+        self, aas_identifier: str, level: Level = Level.default, extent: Extent = Extent.default
+    ) -> ShellBundle | None:
+        """Returns a specific Asset Administration Shell together with all its referenced Submodels.
+
+        The Submodels are requested concurrently with up to 'MaxWorkers' parallel requests.
+
+        :param aas_identifier: The Asset Administration Shells unique id (decoded)
+        :param level: Determines the structural depth of the submodel content. Available values : deep, core
+        :param extent: Determines to which extent the submodels are serialized. Available values : withBlobValue, withoutBlobValue
+        :return: Bundle containing the shell and its submodels or None if an error occurred
+        """
+        if not self._client.shells:
+            _logger.error("Shell API is not initialized in the client. Call 'initialize()' method of the client before calling this method.")
+            return None
+
+        content = self._client.shells.get_asset_administration_shell_with_submodels(aas_identifier, str(level), str(extent))
+
+        if not content:
+            _logger.warning(f"No shell found with ID '{aas_identifier}' on server.")
+            return None
+
+        shell = _to_object(content["shell"])
+        if not isinstance(shell, model.AssetAdministrationShell):
+            return None
+
+        submodels = [submodel for submodel in (_to_object(item) for item in content["submodels"]) if isinstance(submodel, model.Submodel)]
+        return ShellBundle(shell, submodels, content["missing"])
+
     # PUT /shells/{aasIdentifier}
     def put_asset_administration_shell_by_id(self, aas_identifier: str, aas: model.AssetAdministrationShell) -> bool:
         """Creates or replaces an existing Asset Administration Shell.
@@ -357,8 +514,6 @@ class SdkWrapper:
 
         return self._client.shells.delete_submodel_reference_by_id_aas_repository(aas_identifier, submodel_identifier)
 
-    # not supported by Java Server
-
     # PUT /shells/{aasIdentifier}/submodels/{submodelIdentifier}
     def put_submodel_by_id_aas_repository(self, aas_identifier: str, submodel_identifier: str, submodel: model.Submodel) -> bool:
         """Updates the Submodel.
@@ -377,6 +532,7 @@ class SdkWrapper:
         if sm_data is None:
             return False
 
+        self._invalidate(submodel_identifier)
         return self._client.shells.put_submodel_by_id_aas_repository(aas_identifier, submodel_identifier, sm_data)
 
     # GET /shells/{aasIdentifier}/$reference
@@ -430,12 +586,39 @@ class SdkWrapper:
             _logger.error("Submodel API is not initialized in the client. Call 'initialize()' method of the client before calling this method.")
             return None
 
-        content = self._client.submodels.get_submodel_by_id(submodel_identifier, str(level), str(extent))
+        lazy = self._lazy_blobs and extent == Extent.default
+        content = self._client.submodels.get_submodel_by_id(submodel_identifier, str(level), str(Extent.without_blob_value if lazy else extent))
 
         if not content:
             return None
 
-        return _to_object(content)
+        submodel = _to_object(content)
+        if lazy and isinstance(submodel, model.Submodel):
+            make_lazy_blobs(self._client, self._decode(submodel_identifier), iter_submodel_elements(submodel), self._blob_cache)
+
+        # snapshots of reduced representations would turn the omitted parts into deletions
+        self._take_snapshot(submodel, complete=level == Level.default and extent == Extent.default and not lazy)
+
+        if self._element_index and isinstance(submodel, model.Submodel):
+            self._indexes.pop(submodel.id, None)
+            if level == Level.default and extent == Extent.default:
+                self._keep_index(content, lazy=lazy)
+
+        return submodel
+
+    def get_lazy_submodel(self, submodel_identifier: str, max_expanded: int = 1000, prefetch_siblings: int = 0) -> LazySubmodel | None:
+        """Returns a view of a Submodel that fetches its elements with level 'core' when they are traversed.
+
+        :param submodel_identifier: ID of the Submodel to view
+        :param max_expanded: Maximum number of elements whose children are kept, defaults to 1000
+        :param prefetch_siblings: Number of following sibling elements fetched together with an element, defaults to 0
+        :return: Submodel view or None if an error occurred
+        """
+        if not self._client.submodels:
+            _logger.error("Submodel API is not initialized in the client. Call 'initialize()' method of the client before calling this method.")
+            return None
+
+        return LazySubmodel(self._client, self._decode(submodel_identifier), max_expanded, prefetch_siblings)
 
     # PUT /submodels/{submodelIdentifier}
     def put_submodels_by_id(self, submodel_identifier: str, submodel: model.Submodel) -> bool:
@@ -449,12 +632,7 @@ class SdkWrapper:
             _logger.error("Submodel API is not initialized in the client. Call 'initialize()' method of the client before calling this method.")
             return False
 
-        sm_data = _to_dict(submodel)
-
-        if sm_data is None:
-            return False
-
-        return self._client.submodels.put_submodels_by_id(submodel_identifier, sm_data)
+        return self._update_submodel(submodel_identifier, submodel, self._client.submodels.put_submodels_by_id)
 
     # DELETE /submodels/{submodelIdentifier}
     def delete_submodel_by_id(self, submodel_identifier: str) -> bool:
@@ -467,6 +645,7 @@ class SdkWrapper:
             _logger.error("Submodel API is not initialized in the client. Call 'initialize()' method of the client before calling this method.")
             return False
 
+        self._invalidate(submodel_identifier)
         return self._client.submodels.delete_submodel_by_id(submodel_identifier)
 
     # GET /submodels/{submodelIdentifier}/submodel-elements/{idShortPath}
@@ -485,12 +664,25 @@ class SdkWrapper:
             _logger.error("Submodel API is not initialized in the client. Call 'initialize()' method of the client before calling this method.")
             return None
 
-        content = self._client.submodels.get_submodel_element_by_path_submodel_repo(submodel_identifier, id_short_path, str(level), str(extent))
+        if level == Level.default and extent == Extent.default:
+            index = self._fresh_index(submodel_identifier)
+            element = index.get(id_short_path) if index is not None else None
+            if element is not None:
+                return element
+
+        lazy = self._lazy_blobs and extent == Extent.default
+        content = self._client.submodels.get_submodel_element_by_path_submodel_repo(
+            submodel_identifier, id_short_path, str(level), str(Extent.without_blob_value if lazy else extent)
+        )
 
         if not content:
             return None
 
-        return _to_object(content)
+        element = _to_object(content)
+        if lazy and isinstance(element, model.SubmodelElement):
+            make_lazy_blobs(self._client, self._decode(submodel_identifier), iter_element_tree(element, id_short_path), self._blob_cache)
+
+        return element
 
     # PUT /submodels/{submodelIdentifier}/submodel-elements/{idShortPath}
     def put_submodel_element_by_path_submodel_repo(
@@ -513,6 +705,7 @@ class SdkWrapper:
         if sme_data is None:
             return False
 
+        self._invalidate(submodel_identifier)
         return self._client.submodels.put_submodel_element_by_path_submodel_repo(submodel_identifier, id_short_path, sme_data, str(level))
 
     # POST /submodels/{submodelIdentifier}/submodel-elements/{idShortPath}
@@ -542,6 +735,7 @@ class SdkWrapper:
         if sme_data is None:
             return None
 
+        self._invalidate(submodel_identifier)
         content = self._client.submodels.post_submodel_element_by_path_submodel_repo(
             submodel_identifier, id_short_path, sme_data, str(level), str(extent)
         )
@@ -564,6 +758,7 @@ class SdkWrapper:
             _logger.error("Submodel API is not initialized in the client. Call 'initialize()' method of the client before calling this method.")
             return False
 
+        self._invalidate(submodel_identifier)
         return self._client.submodels.delete_submodel_element_by_path_submodel_repo(submodel_identifier, id_short_path)
 
     # GET /submodels
@@ -618,7 +813,9 @@ class SdkWrapper:
         if not content:
             return None
 
-        return _to_object(content)
+        created = _to_object(content)
+        self._take_snapshot(created)
+        return created
 
     # GET /submodels/{submodelIdentifier}/submodel-elements
     def get_all_submodel_elements_submodel_repository(
@@ -658,6 +855,7 @@ class SdkWrapper:
         if sme_data is None:
             return None
 
+        self._invalidate(submodel_identifier)
         content = self._client.submodels.post_submodel_element_submodel_repo(submodel_identifier, sme_data)
 
         if not content:
@@ -666,26 +864,51 @@ class SdkWrapper:
         return _to_object(content)
 
     # POST /submodels/{submodelIdentifier}/submodel-elements/{idShortPath}/invoke
-    def invoke_operation_submodel_repo(self, submodel_identifier: str, id_short_path: str, request_body: dict, async_: str = "async") -> dict | None:
+    def invoke_operation_submodel_repo(
+        self, submodel_identifier: str, id_short_path: str, request_body: dict, async_: str | None = None
+    ) -> dict | None:
         """Synchronously invokes an Operation at a specified path.
 
         :param submodel_identifier: The Submodels unique id
         :param id_short_path: IdShort path to the operation element (dot-separated)
         :param request_body: Input parameters for the operation
-        :param async_: Determines whether an operation invocation is performed asynchronously or synchronously
+        :param async_: Deprecated and not evaluated, use 'invoke_operation_async_submodel_repo' for asynchronous invocations
         :return: Operation result or None if an error occurred
         """
+        if async_ is not None:
+            warnings.warn(
+                "The 'async_' argument of 'invoke_operation_submodel_repo' is not evaluated and will be removed. "
+                "Use 'invoke_operation_async_submodel_repo' for asynchronous invocations.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+
         if not self._client.submodels:
             _logger.error("Submodel API is not initialized in the client. Call 'initialize()' method of the client before calling this method.")
             return None
 
-        content = self._client.submodels.invoke_operation_submodel_repo(submodel_identifier, id_short_path, request_body, async_)
+        content = self._client.submodels.invoke_operation_submodel_repo(submodel_identifier, id_short_path, request_body)
 
         if not content:
             return None
 
         return content
 
+    # POST /submodels/{submodelIdentifier}/submodel-elements/{idShortPath}/invoke-async
+    def invoke_operation_async_submodel_repo(self, submodel_identifier: str, id_short_path: str, request_body: dict) -> OperationHandle | None:
+        """Asynchronously invokes an Operation at a specified path.
+
+        :param submodel_identifier: The Submodels unique id
+        :param id_short_path: IdShort path to the operation element (dot-separated)
+        :param request_body: Input parameters for the operation
+        :return: Handle to poll, wait for or cancel the invocation or None if an error occurred
+        """
+        if not self._client.submodels:
+            _logger.error("Submodel API is not initialized in the client. Call 'initialize()' method of the client before calling this method.")
+            return None
+
+        return invoke_operation_async(self._client, self._decode(submodel_identifier), id_short_path, request_body)
+
     def get_submodel_element_by_path_value_only_submodel_repo(self, submodel_identifier: str, id_short_path: str) -> str | None:
         """Retrieves the value of a specific SubmodelElement.
 
@@ -699,6 +922,19 @@ class SdkWrapper:
 
         return self._client.submodels.get_submodel_element_by_path_value_only_submodel_repo(submodel_identifier, id_short_path)
 
+    def get_values(self, submodel_identifier: str, id_short_paths: list[str]) -> dict[str, Any] | None:
+        """Retrieves the values of multiple SubmodelElements of a Submodel with as few round trips as possible.
+
+        :param submodel_identifier: The Submodels unique id
+        :param id_short_paths: IdShort paths to the submodel elements (dot-separated)
+        :return: Dictionary of IdShort paths and values (values that could not be retrieved are missing) or None if an error occurred
+        """
+        if not self._client.submodels:
+            _logger.error("Submodel API is not initialized in the client. Call 'initialize()' method of the client before calling this method.")
+            return None
+
+        return self._client.submodels.get_values(submodel_identifier, id_short_paths)
+
     # PATCH /submodels/{submodelIdentifier}/submodel-elements/{idShortPath}/$value
     def patch_submodel_element_by_path_value_only_submodel_repo(self, submodel_identifier: str, submodel_element_path: str, value: str) -> bool:
         """Updates the value of an existing SubmodelElement.
@@ -712,7 +948,17 @@ class SdkWrapper:
             _logger.error("Submodel API is not initialized in the client. Call 'initialize()' method of the client before calling this method.")
             return False
 
-        return self._client.submodels.patch_submodel_element_by_path_value_only_submodel_repo(submodel_identifier, submodel_element_path, value)
+        identifier = self._decode(submodel_identifier)
+        self._snapshots.pop(identifier, None)
+        self._invalidate_blobs(submodel_identifier)
+        if not self._client.submodels.patch_submodel_element_by_path_value_only_submodel_repo(submodel_identifier, submodel_element_path, value):
+            return False
+
+        index = self._indexes.get(identifier)
+        if index is not None and not index.update_value(submodel_element_path, value):
+            self._indexes.pop(identifier, None)
+
+        return True
 
     # GET /submodels/{submodelIdentifier}/$value
     def get_submodel_by_id_value_only(self, submodel_identifier: str, level: Level = Level.default, extent: Extent = Extent.default) -> dict | None:
@@ -747,6 +993,7 @@ class SdkWrapper:
             _logger.error("Submodel API is not initialized in the client. Call 'initialize()' method of the client before calling this method.")
             return False
 
+        self._invalidate(submodel_identifier)
         return self._client.submodels.patch_submodel_by_id_value_only(submodel_identifier, request_body, str(level))
 
     # GET /submodels/{submodelIdentifier}/$metadata
@@ -768,8 +1015,6 @@ class SdkWrapper:
 
         return content
 
-    # not supported by Java Server
-
     # PATCH /submodels/{submodelIdentifier}
     def patch_submodel_by_id(self, submodel_identifier: str, submodel: model.Submodel) -> bool:
         """Updates an existing Submodel.
@@ -781,18 +1026,355 @@ class SdkWrapper:
             _logger.error("Submodel API is not initialized in the client. Call 'initialize()' method of the client before calling this method.")
             return False
 
+        return self._update_submodel(submodel_identifier, submodel, self._client.submodels.patch_submodel_by_id)
+
+    def _update_submodel(self, submodel_identifier: str, submodel: model.Submodel, send_submodel: Callable[[str, dict], bool]) -> bool:
+        """Send the changes of a submodel since its snapshot or the complete submodel.
+
+        :param submodel_identifier: Identifier of the submodel to update
+        :param submodel: Submodel data to update
+        :param send_submodel: API method sending the complete submodel (PUT or PATCH)
+        :return: True if the update was successful, False otherwise
+        """
         sm_data = _to_dict(submodel)
 
         if sm_data is None:
             return False
 
-        return self._client.submodels.patch_submodel_by_id(submodel_identifier, sm_data)
+        identifier = self._decode(submodel_identifier)
+        snapshot = self._snapshots.get(identifier)
+        self._invalidate(submodel_identifier)
+        if not self._change_tracking:
+            return send_submodel(submodel_identifier, sm_data)
+
+        local_tree = create_hash_tree(sm_data)
+
+        if snapshot is not None and identifier == submodel.id:
+            operations = plan_delta(sm_data, snapshot, local_tree)
+
+            if not operations:
+                self._snapshots[identifier] = local_tree
+                return True
+
+            is_small = len(operations) <= self.max_delta_operations and operations[0].kind != DeltaKind.replace_submodel
+            if is_small and apply_delta(
+                self._client, identifier, operations, container_types=get_container_types(sm_data.get("submodelElements") or [])
+            ):
+                self._snapshots[identifier] = local_tree
+                return True
+
+            if is_small:
+                _logger.info(f"Delta update of submodel '{identifier}' failed, sending the complete submodel.")
+
+        if not send_submodel(submodel_identifier, sm_data):
+            return False
+
+        self._snapshots[identifier] = local_tree
+        return True
+
+    def _take_snapshot(self, submodel: Any, *, complete: bool = True) -> None:
+        """Keep the hash tree of a submodel as received from the server, if change tracking is enabled.
+
+        :param submodel: Submodel received from the server
+        :param complete: Whether the submodel was received with all elements and values
+        """
+        if not self._change_tracking or not isinstance(submodel, model.Submodel):
+            return
+
+        if not complete:
+            self._snapshots.pop(submodel.id, None)
+            return
+
+        # hash the serialized SDK object, as the server data may differ in optional fields
+        sm_data = _to_dict(submodel)
+        if sm_data is not None:
+            self._snapshots[submodel.id] = create_hash_tree(sm_data)
+
+    def _keep_index(self, content: dict, *, lazy: bool) -> None:
+        # the index gets its own copy, so changes of the returned submodel do not affect later reads
+        submodel = _to_object(content)
+        if not isinstance(submodel, model.Submodel):
+            return
+
+        if lazy:
+            make_lazy_blobs(self._client, submodel.id, iter_submodel_elements(submodel), self._blob_cache)
+
+        self._indexes[submodel.id] = SubmodelIndex(submodel)
+
+    def _fresh_index(self, submodel_identifier: str) -> SubmodelIndex | None:
+        if not self._element_index:
+            return None
+
+        index = self._indexes.get(self._decode(submodel_identifier))
+        if index is None or index.age > self._index_max_age:
+            return None
+
+        return index
+
+    def _invalidate(self, submodel_identifier: str) -> None:
+        # writes to parts of a submodel outdate its snapshot, later delta updates would be based on the old state
+        self._snapshots.pop(self._decode(submodel_identifier), None)
+        self._indexes.pop(self._decode(submodel_identifier), None)
+        self._invalidate_blobs(submodel_identifier)
+
+    def _invalidate_blobs(self, submodel_identifier: str) -> None:
+        if self._blob_cache is not None:
+            self._blob_cache.invalidate(self._decode(submodel_identifier))
+
+    def _decode(self, identifier: str) -> str:
+        return decode_base_64(identifier) if self._client.encoded_ids else identifier
 
     # endregion
 
     # region shell registry
 
-    # currently no SDK implementation for descriptor classes -> no implementation for wrapper
+    # GET /shell-descriptors/{aasIdentifier}
+    def get_asset_administration_shell_descriptor_by_id(self, aas_identifier: str) -> ShellDescriptor | None:
+        """Returns a specific Asset Administration Shell Descriptor.
+
+        :param aas_identifier: The Asset Administration Shells unique id
+        :return: Asset Administration Shell Descriptor or None if an error occurred
+        """
+        if not self._client.shell_registry:
+            _logger.error("Shell Registry API is not initialized in the client. Call 'initialize()' method of the client before calling this method.")
+            return None
+
+        content = self._client.shell_registry.get_asset_administration_shell_descriptor_by_id(aas_identifier)
+
+        if not content:
+            _logger.warning(f"No shell descriptor found with ID '{aas_identifier}' on server.")
+            return None
+
+        return parse_shell_descriptor(content)
+
+    # PUT /shell-descriptors/{aasIdentifier}
+    def put_asset_administration_shell_descriptor_by_id(self, aas_identifier: str, descriptor: ShellDescriptor) -> bool:
+        """Creates or replaces an existing Asset Administration Shell Descriptor.
+
+        :param aas_identifier: The Asset Administration Shells unique id
+        :param descriptor: Asset Administration Shell Descriptor to put
+        :return: True if the update was successful, False otherwise
+        """
+        if not self._client.shell_registry:
+            _logger.error("Shell Registry API is not initialized in the client. Call 'initialize()' method of the client before calling this method.")
+            return False
+
+        return self._client.shell_registry.put_asset_administration_shell_descriptor_by_id(aas_identifier, descriptor.to_dict())
+
+    # DELETE /shell-descriptors/{aasIdentifier}
+    def delete_asset_administration_shell_descriptor_by_id(self, aas_identifier: str) -> bool:
+        """Deletes an Asset Administration Shell Descriptor.
+
+        :param aas_identifier: The Asset Administration Shells unique id
+        :return: True if the deletion was successful, False otherwise
+        """
+        if not self._client.shell_registry:
+            _logger.error("Shell Registry API is not initialized in the client. Call 'initialize()' method of the client before calling this method.")
+            return False
+
+        return self._client.shell_registry.delete_asset_administration_shell_descriptor_by_id(aas_identifier)
+
+    # GET /shell-descriptors
+    def get_all_asset_administration_shell_descriptors(
+        self, asset_kind: AssetKind = AssetKind.default, asset_type: str = "", limit: int = 100, cursor: str = ""
+    ) -> ShellDescriptorPaginatedData | None:
+        """Returns all Asset Administration Shell Descriptors.
+
+        :param asset_kind: The Asset's kind. Available values : Instance, NotApplicable, Type
+        :param asset_type: The Asset's type (UTF8-BASE64-URL-encoded)
+        :param limit: The maximum number of elements in the response array
+        :param cursor: A server-generated identifier retrieved from pagingMetadata
+            that specifies from which position the result listing should continue
+        :return: List of paginated Asset Administration Shell Descriptors or None if an error occurred
+        """
+        if not self._client.shell_registry:
+            _logger.error("Shell Registry API is not initialized in the client. Call 'initialize()' method of the client before calling this method.")
+            return None
+
+        content = self._client.shell_registry.get_all_asset_administration_shell_descriptors(limit, cursor, str(asset_kind), asset_type)
+
+        if not content:
+            return None
+
+        return create_shell_descriptor_paging_data(content)
+
+    # GET /shell-descriptors (all pages)
+    def iter_asset_administration_shell_descriptors(
+        self, asset_kind: AssetKind = AssetKind.default, asset_type: str = "", limit: int = 100
+    ) -> Iterator[ShellDescriptor]:
+        """Iterates over all Asset Administration Shell Descriptors, requesting the next page when the current one is consumed.
+
+        Only one page is held at a time, so large registries can be listed without keeping all descriptors in memory.
+        The iteration ends early if a page could not be retrieved.
+
+        :param asset_kind: The Asset's kind. Available values : Instance, NotApplicable, Type
+        :param asset_type: The Asset's type (UTF8-BASE64-URL-encoded)
+        :param limit: The maximum number of elements per page
+        :return: Iterator of Asset Administration Shell Descriptors
+        """
+        registry = self._client.shell_registry
+        if not registry:
+            _logger.error("Shell Registry API is not initialized in the client. Call 'initialize()' method of the client before calling this method.")
+            return
+
+        def fetch(cursor: str) -> dict | None:
+            return registry.get_all_asset_administration_shell_descriptors(limit, cursor, str(asset_kind), asset_type)
+
+        for results, _ in iter_pages(fetch):
+            for result in results or []:
+                yield parse_shell_descriptor(result)
+
+    # POST /shell-descriptors
+    def post_asset_administration_shell_descriptor(self, descriptor: ShellDescriptor) -> ShellDescriptor | None:
+        """Creates a new Asset Administration Shell Descriptor.
+
+        :param descriptor: Asset Administration Shell Descriptor to post
+        :return: Created Asset Administration Shell Descriptor or None if an error occurred
+        """
+        if not self._client.shell_registry:
+            _logger.error("Shell Registry API is not initialized in the client. Call 'initialize()' method of the client before calling this method.")
+            return None
+
+        content = self._client.shell_registry.post_asset_administration_shell_descriptor(descriptor.to_dict())
+        if not content:
+            return None
+
+        return parse_shell_descriptor(content)
+
+    # GET /shell-descriptors/{aasIdentifier}/submodel-descriptors/{submodelIdentifier}
+    def get_submodel_descriptor_by_id_through_superpath(self, aas_identifier: str, submodel_identifier: str) -> SubmodelDescriptor | None:
+        """Returns a specific Submodel Descriptor of an Asset Administration Shell Descriptor.
+
+        :param aas_identifier: The Asset Administration Shells unique id
+        :param submodel_identifier: The Submodels unique id
+        :return: Submodel Descriptor or None if an error occurred
+        """
+        if not self._client.shell_registry:
+            _logger.error("Shell Registry API is not initialized in the client. Call 'initialize()' method of the client before calling this method.")
+            return None
+
+        content = self._client.shell_registry.get_submodel_descriptor_by_id_through_superpath(aas_identifier, submodel_identifier)
+
+        if not content:
+            _logger.warning(f"No submodel descriptor found with ID '{submodel_identifier}' for shell '{aas_identifier}' on server.")
+            return None
+
+        return parse_submodel_descriptor(content)
+
+    # GET /shell-descriptors/{aasIdentifier}/submodel-descriptors
+    def get_all_submodel_descriptors_through_superpath(self, aas_identifier: str) -> SubmodelDescriptorPaginatedData | None:
+        """Returns all Submodel Descriptors of an Asset Administration Shell Descriptor.
+
+        :param aas_identifier: The Asset Administration Shells unique id
+        :return: List of paginated Submodel Descriptors or None if an error occurred
+        """
+        if not self._client.shell_registry:
+            _logger.error("Shell Registry API is not initialized in the client. Call 'initialize()' method of the client before calling this method.")
+            return None
+
+        content = self._client.shell_registry.get_all_submodel_descriptors_through_superpath(aas_identifier)
+
+        if not content:
+            return None
+
+        return create_submodel_descriptor_paging_data(content)
+
+    # endregion
+
+    # region submodel registry
+
+    # GET /submodel-descriptors/{submodelIdentifier}
+    def get_submodel_descriptor_by_id(self, submodel_identifier: str) -> SubmodelDescriptor | None:
+        """Returns a specific Submodel Descriptor.
+
+        :param submodel_identifier: The Submodels unique id
+        :return: Submodel Descriptor or None if an error occurred
+        """
+        if not self._client.submodel_registry:
+            _logger.error(
+                "Submodel Registry API is not initialized in the client. Call 'initialize()' method of the client before calling this method."
+            )
+            return None
+
+        content = self._client.submodel_registry.get_submodel_descriptor_by_id(submodel_identifier)
+
+        if not content:
+            _logger.warning(f"No submodel descriptor found with ID '{submodel_identifier}' on server.")
+            return None
+
+        return parse_submodel_descriptor(content)
+
+    # PUT /submodel-descriptors/{submodelIdentifier}
+    def put_submodel_descriptor_by_id(self, submodel_identifier: str, descriptor: SubmodelDescriptor) -> bool:
+        """Creates or replaces an existing Submodel Descriptor.
+
+        :param submodel_identifier: The Submodels unique id
+        :param descriptor: Submodel Descriptor to put
+        :return: True if the update was successful, False otherwise
+        """
+        if not self._client.submodel_registry:
+            _logger.error(
+                "Submodel Registry API is not initialized in the client. Call 'initialize()' method of the client before calling this method."
+            )
+            return False
+
+        return self._client.submodel_registry.put_submodel_descriptor_by_id(submodel_identifier, descriptor.to_dict())
+
+    # DELETE /submodel-descriptors/{submodelIdentifier}
+    def delete_submodel_descriptor_by_id(self, submodel_identifier: str) -> bool:
+        """Deletes a Submodel Descriptor.
+
+        :param submodel_identifier: The Submodels unique id
+        :return: True if the deletion was successful, False otherwise
+        """
+        if not self._client.submodel_registry:
+            _logger.error(
+                "Submodel Registry API is not initialized in the client. Call 'initialize()' method of the client before calling this method."
+            )
+            return False
+
+        return self._client.submodel_registry.delete_submodel_descriptor_by_id(submodel_identifier)
+
+    # GET /submodel-descriptors
+    def get_all_submodel_descriptors(self, limit: int = 100, cursor: str = "") -> SubmodelDescriptorPaginatedData | None:
+        """Returns all Submodel Descriptors.
+
+        :param limit: The maximum number of elements in the response array
+        :param cursor: A server-generated identifier retrieved from pagingMetadata
+            that specifies from which position the result listing should continue
+        :return: List of paginated Submodel Descriptors or None if an error occurred
+        """
+        if not self._client.submodel_registry:
+            _logger.error(
+                "Submodel Registry API is not initialized in the client. Call 'initialize()' method of the client before calling this method."
+            )
+            return None
+
+        content = self._client.submodel_registry.get_all_submodel_descriptors(limit, cursor)
+
+        if not content:
+            return None
+
+        return create_submodel_descriptor_paging_data(content)
+
+    # POST /submodel-descriptors
+    def post_submodel_descriptor(self, descriptor: SubmodelDescriptor) -> SubmodelDescriptor | None:
+        """Creates a new Submodel Descriptor.
+
+        :param descriptor: Submodel Descriptor to post
+        :return: Created Submodel Descriptor or None if an error occurred
+        """
+        if not self._client.submodel_registry:
+            _logger.error(
+                "Submodel Registry API is not initialized in the client. Call 'initialize()' method of the client before calling this method."
+            )
+            return None
+
+        content = self._client.submodel_registry.post_submodel_descriptor(descriptor.to_dict())
+        if not content:
+            return None
+
+        return parse_submodel_descriptor(content)
 
     # endregion
 
@@ -841,6 +1423,7 @@ class SdkWrapper:
             _logger.error("Experimental API is not initialized in the client. Call 'initialize()' method of the client before calling this method.")
             return False
 
+        self._invalidate(submodel_identifier)
         return self._client.experimental.post_file_by_path_submodel_repo(submodel_identifier, id_short_path, file)
 
     def experimental_put_file_by_path_submodel_repo(self, submodel_identifier: str, id_short_path: str, file: Path) -> bool:
@@ -855,6 +1438,7 @@ class SdkWrapper:
             _logger.error("Experimental API is not initialized in the client. Call 'initialize()' method of the client before calling this method.")
             return False
 
+        self._invalidate(submodel_identifier)
         return self._client.experimental.put_file_by_path_submodel_repo(submodel_identifier, id_short_path, file)
 
     def experimental_delete_file_by_path_submodel_repo(self, submodel_identifier: str, id_short_path: str) -> bool:
@@ -868,6 +1452,7 @@ class SdkWrapper:
             _logger.error("Experimental API is not initialized in the client. Call 'initialize()' method of the client before calling this method.")
             return False
 
+        self._invalidate(submodel_identifier)
         return self._client.experimental.delete_file_by_path_submodel_repo(submodel_identifier, id_short_path)
 
     # endregion
@@ -0,0 +1,319 @@
+"""Client facade partitioning shells and submodels across several repositories by consistent hashing of their ids."""
+
+import base64
+import bisect
+import hashlib
+import json
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Self
+
+from aas_http_client.classes.client.aas_client import AasHttpClient
+from aas_http_client.classes.wrapper.pagination import iter_pages
+from aas_http_client.utilities.concurrency import iter_prefetched, run_concurrently
+from aas_http_client.utilities.encoder import decode_base_64, encode_base_64
+
+_logger = logging.getLogger(__name__)
+
+_SUBMODELS = "Submodel"
+_SHELLS = "AssetAdministrationShell"
+
+# listing methods requested from all shards
+_FAN_OUT_METHODS = {"get_all_asset_administration_shells", "get_all_submodels"}
+# creating methods routed by the id in the request body
+_POST_METHODS = {"post_asset_administration_shell", "post_submodel"}
+# names of the arguments the shard is selected by
+_IDENTIFIER_ARGUMENTS = ("aas_identifier", "submodel_identifier")
+
+
+class HashRing:
+    """Consistent hash ring mapping identifiers to shards.
+
+    Each shard is placed on the ring 'virtual_nodes' times, an identifier belongs to the shard following its hash
+    on the ring. Adding or removing a shard only moves the identifiers of the ring sections it takes over or gives up.
+    """
+
+    def __init__(self, shards: list[str], virtual_nodes: int = 64):
+        """Initializes the ring with the given shards.
+
+        :param shards: Names of the shards
+        :param virtual_nodes: Number of positions of each shard on the ring, defaults to 64
+        :raises ValueError: If no shard is given
+        """
+        if not shards:
+            raise ValueError("At least one shard is required.")
+
+        nodes = sorted((_hash(f"{shard}#{index}"), shard) for shard in shards for index in range(virtual_nodes))
+        self._positions = [position for position, _ in nodes]
+        self._shards = [shard for _, shard in nodes]
+
+    def get(self, identifier: str) -> str:
+        """Get the shard of an identifier.
+
+        :param identifier: Identifier to locate
+        :return: Name of the shard
+        """
+        index = bisect.bisect(self._positions, _hash(identifier))
+        return self._shards[index % len(self._shards)]
+
+
+@dataclass(frozen=True)
+class ShardMove:
+    """Represents the move of a single object to its shard.
+
+    :param identifier: Unique id of the object
+    :param kind: Type of the object ('AssetAdministrationShell' or 'Submodel')
+    :param source: Base URL of the shard the object was found on
+    :param target: Base URL of the shard the object belongs to
+    :param success: Whether the object was moved, always True for a dry run
+    """
+
+    identifier: str
+    kind: str
+    source: str
+    target: str
+    success: bool = True
+
+
+@dataclass
+class RebalanceReport:
+    """Represents the results of a rebalancing."""
+
+    moves: list[ShardMove] = field(default_factory=list)
+    complete: bool = True
+
+    @property
+    def failed(self) -> list[ShardMove]:
+        """Moves that could not be applied."""
+        return [move for move in self.moves if not move.success]
+
+
+class ShardedAasClient:
+    """Client for shells and submodels partitioned across several repositories (shards).
+
+    The 'shells' and 'submodels' attributes provide the API of the AAS HTTP client. Requests for a single shell or
+    submodel are sent to the shard of its id on a consistent hash ring of the shard base URLs, requests creating an
+    object to the shard of the id in the request body. Requests addressing a submodel through its shell are sent
+    to the shard of the shell. Listings are requested from all shards concurrently and merged; their cursor is a
+    composite of the cursors of all shards with further results, and the limit is split across these shards.
+
+    Identifiers are passed in the convention of the shard clients, which therefore must all have the same
+    'EncodedIds' setting. After adding or removing shards, 'rebalance' moves the objects to their new shard.
+    """
+
+    def __init__(self, clients: list[AasHttpClient], virtual_nodes: int = 64, max_workers: int | None = None):
+        """Initializes the sharded client with the clients of the shards.
+
+        :param clients: Initialized AAS HTTP clients of the shards
+        :param virtual_nodes: Number of positions of each shard on the hash ring, defaults to 64
+        :param max_workers: Maximum number of concurrent moves while rebalancing, defaults to the 'MaxWorkers' setting of the first client
+        :raises ValueError: If no client is given, a client is not initialized, two clients share a base URL or the 'EncodedIds' settings differ
+        """
+        if not clients:
+            raise ValueError("At least one shard is required.")
+        if any(not client.shells or not client.submodels for client in clients):
+            raise ValueError("Client is not initialized. Call 'initialize()' method of the client before sharding.")
+        if len({client.base_url for client in clients}) != len(clients):
+            raise ValueError("The base URLs of the shards must be unique.")
+        if len({client.encoded_ids for client in clients}) != 1:
+            raise ValueError("All shards must have the same 'EncodedIds' setting.")
+
+        self._clients = {client.base_url: client for client in clients}
+        self._ring = HashRing(list(self._clients), virtual_nodes)
+        self.encoded_ids = clients[0].encoded_ids
+        self.max_workers = max_workers or clients[0].max_workers
+        self.shells = _ShardedImplementation(self, "shells")
+        self.submodels = _ShardedImplementation(self, "submodels")
+
+    def __enter__(self) -> Self:
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Exit the context manager and close the clients of the shards."""
+        self.close()
+
+    @property
+    def clients(self) -> list[AasHttpClient]:
+        """Clients of the shards."""
+        return list(self._clients.values())
+
+    def get_shard(self, identifier: str) -> AasHttpClient:
+        """Get the client of the shard an identifier belongs to.
+
+        :param identifier: Identifier in the convention of the shard clients (base64-encoded if 'EncodedIds' is enabled)
+        :return: Client of the shard
+        """
+        return self._clients[self._ring.get(decode_base_64(identifier) if self.encoded_ids else identifier)]
+
+    def rebalance(self, *, dry_run: bool = False, page_size: int = 100) -> RebalanceReport:
+        """Move all shells and submodels stored on another shard than the one they belong to.
+
+        Each shard is listed page by page, collecting the ids of misplaced objects. Each misplaced object is then
+        read, written to its shard and deleted from the shard it was found on, with up to 'max_workers' parallel
+        moves. Submodels are moved before shells. Thumbnails and attachments are not moved.
+
+        :param dry_run: If enabled, the required moves are only determined, defaults to False
+        :param page_size: Number of objects requested per page, defaults to 100
+        :return: Report with the moves
+        """
+        report = RebalanceReport()
+
+        for kind in (_SUBMODELS, _SHELLS):
+            for source in self._clients.values():
+                misplaced = self._find_misplaced(source, kind, page_size)
+                if misplaced is None:
+                    report.complete = False
+                    continue
+
+                move = partial(self._move, kind, source, dry_run=dry_run)
+                report.moves.extend(run_concurrently(move, misplaced, self.max_workers))
+
+        if report.failed:
+            _logger.warning(f"{len(report.failed)} of {len(report.moves)} objects could not be moved.")
+
+        return report
+
+    def close(self) -> None:
+        """Close the clients of the shards."""
+        for client in self._clients.values():
+            client.close()
+
+    def _find_misplaced(self, source: AasHttpClient, kind: str, page_size: int) -> list[tuple[str, AasHttpClient]] | None:
+        """List the objects of a shard that belong to another shard.
+
+        :param source: Client of the shard to list
+        :param kind: Type of the objects to list
+        :param page_size: Number of objects requested per page
+        :return: Ids of the misplaced objects with the client of their shard or None if the shard could not be listed
+        """
+        misplaced: list[tuple[str, AasHttpClient]] = []
+        for page, _ in iter_prefetched(iter_pages(self._fetch_function(source, kind, page_size))):
+            if page is None:
+                _logger.error(f"Failed to list shard '{source.base_url}'.")
+                return None
+
+            for item in page:
+                target = self._clients[self._ring.get(item["id"])]
+                if target is not source:
+                    misplaced.append((item["id"], target))
+
+        return misplaced
+
+    def _move(self, kind: str, source: AasHttpClient, item: tuple[str, AasHttpClient], *, dry_run: bool) -> ShardMove:
+        identifier, target = item
+        if dry_run:
+            return ShardMove(identifier, kind, source.base_url, target.base_url)
+
+        encoded_identifier = encode_base_64(identifier) if self.encoded_ids else identifier
+        if kind == _SUBMODELS:
+            data = source.submodels.get_submodel_by_id(encoded_identifier)  # type: ignore[union-attr]
+            success = data is not None and (
+                target.submodels.post_submodel(data) is not None  # type: ignore[union-attr]
+                or target.submodels.put_submodels_by_id(encoded_identifier, data)  # type: ignore[union-attr]
+            )
+            success = success and source.submodels.delete_submodel_by_id(encoded_identifier)  # type: ignore[union-attr]
+        else:
+            data = source.shells.get_asset_administration_shell_by_id(encoded_identifier)  # type: ignore[union-attr]
+            success = data is not None and (
+                target.shells.post_asset_administration_shell(data) is not None  # type: ignore[union-attr]
+                or target.shells.put_asset_administration_shell_by_id(encoded_identifier, data)  # type: ignore[union-attr]
+            )
+            success = success and source.shells.delete_asset_administration_shell_by_id(encoded_identifier)  # type: ignore[union-attr]
+
+        return ShardMove(identifier, kind, source.base_url, target.base_url, success)
+
+    def _fetch_function(self, client: AasHttpClient, kind: str, page_size: int):
+        if kind == _SUBMODELS:
+            # the submodel elements are not needed to locate the submodels
+            return lambda cursor: client.submodels.get_all_submodels(limit=page_size, cursor=cursor, level="core")  # type: ignore[union-attr]
+
+        return lambda cursor: client.shells.get_all_asset_administration_shells(limit=page_size, cursor=cursor)  # type: ignore[union-attr]
+
+
+class _ShardedImplementation:
+    """Routes the calls of an implementation of the AAS HTTP client ('shells' or 'submodels') to the shards."""
+
+    def __init__(self, sharded_client: ShardedAasClient, attribute: str):
+        self._sharded_client = sharded_client
+        self._attribute = attribute
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        implementation = getattr(self._sharded_client.clients[0], self._attribute)
+        if name.startswith("_") or not callable(getattr(implementation, name, None)):
+            raise AttributeError(f"'{self._attribute}' has no method '{name}'")
+
+        if name in _FAN_OUT_METHODS:
+            return partial(self._list, name)
+
+        return partial(self._call, name)
+
+    def _call(self, name: str, *args, **kwargs) -> Any:
+        if name in _POST_METHODS:
+            request_body = args[0] if args else kwargs["request_body"]
+            identifier = encode_base_64(request_body["id"]) if self._sharded_client.encoded_ids else request_body["id"]
+        else:
+            identifier = args[0] if args else next((kwargs[argument] for argument in _IDENTIFIER_ARGUMENTS if argument in kwargs), None)
+            if identifier is None:
+                raise TypeError(f"'{name}' requires an identifier to select the shard.")
+
+        client = self._sharded_client.get_shard(identifier)
+        return getattr(getattr(client, self._attribute), name)(*args, **kwargs)
+
+    def _list(self, name: str, *args, limit: int = 0, cursor: str = "", **kwargs) -> dict | None:
+        """Request a listing from all shards with further results and merge the pages.
+
+        :param name: Name of the listing method
+        :param limit: Maximum number of results, split across the shards
+        :param cursor: Composite cursor of a previous page, empty for the first page
+        :return: Merged page with a composite cursor or None if a shard could not be listed
+        """
+        clients = {client.base_url: client for client in self._sharded_client.clients}
+        cursors = _decode_cursor(cursor) if cursor else dict.fromkeys(clients, "")
+        if cursors is None:
+            _logger.error(f"Invalid cursor '{cursor}'.")
+            return None
+
+        shard_limit = max(1, limit // len(cursors)) if limit and cursors else limit
+
+        def fetch(shard: tuple[str, str]) -> dict | None:
+            base_url, shard_cursor = shard
+            client = clients.get(base_url)
+            if client is None:
+                _logger.error(f"Cursor refers to unknown shard '{base_url}'.")
+                return None
+            return getattr(getattr(client, self._attribute), name)(*args, limit=shard_limit, cursor=shard_cursor, **kwargs)
+
+        shards = list(cursors.items())
+        pages = run_concurrently(fetch, shards, len(shards))
+        if any(page is None for page in pages):
+            return None
+
+        result: list[dict] = []
+        next_cursors: dict[str, str] = {}
+        for (base_url, _), page in zip(shards, pages, strict=True):
+            result.extend(page.get("result", []))
+            next_cursor = page.get("paging_metadata", {}).get("cursor", "")
+            if next_cursor:
+                next_cursors[base_url] = next_cursor
+
+        return {"paging_metadata": {"cursor": _encode_cursor(next_cursors)} if next_cursors else {}, "result": result}
+
+
+def _hash(text: str) -> int:
+    return int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def _encode_cursor(cursors: dict[str, str]) -> str:
+    return base64.urlsafe_b64encode(json.dumps(cursors, separators=(",", ":")).encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> dict[str, str] | None:
+    try:
+        cursors = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except ValueError:
+        return None
+
+    return cursors if isinstance(cursors, dict) else None
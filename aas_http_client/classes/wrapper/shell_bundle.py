@@ -0,0 +1,24 @@
+"""Shell bundle wrapper class for AAS HTTP Client."""
+
+from basyx.aas import model
+
+
+class ShellBundle(model.DictObjectStore):
+    """Object store containing an Asset Administration Shell and its referenced Submodels."""
+
+    def __init__(self, shell: model.AssetAdministrationShell, submodels: list[model.Submodel], missing_submodel_ids: list[str]):
+        """Initializes the bundle with the given shell and submodels.
+
+        :param shell: The Asset Administration Shell
+        :param submodels: The Submodels referenced in the shell, in reference order
+        :param missing_submodel_ids: IDs of referenced Submodels that could not be retrieved
+        """
+        super().__init__([shell, *submodels])
+        self.shell = shell
+        self.submodels = submodels
+        self.missing_submodel_ids = missing_submodel_ids
+
+    @property
+    def complete(self) -> bool:
+        """Whether all referenced Submodels are contained in the bundle."""
+        return not self.missing_submodel_ids
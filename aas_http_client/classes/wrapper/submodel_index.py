@@ -0,0 +1,161 @@
+"""Index of the elements of a fetched submodel for lookups without traversing the submodel."""
+
+import logging
+import time
+from collections.abc import Iterator
+from typing import Any, TypeVar
+
+from basyx.aas import model
+
+from aas_http_client.utilities.sdk_tools import iter_element_tree, iter_submodel_elements
+
+_logger = logging.getLogger(__name__)
+
+_Element = TypeVar("_Element", bound=model.SubmodelElement)
+
+
+class SubmodelIndex:
+    """Maps the IdShort paths, semanticIds and types of the elements of a submodel to the elements.
+
+    Elements of SubmodelElementLists are addressed by their index (e.g. 'list[0].property'), elements are found by
+    the value of the last key of their semanticId. The index refers to the elements of the given submodel, so value
+    changes of indexed elements are visible without update. After adding, removing or replacing elements, the
+    changed part must be re-indexed with 'refresh'.
+    """
+
+    def __init__(self, submodel: model.Submodel):
+        """Initializes the index with all elements of the given submodel.
+
+        :param submodel: Submodel to index
+        """
+        self.submodel = submodel
+        self.created = time.monotonic()
+
+        self._elements: dict[str, model.SubmodelElement] = {}
+        self._semantic_ids: dict[str, dict[str, None]] = {}
+        self._types: dict[type, dict[str, None]] = {}
+        # keys each path is indexed by, as the element may have changed when it is removed
+        self._keys: dict[str, tuple[type, str | None]] = {}
+        self.refresh()
+
+    def __len__(self) -> int:
+        """Number of indexed elements."""
+        return len(self._elements)
+
+    def __contains__(self, id_short_path: str) -> bool:
+        """Whether an element with the given IdShort path is indexed."""
+        return id_short_path in self._elements
+
+    def __iter__(self) -> Iterator[tuple[str, model.SubmodelElement]]:
+        """Iterate over the IdShort paths and elements."""
+        return iter(list(self._elements.items()))
+
+    @property
+    def age(self) -> float:
+        """Time in seconds since the index was created."""
+        return time.monotonic() - self.created
+
+    def get(self, id_short_path: str) -> model.SubmodelElement | None:
+        """Get an element by its IdShort path.
+
+        :param id_short_path: IdShort path of the element (e.g. 'collection.list[2].property')
+        :return: Element or None if the submodel contains no such element
+        """
+        return self._elements.get(id_short_path)
+
+    def find_by_semantic_id(self, semantic_id: str) -> list[model.SubmodelElement]:
+        """Find all elements with the given semanticId.
+
+        :param semantic_id: Value of the last key of the semanticId
+        :return: Elements with the semanticId
+        """
+        return [self._elements[path] for path in self._semantic_ids.get(semantic_id, {})]
+
+    def find_by_type(self, element_type: type[_Element]) -> list[_Element]:
+        """Find all elements of the given type, including subclasses.
+
+        :param element_type: Type of the elements (e.g. model.Property)
+        :return: Elements of the type
+        """
+        return [
+            self._elements[path]  # type: ignore[misc]
+            for indexed_type, paths in self._types.items()
+            if issubclass(indexed_type, element_type)
+            for path in paths
+        ]
+
+    def paths_by_semantic_id(self, semantic_id: str) -> list[str]:
+        """Get the IdShort paths of all elements with the given semanticId.
+
+        :param semantic_id: Value of the last key of the semanticId
+        :return: IdShort paths of the elements
+        """
+        return list(self._semantic_ids.get(semantic_id, {}))
+
+    def update_value(self, id_short_path: str, value: Any) -> bool:
+        """Set the value of an indexed Property, e.g. after its value was patched on the server.
+
+        :param id_short_path: IdShort path of the Property
+        :param value: New value, strings are parsed according to the value type of the Property
+        :return: True if the value was set, False if the element is no Property or the value is invalid
+        """
+        element = self._elements.get(id_short_path)
+        if not isinstance(element, model.Property):
+            return False
+
+        try:
+            element.value = model.datatypes.from_xsd(value, element.value_type) if isinstance(value, str) else value
+        except (TypeError, ValueError):
+            _logger.debug(f"Value '{value}' is not valid for Property '{id_short_path}'.")
+            return False
+
+        return True
+
+    def refresh(self, id_short_path: str = "") -> None:
+        """Re-index an element and its child elements after they were changed.
+
+        :param id_short_path: IdShort path of the changed element, re-indexes the complete submodel if empty
+        :raises KeyError: If the element is not indexed
+        """
+        if not id_short_path:
+            self._elements.clear()
+            self._semantic_ids.clear()
+            self._types.clear()
+            self._keys.clear()
+            elements = iter_submodel_elements(self.submodel)
+        else:
+            element = self._elements[id_short_path]
+            for path in [path for path in self._elements if _is_within(path, id_short_path)]:
+                self._remove(path)
+            elements = iter_element_tree(element, id_short_path)
+
+        for path, element in elements:
+            self._add(path, element)
+
+    def _add(self, id_short_path: str, element: model.SubmodelElement) -> None:
+        semantic_id = _semantic_key(element)
+        self._elements[id_short_path] = element
+        self._keys[id_short_path] = (type(element), semantic_id)
+        self._types.setdefault(type(element), {})[id_short_path] = None
+
+        if semantic_id is not None:
+            self._semantic_ids.setdefault(semantic_id, {})[id_short_path] = None
+
+    def _remove(self, id_short_path: str) -> None:
+        del self._elements[id_short_path]
+        element_type, semantic_id = self._keys.pop(id_short_path)
+        self._types[element_type].pop(id_short_path, None)
+
+        if semantic_id is not None:
+            self._semantic_ids.get(semantic_id, {}).pop(id_short_path, None)
+
+
+def _semantic_key(element: model.SubmodelElement) -> str | None:
+    if element.semantic_id is None or not element.semantic_id.key:
+        return None
+
+    return str(element.semantic_id.key[-1].value)
+
+
+def _is_within(path: str, parent: str) -> bool:
+    return path == parent or path.startswith((f"{parent}.", f"{parent}["))
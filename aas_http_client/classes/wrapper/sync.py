@@ -0,0 +1,209 @@
+"""Incremental synchronization of local submodels with a repository."""
+
+import json
+import logging
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+
+from basyx.aas import model
+
+from aas_http_client.classes.client.aas_client import AasHttpClient
+from aas_http_client.classes.wrapper.delta import DeltaOperation, apply_delta, plan_delta
+from aas_http_client.utilities.concurrency import run_concurrently
+from aas_http_client.utilities.encoder import encode_base_64
+from aas_http_client.utilities.hashing import HashTree, create_hash_tree
+from aas_http_client.utilities.id_short_path import get_container_types
+from aas_http_client.utilities.sdk_tools import convert_to_dict as _to_dict
+
+_logger = logging.getLogger(__name__)
+
+
+class SyncStatus(Enum):
+    """Result status of a synchronized submodel."""
+
+    unchanged = "unchanged"
+    created = "created"
+    updated = "updated"
+    replaced = "replaced"
+    failed = "failed"
+
+    def __str__(self) -> str:
+        """String representation of the SyncStatus enum."""
+        return self.value
+
+
+@dataclass(frozen=True)
+class SyncResult:
+    """Represents the synchronization result of a single submodel.
+
+    :param identifier: Unique id of the submodel
+    :param status: Result status
+    :param operations: Delta operations sent to the server
+    """
+
+    identifier: str
+    status: SyncStatus
+    operations: tuple[DeltaOperation, ...] = ()
+
+
+@dataclass
+class SyncReport:
+    """Represents the results of a synchronization."""
+
+    results: list[SyncResult] = field(default_factory=list)
+
+    def get_results(self, status: SyncStatus) -> list[SyncResult]:
+        """Returns the results of all submodels with the given status.
+
+        :param status: Status to filter by
+        :return: List of results
+        """
+        return [result for result in self.results if result.status == status]
+
+
+class SyncManifest:
+    """Persistent hash trees of the submodels last synchronized to a repository."""
+
+    def __init__(self, file: Path | None = None):
+        """Initializes the manifest and loads it from the given file.
+
+        :param file: Path to the manifest file, the manifest is kept in memory only if not set
+        """
+        self.file = file
+        self._lock = threading.Lock()
+        self._trees: dict[str, HashTree] = {}
+
+        if file is not None and file.exists():
+            try:
+                content = json.loads(file.read_text(encoding="utf-8"))
+                self._trees = {identifier: HashTree.from_dict(tree) for identifier, tree in content.items()}
+            except (json.JSONDecodeError, AttributeError) as e:
+                _logger.error(f"Manifest file '{file}' is invalid and is ignored: {e}")
+
+    def get(self, identifier: str) -> HashTree | None:
+        """Get the hash tree of a submodel.
+
+        :param identifier: The Submodels unique id
+        :return: Hash tree or None if the submodel is not contained
+        """
+        with self._lock:
+            return self._trees.get(identifier)
+
+    def set(self, identifier: str, tree: HashTree | None) -> None:
+        """Set or remove the hash tree of a submodel.
+
+        :param identifier: The Submodels unique id
+        :param tree: Hash tree of the submodel as stored on the server, None to remove it
+        """
+        with self._lock:
+            if tree is None:
+                self._trees.pop(identifier, None)
+            else:
+                self._trees[identifier] = tree
+
+    def save(self) -> None:
+        """Save the manifest atomically to its file."""
+        if self.file is None:
+            return
+
+        with self._lock:
+            content = {identifier: tree.to_dict() for identifier, tree in self._trees.items()}
+
+        temp_file = self.file.with_name(f"{self.file.name}.tmp")
+        temp_file.write_text(json.dumps(content, separators=(",", ":")), encoding="utf-8")
+        temp_file.replace(self.file)
+
+
+class SubmodelSync:
+    """Pushes local submodels to a repository sending only the changed parts.
+
+    The hash tree of each pushed submodel is kept in a manifest. Submodels whose hash equals the manifest are
+    skipped without any request. Without manifest entry, the submodel is fetched once to calculate its hash tree.
+    The manifest assumes that the submodels are not changed on the server by others; if a delta update fails,
+    the submodel is replaced completely.
+    """
+
+    def __init__(self, client: AasHttpClient, manifest: SyncManifest | None = None, *, batch_values: bool = True, max_workers: int | None = None):
+        """Initializes the synchronization with the given client.
+
+        :param client: Initialized AAS HTTP client
+        :param manifest: Manifest of the submodel hash trees, defaults to an in-memory manifest
+        :param batch_values: If enabled, multiple changed values of a submodel are sent in a single value-only PATCH, defaults to True
+        :param max_workers: Maximum number of submodels synchronized concurrently, defaults to the 'MaxWorkers' setting of the client
+        """
+        self._client = client
+        self.manifest = manifest or SyncManifest()
+        self.batch_values = batch_values
+        self.max_workers = max_workers or client.max_workers
+
+    def sync(self, submodels: Iterable[model.Submodel | dict]) -> SyncReport:
+        """Synchronizes the given submodels with the repository and saves the manifest.
+
+        :param submodels: SDK submodels or submodel data
+        :return: Report with one result per submodel
+        """
+        if not self._client.submodels:
+            raise ValueError("Client is not initialized. Call 'initialize()' method of the client before synchronizing.")
+
+        report = SyncReport(results=run_concurrently(self._sync_submodel, list(submodels), self.max_workers))
+        self.manifest.save()
+
+        failed = report.get_results(SyncStatus.failed)
+        if failed:
+            _logger.warning(f"{len(failed)} of {len(report.results)} submodels could not be synchronized.")
+
+        return report
+
+    def _sync_submodel(self, submodel: model.Submodel | dict) -> SyncResult:
+        local = submodel if isinstance(submodel, dict) else _to_dict(submodel)
+        if not local or "id" not in local:
+            return SyncResult(str(getattr(submodel, "id", "")), SyncStatus.failed)
+
+        identifier = local["id"]
+        local_tree = create_hash_tree(local)
+        remote_tree = self.manifest.get(identifier)
+
+        if remote_tree is None:
+            remote_tree = self._get_remote_tree(identifier)
+            if remote_tree is None:
+                return self._create(local, local_tree)
+
+        operations = plan_delta(local, remote_tree, local_tree)
+        if not operations:
+            self.manifest.set(identifier, local_tree)
+            return SyncResult(identifier, SyncStatus.unchanged)
+
+        if apply_delta(
+            self._client,
+            identifier,
+            operations,
+            batch_values=self.batch_values,
+            container_types=get_container_types(local.get("submodelElements") or []),
+        ):
+            self.manifest.set(identifier, local_tree)
+            return SyncResult(identifier, SyncStatus.updated, tuple(operations))
+
+        _logger.info(f"Delta update of submodel '{identifier}' failed, replacing the submodel.")
+        if self._client.submodels and self._client.submodels.put_submodels_by_id(self._encode(identifier), local):
+            self.manifest.set(identifier, local_tree)
+            return SyncResult(identifier, SyncStatus.replaced, tuple(operations))
+
+        self.manifest.set(identifier, None)
+        return SyncResult(identifier, SyncStatus.failed, tuple(operations))
+
+    def _get_remote_tree(self, identifier: str) -> HashTree | None:
+        remote = self._client.submodels.get_submodel_by_id(self._encode(identifier)) if self._client.submodels else None
+        return create_hash_tree(remote) if remote else None
+
+    def _create(self, local: dict, local_tree: HashTree) -> SyncResult:
+        if self._client.submodels and self._client.submodels.post_submodel(local) is not None:
+            self.manifest.set(local["id"], local_tree)
+            return SyncResult(local["id"], SyncStatus.created)
+
+        return SyncResult(local["id"], SyncStatus.failed)
+
+    def _encode(self, identifier: str) -> str:
+        return encode_base_64(identifier) if self._client.encoded_ids else identifier
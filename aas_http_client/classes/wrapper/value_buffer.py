@@ -0,0 +1,225 @@
+"""Write-behind buffer for value updates of submodel elements."""
+
+import logging
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Self
+
+from aas_http_client.classes.client.aas_client import AasHttpClient
+from aas_http_client.utilities.concurrency import run_concurrently
+from aas_http_client.utilities.encoder import encode_base_64
+from aas_http_client.utilities.id_short_path import create_value_only_body, parent_path, split_value_only_batch
+
+_logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ValueWriteError:
+    """Represents a value update that could not be written.
+
+    :param submodel_identifier: The Submodels unique id (decoded)
+    :param id_short_path: IdShort path of the submodel element
+    :param value: Value that could not be written
+    """
+
+    submodel_identifier: str
+    id_short_path: str
+    value: Any
+
+
+class ValueWriteBuffer:
+    """Collects value updates of submodel elements and writes them in the background.
+
+    Only the last value per element is kept. The values of a submodel are sent as one value-only PATCH of the
+    submodel after 'flush_interval' seconds or as soon as 'max_batch_size' elements of a submodel changed.
+    Values of SubmodelElementList items and of child elements of Entities and AnnotatedRelationshipElements, and all
+    values of a submodel whose PATCH failed, are sent per element, so failures are reported per IdShort path.
+    The model types of the parent elements are requested once with level 'core'.
+    """
+
+    def __init__(
+        self,
+        client: AasHttpClient,
+        flush_interval: float = 0.5,
+        max_batch_size: int = 500,
+        max_pending: int = 10000,
+        on_error: Callable[[ValueWriteError], None] | None = None,
+    ):
+        """Initializes the buffer and starts the background writer.
+
+        :param client: Initialized AAS HTTP client
+        :param flush_interval: Maximum time in seconds a value is buffered, defaults to 0.5
+        :param max_batch_size: Number of changed elements of a submodel that triggers an immediate write, defaults to 500
+        :param max_pending: Maximum number of buffered and unconfirmed values, 'write' blocks while the limit is reached, defaults to 10000
+        :param on_error: Callback for values that could not be written in the background, errors are logged if not set
+        """
+        if not client.submodels:
+            raise ValueError("Client is not initialized. Call 'initialize()' method of the client before writing values.")
+
+        self._client = client
+        self.flush_interval = flush_interval
+        self.max_batch_size = max_batch_size
+        self.max_pending = max_pending
+        self.on_error = on_error
+
+        self._condition = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._pending: dict[str, dict[str, Any]] = {}
+        self._pending_count = 0
+        self._closed = False
+        # model types of the parents of written elements per submodel
+        self._container_types: dict[str, dict[str, str]] = {}
+
+        self._thread = threading.Thread(target=self._run, name="aas-http-client-value-buffer", daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> Self:
+        """Enter the context of the buffer."""
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Close the buffer and write all buffered values."""
+        self.close()
+
+    def write(self, submodel_identifier: str, id_short_path: str, value: Any, timeout: float | None = None) -> bool:
+        """Buffer the value of a submodel element, replacing a buffered value of the same element.
+
+        :param submodel_identifier: The Submodels unique id (decoded)
+        :param id_short_path: IdShort path of the submodel element (e.g. 'collection.property')
+        :param value: Value-only representation of the element value (e.g. a string for Properties)
+        :param timeout: Maximum time in seconds to wait while the buffer is full, waits without limit if not set
+        :return: True if the value was buffered, False if the buffer stayed full until the timeout
+        :raises RuntimeError: If the buffer is closed
+        """
+
+        def has_capacity() -> bool:
+            return self._closed or self._pending_count < self.max_pending or id_short_path in self._pending.get(submodel_identifier, {})
+
+        with self._condition:
+            if not self._condition.wait_for(has_capacity, timeout):
+                _logger.warning(f"Value buffer is full, value of '{id_short_path}' in submodel '{submodel_identifier}' is not buffered.")
+                return False
+
+            if self._closed:
+                raise RuntimeError("Value buffer is closed.")
+
+            values = self._pending.setdefault(submodel_identifier, {})
+            if id_short_path not in values:
+                self._pending_count += 1
+            values[id_short_path] = value
+
+            if len(values) >= self.max_batch_size:
+                self._condition.notify_all()
+
+        return True
+
+    def flush(self) -> list[ValueWriteError]:
+        """Write all buffered values immediately.
+
+        :return: Values that could not be written
+        """
+        with self._flush_lock:
+            with self._condition:
+                batches, self._pending = self._pending, {}
+
+            if not batches:
+                return []
+
+            try:
+                results = run_concurrently(self._write_submodel, batches.items(), self._client.max_workers)
+            finally:
+                # buffered values count against 'max_pending' until they are written
+                with self._condition:
+                    self._pending_count -= sum(len(values) for values in batches.values())
+                    self._condition.notify_all()
+
+        return [error for errors in results for error in errors]
+
+    def close(self) -> list[ValueWriteError]:
+        """Stop the background writer and write all buffered values.
+
+        :return: Values that could not be written by the final flush
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+        self._thread.join()
+        return self.flush()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._closed or self._has_full_batch(), self.flush_interval)
+                if self._closed:
+                    return
+
+            errors = self.flush()
+            for error in errors:
+                if self.on_error is not None:
+                    self.on_error(error)
+                else:
+                    _logger.error(f"Value of '{error.id_short_path}' in submodel '{error.submodel_identifier}' could not be written.")
+
+    def _has_full_batch(self) -> bool:
+        return any(len(values) >= self.max_batch_size for values in self._pending.values())
+
+    def _write_submodel(self, batch: tuple[str, dict[str, Any]]) -> list[ValueWriteError]:
+        """Write the buffered values of a submodel.
+
+        :param batch: The Submodels unique id and the values per IdShort path
+        :return: Values that could not be written
+        """
+        submodel_identifier, values = batch
+        api = self._client.submodels
+        if api is None:
+            return [ValueWriteError(submodel_identifier, path, value) for path, value in values.items()]
+
+        identifier = encode_base_64(submodel_identifier) if self._client.encoded_ids else submodel_identifier
+        container_types = self._get_container_types(submodel_identifier, identifier, list(values)) if len(values) > 1 else {}
+        nested, single = split_value_only_batch(values, container_types)
+
+        if len(nested) > 1 and not api.patch_submodel_by_id_value_only(identifier, create_value_only_body(nested)):
+            _logger.info(f"Value-only PATCH of submodel '{submodel_identifier}' failed, writing the values per element.")
+            # the structure of the submodel may have changed
+            self._container_types.pop(submodel_identifier, None)
+            single.update(nested)
+        elif len(nested) == 1:
+            single.update(nested)
+
+        write = partial(api.patch_submodel_element_by_path_value_only_submodel_repo, identifier)
+        return [ValueWriteError(submodel_identifier, path, value) for path, value in single.items() if not write(path, value)]
+
+    def _get_container_types(self, submodel_identifier: str, identifier: str, paths: list[str]) -> dict[str, str]:
+        """Get the model types of the parents of submodel elements, requesting unknown parents with level 'core'.
+
+        Parents below elements other than SubmodelElementCollections are not requested, as their children are
+        written per element anyway.
+
+        :param submodel_identifier: The Submodels unique id (decoded)
+        :param identifier: The Submodels id as used in requests
+        :param paths: IdShort paths of the submodel elements
+        :return: Dictionary of IdShort paths and model types of the parents
+        """
+        api = self._client.submodels
+        types = self._container_types.setdefault(submodel_identifier, {})
+        parents: set[str] = set()
+        for path in paths:
+            parent = parent_path(path) if "[" not in path else ""
+            while parent and parent not in parents:
+                parents.add(parent)
+                parent = parent_path(parent)
+
+        # parents ordered by depth, so that the children of other containers are skipped
+        for parent in sorted(parents, key=lambda path: path.count(".")):
+            ancestor = parent_path(parent)
+            if parent in types or (ancestor and types.get(ancestor) != "SubmodelElementCollection") or api is None:
+                continue
+
+            element = api.get_submodel_element_by_path_submodel_repo(identifier, parent, "core")
+            if element:
+                types[parent] = element.get("modelType", "")
+
+        return types
@@ -0,0 +1,305 @@
+"""Change notifications for submodel values based on polling."""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import random
+import threading
+import time
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Self
+
+from aas_http_client.classes.client.aas_client import AasHttpClient
+from aas_http_client.utilities.encoder import encode_base_64
+from aas_http_client.utilities.hashing import content_hash
+from aas_http_client.utilities.id_short_path import child_path
+
+_logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ValueChange:
+    """Represents the change of a value in a watched submodel.
+
+    :param submodel_identifier: The Submodels unique id (decoded)
+    :param id_short_path: Path of the value in the ValueOnly representation (e.g. 'collection.property' or 'range.min')
+    :param old_value: Value before the change, None if the value was added
+    :param new_value: Value after the change, None if the value was removed
+    """
+
+    submodel_identifier: str
+    id_short_path: str
+    old_value: Any
+    new_value: Any
+
+
+@dataclass
+class _WatchState:
+    identifier: str
+    callback: Callable[[ValueChange], None] | None
+    paths: tuple[str, ...]
+    generation: int = 0
+    etag: str = ""
+    root_hash: str = ""
+    element_hashes: dict[str, str] = field(default_factory=dict)
+    values: dict[str, dict[str, Any]] = field(default_factory=dict)
+    initialized: bool = False
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class SubmodelWatcher:
+    """Watches the values of submodels by polling their ValueOnly representation.
+
+    All submodels are polled by one scheduler thread with up to 'max_workers' parallel requests. Each submodel is
+    polled every 'interval' seconds with a random jitter, so the requests of many submodels are spread evenly.
+    Conditional requests (ETag) avoid the transfer of unchanged submodels if the server supports them. Changed
+    submodels are compared per top level element by hash, only changed elements are compared value by value.
+    """
+
+    def __init__(self, client: AasHttpClient, interval: float = 5.0, jitter: float = 0.1, max_workers: int | None = None):
+        """Initializes the watcher with the given client.
+
+        :param client: Initialized AAS HTTP client
+        :param interval: Time in seconds between two polls of a submodel, defaults to 5.0
+        :param jitter: Relative random deviation of the interval, defaults to 0.1 (+/- 10 %)
+        :param max_workers: Maximum number of concurrent polls, defaults to the 'MaxWorkers' setting of the client
+        """
+        if not client.submodels:
+            raise ValueError("Client is not initialized. Call 'initialize()' method of the client before watching submodels.")
+
+        self._client = client
+        self.interval = interval
+        self.jitter = jitter
+        self.max_workers = max_workers or client.max_workers
+
+        self._condition = threading.Condition()
+        self._states: dict[str, _WatchState] = {}
+        # entries of replaced or removed states are skipped, as their generation differs from the watched state
+        self._schedule: list[tuple[float, int, str]] = []
+        self._generations = itertools.count(1)
+        self._listeners: list[Callable[[ValueChange | None], None]] = []
+        self._running = False
+        self._thread: threading.Thread | None = None
+        self._executor: ThreadPoolExecutor | None = None
+
+    def __enter__(self) -> Self:
+        """Start the watcher."""
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Stop the watcher."""
+        self.stop()
+
+    def watch(self, submodel_identifier: str, callback: Callable[[ValueChange], None] | None = None, paths: list[str] | None = None) -> None:
+        """Start watching a submodel.
+
+        The first poll only records the current values, changes are reported from the second poll on.
+
+        :param submodel_identifier: The Submodels unique id (decoded)
+        :param callback: Function called for each change of the submodel, changes are only available via 'changes' if not set
+        :param paths: Only report changes of these paths and their child elements, defaults to all changes
+        """
+        with self._condition:
+            state = _WatchState(submodel_identifier, callback, tuple(paths or ()), generation=next(self._generations))
+            self._states[submodel_identifier] = state
+
+            # the first polls are spread over one interval
+            self._schedule_poll(state, random.uniform(0, self.interval))  # noqa: S311
+
+    def unwatch(self, submodel_identifier: str) -> None:
+        """Stop watching a submodel.
+
+        :param submodel_identifier: The Submodels unique id (decoded)
+        """
+        with self._condition:
+            self._states.pop(submodel_identifier, None)
+
+    def start(self) -> None:
+        """Start polling the watched submodels in the background."""
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="aas-http-client-watcher")
+        self._thread = threading.Thread(target=self._run, name="aas-http-client-watcher-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop polling and end all iterators created by 'changes'."""
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+            listeners = list(self._listeners)
+
+        if self._thread is not None:
+            self._thread.join()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+        for listener in listeners:
+            listener(None)
+
+    async def changes(self) -> AsyncIterator[ValueChange]:
+        """Iterate asynchronously over the changes of all watched submodels until the watcher is stopped.
+
+        :return: Async iterator of the changes
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[ValueChange | None] = asyncio.Queue()
+
+        def listener(change: ValueChange | None) -> None:
+            loop.call_soon_threadsafe(queue.put_nowait, change)
+
+        with self._condition:
+            self._listeners.append(listener)
+
+        try:
+            while (change := await queue.get()) is not None:
+                yield change
+        finally:
+            with self._condition:
+                self._listeners.remove(listener)
+
+    def poll(self, submodel_identifier: str) -> list[ValueChange]:
+        """Poll a watched submodel immediately and report its changes.
+
+        :param submodel_identifier: The Submodels unique id (decoded)
+        :return: Changes since the previous poll
+        """
+        with self._condition:
+            state = self._states.get(submodel_identifier)
+
+        if state is None:
+            raise ValueError(f"Submodel '{submodel_identifier}' is not watched.")
+
+        with state.lock:
+            changes = self._poll(state)
+        self._notify(state, changes)
+        return changes
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while self._running and not self._is_due():
+                    timeout = self._schedule[0][0] - time.monotonic() if self._schedule else None
+                    self._condition.wait(timeout)
+
+                if not self._running:
+                    return
+
+                _, generation, identifier = heapq.heappop(self._schedule)
+                state = self._states.get(identifier)
+
+            if state is not None and state.generation == generation and self._executor is not None:
+                self._executor.submit(self._poll_and_reschedule, state)
+
+    def _is_due(self) -> bool:
+        return bool(self._schedule) and self._schedule[0][0] <= time.monotonic()
+
+    def _schedule_poll(self, state: _WatchState, delay: float) -> None:
+        heapq.heappush(self._schedule, (time.monotonic() + delay, state.generation, state.identifier))
+        self._condition.notify_all()
+
+    def _poll_and_reschedule(self, state: _WatchState) -> None:
+        try:
+            with state.lock:
+                changes = self._poll(state)
+            self._notify(state, changes)
+        except Exception:
+            _logger.exception(f"Polling submodel '{state.identifier}' failed.")
+        finally:
+            with self._condition:
+                # a state replaced by 'watch' in the meantime has been scheduled by 'watch'
+                if self._states.get(state.identifier) is state:
+                    self._schedule_poll(state, self.interval * (1 + random.uniform(-self.jitter, self.jitter)))  # noqa: S311
+
+    def _poll(self, state: _WatchState) -> list[ValueChange]:
+        """Fetch the values of a submodel and compare them with the previous poll.
+
+        :param state: State of the watched submodel
+        :return: Changes since the previous poll
+        """
+        api = self._client.submodels
+        if api is None:
+            return []
+
+        identifier = encode_base_64(state.identifier) if self._client.encoded_ids else state.identifier
+        response = api.get_submodel_by_id_value_only_if_modified(identifier, state.etag)
+        if response is None or response["value"] is None:
+            return []
+
+        content: dict = response["value"]
+        state.etag = response["etag"]
+        root_hash = content_hash(content)
+        if root_hash == state.root_hash:
+            return []
+
+        changes: list[ValueChange] = []
+        element_hashes = {id_short: content_hash(value) for id_short, value in content.items()}
+
+        for id_short in state.element_hashes.keys() - element_hashes.keys():
+            old_values = state.values.pop(id_short)
+            changes.extend(ValueChange(state.identifier, path, value, None) for path, value in old_values.items())
+
+        for id_short, element_hash in element_hashes.items():
+            if state.element_hashes.get(id_short) == element_hash:
+                continue
+
+            old_values = state.values.get(id_short, {})
+            new_values = dict(_flatten(content[id_short], id_short))
+            state.values[id_short] = new_values
+            changes.extend(
+                ValueChange(state.identifier, path, old_values.get(path), new_values.get(path))
+                for path in dict.fromkeys([*old_values, *new_values])
+                if old_values.get(path) != new_values.get(path) or (path in old_values) != (path in new_values)
+            )
+
+        state.root_hash = root_hash
+        state.element_hashes = element_hashes
+
+        if not state.initialized:
+            state.initialized = True
+            return []
+
+        return [change for change in changes if _matches(change.id_short_path, state.paths)]
+
+    def _notify(self, state: _WatchState, changes: list[ValueChange]) -> None:
+        if not changes:
+            return
+
+        with self._condition:
+            listeners = list(self._listeners)
+
+        for change in changes:
+            if state.callback is not None:
+                state.callback(change)
+            for listener in listeners:
+                listener(change)
+
+
+def _flatten(value: Any, path: str) -> list[tuple[str, Any]]:
+    """Flatten a value of the ValueOnly representation into its leaf values.
+
+    :param value: Value of an element in the ValueOnly representation
+    :param path: Path of the value
+    :return: List of tuples with the path and the value of each leaf
+    """
+    if isinstance(value, dict) and value:
+        return [leaf for key, child in value.items() for leaf in _flatten(child, child_path(path, key, 0))]
+
+    if isinstance(value, list) and value:
+        return [leaf for index, child in enumerate(value) for leaf in _flatten(child, child_path(path, None, index, in_list=True))]
+
+    return [(path, value)]
+
+
+def _matches(path: str, watched_paths: tuple[str, ...]) -> bool:
+    if not watched_paths:
+        return True
+
+    return any(path == watched or path.startswith((f"{watched}.", f"{watched}[")) for watched in watched_paths)
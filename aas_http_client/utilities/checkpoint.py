@@ -0,0 +1,74 @@
+"""Checkpoint files for resumable long running operations."""
+
+import json
+import logging
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+_logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Checkpoint:
+    """Position of an interrupted operation over paged collections, used to resume it.
+
+    :param collection: Name of the collection in progress
+    :param cursor: Cursor of the next page of the collection in progress
+    :param offset: Byte offset of the output file after the last completed page
+    :param completed: Names of completely processed collections
+    """
+
+    collection: str = ""
+    cursor: str = ""
+    offset: int = 0
+    completed: list[str] = field(default_factory=list)
+
+    @classmethod
+    def load(cls, file: Path) -> "Checkpoint | None":
+        """Load a checkpoint from a file.
+
+        :param file: Path to the checkpoint file
+        :return: The checkpoint or None if the file does not exist or is invalid
+        """
+        if not file.exists():
+            return None
+
+        try:
+            return cls(**json.loads(file.read_text(encoding="utf-8")))
+        except (json.JSONDecodeError, TypeError) as e:
+            _logger.error(f"Checkpoint file '{file}' is invalid: {e}")
+            return None
+
+    def save(self, file: Path) -> None:
+        """Save the checkpoint atomically to a file.
+
+        :param file: Path to the checkpoint file
+        """
+        temp_file = file.with_name(f"{file.name}.tmp")
+        temp_file.write_text(json.dumps(asdict(self)), encoding="utf-8")
+        temp_file.replace(file)
+
+    def start(self, collection: str) -> str | None:
+        """Start processing a collection.
+
+        :param collection: Name of the collection
+        :return: Cursor to start the collection with or None if the collection is already completed
+        """
+        if collection in self.completed:
+            return None
+
+        cursor = self.cursor if self.collection == collection else ""
+        self.collection = collection
+        self.cursor = cursor
+        return cursor
+
+    def advance(self, cursor: str, offset: int = 0) -> None:
+        """Record a completely processed page of the current collection.
+
+        :param cursor: Cursor of the next page, an empty cursor completes the collection
+        :param offset: Byte offset of the output file after the page
+        """
+        self.cursor = cursor
+        self.offset = offset
+        if not cursor:
+            self.completed.append(self.collection)
@@ -0,0 +1,121 @@
+"""Helper functions for running API calls concurrently."""
+
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+_logger = logging.getLogger(__name__)
+
+
+def run_concurrently(function: Callable[[Any], Any], items: Iterable[Any], max_workers: int) -> list[Any]:
+    """Call a function for each item using a bounded thread pool.
+
+    :param function: Function to call for each item
+    :param items: Items to pass to the function
+    :param max_workers: Maximum number of concurrent calls, values below 2 run the calls sequentially
+    :return: Results in the order of the given items
+    """
+    items = list(items)
+    if max_workers < 2 or len(items) < 2:
+        return [function(item) for item in items]
+
+    workers = min(max_workers, len(items))
+    _logger.debug("Run %s calls with %s workers.", len(items), workers)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="aas-http-client") as executor:
+        return list(executor.map(function, items))
+
+
+class RateLimiter:
+    """Limits the rate of calls shared by several threads (token bucket).
+
+    Up to 'burst' calls pass without delay, further calls are spaced evenly to 'rate' calls per second.
+    Waiting threads are served in the order they called 'acquire'.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """Initializes the rate limiter.
+
+        :param rate: Maximum number of calls per second, values of 0 or below disable the limit
+        :param burst: Number of calls allowed without delay, defaults to 1
+        """
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+
+    def acquire(self) -> None:
+        """Wait until the next call is allowed."""
+        if self.rate <= 0:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # the token is reserved immediately, so later callers wait behind this one
+            self._tokens -= 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if delay > 0:
+            time.sleep(delay)
+
+
+def iter_prefetched(iterable: Iterable[Any], depth: int = 1) -> Iterator[Any]:
+    """Iterate over an iterable in a background thread, reading ahead up to 'depth' items.
+
+    Used to overlap reading (e.g. fetching the next page) with processing the current item while keeping memory bounded.
+
+    :param iterable: Iterable to read in the background
+    :param depth: Maximum number of items read ahead
+    :return: Iterator of the items in their original order
+    """
+    items: queue.Queue = queue.Queue(maxsize=max(depth, 1))
+    stop = threading.Event()
+
+    reader = threading.Thread(target=_read_ahead, args=(iterable, items, stop), name="aas-http-client-prefetch", daemon=True)
+    reader.start()
+
+    try:
+        while True:
+            has_item, item = items.get()
+            if not has_item:
+                if item is not None:
+                    raise item
+                return
+
+            yield item
+    finally:
+        stop.set()
+
+
+def _read_ahead(iterable: Iterable[Any], items: queue.Queue, stop: threading.Event) -> None:
+    """Read the items of an iterable into a queue until the iterable is exhausted or the reading is stopped.
+
+    :param iterable: Iterable to read
+    :param items: Queue receiving tuples of a flag whether an item was read and the item (or the raised exception)
+    :param stop: Event to stop reading
+    """
+
+    def put(entry: tuple[bool, Any]) -> bool:
+        while not stop.is_set():
+            try:
+                items.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    try:
+        for item in iterable:
+            if not put((True, item)):
+                return
+    except Exception as e:
+        put((False, e))
+        return
+
+    put((False, None))
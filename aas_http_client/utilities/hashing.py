@@ -0,0 +1,166 @@
+"""Content hashing of AAS data for change detection."""
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Any
+
+from aas_http_client.utilities.id_short_path import child_path, parent_path
+
+
+def canonical_json(data: Any) -> bytes:
+    """Serialize data to a canonical JSON representation (sorted keys, no whitespace).
+
+    :param data: JSON serializable data
+    :return: UTF-8 encoded canonical JSON
+    """
+    return json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def content_hash(data: Any, *, ignore_empty: bool = False) -> str:
+    """Calculate the SHA-256 hash of the canonical JSON representation of the given data.
+
+    Two objects get the same hash if their JSON data is equal, regardless of the key order.
+
+    :param data: JSON serializable data
+    :param ignore_empty: If enabled, empty values (None, "", [] and {}) are ignored, as servers differ in omitting them, defaults to False
+    :return: Hex digest of the hash
+    """
+    if ignore_empty:
+        data = strip_empty(data)
+
+    return hashlib.sha256(canonical_json(data)).hexdigest()
+
+
+def strip_empty(data: Any) -> Any:
+    """Recursively remove empty values (None, "", [] and {}) from dictionaries.
+
+    :param data: JSON serializable data
+    :return: Data without empty dictionary values
+    """
+    if isinstance(data, dict):
+        stripped = {key: strip_empty(value) for key, value in data.items()}
+        return {key: value for key, value in stripped.items() if value not in (None, "", [], {})}
+
+    if isinstance(data, list):
+        return [strip_empty(item) for item in data]
+
+    return data
+
+
+# keys holding the child elements of container elements
+CHILD_KEYS: dict[str, str] = {
+    "SubmodelElementCollection": "value",
+    "SubmodelElementList": "value",
+    "Entity": "statements",
+    "AnnotatedRelationshipElement": "annotations",
+}
+
+# keys holding the value of an element (see value-only serialization)
+VALUE_KEYS: dict[str, tuple[str, ...]] = {
+    "Property": ("value",),
+    "MultiLanguageProperty": ("value",),
+    "Range": ("min", "max"),
+    "File": ("value",),
+    "Blob": ("value",),
+    "ReferenceElement": ("value",),
+    "RelationshipElement": ("first", "second"),
+    "AnnotatedRelationshipElement": ("first", "second"),
+    "Entity": ("globalAssetId", "specificAssetIds"),
+    "BasicEventElement": ("observed",),
+}
+
+
+@dataclass
+class HashTree:
+    """Merkle hash tree of a submodel.
+
+    Each node is addressed by its IdShort path, the submodel itself by the empty path "".
+
+    :param hashes: Hash of each element subtree (metadata, value and child hashes)
+    :param metadata: Hash of each element without its value and child elements
+    :param values: Hash of the value of each element without its child elements
+    """
+
+    hashes: dict[str, str] = field(default_factory=dict)
+    metadata: dict[str, str] = field(default_factory=dict)
+    values: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def root(self) -> str:
+        """Hash of the whole submodel."""
+        return self.hashes.get("", "")
+
+    def get_children(self) -> dict[str, list[str]]:
+        """Get the paths of the direct child elements of each path.
+
+        :return: Dictionary of paths and the ordered paths of their child elements
+        """
+        children: dict[str, list[str]] = {}
+        for path in self.hashes:
+            if path:
+                children.setdefault(parent_path(path), []).append(path)
+
+        return children
+
+    def to_dict(self) -> dict[str, dict[str, str]]:
+        """Convert the hash tree to a JSON serializable dictionary.
+
+        :return: Dictionary representation of the hash tree
+        """
+        return {"hashes": self.hashes, "metadata": self.metadata, "values": self.values}
+
+    @classmethod
+    def from_dict(cls, content: dict) -> "HashTree":
+        """Create a hash tree from its dictionary representation.
+
+        :param content: Dictionary created by 'to_dict'
+        :return: The hash tree
+        """
+        return cls(hashes=dict(content.get("hashes", {})), metadata=dict(content.get("metadata", {})), values=dict(content.get("values", {})))
+
+
+def create_hash_tree(submodel: dict) -> HashTree:
+    """Create the Merkle hash tree of the given submodel data.
+
+    :param submodel: Submodel data
+    :return: Hash tree with a node for the submodel and each submodel element
+    """
+    tree = HashTree()
+    metadata = {key: value for key, value in submodel.items() if key != "submodelElements"}
+    tree.metadata[""] = content_hash(metadata, ignore_empty=True)
+    child_hashes = _add_elements(tree, submodel.get("submodelElements") or [], "", in_list=False)
+    tree.hashes[""] = _combine(tree.metadata[""], "", child_hashes)
+
+    return tree
+
+
+def _add_elements(tree: HashTree, elements: list[dict], parent: str, *, in_list: bool) -> list[str]:
+    hashes = []
+    for index, element in enumerate(elements):
+        path = child_path(parent, element.get("idShort"), index, in_list=in_list)
+        model_type = element.get("modelType", "")
+        child_key = CHILD_KEYS.get(model_type)
+        value_keys = VALUE_KEYS.get(model_type, ())
+
+        metadata = {key: value for key, value in element.items() if key != child_key and key not in value_keys}
+        value = {key: element[key] for key in value_keys if key in element}
+
+        child_hashes: list[str] = []
+        if child_key:
+            child_hashes = _add_elements(tree, element.get(child_key) or [], path, in_list=model_type == "SubmodelElementList")
+
+        tree.metadata[path] = content_hash(metadata, ignore_empty=True)
+        tree.values[path] = content_hash(value, ignore_empty=True)
+        tree.hashes[path] = _combine(tree.metadata[path], tree.values[path], child_hashes)
+        hashes.append(tree.hashes[path])
+
+    return hashes
+
+
+def _combine(metadata_hash: str, value_hash: str, child_hashes: list[str]) -> str:
+    digest = hashlib.sha256()
+    for part in (metadata_hash, value_hash, *child_hashes):
+        digest.update(part.encode("ascii"))
+
+    return digest.hexdigest()
@@ -11,55 +11,132 @@ STATUS_CODE_200 = 200
 STATUS_CODE_201 = 201
 STATUS_CODE_202 = 202
 STATUS_CODE_204 = 204
+STATUS_CODE_302 = 302
+STATUS_CODE_304 = 304
 STATUS_CODE_404 = 404
+STATUS_CODE_405 = 405
+STATUS_CODE_500 = 500
+STATUS_CODE_501 = 501
 
+DEFAULT_MAX_LOGGED_BODY_SIZE = 2048
 
-def log_response(response: Response, log_level: int = logging.ERROR):  # noqa: C901, PLR0912
+_max_logged_body_size: int = DEFAULT_MAX_LOGGED_BODY_SIZE
+
+
+def set_max_logged_body_size(size: int) -> None:
+    """Sets the maximum number of bytes of a response body that are written to the log.
+
+    Larger bodies are truncated and not parsed for error messages.
+
+    :param size: Maximum body size in bytes, 0 disables logging of response bodies
+    """
+    global _max_logged_body_size  # noqa: PLW0603
+    _max_logged_body_size = max(size, 0)
+
+
+def get_max_logged_body_size() -> int:
+    """Gets the maximum number of bytes of a response body that are written to the log.
+
+    :return: Maximum body size in bytes
+    """
+    return _max_logged_body_size
+
+
+def log_response(response: Response, log_level: int = logging.ERROR, max_body_size: int | None = None):
     """Extracts and logs error messages from an HTTP response.
 
     This method parses the response content for error details, messages, or error fields,
     and logs each error message found. If the response cannot be decoded as JSON,
     it logs the raw response content. Always logs the HTTP status code.
+    Nothing is evaluated if the given log level is disabled. Bodies larger than the
+    configured maximum size are truncated and not parsed.
 
     :param response: The HTTP response object to extract and log errors from
     :param log_level: The logging level to use (default is logging.ERROR)
+    :param max_body_size: Maximum body size in bytes to log, defaults to the value set by 'set_max_logged_body_size'
+    """
+    if not _logger.isEnabledFor(log_level):
+        return
+
+    if max_body_size is None:
+        max_body_size = _max_logged_body_size
+
+    content: bytes = response.content or b""
+    truncated = len(content) > max_body_size
+    logged_content = content[:max_body_size]
+
+    result_error_messages = _extract_error_messages(logged_content) if not truncated else []
+    if len(result_error_messages) == 0 and logged_content:
+        result_error_messages.append(_body_to_text(logged_content, truncated))
+
+    extra = {
+        "http_status_code": response.status_code,
+        "http_method": response.request.method if response.request is not None else None,
+        "http_url": response.url,
+        "http_body_size": len(content),
+        "http_body_truncated": truncated,
+    }
+
+    _logger.log(log_level, "Status code: %s", response.status_code, extra=extra)
+    for result_error_message in result_error_messages:
+        _logger.log(log_level, "%s", result_error_message, extra=extra)
+
+    if _logger.isEnabledFor(logging.DEBUG):
+        _logger.debug("Full response content: %s", _body_to_text(logged_content, truncated), extra=extra)
+
+
+def _extract_error_messages(content: bytes) -> list[str]:  # noqa: C901
+    """Extracts error messages from the JSON body of an HTTP response.
+
+    :param content: Response body
+    :return: List of error messages, empty if the body does not contain known error fields
     """
     result_error_messages: list[str] = []
 
+    if not content:
+        return result_error_messages
+
     try:
-        response_content_dict: dict = json.loads(response.content)
+        response_content_dict = json.loads(content)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return result_error_messages
 
-        if "detail" in response_content_dict:
-            detail: dict = response_content_dict.get("detail", {})
-            if "error" in detail:
-                error: str = detail.get("error", "")
-                result_error_messages.append(f"{error}")
-            else:
-                result_error_messages.append(f"{detail}")
+    if not isinstance(response_content_dict, dict):
+        return result_error_messages
 
-        elif "messages" in response_content_dict or "Messages" in response_content_dict:
-            messages: list = response_content_dict.get("messages", [])
+    if "detail" in response_content_dict:
+        detail = response_content_dict.get("detail", {})
+        if isinstance(detail, dict) and "error" in detail:
+            result_error_messages.append(f"{detail.get('error', '')}")
+        else:
+            result_error_messages.append(f"{detail}")
 
-            if not messages:
-                messages = response_content_dict.get("Messages", [])
+    elif "messages" in response_content_dict or "Messages" in response_content_dict:
+        messages: list = response_content_dict.get("messages", [])
 
-            for message in messages:
-                if isinstance(message, dict) and "message" in message:
-                    result_error_messages.append(message["message"])
-                else:
-                    result_error_messages.append(str(message))
-        elif "error" in response_content_dict:
-            result_error_messages.append(response_content_dict.get("error", ""))
+        if not messages:
+            messages = response_content_dict.get("Messages", [])
 
-        if len(result_error_messages) == 0 and response.text:
-            result_error_messages.append(response.text)
+        for message in messages:
+            if isinstance(message, dict) and "message" in message:
+                result_error_messages.append(message["message"])
+            else:
+                result_error_messages.append(str(message))
+    elif "error" in response_content_dict:
+        result_error_messages.append(response_content_dict.get("error", ""))
 
-    except json.JSONDecodeError:
-        if response.content and response.content != "b''":
-            result_error_messages.append(str(response.content))
+    return result_error_messages
 
-    _logger.log(log_level, f"Status code: {response.status_code}")
-    for result_error_message in result_error_messages:
-        _logger.log(log_level, result_error_message)
 
-    _logger.debug(f"Full response content: {str(response.content)}")
+def _body_to_text(content: bytes, truncated: bool) -> str:  # noqa: FBT001
+    """Converts a (possibly truncated) response body to text for logging.
+
+    :param content: Response body
+    :param truncated: True if the body was truncated
+    :return: Body as text
+    """
+    text = content.decode("utf-8", errors="replace")
+    if truncated:
+        return f"{text}... (truncated)"
+
+    return text
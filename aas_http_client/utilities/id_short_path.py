@@ -0,0 +1,176 @@
+"""Helper functions for IdShort paths of submodel elements in JSON data."""
+
+import re
+from collections.abc import Iterator
+from typing import Any
+
+_PATH_SEGMENT = re.compile(r"([^.\[\]]+)|\[(\d+)\]")
+
+_CONTAINER_TYPES = ("SubmodelElementCollection", "SubmodelElementList", "Entity", "AnnotatedRelationshipElement")
+
+
+def iter_element_data(elements: list[dict], parent_path: str = "", *, in_list: bool = False) -> Iterator[tuple[str, dict]]:
+    """Iterate depth-first over submodel element data.
+
+    Elements of a SubmodelElementList are addressed by their index (e.g. 'list[0].property').
+
+    :param elements: List of submodel element data (e.g. the 'submodelElements' of a submodel)
+    :param parent_path: IdShort path of the parent element, defaults to ""
+    :param in_list: Whether the elements are items of a SubmodelElementList, defaults to False
+    :return: Iterator of tuples with the IdShort path and the submodel element data
+    """
+    for index, element in enumerate(elements):
+        path = child_path(parent_path, element.get("idShort"), index, in_list=in_list)
+
+        yield path, element
+
+        model_type = element.get("modelType")
+        if model_type == "SubmodelElementList":
+            yield from iter_element_data(element.get("value") or [], path, in_list=True)
+        elif model_type == "SubmodelElementCollection":
+            yield from iter_element_data(element.get("value") or [], path)
+        elif model_type == "Entity":
+            yield from iter_element_data(element.get("statements") or [], path)
+        elif model_type == "AnnotatedRelationshipElement":
+            yield from iter_element_data(element.get("annotations") or [], path)
+
+
+def iter_file_elements(submodel: dict) -> Iterator[tuple[str, dict]]:
+    """Iterate over all File elements of the given submodel data.
+
+    :param submodel: Submodel data
+    :return: Iterator of tuples with the IdShort path and the File element data
+    """
+    for path, element in iter_element_data(submodel.get("submodelElements") or []):
+        if element.get("modelType") == "File":
+            yield path, element
+
+
+def child_path(parent: str, id_short: str | None, index: int, *, in_list: bool = False) -> str:
+    """Build the IdShort path of a child element.
+
+    :param parent: IdShort path of the parent element, "" for top level elements
+    :param id_short: IdShort of the child element
+    :param index: Position of the child element within its parent
+    :param in_list: Whether the parent is a SubmodelElementList, whose items are addressed by index, defaults to False
+    :return: IdShort path of the child element
+    """
+    if in_list:
+        return f"{parent}[{index}]"
+
+    return f"{parent}.{id_short}" if parent else str(id_short)
+
+
+def split_path(id_short_path: str) -> list[str | int]:
+    """Split an IdShort path into its IdShorts and list indexes.
+
+    :param id_short_path: IdShort path (e.g. 'collection.list[2].property')
+    :return: List of IdShorts (str) and list indexes (int), e.g. ['collection', 'list', 2, 'property']
+    """
+    segments: list[str | int] = []
+    for id_short, index in _PATH_SEGMENT.findall(id_short_path):
+        segments.append(id_short if id_short else int(index))
+
+    return segments
+
+
+def parent_path(id_short_path: str) -> str:
+    """Get the IdShort path of the parent element.
+
+    :param id_short_path: IdShort path (e.g. 'collection.list[2]')
+    :return: IdShort path of the parent element (e.g. 'collection.list') or "" for top level elements
+    """
+    if id_short_path.endswith("]"):
+        return id_short_path[: id_short_path.rindex("[")]
+
+    separator = id_short_path.rfind(".")
+    return id_short_path[:separator] if separator >= 0 else ""
+
+
+def create_value_only_body(values: dict[str, Any]) -> dict:
+    """Create a nested value-only body (as used by the value-only PATCH of a submodel) from element values.
+
+    The paths must only contain SubmodelElementCollections as parents (see 'split_value_only_batch').
+
+    :param values: Dictionary of IdShort paths (e.g. 'collection.property') and values
+    :return: Value-only representation of the elements, e.g. {'collection': {'property': value}}
+    """
+    body: dict = {}
+    for path, value in values.items():
+        node = body
+        segments = path.split(".")
+        for segment in segments[:-1]:
+            node = node.setdefault(segment, {})
+        node[segments[-1]] = value
+
+    return body
+
+
+def get_container_types(elements: list[dict]) -> dict[str, str]:
+    """Get the model types of all container elements, as required by 'split_value_only_batch'.
+
+    :param elements: List of submodel element data (e.g. the 'submodelElements' of a submodel)
+    :return: Dictionary of IdShort paths and model types of the SubmodelElementCollections, SubmodelElementLists,
+        Entities and AnnotatedRelationshipElements
+    """
+    return {path: element["modelType"] for path, element in iter_element_data(elements) if element.get("modelType") in _CONTAINER_TYPES}
+
+
+def split_value_only_batch(values: dict[str, Any], container_types: dict[str, str]) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Split element values into values that can be combined by 'create_value_only_body' and values to be written per element.
+
+    Items of SubmodelElementLists can not be addressed in a value-only body, and the child elements of Entities and
+    AnnotatedRelationshipElements are nested below 'statements' and 'annotations' there. Their values, and the values
+    of elements below containers of unknown type, are written per element.
+
+    :param values: Dictionary of IdShort paths and values
+    :param container_types: Dictionary of IdShort paths and model types of the container elements (see 'get_container_types')
+    :return: Tuple of the values for a value-only body and the values to be written per element
+    """
+    batch: dict[str, Any] = {}
+    single: dict[str, Any] = {}
+    for path, value in values.items():
+        parent = parent_path(path) if "[" not in path else None
+        while parent and container_types.get(parent) == "SubmodelElementCollection":
+            parent = parent_path(parent)
+
+        if parent == "":
+            batch[path] = value
+        else:
+            single[path] = value
+
+    return batch, single
+
+
+def find_value(value_only: dict, id_short_path: str) -> Any:
+    """Find the value of a submodel element in the ValueOnly representation of a submodel.
+
+    :param value_only: ValueOnly representation of a submodel (e.g. {'collection': {'property': value}})
+    :param id_short_path: IdShort path of the submodel element (e.g. 'collection.list[2].property')
+    :return: Value of the submodel element
+    :raises KeyError: If the submodel element is not contained
+    """
+    node: Any = value_only
+    for segment in split_path(id_short_path):
+        if isinstance(segment, int):
+            if not isinstance(node, list) or segment >= len(node):
+                raise KeyError(id_short_path)
+            node = node[segment]
+            continue
+
+        if not isinstance(node, dict):
+            raise KeyError(id_short_path)
+
+        if segment in node:
+            node = node[segment]
+            continue
+
+        # child elements of Entities and AnnotatedRelationshipElements
+        children = node.get("statements", node.get("annotations"))
+        if isinstance(children, list):
+            children = {key: value for child in children if isinstance(child, dict) for key, value in child.items()}
+        if not isinstance(children, dict) or segment not in children:
+            raise KeyError(id_short_path)
+        node = children[segment]
+
+    return node
@@ -2,6 +2,7 @@
 
 import json
 import logging
+from collections.abc import Iterator
 from typing import Any
 
 import basyx.aas.adapter.json
@@ -27,6 +28,52 @@ def get_submodel_ids(shell: model.AssetAdministrationShell) -> list[str]:
     return submodel_ids
 
 
+def iter_submodel_elements(submodel: model.Submodel) -> Iterator[tuple[str, model.SubmodelElement]]:
+    """Iterate depth-first over all submodel elements of the given submodel.
+
+    Elements of a SubmodelElementList are addressed by their index (e.g. 'list[0].property').
+
+    :param submodel: The submodel to iterate over
+    :return: Iterator of tuples with the IdShort path and the submodel element
+    """
+    yield from _iter_elements(submodel.submodel_element, "")
+
+
+def iter_element_tree(element: model.SubmodelElement, id_short_path: str) -> Iterator[tuple[str, model.SubmodelElement]]:
+    """Iterate depth-first over the given submodel element and all its child elements.
+
+    :param element: The submodel element to iterate over
+    :param id_short_path: IdShort path of the given element within its submodel
+    :return: Iterator of tuples with the IdShort path and the submodel element, starting with the given element
+    """
+    yield id_short_path, element
+    yield from _iter_children(element, id_short_path)
+
+
+def _iter_elements(elements: Any, parent_path: str, *, in_list: bool = False) -> Iterator[tuple[str, model.SubmodelElement]]:
+    for index, element in enumerate(elements):
+        if in_list:
+            path = f"{parent_path}[{index}]"
+        elif parent_path:
+            path = f"{parent_path}.{element.id_short}"
+        else:
+            path = str(element.id_short)
+
+        yield path, element
+        yield from _iter_children(element, path)
+
+
+def _iter_children(element: model.SubmodelElement, path: str) -> Iterator[tuple[str, model.SubmodelElement]]:
+    if isinstance(element, model.SubmodelElementList):
+        yield from _iter_elements(element.value, path, in_list=True)
+    elif isinstance(element, model.SubmodelElementCollection):
+        yield from _iter_elements(element.value, path)
+    elif isinstance(element, model.Entity):
+        yield from _iter_elements(element.statement, path)
+    elif isinstance(element, model.AnnotatedRelationshipElement):
+        yield from _iter_elements(element.annotation, path)
+
+
 def add_submodel_to_aas(aas: model.AssetAdministrationShell, submodel: model.Submodel) -> bool:
     """Add a given Submodel correctly to a provided AssetAdministrationShell.
 
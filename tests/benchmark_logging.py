@@ -0,0 +1,57 @@
+"""Benchmark of the logging overhead on the request path with logging disabled.
+
+Run with: python -m tests.benchmark_logging
+"""
+
+import json
+import logging
+import timeit
+
+import requests
+
+from aas_http_client.utilities.http_helper import log_response
+
+_logger = logging.getLogger("aas_http_client.benchmark")
+
+ITERATIONS = 100_000
+ERROR_BODY = json.dumps({"messages": [{"message": "x" * 64, "code": "400"}] * 2_000}).encode()
+
+
+def _create_response(content: bytes) -> requests.Response:
+    response = requests.models.Response()
+    response.status_code = 400
+    response._content = content
+    response.url = "http://localhost/submodels/aHR0cHM6Ly9leGFtcGxlLmNvbS9pZHMvc20"
+    response.request = requests.Request("GET", response.url).prepare()
+    return response
+
+
+def _eager_log_response(response: requests.Response) -> None:
+    """Logging as done before: f-strings and full JSON parsing regardless of the log level."""
+    _logger.debug(f"Call REST API url '{response.url}'")
+    messages = [message["message"] for message in json.loads(response.content).get("messages", [])]
+    _logger.error(f"Status code: {response.status_code}")
+    for message in messages:
+        _logger.error(message)
+    _logger.debug(f"Full response content: {response.content!s}")
+
+
+def _lazy_log_response(response: requests.Response) -> None:
+    """Logging as done now: deferred formatting and early exit if the level is disabled."""
+    _logger.debug("Call REST API url '%s'", response.url)
+    log_response(response)
+
+
+def main() -> None:
+    """Runs the benchmark and prints the per call overhead."""
+    logging.disable(logging.CRITICAL)
+    response = _create_response(ERROR_BODY)
+
+    for name, function in (("eager", _eager_log_response), ("lazy", _lazy_log_response)):
+        iterations = ITERATIONS // 100 if name == "eager" else ITERATIONS
+        seconds = timeit.timeit(lambda function=function: function(response), number=iterations)
+        print(f"{name:>5}: {seconds / iterations * 1_000_000:10.3f} µs per call (error body {len(ERROR_BODY)} bytes, logging off)")
+
+
+if __name__ == "__main__":
+    main()
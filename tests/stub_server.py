@@ -0,0 +1,440 @@
+"""Minimal in-memory AAS server for offline tests.
+
+Serves a subset of the AAS repository and registry API from dictionaries and records
+the requests it received.
+"""
+
+import hashlib
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlparse
+
+from aas_http_client.utilities.encoder import decode_base_64
+
+# keys holding the child elements of container elements
+CHILD_KEYS = {
+    "SubmodelElementCollection": "value",
+    "SubmodelElementList": "value",
+    "Entity": "statements",
+    "AnnotatedRelationshipElement": "annotations",
+}
+
+
+class StubAasServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _StubHandler)
+        self.lock = threading.Lock()
+        self.shells: dict[str, dict] = {}
+        self.submodels: dict[str, dict] = {}
+        self.shell_descriptors: dict[str, dict] = {}
+        self.submodel_descriptors: dict[str, dict] = {}
+        self.attachments: dict[tuple[str, str], bytes] = {}
+        self.fail_cursors: set[str] = set()
+        self.etags = True
+        self.operations: dict[str, dict] = {}
+        self.operation_polls = 2
+        # fields of the operation results by idShort path, e.g. {"executionState": "Failed", "success": False}
+        self.operation_results: dict[str, dict] = {}
+        self.search_delay = 0.0
+        self.profiles: list[str] = []
+        # routes answered with 405, e.g. 'PATCH /submodels/*' (identifiers replaced by '*')
+        self.unsupported: set[str] = set()
+        # the next 'delayed_requests' GET requests are answered after 'delay' seconds
+        self.delay = 0.0
+        self.delayed_requests = 0
+        self.requests: list[tuple[str, str, dict]] = []
+        self.connections = 0
+        self.token_requests = 0
+        self.token_counter = 0
+        self.expected_authorization: str | None = None
+        self.unauthorized = 0
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def start(self) -> "StubAasServer":
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def count(self, method: str, path_prefix: str = "") -> int:
+        with self.lock:
+            return sum(1 for m, p, _ in self.requests if m == method and p.startswith(path_prefix))
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    server: StubAasServer
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, body=None, headers: dict | None = None):
+        if isinstance(body, bytes):
+            data, content_type = body, "application/octet-stream"
+        else:
+            data, content_type = (b"" if body is None else json.dumps(body).encode()), "application/json"
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        if self.headers.get("Connection", "").lower() == "close":
+            self.send_header("Connection", "close")
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return None
+        data = self.rfile.read(length)
+        if "json" not in self.headers.get("Content-Type", ""):
+            return data
+        return json.loads(data)
+
+    def _handle(self, method: str):
+        url = urlparse(self.path)
+        parts = [unquote(part) for part in url.path.split("/") if part]
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        body = self._read_body()
+
+        with self.server.lock:
+            self.server.requests.append((method, url.path, dict(self.headers)))
+            delayed = method == "GET" and self.server.delayed_requests > 0
+            if delayed:
+                self.server.delayed_requests -= 1
+
+        if delayed:
+            time.sleep(self.server.delay)
+
+        if parts == ["token"] and method == "POST":
+            with self.server.lock:
+                self.server.token_requests += 1
+                self.server.token_counter += 1
+                token = f"token-{self.server.token_counter}"
+            self._send(200, {"access_token": token, "expires_in": 3600, "token_type": "Bearer"})
+            return
+
+        expected = self.server.expected_authorization
+        if expected is not None and self.headers.get("Authorization") != expected:
+            with self.server.lock:
+                self.server.unauthorized += 1
+            self._send(401, {"messages": [{"message": "Unauthorized"}]})
+            return
+
+        route = f"{method} /" + "/".join("*" if index in (1, 3) else part for index, part in enumerate(parts))
+        if route in self.server.unsupported:
+            self._send(405, {"messages": [{"message": "Method not allowed"}]})
+            return
+
+        if parts == ["description"] and method == "GET":
+            self._send(200, {"profiles": self.server.profiles})
+            return
+
+        if parts == ["search"] and method == "POST":
+            self._handle_search(body or {})
+            return
+
+        stores = {
+            "shells": self.server.shells,
+            "submodels": self.server.submodels,
+            "shell-descriptors": self.server.shell_descriptors,
+            "submodel-descriptors": self.server.submodel_descriptors,
+        }
+        if parts and parts[0] in stores:
+            self._handle_store(method, stores[parts[0]], parts, query, body)
+            return
+
+        self._send(404, {"messages": [{"message": "Not found"}]})
+
+    def _handle_search(self, body: dict):
+        time.sleep(self.server.search_delay)
+        query = body.get("query") or {}
+        with self.server.lock:
+            hits = [
+                item for item in self.server.shell_descriptors.values() if str(query.get("value", "")) in str(item.get(query.get("path", "id"), ""))
+            ]
+        page = body.get("page") or {}
+        index, size = int(page.get("index", 0)), int(page.get("size") or len(hits) or 1)
+        self._send(200, {"total": len(hits), "hits": hits[index * size : (index + 1) * size]})
+
+    def _handle_store(self, method: str, store: dict, parts: list[str], query: dict, body):  # noqa: C901, PLR0911, PLR0912
+        if len(parts) == 1:
+            if method == "GET":
+                with self.server.lock:
+                    items = list(store.values())
+                if query.get("cursor") in self.server.fail_cursors:
+                    self._send(500, {"messages": [{"message": "Internal server error"}]})
+                    return
+                start = int(query.get("cursor") or 0)
+                limit = int(query.get("limit") or 0) or len(items)
+                result = items[start : start + limit]
+                paging = {"cursor": str(start + limit)} if start + limit < len(items) else {}
+                self._send(200, {"result": result, "paging_metadata": paging})
+                return
+            if method == "POST":
+                with self.server.lock:
+                    if body["id"] in store:
+                        self._send(409, {"messages": [{"message": "Conflict"}]})
+                        return
+                    store[body["id"]] = body
+                self._send(201, body)
+                return
+
+        identifier = decode_base_64(parts[1])
+        with self.server.lock:
+            item = store.get(identifier)
+
+        if len(parts) == 2:
+            if method == "GET":
+                if item is not None and query.get("extent") == "withoutBlobValue":
+                    item = _without_blob_values(item)
+                if item is not None and query.get("level") == "core":
+                    item = _core(item)
+                self._send(200, item) if item is not None else self._send(404, {"messages": [{"message": "Not found"}]})
+                return
+            if method == "PUT":
+                if item is None:
+                    self._send(404, {"messages": [{"message": "Not found"}]})
+                    return
+                with self.server.lock:
+                    store[identifier] = body
+                self._send(204)
+                return
+            if method == "PATCH":
+                if item is None:
+                    self._send(404, {"messages": [{"message": "Not found"}]})
+                    return
+                with self.server.lock:
+                    store[identifier] = {**item, **body}
+                self._send(204)
+                return
+            if method == "DELETE":
+                with self.server.lock:
+                    removed = store.pop(identifier, None)
+                self._send(204) if removed is not None else self._send(404, {"messages": [{"message": "Not found"}]})
+                return
+
+        if parts[0] == "shells" and len(parts) == 4 and parts[2] == "submodels" and method == "PUT":
+            submodel_identifier = decode_base_64(parts[3])
+            with self.server.lock:
+                if item is None or submodel_identifier not in self.server.submodels:
+                    self._send(404, {"messages": [{"message": "Not found"}]})
+                    return
+                self.server.submodels[submodel_identifier] = body
+            self._send(204)
+            return
+
+        if (
+            parts[0] == "submodels"
+            and item is not None
+            and len(parts) > 2
+            and parts[2] in ("submodel-elements", "$value")
+            and parts[-1] != "attachment"
+        ):
+            self._handle_elements(method, item, parts[2:], query, body)
+            return
+
+        is_attachment = len(parts) == 5 and parts[2] == "submodel-elements" and parts[4] == "attachment"
+        is_thumbnail = parts[2:] == ["asset-information", "thumbnail"]
+        if is_attachment or is_thumbnail:
+            key = (identifier, parts[3] if is_attachment else "thumbnail")
+            if item is None or (method == "GET" and key not in self.server.attachments):
+                self._send(404, {"messages": [{"message": "Not found"}]})
+                return
+            if method == "GET":
+                self._send(200, self.server.attachments[key])
+                return
+            if method == "PUT":
+                with self.server.lock:
+                    self.server.attachments[key] = body or b""
+                self._send(204)
+                return
+
+        self._send(404, {"messages": [{"message": "Not found"}]})
+
+    def _handle_elements(self, method: str, submodel: dict, parts: list[str], query: dict, body):  # noqa: C901, PLR0911, PLR0912
+        if parts == ["$value"] and method == "GET":
+            with self.server.lock:
+                content = {element["idShort"]: _value_only(element) for element in submodel.get("submodelElements") or []}
+            if not self.server.etags:
+                self._send(200, content)
+                return
+            etag = f'"{hashlib.sha256(json.dumps(content, sort_keys=True).encode()).hexdigest()}"'
+            if self.headers.get("If-None-Match") == etag:
+                self._send(304, headers={"ETag": etag})
+                return
+            self._send(200, content, headers={"ETag": etag})
+            return
+
+        if parts == ["$value"] and method == "PATCH":
+            with self.server.lock:
+                _patch_values(submodel.setdefault("submodelElements", []), body)
+            self._send(204)
+            return
+
+        if parts == ["submodel-elements"] and method == "POST":
+            with self.server.lock:
+                submodel.setdefault("submodelElements", []).append(body)
+            self._send(201, body)
+            return
+
+        if len(parts) > 2 and parts[2] in ("invoke-async", "operation-status", "operation-results"):
+            self._handle_operation(method, parts, body)
+            return
+
+        if len(parts) < 2:
+            self._send(404, {"messages": [{"message": "Not found"}]})
+            return
+
+        with self.server.lock:
+            location = _locate(submodel.get("submodelElements") or [], parts[1])
+            if location is None:
+                self._send(404, {"messages": [{"message": "Not found"}]})
+                return
+
+            container, index = location
+            element = container[index]
+            if parts[2:] == ["$value"] and method == "PATCH":
+                element["value"] = body
+                self._send(204)
+            elif parts[2:] == ["$value"] and method == "GET":
+                self._send(200, _value_only(element))
+            elif method == "GET":
+                if query.get("extent") == "withoutBlobValue":
+                    element = _without_blob_values(element)
+                self._send(200, _core(element) if query.get("level") == "core" else element)
+            elif method == "PUT":
+                container[index] = body
+                self._send(204)
+            elif method == "POST":
+                element.setdefault(CHILD_KEYS[element["modelType"]], []).append(body)
+                self._send(201, body)
+            elif method == "DELETE":
+                del container[index]
+                self._send(204)
+            else:
+                self._send(405, {"messages": [{"message": "Method not allowed"}]})
+
+    def _handle_operation(self, method: str, parts: list[str], body):
+        base_path = self.path[: self.path.rindex(f"/{parts[2]}")]
+
+        if parts[2] == "invoke-async" and method == "POST":
+            with self.server.lock:
+                handle_id = f"handle-{len(self.server.operations)}"
+                self.server.operations[handle_id] = {"polls": self.server.operation_polls, "input": body or {}}
+            self._send(202, headers={"Location": f"{base_path}/operation-status/{handle_id}"})
+            return
+
+        with self.server.lock:
+            operation = self.server.operations.get(parts[3]) if len(parts) > 3 else None
+            if operation is not None and parts[2] == "operation-status":
+                operation["polls"] -= 1
+
+        if operation is None or method != "GET":
+            self._send(404, {"messages": [{"message": "Not found"}]})
+        elif parts[2] == "operation-status" and operation["polls"] > 0:
+            self._send(200, {"executionState": "Running"})
+        elif parts[2] == "operation-status":
+            self._send(302, headers={"Location": f"{base_path}/operation-results/{parts[3]}"})
+        else:
+            arguments = operation["input"].get("inputArguments", [])
+            result = {"executionState": "Completed", "success": True, "outputArguments": arguments}
+            self._send(200, {**result, **self.server.operation_results.get(parts[1], {})})
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_PUT(self):
+        self._handle("PUT")
+
+    def do_PATCH(self):
+        self._handle("PATCH")
+
+    def do_DELETE(self):
+        self._handle("DELETE")
+
+
+def _split_path(path: str) -> list[str | int]:
+    return [int(index) if index else id_short for id_short, index in re.findall(r"([^.\[\]]+)|\[(\d+)\]", path)]
+
+
+def _locate(elements: list[dict], path: str) -> tuple[list[dict], int] | None:
+    container, index = elements, -1
+    for segment in _split_path(path):
+        if index >= 0:
+            element = container[index]
+            container = element.get(CHILD_KEYS.get(element.get("modelType", ""), ""), None) or []
+        if isinstance(segment, int):
+            index = segment if segment < len(container) else -1
+        else:
+            index = next((position for position, element in enumerate(container) if element.get("idShort") == segment), -1)
+        if index < 0:
+            return None
+
+    return container, index
+
+
+def _without_blob_values(data: dict) -> dict:
+    if data.get("modelType") == "Blob":
+        return {key: value for key, value in data.items() if key != "value"}
+
+    result = dict(data)
+    for key in ("submodelElements", *CHILD_KEYS.values()):
+        if isinstance(result.get(key), list):
+            result[key] = [_without_blob_values(child) if isinstance(child, dict) else child for child in result[key]]
+    return result
+
+
+def _core(data: dict) -> dict:
+    key = "submodelElements" if data.get("modelType") == "Submodel" else CHILD_KEYS.get(data.get("modelType", ""))
+    if key is None or not isinstance(data.get(key), list):
+        return data
+
+    children = [{name: value for name, value in child.items() if name != CHILD_KEYS.get(child.get("modelType", ""))} for child in data[key]]
+    return {**data, key: children}
+
+
+def _patch_values(elements: list[dict], values: dict):
+    for id_short, value in values.items():
+        element = next((element for element in elements if element.get("idShort") == id_short), None)
+        if element is None:
+            continue
+        if isinstance(value, dict) and element.get("modelType") in CHILD_KEYS:
+            _patch_values(element.get(CHILD_KEYS[element["modelType"]]) or [], value)
+        else:
+            element["value"] = value
+
+
+def _value_only(element: dict):
+    model_type = element.get("modelType")
+    if model_type == "SubmodelElementCollection":
+        return {child["idShort"]: _value_only(child) for child in element.get("value") or []}
+    if model_type == "SubmodelElementList":
+        return [_value_only(child) for child in element.get("value") or []]
+    if model_type == "Entity":
+        statements = {child["idShort"]: _value_only(child) for child in element.get("statements") or []}
+        return {"statements": statements, "entityType": element.get("entityType"), "globalAssetId": element.get("globalAssetId")}
+    if model_type == "Range":
+        return {"min": element.get("min"), "max": element.get("max")}
+    return element.get("value")
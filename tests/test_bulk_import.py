@@ -0,0 +1,100 @@
+import io
+from pathlib import Path
+
+import pytest
+from basyx.aas import model
+from basyx.aas.adapter import aasx
+from basyx.aas.adapter.json import write_aas_json_file
+
+from aas_http_client.classes.client.aas_client import create_by_dict
+from aas_http_client.classes.wrapper.bulk_import import BulkImporter, ImportStatus
+from aas_http_client.classes.wrapper.sdk_wrapper import SdkWrapper
+from aas_http_client.utilities import model_builder, sdk_tools
+from tests.stub_server import StubAasServer
+
+SUBMODEL_COUNT = 5
+FILE_CONTENT = b"%PDF-1.4 bulk import"
+
+
+@pytest.fixture()
+def server():
+    server = StubAasServer().start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture()
+def object_store() -> model.DictObjectStore:
+    shell = model_builder.create_base_aas(identifier="fluid40/aas_bulk", id_short="aas_bulk", global_asset_identifier="fluid40/asset_bulk")
+    submodels = [
+        model_builder.create_base_submodel(identifier=f"fluid40/sm_bulk_{index}", id_short=f"sm_bulk_{index}") for index in range(SUBMODEL_COUNT)
+    ]
+    for submodel in submodels:
+        sdk_tools.add_submodel_to_aas(shell, submodel)
+
+    documents = model.SubmodelElementCollection("documents", value=[model.File("manual", "application/pdf", "/aasx/files/manual.pdf")])
+    submodels[0].submodel_element.add(documents)
+
+    return model.DictObjectStore([shell, *submodels])
+
+
+def _write_aasx(file: Path, object_store: model.DictObjectStore):
+    file_store = aasx.DictSupplementaryFileContainer()
+    file_store.add_file("/aasx/files/manual.pdf", io.BytesIO(FILE_CONTENT), "application/pdf")
+    with aasx.AASXWriter(file) as writer:
+        writer.write_aas("fluid40/aas_bulk", object_store, file_store)
+
+
+def test_001_import_object_store(server: StubAasServer, object_store: model.DictObjectStore):
+    server.submodels["fluid40/sm_bulk_1"] = {"id": "fluid40/sm_bulk_1", "idShort": "outdated", "modelType": "Submodel"}
+    client = create_by_dict({"BaseUrl": server.base_url})
+
+    report = BulkImporter(client).import_object_store(object_store)
+
+    assert report.success
+    assert len(report.results) == SUBMODEL_COUNT + 1
+    statuses = {result.identifier: result.status for result in report.results}
+    assert statuses["fluid40/sm_bulk_0"] == ImportStatus.created
+    assert statuses["fluid40/sm_bulk_1"] == ImportStatus.updated
+    assert server.submodels["fluid40/sm_bulk_1"]["idShort"] == "sm_bulk_1"
+    assert len(server.shells["fluid40/aas_bulk"]["submodels"]) == SUBMODEL_COUNT
+
+
+def test_002_import_without_upsert(server: StubAasServer, object_store: model.DictObjectStore):
+    server.submodels["fluid40/sm_bulk_1"] = {"id": "fluid40/sm_bulk_1", "idShort": "outdated", "modelType": "Submodel"}
+    client = create_by_dict({"BaseUrl": server.base_url})
+
+    report = BulkImporter(client, upsert=False).import_object_store(object_store)
+
+    assert [result.identifier for result in report.failed] == ["fluid40/sm_bulk_1"]
+    assert server.submodels["fluid40/sm_bulk_1"]["idShort"] == "outdated"
+
+
+def test_003_import_aasx_with_attachments(server: StubAasServer, object_store: model.DictObjectStore, tmp_path: Path):
+    file = tmp_path / "bulk.aasx"
+    _write_aasx(file, object_store)
+    wrapper = SdkWrapper({"BaseUrl": server.base_url, "MaxWorkers": 4})
+
+    report = wrapper.bulk_import(file)
+
+    assert report.success
+    attachments = [result for result in report.results if result.kind == "Attachment"]
+    assert [result.id_short_path for result in attachments] == ["documents.manual"]
+    assert FILE_CONTENT in server.attachments[("fluid40/sm_bulk_0", "documents.manual")]
+    assert len(server.submodels) == SUBMODEL_COUNT
+
+
+def test_004_import_json_environment(server: StubAasServer, object_store: model.DictObjectStore, tmp_path: Path):
+    file = tmp_path / "bulk.json"
+    with file.open("w", encoding="utf-8") as f:
+        write_aas_json_file(f, object_store)
+    client = create_by_dict({"BaseUrl": server.base_url, "EncodedIds": False})
+
+    report = BulkImporter(client).import_file(file)
+
+    assert report.success
+    assert "fluid40/aas_bulk" in server.shells
+    assert not server.attachments
+
+    with pytest.raises(ValueError):
+        BulkImporter(client).import_file(tmp_path / "unknown.xml")
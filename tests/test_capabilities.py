@@ -0,0 +1,131 @@
+import pytest
+
+from aas_http_client.classes.client.aas_client import create_by_dict
+from aas_http_client.classes.client.capabilities import Capability
+from aas_http_client.utilities.encoder import encode_base_64
+from tests.stub_server import StubAasServer
+
+SUBMODEL_ID = "fluid40/sm_capabilities"
+SHELL_ID = "fluid40/shell_capabilities"
+SUBMODEL = {
+    "id": SUBMODEL_ID,
+    "idShort": "sm_capabilities",
+    "modelType": "Submodel",
+    "displayName": [{"language": "en", "text": "Capabilities"}],
+    "submodelElements": [{"idShort": "Speed", "modelType": "Property", "valueType": "xs:int", "value": "1"}],
+}
+
+
+@pytest.fixture()
+def server():
+    server = StubAasServer().start()
+    server.profiles = ["https://admin-shell.io/aas/API/3/0/SubmodelRepositoryServiceSpecification/SSP-001"]
+    server.submodels[SUBMODEL_ID] = dict(SUBMODEL)
+    server.shells[SHELL_ID] = {
+        "id": SHELL_ID,
+        "idShort": "shell_capabilities",
+        "modelType": "AssetAdministrationShell",
+        "submodels": [{"type": "ModelReference", "keys": [{"type": "Submodel", "value": SUBMODEL_ID}]}],
+    }
+    yield server
+    server.stop()
+
+
+def _patch(client) -> bool:
+    return client.submodels.patch_submodel_by_id(
+        encode_base_64(SUBMODEL_ID), {"id": SUBMODEL_ID, "description": [{"language": "en", "text": "Patched"}]}
+    )
+
+
+def test_001_profile_is_detected_once(server: StubAasServer):
+    server.unsupported = {"PATCH /submodels/*"}
+    client = create_by_dict({"BaseUrl": server.base_url})
+
+    profile = client.get_server_profile()
+    assert profile.profiles == tuple(server.profiles)
+    assert not profile.supports(Capability.patch_submodel)
+    assert profile.supports(Capability.put_submodel_through_shell)
+
+    for _ in range(3):
+        assert _patch(client)
+
+    # the unsupported endpoint is only requested by the probe
+    assert server.count("PATCH") == 1
+    assert server.count("GET", "/description") == 1
+    # the fields not contained in the patch are kept
+    submodel = server.submodels[SUBMODEL_ID]
+    assert submodel["description"][0]["text"] == "Patched"
+    assert submodel["displayName"] == SUBMODEL["displayName"]
+    assert len(submodel["submodelElements"]) == 1
+    client.close()
+
+
+def test_002_supported_endpoints_are_used(server: StubAasServer):
+    client = create_by_dict({"BaseUrl": server.base_url})
+
+    assert _patch(client)
+    assert server.count("PATCH", f"/submodels/{encode_base_64(SUBMODEL_ID)}") == 1
+    assert server.count("PUT") == 1  # probe
+
+    shell_identifier, submodel_identifier = encode_base_64(SHELL_ID), encode_base_64(SUBMODEL_ID)
+    assert client.shells.put_submodel_by_id_aas_repository(shell_identifier, submodel_identifier, SUBMODEL)
+    assert server.count("PUT", f"/shells/{shell_identifier}/submodels/") == 1
+    client.close()
+
+
+def test_003_unsupported_endpoint_is_learned_without_probing(server: StubAasServer):
+    server.unsupported = {"PUT /shells/*/submodels/*"}
+    client = create_by_dict({"BaseUrl": server.base_url, "CapabilityProbing": False})
+
+    shell_identifier, submodel_identifier = encode_base_64(SHELL_ID), encode_base_64(SUBMODEL_ID)
+    for _ in range(2):
+        assert client.shells.put_submodel_by_id_aas_repository(shell_identifier, submodel_identifier, SUBMODEL)
+
+    assert server.count("GET", "/description") == 0
+    assert server.count("PUT", "/shells/") == 1
+    assert server.count("PUT", f"/submodels/{submodel_identifier}") == 2
+    assert not client.supports(Capability.put_submodel_through_shell)
+    client.close()
+
+
+def test_004_patch_is_merged_by_element(server: StubAasServer):
+    server.unsupported = {"PATCH /submodels/*"}
+    server.submodels[SUBMODEL_ID]["submodelElements"] = [
+        {"idShort": "Speed", "modelType": "Property", "valueType": "xs:int", "value": "1"},
+        {
+            "idShort": "Motor",
+            "modelType": "SubmodelElementCollection",
+            "value": [
+                {"idShort": "Power", "modelType": "Property", "valueType": "xs:int", "value": "5"},
+                {"idShort": "Voltage", "modelType": "Property", "valueType": "xs:int", "value": "230"},
+            ],
+        },
+    ]
+    client = create_by_dict({"BaseUrl": server.base_url})
+
+    changes = {
+        "displayName": [],
+        "submodelElements": [
+            {"idShort": "Motor", "value": [{"idShort": "Power", "value": "7"}]},
+            {"idShort": "Torque", "modelType": "Property", "valueType": "xs:int", "value": "3"},
+        ],
+    }
+    assert client.submodels.patch_submodel_by_id(encode_base_64(SUBMODEL_ID), changes)
+
+    submodel = server.submodels[SUBMODEL_ID]
+    assert submodel["displayName"] == []
+    assert [element["idShort"] for element in submodel["submodelElements"]] == ["Speed", "Motor", "Torque"]
+    power, voltage = submodel["submodelElements"][1]["value"]
+    assert power == {"idShort": "Power", "modelType": "Property", "valueType": "xs:int", "value": "7"}
+    assert voltage["value"] == "230"
+    client.close()
+
+
+def test_005_submodel_not_referenced_by_the_shell_is_not_put(server: StubAasServer):
+    server.unsupported = {"PUT /shells/*/submodels/*"}
+    server.shells[SHELL_ID]["submodels"] = []
+    client = create_by_dict({"BaseUrl": server.base_url})
+
+    assert not client.shells.put_submodel_by_id_aas_repository(encode_base_64(SHELL_ID), encode_base_64(SUBMODEL_ID), SUBMODEL)
+    assert server.count("PUT", "/submodels/") == 0
+    client.close()
@@ -0,0 +1,118 @@
+import pytest
+from basyx.aas import model
+
+from aas_http_client.classes.wrapper.sdk_wrapper import SdkWrapper
+from aas_http_client.utilities import encoder
+from tests.stub_server import StubAasServer
+
+SUBMODEL_ID = "fluid40/sm_tracking"
+
+
+def _property(id_short: str, value: str) -> dict:
+    return {"idShort": id_short, "modelType": "Property", "valueType": "xs:string", "value": value}
+
+
+@pytest.fixture()
+def server():
+    server = StubAasServer().start()
+    server.submodels[SUBMODEL_ID] = {
+        "id": SUBMODEL_ID,
+        "idShort": "sm_tracking",
+        "modelType": "Submodel",
+        "submodelElements": [
+            _property("serial", "S-1"),
+            {"idShort": "status", "modelType": "SubmodelElementCollection", "value": [_property(f"sensor_{i}", "0") for i in range(30)]},
+        ],
+    }
+    yield server
+    server.stop()
+
+
+@pytest.fixture()
+def wrapper(server: StubAasServer) -> SdkWrapper:
+    wrapper = SdkWrapper({"BaseUrl": server.base_url})
+    wrapper.set_change_tracking(enabled=True)
+    return wrapper
+
+
+def _sensor(submodel: model.Submodel, index: int) -> model.Property:
+    status = submodel.get_referable("status")
+    assert isinstance(status, model.SubmodelElementCollection)
+    sensor = status.get_referable(f"sensor_{index}")
+    assert isinstance(sensor, model.Property)
+    return sensor
+
+
+def test_001_single_change_is_patched(server: StubAasServer, wrapper: SdkWrapper):
+    identifier = encoder.encode_base_64(SUBMODEL_ID)
+    submodel = wrapper.get_submodel_by_id(identifier)
+    assert isinstance(submodel, model.Submodel)
+
+    _sensor(submodel, 3).value = "42"
+    request_count = len(server.requests)
+
+    assert wrapper.put_submodels_by_id(identifier, submodel)
+    assert [(method, path) for method, path, _ in server.requests[request_count:]] == [
+        ("PATCH", f"/submodels/{identifier}/submodel-elements/status.sensor_3/$value")
+    ]
+    assert server.submodels[SUBMODEL_ID]["submodelElements"][1]["value"][3]["value"] == "42"
+
+    # unchanged submodels are not sent again
+    assert wrapper.put_submodels_by_id(identifier, submodel)
+    assert len(server.requests) == request_count + 1
+
+
+def test_002_large_diff_sends_complete_submodel(server: StubAasServer, wrapper: SdkWrapper):
+    identifier = encoder.encode_base_64(SUBMODEL_ID)
+    wrapper.set_change_tracking(enabled=True, max_delta_operations=5)
+    submodel = wrapper.get_submodel_by_id(identifier)
+    assert isinstance(submodel, model.Submodel)
+
+    submodel.id_short = "sm_renamed"
+    assert wrapper.put_submodels_by_id(identifier, submodel)
+    assert server.count("PUT", f"/submodels/{identifier}") == 1
+
+    for index in range(10):
+        _sensor(submodel, index).value = "1"
+    assert wrapper.put_submodels_by_id(identifier, submodel)
+    assert server.count("PUT", f"/submodels/{identifier}") == 2
+    assert server.count("PATCH") == 0
+
+    _sensor(submodel, 10).value = "1"
+    _sensor(submodel, 11).value = "1"
+    assert wrapper.put_submodels_by_id(identifier, submodel)
+
+    # both values are sent in one value-only PATCH
+    assert server.count("PUT", f"/submodels/{identifier}") == 2
+    assert server.count("PATCH", f"/submodels/{identifier}/$value") == 1
+    assert server.submodels[SUBMODEL_ID]["idShort"] == "sm_renamed"
+    assert all(element["value"] == "1" for element in server.submodels[SUBMODEL_ID]["submodelElements"][1]["value"][:12])
+
+
+def test_003_without_snapshot_sends_complete_submodel(server: StubAasServer, wrapper: SdkWrapper):
+    identifier = encoder.encode_base_64(SUBMODEL_ID)
+    submodel = wrapper.get_submodel_by_id(identifier)
+    assert isinstance(submodel, model.Submodel)
+
+    wrapper.set_change_tracking(enabled=False)
+    wrapper.set_change_tracking(enabled=True)
+    _sensor(submodel, 0).value = "7"
+
+    assert wrapper.put_submodels_by_id(identifier, submodel)
+    assert server.count("PUT", f"/submodels/{identifier}") == 1
+    assert server.count("PATCH") == 0
+
+
+def test_004_element_write_discards_snapshot(server: StubAasServer, wrapper: SdkWrapper):
+    identifier = encoder.encode_base_64(SUBMODEL_ID)
+    submodel = wrapper.get_submodel_by_id(identifier)
+    assert isinstance(submodel, model.Submodel)
+
+    assert wrapper.patch_submodel_element_by_path_value_only_submodel_repo(identifier, "status.sensor_0", "5")
+    _sensor(submodel, 1).value = "6"
+
+    # a delta against the snapshot would only send sensor_1 and keep the value written in between
+    assert wrapper.put_submodels_by_id(identifier, submodel)
+    assert server.count("PUT", f"/submodels/{identifier}") == 1
+    assert server.submodels[SUBMODEL_ID]["submodelElements"][1]["value"][0]["value"] == "0"
+    assert server.submodels[SUBMODEL_ID]["submodelElements"][1]["value"][1]["value"] == "6"
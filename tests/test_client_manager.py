@@ -0,0 +1,87 @@
+import time
+
+import pytest
+
+from aas_http_client.classes.client.client_manager import ClientManager
+from aas_http_client.classes.Configuration.config_classes import AuthenticationConfig, BasicAuth, BearerAuth, OAuth
+from aas_http_client.utilities.encoder import encode_base_64
+from tests.stub_server import StubAasServer
+
+SUBMODEL_ID = "fluid40/sm_tenants"
+
+
+@pytest.fixture()
+def server():
+    server = StubAasServer().start()
+    server.submodels[SUBMODEL_ID] = {"id": SUBMODEL_ID, "idShort": "sm_tenants", "modelType": "Submodel", "submodelElements": []}
+    yield server
+    server.stop()
+
+
+def _bearer() -> AuthenticationConfig:
+    return AuthenticationConfig(bearer_auth=BearerAuth())
+
+
+def test_001_connection_is_tested_once_per_server(server: StubAasServer):
+    with ClientManager({"TimeOut": 30}) as manager:
+        first = manager.get_client("tenant_1", server.base_url, _bearer(), bearer_auth_token="token-1")
+        probes = len(server.requests)
+
+        started = time.perf_counter()
+        clients = [manager.get_client(f"tenant_{index}", server.base_url, _bearer(), bearer_auth_token=f"token-{index}") for index in range(2, 52)]
+        elapsed = time.perf_counter() - started
+
+        # further tenants are created without requests to the server
+        assert len(server.requests) == probes
+        assert elapsed < 0.5
+        assert manager.get_client("tenant_1", server.base_url) is first
+        assert all(client.time_out == 30 for client in clients)
+
+
+def test_002_tenants_use_their_own_credentials(server: StubAasServer):
+    with ClientManager() as manager:
+        clients = {tenant: manager.get_client(tenant, server.base_url, _bearer(), bearer_auth_token=f"token-{tenant}") for tenant in ("a", "b")}
+        basic = manager.get_client("c", server.base_url, AuthenticationConfig(basic_auth=BasicAuth(username="c")), basic_auth_password="secret")
+
+        for client in (*clients.values(), basic):
+            assert client.submodels.get_submodel_by_id(encode_base_64(SUBMODEL_ID)) is not None
+
+        headers = [headers.get("Authorization") for method, path, headers in server.requests if path.startswith("/submodels/")]
+        assert headers[:2] == ["Bearer token-a", "Bearer token-b"]
+        assert headers[2].startswith("Basic ")
+
+        # the connection pool and capability profile are shared
+        assert clients["a"].get_session().get_adapter(server.base_url) is clients["b"].get_session().get_adapter(server.base_url)
+        clients["a"].get_server_profile()
+        descriptions = server.count("GET", "/description")
+        clients["b"].get_server_profile()
+        basic.get_server_profile()
+        assert server.count("GET", "/description") == descriptions == 1
+
+
+def test_003_oauth_tokens_are_cached_per_tenant(server: StubAasServer):
+    with ClientManager() as manager:
+        for tenant in ("a", "b"):
+            settings = AuthenticationConfig(o_auth=OAuth(client_id=tenant, token_url=f"{server.base_url}/token"))
+            client = manager.get_client(tenant, server.base_url, settings, o_auth_client_secret="secret")
+            for _ in range(3):
+                assert client.submodels.get_submodel_by_id(encode_base_64(SUBMODEL_ID)) is not None
+
+        assert server.token_requests == 2
+
+        manager.remove_client("a", server.base_url)
+        # the other tenants keep using the shared connection pool
+        assert manager.get_client("b", server.base_url).submodels.get_submodel_by_id(encode_base_64(SUBMODEL_ID)) is not None
+
+
+def test_004_tenants_reuse_the_connections_of_the_server(server: StubAasServer):
+    with ClientManager() as manager:
+        clients = [manager.get_client(tenant, server.base_url, _bearer(), bearer_auth_token=f"token-{tenant}") for tenant in ("a", "b")]
+        connections = server.connections
+
+        for _ in range(10):
+            for client in clients:
+                assert client.submodels.get_submodel_by_id(encode_base_64(SUBMODEL_ID)) is not None
+
+        # the 20 requests of both tenants are sent through the kept-alive connection of the shared pool
+        assert server.connections - connections <= 1
@@ -0,0 +1,51 @@
+import time
+
+import pytest
+
+from aas_http_client.utilities.concurrency import RateLimiter, iter_prefetched, run_concurrently
+
+
+def test_001_iter_prefetched_keeps_order():
+    assert list(iter_prefetched(range(100), depth=3)) == list(range(100))
+
+
+def test_002_iter_prefetched_raises_reader_errors():
+    def pages():
+        yield 1
+        raise RuntimeError("page failed")
+
+    iterator = iter_prefetched(pages())
+
+    assert next(iterator) == 1
+    with pytest.raises(RuntimeError):
+        next(iterator)
+
+
+def test_003_iter_prefetched_stops_reading_early():
+    read = []
+
+    def pages():
+        for index in range(1000):
+            read.append(index)
+            yield index
+
+    for index in iter_prefetched(pages(), depth=2):
+        if index == 5:
+            break
+
+    assert len(read) < 20
+
+
+def test_004_rate_limiter_spaces_calls():
+    limiter = RateLimiter(20, burst=2)
+
+    started = time.monotonic()
+    run_concurrently(lambda _: limiter.acquire(), range(6), max_workers=6)
+
+    # two calls pass immediately, the remaining four are spaced by 50 ms
+    assert time.monotonic() - started >= 0.19
+
+    started = time.monotonic()
+    for _ in range(100):
+        RateLimiter(0).acquire()
+    assert time.monotonic() - started < 0.1
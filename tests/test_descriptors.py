@@ -0,0 +1,89 @@
+import pytest
+
+from aas_http_client.classes.wrapper.descriptors import DescriptorEndpoint, ShellDescriptor, SubmodelDescriptor, parse_shell_descriptor
+from aas_http_client.classes.wrapper.pagination import create_shell_descriptor_paging_data
+from aas_http_client.classes.wrapper.sdk_wrapper import SdkWrapper
+from aas_http_client.utilities.encoder import encode_base_64
+from tests.stub_server import StubAasServer
+
+SEMANTIC_ID = "https://admin-shell.io/idta/nameplate"
+
+
+def _shell_descriptor(index: int) -> dict:
+    submodel_id = f"fluid40/sm_{index}"
+    return {
+        "id": f"fluid40/aas_{index}",
+        "idShort": f"aas_{index}",
+        "assetKind": "Instance",
+        "globalAssetId": f"fluid40/asset_{index}",
+        "endpoints": [
+            {
+                "interface": "AAS-3.0",
+                "protocolInformation": {"href": f"http://repo/shells/{encode_base_64(f'fluid40/aas_{index}')}", "endpointProtocol": "HTTP"},
+            }
+        ],
+        "submodelDescriptors": [
+            {
+                "id": submodel_id,
+                "semanticId": {"type": "ExternalReference", "keys": [{"type": "GlobalReference", "value": SEMANTIC_ID}]},
+                "endpoints": [{"interface": "SUBMODEL-3.0", "protocolInformation": {"href": f"http://repo/submodels/{encode_base_64(submodel_id)}"}}],
+            }
+        ],
+    }
+
+
+@pytest.fixture()
+def server():
+    server = StubAasServer().start()
+    for index in range(5):
+        descriptor = _shell_descriptor(index)
+        server.shell_descriptors[descriptor["id"]] = descriptor
+    yield server
+    server.stop()
+
+
+def test_001_parse_and_serialize():
+    data = _shell_descriptor(1)
+    descriptor = parse_shell_descriptor(data)
+
+    assert descriptor.id == "fluid40/aas_1"
+    assert descriptor.asset_kind == "Instance"
+    assert descriptor.endpoints[0].endpoint_protocol == "HTTP"
+    assert descriptor.get_submodel_descriptor("fluid40/sm_1").semantic_id_value == SEMANTIC_ID  # type: ignore[union-attr]
+    assert descriptor.get_submodel_descriptor("fluid40/sm_2") is None
+    assert descriptor.to_dict() == data
+
+    # repeated strings are shared between descriptors
+    other = parse_shell_descriptor(_shell_descriptor(2))
+    assert other.endpoints[0].interface is descriptor.endpoints[0].interface
+    assert not hasattr(descriptor, "__dict__")
+
+    assert create_shell_descriptor_paging_data({"result": [data, {"idShort": "no id"}]}) is None
+
+
+def test_002_wrapper_lists_descriptors(server: StubAasServer):
+    wrapper = SdkWrapper({"BaseUrl": server.base_url})
+    requests = server.count("GET", "/shell-descriptors")
+
+    page = wrapper.get_all_asset_administration_shell_descriptors(limit=2)
+    assert page is not None
+    assert [descriptor.id for descriptor in page.results] == ["fluid40/aas_0", "fluid40/aas_1"]
+    assert page.paging_metadata.cursor == "2"
+
+    assert [descriptor.id_short for descriptor in wrapper.iter_asset_administration_shell_descriptors(limit=2)] == [f"aas_{i}" for i in range(5)]
+    assert server.count("GET", "/shell-descriptors") - requests == 4
+
+
+def test_003_wrapper_writes_descriptors(server: StubAasServer):
+    wrapper = SdkWrapper({"BaseUrl": server.base_url, "EncodedIds": False})
+    endpoint = DescriptorEndpoint(interface="SUBMODEL-3.0", href="http://repo/submodels/c20")
+    descriptor = SubmodelDescriptor(id="fluid40/sm_new", id_short="sm_new", endpoints=(endpoint,))
+
+    assert wrapper.post_submodel_descriptor(descriptor) == descriptor
+    assert wrapper.get_submodel_descriptor_by_id("fluid40/sm_new") == descriptor
+
+    shell = ShellDescriptor(id="fluid40/aas_0", id_short="renamed", submodel_descriptors=(descriptor,))
+    assert wrapper.put_asset_administration_shell_descriptor_by_id("fluid40/aas_0", shell)
+    assert wrapper.get_asset_administration_shell_descriptor_by_id("fluid40/aas_0") == shell
+    assert wrapper.delete_asset_administration_shell_descriptor_by_id("fluid40/aas_0")
+    assert wrapper.get_asset_administration_shell_descriptor_by_id("fluid40/aas_0") is None
@@ -0,0 +1,120 @@
+import pytest
+
+from aas_http_client.classes.client.aas_client import create_by_dict
+from aas_http_client.classes.wrapper.endpoint_resolver import EndpointResolver, repository_base_url
+from aas_http_client.utilities.encoder import encode_base_64
+from tests.stub_server import StubAasServer
+
+SHELL_ID = "fluid40/aas_resolver"
+SUBMODEL_ID = "fluid40/sm_resolver"
+
+
+def _descriptor(identifier: str, interface: str, href: str, **kwargs) -> dict:
+    return {"id": identifier, "endpoints": [{"interface": interface, "protocolInformation": {"href": href}}], **kwargs}
+
+
+@pytest.fixture()
+def servers():
+    registry, repository = StubAasServer().start(), StubAasServer().start()
+    repository.shells[SHELL_ID] = {"id": SHELL_ID, "idShort": "aas_resolver", "modelType": "AssetAdministrationShell"}
+    repository.submodels[SUBMODEL_ID] = {"id": SUBMODEL_ID, "idShort": "sm_resolver", "modelType": "Submodel", "submodelElements": []}
+
+    submodel_href = f"{repository.base_url}/submodels/{encode_base_64(SUBMODEL_ID)}"
+    registry.shell_descriptors[SHELL_ID] = _descriptor(
+        SHELL_ID,
+        "AAS-3.0",
+        f"{repository.base_url}/shells/{encode_base_64(SHELL_ID)}",
+        submodelDescriptors=[_descriptor(SUBMODEL_ID, "SUBMODEL-3.0", submodel_href)],
+    )
+    registry.submodel_descriptors[SUBMODEL_ID] = _descriptor(SUBMODEL_ID, "SUBMODEL-3.0", submodel_href)
+    yield registry, repository
+    registry.stop()
+    repository.stop()
+
+
+def test_001_repository_base_url():
+    assert repository_base_url("http://repo/api/v3.0/submodels/c20") == "http://repo/api/v3.0"
+    assert repository_base_url("http://repo/shells/YWFz/submodels/c20") == "http://repo"
+    assert repository_base_url("http://repo/api/") == "http://repo/api"
+
+
+def test_002_requests_are_routed_to_the_repository(servers: tuple[StubAasServer, StubAasServer]):
+    registry, repository = servers
+    resolver = EndpointResolver(create_by_dict({"BaseUrl": registry.base_url, "EncodedIds": False}))
+
+    for _ in range(3):
+        assert resolver.get_asset_administration_shell_by_id(SHELL_ID)["idShort"] == "aas_resolver"  # type: ignore[index]
+        assert resolver.get_submodel_by_id(SHELL_ID, SUBMODEL_ID)["idShort"] == "sm_resolver"  # type: ignore[index]
+
+    # one registry request for the shell, the submodel descriptor is part of the shell descriptor
+    assert registry.count("GET", "/shell-descriptors/") == 1
+    assert registry.count("GET", "/submodel-descriptors/") == 0
+    assert resolver.registry_requests == 1
+    assert repository.count("GET", "/submodels/") == 3
+    assert resolver.get_client(repository.base_url) is resolver.get_client(repository.base_url)
+
+    # submodels without shell are resolved via the submodel registry
+    assert resolver.get_submodel_by_id(None, SUBMODEL_ID) is not None
+    assert resolver.get_submodel_by_id(None, SUBMODEL_ID) is not None
+    assert registry.count("GET", "/submodel-descriptors/") == 1
+    resolver.close()
+
+
+def test_003_failed_lookups_are_cached(servers: tuple[StubAasServer, StubAasServer]):
+    registry, _ = servers
+    resolver = EndpointResolver(create_by_dict({"BaseUrl": registry.base_url, "EncodedIds": False}), negative_ttl=60)
+
+    for _ in range(3):
+        assert resolver.get_asset_administration_shell_by_id("fluid40/unknown") is None
+    assert registry.count("GET", "/shell-descriptors/") == 1
+
+    resolver.invalidate()
+    assert resolver.resolve_shell("fluid40/unknown") is None
+    assert registry.count("GET", "/shell-descriptors/") == 2
+
+
+def test_004_moved_submodel_is_resolved_again(servers: tuple[StubAasServer, StubAasServer]):
+    registry, repository = servers
+    resolver = EndpointResolver(create_by_dict({"BaseUrl": registry.base_url, "EncodedIds": False}))
+    assert resolver.get_submodel_by_id(SHELL_ID, SUBMODEL_ID) is not None
+
+    # the submodel moves to another repository and the old one is shut down, the cached descriptor still points to it
+    target = StubAasServer().start()
+    try:
+        target.submodels[SUBMODEL_ID] = repository.submodels.pop(SUBMODEL_ID)
+        repository.stop()
+        href = f"{target.base_url}/submodels/{encode_base_64(SUBMODEL_ID)}"
+        registry.shell_descriptors[SHELL_ID]["submodelDescriptors"] = [_descriptor(SUBMODEL_ID, "SUBMODEL-3.0", href)]
+
+        assert resolver.get_submodel_by_id(SHELL_ID, SUBMODEL_ID) is not None
+        assert resolver.resolve_submodel(SHELL_ID, SUBMODEL_ID).base_url == target.base_url  # type: ignore[union-attr]
+        assert registry.count("GET", "/shell-descriptors/") == 2
+    finally:
+        resolver.close()
+        target.stop()
+
+
+def test_005_unknown_id_is_not_resolved_again(servers: tuple[StubAasServer, StubAasServer]):
+    registry, repository = servers
+    resolver = EndpointResolver(create_by_dict({"BaseUrl": registry.base_url, "EncodedIds": False}))
+    del repository.submodels[SUBMODEL_ID]
+
+    # the repository answers with 404, so the endpoint is still valid
+    assert resolver.get_submodel_by_id(SHELL_ID, SUBMODEL_ID) is None
+    assert resolver.get_submodel_by_id(SHELL_ID, SUBMODEL_ID) is None
+    assert registry.count("GET", "/shell-descriptors/") == 1
+    resolver.close()
+
+
+def test_006_cache_is_bounded(servers: tuple[StubAasServer, StubAasServer]):
+    registry, _ = servers
+    resolver = EndpointResolver(create_by_dict({"BaseUrl": registry.base_url, "EncodedIds": False}), max_cached_descriptors=3)
+
+    for index in range(10):
+        assert resolver.resolve_shell(f"fluid40/unknown_{index}") is None
+    assert resolver.resolve_shell(SHELL_ID) is not None
+
+    assert len(resolver._shell_descriptors) == 3
+    found, descriptor = resolver._shell_descriptors.get(SHELL_ID)
+    assert found
+    assert descriptor is not None
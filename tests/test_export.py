@@ -0,0 +1,131 @@
+import base64
+import io
+import json
+from pathlib import Path
+
+import pytest
+from basyx.aas import model
+from basyx.aas.adapter import aasx
+
+from aas_http_client.classes.client.aas_client import create_by_dict
+from aas_http_client.classes.wrapper.export import ExportCollection, RepositoryExporter
+from aas_http_client.utilities.checkpoint import Checkpoint
+from tests.stub_server import StubAasServer
+
+SHELL_COUNT = 3
+SUBMODEL_COUNT = 25
+FILE_CONTENT = b"%PDF-1.4 export"
+
+
+@pytest.fixture()
+def server():
+    server = StubAasServer().start()
+    for index in range(SHELL_COUNT):
+        identifier = f"fluid40/aas_export_{index}"
+        server.shells[identifier] = {
+            "id": identifier,
+            "idShort": f"aas_export_{index}",
+            "modelType": "AssetAdministrationShell",
+            "assetInformation": {"assetKind": "Instance", "globalAssetId": f"fluid40/asset_export_{index}"},
+        }
+    for index in range(SUBMODEL_COUNT):
+        identifier = f"fluid40/sm_export_{index}"
+        server.submodels[identifier] = {"id": identifier, "idShort": f"sm_export_{index}", "modelType": "Submodel"}
+
+    server.submodels["fluid40/sm_export_0"]["submodelElements"] = [
+        {
+            "idShort": "documents",
+            "modelType": "SubmodelElementCollection",
+            "value": [{"idShort": "manual", "modelType": "File", "contentType": "application/pdf", "value": "/aasx/files/manual.pdf"}],
+        }
+    ]
+    server.attachments[("fluid40/sm_export_0", "documents.manual")] = FILE_CONTENT
+    yield server
+    server.stop()
+
+
+def _read_records(file: Path) -> list[dict]:
+    return [json.loads(line) for line in file.read_text(encoding="utf-8").splitlines()]
+
+
+def test_001_export_ndjson(server: StubAasServer, tmp_path: Path):
+    client = create_by_dict({"BaseUrl": server.base_url})
+    file = tmp_path / "export.ndjson"
+
+    summary = RepositoryExporter(client, page_size=10, include_attachments=True).export_ndjson(file)
+
+    records = _read_records(file)
+    assert summary.complete
+    assert summary.counts == {"AssetAdministrationShell": SHELL_COUNT, "Submodel": SUBMODEL_COUNT, "Attachment": 1}
+    assert len(records) == SHELL_COUNT + SUBMODEL_COUNT + 1
+    attachment = next(record["data"] for record in records if record["kind"] == "Attachment")
+    assert attachment["idShortPath"] == "documents.manual"
+    assert base64.b64decode(attachment["content"]) == FILE_CONTENT
+
+
+def test_002_resume_ndjson_from_checkpoint(server: StubAasServer, tmp_path: Path):
+    client = create_by_dict({"BaseUrl": server.base_url})
+    exporter = RepositoryExporter(client, collections=[ExportCollection.submodels], page_size=10)
+    file = tmp_path / "export.ndjson"
+    checkpoint_file = tmp_path / "export.checkpoint"
+
+    server.fail_cursors.add("20")
+    summary = exporter.export_ndjson(file, checkpoint_file)
+
+    assert not summary.complete
+    assert len(_read_records(file)) == 20
+    assert Checkpoint.load(checkpoint_file).cursor == "20"
+
+    # simulate a partially written page before the interruption
+    with file.open("ab") as stream:
+        stream.write(b'{"kind":"Submodel","data":{"id":"partial"')
+
+    server.fail_cursors.clear()
+    summary = exporter.export_ndjson(file, checkpoint_file)
+
+    records = _read_records(file)
+    assert summary.complete
+    assert summary.counts == {"Submodel": SUBMODEL_COUNT - 20}
+    assert [record["data"]["id"] for record in records] == [f"fluid40/sm_export_{index}" for index in range(SUBMODEL_COUNT)]
+    assert not checkpoint_file.exists()
+
+
+def test_003_export_aasx(server: StubAasServer, tmp_path: Path):
+    client = create_by_dict({"BaseUrl": server.base_url})
+    file = tmp_path / "export.aasx"
+
+    summary = RepositoryExporter(client, page_size=10, include_attachments=True).export_aasx(file)
+
+    assert summary.complete
+    object_store = model.DictObjectStore()
+    file_store = aasx.DictSupplementaryFileContainer()
+    with aasx.AASXReader(file) as reader:
+        reader.read_into(object_store, file_store)
+
+    assert len(object_store) == SHELL_COUNT + SUBMODEL_COUNT
+    assert _read_file(object_store, file_store, "fluid40/sm_export_0") == FILE_CONTENT
+
+
+def test_004_export_aasx_attachments_of_the_same_name(server: StubAasServer, tmp_path: Path):
+    server.submodels["fluid40/sm_export_1"]["submodelElements"] = server.submodels["fluid40/sm_export_0"]["submodelElements"]
+    server.attachments[("fluid40/sm_export_1", "documents.manual")] = b"%PDF-1.4 other manual"
+    client = create_by_dict({"BaseUrl": server.base_url})
+    file = tmp_path / "export.aasx"
+
+    summary = RepositoryExporter(client, collections=[ExportCollection.submodels], include_attachments=True).export_aasx(file)
+
+    assert summary.complete
+    object_store = model.DictObjectStore()
+    file_store = aasx.DictSupplementaryFileContainer()
+    with aasx.AASXReader(file) as reader:
+        reader.read_into(object_store, file_store)
+
+    assert _read_file(object_store, file_store, "fluid40/sm_export_0") == FILE_CONTENT
+    assert _read_file(object_store, file_store, "fluid40/sm_export_1") == b"%PDF-1.4 other manual"
+
+
+def _read_file(object_store: model.DictObjectStore, file_store: aasx.DictSupplementaryFileContainer, submodel_id: str) -> bytes:
+    element = object_store.get_identifiable(submodel_id).get_referable("documents").get_referable("manual")
+    stream = io.BytesIO()
+    file_store.write_file(element.value, stream)
+    return stream.getvalue()
@@ -0,0 +1,72 @@
+import time
+
+import pytest
+
+from aas_http_client.classes.client.aas_client import create_by_dict
+from aas_http_client.classes.wrapper.federated_search import FederatedSearch
+from tests.stub_server import StubAasServer
+
+
+def _descriptor(identifier: str) -> dict:
+    return {"id": identifier, "idShort": identifier.rsplit("/", 1)[-1], "endpoints": []}
+
+
+@pytest.fixture()
+def registries():
+    registries = [StubAasServer().start() for _ in range(3)]
+    for number, registry in enumerate(registries):
+        for index in range(5):
+            descriptor = _descriptor(f"fluid40/region_{number}/motor_{index}")
+            registry.shell_descriptors[descriptor["id"]] = descriptor
+        # registered in every region
+        registry.shell_descriptors["fluid40/shared"] = _descriptor("fluid40/shared")
+    yield registries
+    for registry in registries:
+        registry.stop()
+
+
+def _search(registries: list[StubAasServer]) -> FederatedSearch:
+    return FederatedSearch([create_by_dict({"BaseUrl": registry.base_url}) for registry in registries], page_size=2)
+
+
+def test_001_results_are_merged(registries: list[StubAasServer]):
+    for registry in registries:
+        registry.search_delay = 0.2
+
+    started = time.monotonic()
+    result = _search(registries).search()
+    elapsed = time.monotonic() - started
+
+    assert result.complete
+    assert len(result.results) == 16
+    assert len({descriptor.id for descriptor in result.results}) == 16
+    # three pages per registry, the registries are searched in parallel
+    assert all(registry.count("POST", "/search") == 3 for registry in registries)
+    assert elapsed < 3 * 3 * 0.2
+
+    result = _search(registries).search({"path": "idShort", "value": "motor_1"})
+    assert sorted(descriptor.id for descriptor in result.results) == [f"fluid40/region_{number}/motor_1" for number in range(3)]
+
+
+def test_002_search_stops_at_limit(registries: list[StubAasServer]):
+    result = _search(registries[:1]).search(limit=3)
+
+    assert len(result.results) == 3
+    assert not result.complete
+    assert result.unfinished == [registries[0].base_url]
+    assert registries[0].count("POST", "/search") == 2
+
+
+def test_003_deadline_and_failures(registries: list[StubAasServer]):
+    slow, failing, fast = registries
+    slow.search_delay = 2.0
+    search = _search(registries)
+    failing.stop()
+
+    started = time.monotonic()
+    result = search.search(timeout=0.5)
+
+    assert time.monotonic() - started < 1.5
+    assert result.failed == [failing.base_url]
+    assert result.unfinished == [slow.base_url]
+    assert {descriptor.id for descriptor in result.results} == set(fast.shell_descriptors)
@@ -0,0 +1,88 @@
+import json
+import logging
+
+import pytest
+import requests
+
+from aas_http_client.utilities import http_helper
+
+
+def _create_response(status_code: int, content: bytes) -> requests.Response:
+    response = requests.models.Response()
+    response.status_code = status_code
+    response._content = content
+    response.url = "http://localhost/submodels"
+    response.request = requests.Request("GET", response.url).prepare()
+    return response
+
+
+@pytest.fixture(autouse=True)
+def reset_body_size():
+    yield
+    http_helper.set_max_logged_body_size(http_helper.DEFAULT_MAX_LOGGED_BODY_SIZE)
+
+
+def test_001_log_response_messages(caplog):
+    response = _create_response(400, json.dumps({"messages": [{"message": "Invalid id"}]}).encode())
+
+    with caplog.at_level(logging.ERROR, logger=http_helper.__name__):
+        http_helper.log_response(response)
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert messages == ["Status code: 400", "Invalid id"]
+    assert caplog.records[0].http_status_code == 400
+    assert caplog.records[0].http_method == "GET"
+    assert caplog.records[0].http_url == "http://localhost/submodels"
+    assert caplog.records[0].http_body_truncated is False
+
+
+def test_002_log_response_detail(caplog):
+    response = _create_response(500, json.dumps({"detail": {"error": "Server error"}}).encode())
+
+    with caplog.at_level(logging.ERROR, logger=http_helper.__name__):
+        http_helper.log_response(response)
+
+    assert [record.getMessage() for record in caplog.records] == ["Status code: 500", "Server error"]
+
+
+def test_003_log_response_no_json(caplog):
+    response = _create_response(502, b"Bad Gateway")
+
+    with caplog.at_level(logging.ERROR, logger=http_helper.__name__):
+        http_helper.log_response(response)
+
+    assert [record.getMessage() for record in caplog.records] == ["Status code: 502", "Bad Gateway"]
+
+
+def test_004_log_response_truncated(caplog):
+    http_helper.set_max_logged_body_size(16)
+    response = _create_response(500, json.dumps({"error": "x" * 1000}).encode())
+
+    with caplog.at_level(logging.DEBUG, logger=http_helper.__name__):
+        http_helper.log_response(response)
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert messages[0] == "Status code: 500"
+    assert messages[1] == '{"error": "xxxxx... (truncated)'
+    assert caplog.records[0].http_body_size > 16
+    assert caplog.records[0].http_body_truncated is True
+    assert all(len(message) < 100 for message in messages)
+
+
+def test_005_log_response_disabled(caplog):
+    class _ProbeResponse(requests.models.Response):
+        accessed = False
+
+        @property
+        def content(self):
+            _ProbeResponse.accessed = True
+            return b""
+
+    response = _ProbeResponse()
+    response.status_code = 500
+
+    with caplog.at_level(logging.CRITICAL, logger=http_helper.__name__):
+        http_helper.log_response(response)
+
+    assert caplog.records == []
+    assert _ProbeResponse.accessed is False
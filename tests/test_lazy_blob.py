@@ -0,0 +1,129 @@
+import base64
+
+import pytest
+from basyx.aas import model
+
+from aas_http_client.classes.wrapper.lazy_blob import BlobCache, LazyBlob
+from aas_http_client.classes.wrapper.sdk_wrapper import Extent, SdkWrapper
+from aas_http_client.utilities import encoder
+from tests.stub_server import StubAasServer
+
+SUBMODEL_ID = "fluid40/sm_blobs"
+ELEMENTS_PATH = f"/submodels/{encoder.encode_base_64(SUBMODEL_ID)}/submodel-elements/"
+
+
+def _blob(id_short: str, value: bytes) -> dict:
+    return {"idShort": id_short, "modelType": "Blob", "contentType": "application/octet-stream", "value": base64.b64encode(value).decode()}
+
+
+@pytest.fixture()
+def server():
+    server = StubAasServer().start()
+    server.submodels[SUBMODEL_ID] = {
+        "id": SUBMODEL_ID,
+        "idShort": "sm_blobs",
+        "modelType": "Submodel",
+        "submodelElements": [
+            _blob("image", b"image-data"),
+            {"idShort": "files", "modelType": "SubmodelElementCollection", "value": [_blob(f"file_{i}", f"file-{i}".encode()) for i in range(3)]},
+        ],
+    }
+    yield server
+    server.stop()
+
+
+@pytest.fixture()
+def wrapper(server: StubAasServer) -> SdkWrapper:
+    wrapper = SdkWrapper({"BaseUrl": server.base_url})
+    wrapper.set_lazy_blobs(enabled=True, cache_size=1024)
+    return wrapper
+
+
+def test_001_blob_cache_is_bounded():
+    cache = BlobCache(10)
+    cache.put("sm", "a", b"1234")
+    cache.put("sm", "b", b"1234")
+    assert cache.get("sm", "a") == b"1234"
+
+    # 'b' is the least recently used value
+    cache.put("other", "c", b"1234")
+    assert cache.get("sm", "b") is None
+    assert cache.size == 8
+
+    cache.put("sm", "d", b"12345678901")
+    assert cache.get("sm", "d") is None
+
+    cache.invalidate("sm")
+    assert len(cache) == 1
+    assert cache.get("other", "c") == b"1234"
+
+
+def test_002_blob_values_are_fetched_on_access(server: StubAasServer, wrapper: SdkWrapper):
+    identifier = encoder.encode_base_64(SUBMODEL_ID)
+    submodel = wrapper.get_submodel_by_id(identifier)
+    assert isinstance(submodel, model.Submodel)
+    assert server.count("GET", ELEMENTS_PATH) == 0
+
+    files = submodel.get_referable("files")
+    assert isinstance(files, model.SubmodelElementCollection)
+    blob = files.get_referable("file_1")
+    assert isinstance(blob, LazyBlob)
+    assert not blob.is_loaded
+
+    assert blob.value == b"file-1"
+    assert blob.value == b"file-1"
+    assert server.count("GET", ELEMENTS_PATH) == 1
+
+    # values are served from the cache for later reads of the submodel
+    submodel = wrapper.get_submodel_by_id(identifier)
+    assert isinstance(submodel, model.Submodel)
+    files = submodel.get_referable("files")
+    assert isinstance(files, model.SubmodelElementCollection)
+    blob = files.get_referable("file_1")
+    assert isinstance(blob, LazyBlob)
+    assert blob.value == b"file-1"
+    assert server.count("GET", ELEMENTS_PATH) == 1
+
+    # an explicit extent is passed to the server
+    submodel = wrapper.get_submodel_by_id(identifier, extent=Extent.with_blob_value)
+    assert isinstance(submodel, model.Submodel)
+    image = submodel.get_referable("image")
+    assert type(image) is model.Blob
+    assert image.value == b"image-data"
+
+
+def test_003_element_blobs_and_updates(server: StubAasServer, wrapper: SdkWrapper):
+    identifier = encoder.encode_base_64(SUBMODEL_ID)
+    files = wrapper.get_submodel_element_by_path_submodel_repo(identifier, "files")
+    assert isinstance(files, model.SubmodelElementCollection)
+    assert all(isinstance(blob, LazyBlob) and not blob.is_loaded for blob in files.value)
+
+    # sending the element fetches the unread values, so they are not removed on the server
+    blob = files.get_referable("file_0")
+    assert isinstance(blob, model.Blob)
+    blob.value = b"changed"
+    assert wrapper.put_submodel_element_by_path_submodel_repo(identifier, "files", files)
+    assert server.count("GET", f"{ELEMENTS_PATH}files.file_") == 2
+
+    stored = server.submodels[SUBMODEL_ID]["submodelElements"][1]["value"]
+    assert [base64.b64decode(element["value"]) for element in stored] == [b"changed", b"file-1", b"file-2"]
+
+    # the update invalidates the cache
+    blob = wrapper.get_submodel_element_by_path_submodel_repo(identifier, "files.file_1")
+    assert isinstance(blob, LazyBlob)
+    assert blob.value == b"file-1"
+    assert server.count("GET", f"{ELEMENTS_PATH}files.file_1") == 3
+
+
+def test_004_failed_fetch_is_retried(server: StubAasServer, wrapper: SdkWrapper):
+    identifier = encoder.encode_base_64(SUBMODEL_ID)
+    blob = wrapper.get_submodel_element_by_path_submodel_repo(identifier, "image")
+    assert isinstance(blob, LazyBlob)
+
+    element = server.submodels[SUBMODEL_ID]["submodelElements"].pop(0)
+    with pytest.raises(RuntimeError):
+        _ = blob.value
+    assert not blob.is_loaded
+
+    server.submodels[SUBMODEL_ID]["submodelElements"].insert(0, element)
+    assert blob.value == b"image-data"
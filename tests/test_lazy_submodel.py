@@ -0,0 +1,83 @@
+import pytest
+
+from aas_http_client.classes.client.aas_client import create_by_dict
+from aas_http_client.classes.wrapper.lazy_submodel import LazySubmodel
+from aas_http_client.utilities.encoder import encode_base_64
+from tests.stub_server import StubAasServer
+
+SUBMODEL_ID = "fluid40/sm_lazy"
+SUBMODEL_PATH = f"/submodels/{encode_base_64(SUBMODEL_ID)}"
+
+
+def _property(id_short: str, value: str) -> dict:
+    return {"idShort": id_short, "modelType": "Property", "valueType": "xs:string", "value": value}
+
+
+def _collection(id_short: str, value: list[dict]) -> dict:
+    return {"idShort": id_short, "modelType": "SubmodelElementCollection", "value": value}
+
+
+@pytest.fixture()
+def server():
+    server = StubAasServer().start()
+    groups = [
+        _collection(f"group_{g}", [_collection(f"sub_{s}", [_property(f"prop_{p}", f"{g}.{s}.{p}") for p in range(10)]) for s in range(10)])
+        for g in range(10)
+    ]
+    items = {
+        "idShort": "items",
+        "modelType": "SubmodelElementList",
+        "typeValueListElement": "SubmodelElementCollection",
+        "value": [_collection("", [_property("name", f"item {i}")]) for i in range(3)],
+    }
+    server.submodels[SUBMODEL_ID] = {"id": SUBMODEL_ID, "idShort": "sm_lazy", "modelType": "Submodel", "submodelElements": [*groups, items]}
+    yield server
+    server.stop()
+
+
+@pytest.fixture()
+def client(server: StubAasServer):
+    return create_by_dict({"BaseUrl": server.base_url, "EncodedIds": False})
+
+
+def test_001_branch_is_fetched_on_demand(server: StubAasServer, client):
+    view = LazySubmodel(client, SUBMODEL_ID)
+
+    assert view.get("group_3.sub_4.prop_5").value == "3.4.5"
+    assert view.get("items[1].name").value == "item 1"
+    assert server.count("GET", SUBMODEL_PATH) == 5
+
+    # expanded nodes are kept
+    assert [node.id_short for node in view.get("group_3.sub_4")][:2] == ["prop_0", "prop_1"]
+    assert server.count("GET", SUBMODEL_PATH) == 5
+
+    with pytest.raises(KeyError):
+        view.get("group_3.unknown")
+    with pytest.raises(KeyError):
+        view.get("items[3]")
+
+
+def test_002_siblings_are_prefetched(server: StubAasServer, client):
+    view = LazySubmodel(client, SUBMODEL_ID, prefetch_siblings=2)
+
+    assert len(view.root["group_3"].children) == 10
+    assert server.count("GET", SUBMODEL_PATH) == 4
+
+    for group in ("group_4", "group_5"):
+        assert view.root[group]["sub_0"].value is None
+    assert server.count("GET", SUBMODEL_PATH) == 4
+
+    view.prefetch(["group_6", "group_7", "group_4"])
+    assert view.request_count == 6
+
+
+def test_003_expanded_nodes_are_evicted(client):
+    view = LazySubmodel(client, SUBMODEL_ID, max_expanded=2)
+
+    view.get("group_0.sub_0")
+    view.get("group_1.sub_0")
+    assert view.request_count == 3
+
+    # the least recently used children of 'group_0' were evicted by 'group_1'
+    assert view.get("group_0.sub_0.prop_0").value == "0.0.0"
+    assert view.request_count == 5
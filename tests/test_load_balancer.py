@@ -0,0 +1,159 @@
+import threading
+import time
+
+import pytest
+
+from aas_http_client.classes.client.aas_client import create_by_dict
+from aas_http_client.classes.client.load_balancer import LoadBalancer, LoadBalancing
+from aas_http_client.utilities.encoder import encode_base_64
+from tests.stub_server import StubAasServer
+
+SUBMODEL_ID = "fluid40/sm_replicated"
+SUBMODEL_PATH = f"/submodels/{encode_base_64(SUBMODEL_ID)}"
+
+
+@pytest.fixture()
+def replicas():
+    replicas = [StubAasServer().start() for _ in range(3)]
+    for replica in replicas:
+        replica.submodels[SUBMODEL_ID] = {"id": SUBMODEL_ID, "idShort": "sm_replicated", "modelType": "Submodel", "submodelElements": []}
+    yield replicas
+    for replica in replicas:
+        replica.stop()
+
+
+def _client(replicas: list[StubAasServer], **kwargs):
+    return create_by_dict({"BaseUrl": replicas[0].base_url, "BaseUrls": [replica.base_url for replica in replicas[1:]], **kwargs})
+
+
+def test_001_requests_are_distributed(replicas: list[StubAasServer]):
+    client = _client(replicas)
+
+    for _ in range(9):
+        assert client.submodels.get_submodel_by_id(encode_base_64(SUBMODEL_ID)) is not None
+
+    assert [replica.count("GET", SUBMODEL_PATH) for replica in replicas] == [3, 3, 3]
+    client.close()
+
+
+def test_002_idempotent_requests_fail_over(replicas: list[StubAasServer]):
+    client = _client(replicas)
+    replicas[1].stop()
+
+    for _ in range(12):
+        assert client.submodels.get_submodel_by_id(encode_base_64(SUBMODEL_ID)) is not None
+
+    # the stopped replica is ejected after three failed requests
+    states = {state.base_url: state for state in client.get_load_balancer().replicas}  # type: ignore[union-attr]
+    assert states[replicas[1].base_url].ejected_until > 0
+    assert replicas[0].count("GET", SUBMODEL_PATH) + replicas[2].count("GET", SUBMODEL_PATH) == 12
+
+    client.close()
+
+
+def test_003_other_requests_do_not_fail_over(replicas: list[StubAasServer]):
+    client = _client(replicas[:2])
+    replicas[1].stop()
+
+    # POST is not repeated, as it may have been processed by the failed replica
+    results = [client.submodels.post_submodel({"id": f"fluid40/sm_{index}", "modelType": "Submodel"}) for index in range(2)]
+    assert results.count(None) == 1
+    assert replicas[0].count("POST", "/submodels") == 1
+    client.close()
+
+
+def test_004_strategies():
+    balancer = LoadBalancer(["http://a", "http://b", "http://c"], LoadBalancing.least_outstanding)
+    balancer.begin("http://a")
+    balancer.begin("http://b")
+    assert balancer.select() == "http://c"
+    assert balancer.select({"http://c"}) in ("http://a", "http://b")
+    assert balancer.select({"http://a", "http://b", "http://c"}) is None
+
+    balancer = LoadBalancer(["http://a", "http://b"], LoadBalancing.latency)
+    for base_url, elapsed in (("http://a", 0.5), ("http://b", 0.05)):
+        balancer.begin(base_url)
+        balancer.end(base_url, elapsed, success=True)
+    assert {balancer.select() for _ in range(5)} == {"http://b"}
+
+
+def test_005_health_checks_eject_and_readmit():
+    healthy = {"http://a": True, "http://b": False}
+    checked = threading.Event()
+
+    def check(base_url: str) -> bool:
+        checked.set()
+        return healthy[base_url]
+
+    balancer = LoadBalancer(list(healthy))
+    balancer.start_health_checks(0.01, check)
+    assert checked.wait(1)
+
+    try:
+        for _ in range(100):
+            if {balancer.select() for _ in range(4)} == {"http://a"}:
+                break
+            checked.clear()
+            checked.wait(1)
+        assert {balancer.select() for _ in range(4)} == {"http://a"}
+
+        healthy["http://b"] = True
+        for _ in range(100):
+            if {balancer.select() for _ in range(4)} == {"http://a", "http://b"}:
+                break
+            checked.clear()
+            checked.wait(1)
+        assert {balancer.select() for _ in range(4)} == {"http://a", "http://b"}
+    finally:
+        balancer.stop_health_checks()
+
+
+def _warm_up(client, count: int = 30):
+    for _ in range(count):
+        assert client.submodels.get_submodel_by_id(encode_base_64(SUBMODEL_ID)) is not None
+
+
+def test_006_slow_get_requests_are_hedged(replicas: list[StubAasServer]):
+    server = replicas[0]
+    client = create_by_dict({"BaseUrl": server.base_url, "HedgePercentile": 90, "HedgeBudget": 0.1})
+    _warm_up(client)
+
+    server.delay = 1.0
+    server.delayed_requests = 1
+    started = time.monotonic()
+    assert client.submodels.get_submodel_by_id(encode_base_64(SUBMODEL_ID)) is not None
+
+    assert time.monotonic() - started < 0.5
+    assert client.get_load_balancer().hedged_requests == 1  # type: ignore[union-attr]
+    client.close()
+
+
+def test_007_hedge_budget(replicas: list[StubAasServer]):
+    server = replicas[0]
+    client = create_by_dict({"BaseUrl": server.base_url, "HedgePercentile": 90, "HedgeBudget": 0})
+    _warm_up(client)
+
+    server.delay = 1.0
+    server.delayed_requests = 1
+    started = time.monotonic()
+    assert client.submodels.get_submodel_by_id(encode_base_64(SUBMODEL_ID)) is not None
+
+    assert time.monotonic() - started >= 1.0
+    assert client.get_load_balancer().hedged_requests == 0  # type: ignore[union-attr]
+    client.close()
+
+
+def test_008_hedged_request_goes_to_other_replica(replicas: list[StubAasServer]):
+    client = _client(replicas[:2], HedgePercentile=90, HedgeBudget=0.1)
+    _warm_up(client)
+    counts = [replica.count("GET", SUBMODEL_PATH) for replica in replicas[:2]]
+
+    # round robin selects the first replica next
+    replicas[0].delay = 1.0
+    replicas[0].delayed_requests = 1
+    started = time.monotonic()
+    assert client.submodels.get_submodel_by_id(encode_base_64(SUBMODEL_ID)) is not None
+
+    assert time.monotonic() - started < 0.5
+    assert [replica.count("GET", SUBMODEL_PATH) - count for replica, count in zip(replicas[:2], counts, strict=True)] == [1, 1]
+    client.close()
@@ -0,0 +1,76 @@
+import multiprocessing
+import pickle
+import sys
+
+import pytest
+
+from aas_http_client.classes.client.aas_client import AasHttpClient, ClientSpec, create_by_dict, create_by_spec
+from aas_http_client.utilities import encoder
+from tests.stub_server import StubAasServer
+
+SUBMODEL_ID = "fluid40/sm_multiprocessing"
+
+
+@pytest.fixture()
+def server():
+    server = StubAasServer().start()
+    server.submodels[SUBMODEL_ID] = {"id": SUBMODEL_ID, "idShort": "sm_multiprocessing", "modelType": "Submodel"}
+    yield server
+    server.stop()
+
+
+def _session_id_in_child(client: AasHttpClient, parent_session_id: int, queue) -> None:
+    submodel = client.submodels.get_submodel_by_id(encoder.encode_base_64(SUBMODEL_ID))
+    queue.put((id(client.get_session()) != parent_session_id, submodel is not None))
+
+
+def test_001_spec_round_trip_without_connection_probe(server: StubAasServer):
+    configuration = {
+        "BaseUrl": server.base_url,
+        "TimeOut": 42,
+        "AuthenticationSettings": {"OAuth": {"ClientId": "client", "TokenUrl": f"{server.base_url}/token"}},
+    }
+    client = create_by_dict(configuration, o_auth_client_secret="client-secret-value")
+    client.set_token()
+    probes = server.count("GET", "/shells")
+
+    spec = pickle.loads(pickle.dumps(client.to_spec()))
+    restored = create_by_spec(spec)
+
+    assert isinstance(spec, ClientSpec)
+    assert "client-secret-value" not in repr(spec)
+    assert restored.time_out == 42
+    assert restored.auth_settings.o_auth.get_client_secret() == "client-secret-value"
+    assert restored.get_session() is not client.get_session()
+    assert server.count("GET", "/shells") == probes
+
+    assert restored.set_token() == client.set_token()
+    assert server.token_requests == 1
+
+
+def test_002_pickle_client(server: StubAasServer):
+    client = create_by_dict({"BaseUrl": server.base_url}, bearer_auth_token="static-token")
+    probes = server.count("GET", "/shells")
+
+    restored = pickle.loads(pickle.dumps(client))
+
+    assert restored.base_url == client.base_url
+    assert restored.auth_settings.bearer_auth.get_token() == "static-token"
+    assert restored.submodels.get_submodel_by_id(encoder.encode_base_64(SUBMODEL_ID)) is not None
+    assert server.count("GET", "/shells") == probes
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="fork start method is not available on Windows")
+def test_003_fork_rebuilds_session(server: StubAasServer):
+    client = create_by_dict({"BaseUrl": server.base_url})
+    context = multiprocessing.get_context("fork")
+    queue = context.Queue()
+
+    process = context.Process(target=_session_id_in_child, args=(client, id(client.get_session()), queue))
+    process.start()
+    new_session, found = queue.get(timeout=30)
+    process.join(timeout=30)
+
+    assert new_session
+    assert found
+    assert process.exitcode == 0
@@ -0,0 +1,90 @@
+import threading
+import time
+
+import pytest
+
+from aas_http_client.classes.client.aas_client import create_by_dict
+from aas_http_client.classes.wrapper.operations import ExecutionState, invoke_operation_async, run_operations
+from tests.stub_server import StubAasServer
+
+SUBMODEL_ID = "fluid40/sm_operations"
+
+
+def _arguments(value: str) -> dict:
+    return {"inputArguments": [{"value": {"idShort": "input", "modelType": "Property", "valueType": "xs:string", "value": value}}]}
+
+
+@pytest.fixture()
+def server():
+    server = StubAasServer().start()
+    server.submodels[SUBMODEL_ID] = {"id": SUBMODEL_ID, "idShort": "sm_operations", "modelType": "Submodel", "submodelElements": []}
+    yield server
+    server.stop()
+
+
+def test_001_invoke_and_wait(server: StubAasServer):
+    client = create_by_dict({"BaseUrl": server.base_url})
+    handle = invoke_operation_async(client, SUBMODEL_ID, "machine.start", _arguments("1"), poll_interval=0.01)
+    assert handle is not None
+    assert handle.state == ExecutionState.initiated
+
+    result = handle.wait(timeout=10)
+
+    assert handle.state == ExecutionState.completed
+    assert result is not None
+    assert result["outputArguments"] == _arguments("1")["inputArguments"]
+    assert server.count("GET", "/submodels/Zmx1aWQ0MC9zbV9vcGVyYXRpb25z/submodel-elements/machine.start/operation-status/") == 2
+    assert server.count("GET", "/submodels/Zmx1aWQ0MC9zbV9vcGVyYXRpb25z/submodel-elements/machine.start/operation-results/") == 1
+
+
+def test_002_run_many_operations(server: StubAasServer):
+    client = create_by_dict({"BaseUrl": server.base_url, "MaxWorkers": 4})
+    server.operation_polls = 3
+
+    invocations = [(SUBMODEL_ID, f"machine_{index}.start", _arguments(str(index))) for index in range(20)]
+    handles = run_operations(client, invocations, timeout=10, poll_interval=0.01)
+
+    assert all(handle is not None and handle.state == ExecutionState.completed for handle in handles)
+    assert [handle.result["outputArguments"][0]["value"]["value"] for handle in handles if handle and handle.result] == [str(i) for i in range(20)]
+    assert server.count("GET", "/submodels/") == 20 * 4
+
+
+def test_003_cancel_and_timeout(server: StubAasServer):
+    client = create_by_dict({"BaseUrl": server.base_url})
+    server.operation_polls = 1000
+
+    handle = invoke_operation_async(client, SUBMODEL_ID, "machine.start", _arguments("1"), poll_interval=0.01, max_poll_interval=0.05)
+    assert handle is not None
+    assert handle.wait(timeout=0.2) is None
+    assert handle.state == ExecutionState.running
+
+    threading.Timer(0.1, handle.cancel).start()
+    start = time.monotonic()
+    assert handle.wait() is None
+    assert time.monotonic() - start < 5
+    assert handle.state == ExecutionState.canceled
+
+
+def test_004_async_argument_is_deprecated(server: StubAasServer):
+    client = create_by_dict({"BaseUrl": server.base_url})
+    assert client.submodels is not None
+
+    with pytest.warns(DeprecationWarning, match="invoke_operation_async_submodel_repo"):
+        client.submodels.invoke_operation_submodel_repo(SUBMODEL_ID, "machine.start", _arguments("1"), async_="async")
+
+
+def test_005_failed_operations_are_not_completed(server: StubAasServer):
+    client = create_by_dict({"BaseUrl": server.base_url})
+    server.operation_results["machine.failed"] = {"executionState": "Failed", "success": False}
+    server.operation_results["machine.unsuccessful"] = {"success": False}
+
+    handles = run_operations(
+        client,
+        [(SUBMODEL_ID, path, _arguments("1")) for path in ("machine.failed", "machine.unsuccessful", "machine.start")],
+        timeout=10,
+        poll_interval=0.01,
+    )
+
+    assert [handle.state for handle in handles if handle] == [ExecutionState.failed, ExecutionState.failed, ExecutionState.completed]
+    assert handles[0] is not None
+    assert handles[0].wait() is None
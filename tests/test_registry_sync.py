@@ -0,0 +1,91 @@
+import pytest
+
+from aas_http_client.classes.client.aas_client import create_by_dict
+from aas_http_client.classes.wrapper.registry_sync import RegistrySync
+from aas_http_client.classes.wrapper.replication import ReplicationAction
+from tests.stub_server import StubAasServer
+
+
+def _reference(submodel_id: str) -> dict:
+    return {"type": "ModelReference", "keys": [{"type": "Submodel", "value": submodel_id}]}
+
+
+@pytest.fixture()
+def servers():
+    repository, registry = StubAasServer().start(), StubAasServer().start()
+    for index in range(4):
+        submodel_id = f"fluid40/sm_{index}"
+        repository.submodels[submodel_id] = {"id": submodel_id, "idShort": f"sm_{index}", "modelType": "Submodel", "submodelElements": []}
+    for index in range(3):
+        shell_id = f"fluid40/aas_{index}"
+        repository.shells[shell_id] = {
+            "id": shell_id,
+            "idShort": f"aas_{index}",
+            "modelType": "AssetAdministrationShell",
+            "assetInformation": {"assetKind": "Instance", "globalAssetId": f"fluid40/asset_{index}"},
+            "submodels": [_reference(f"fluid40/sm_{index}"), _reference("fluid40/external")],
+        }
+    # registered by another repository
+    registry.submodel_descriptors["fluid40/foreign"] = {
+        "id": "fluid40/foreign",
+        "endpoints": [{"interface": "SUBMODEL-3.0", "protocolInformation": {"href": "http://other/submodels/Zm9yZWlnbg"}}],
+    }
+    yield repository, registry
+    repository.stop()
+    registry.stop()
+
+
+def _sync(servers: tuple[StubAasServer, StubAasServer], **kwargs) -> RegistrySync:
+    repository, registry = servers
+    return RegistrySync(create_by_dict({"BaseUrl": repository.base_url}), create_by_dict({"BaseUrl": registry.base_url}), page_size=2, **kwargs)
+
+
+def test_001_descriptors_are_created(servers: tuple[StubAasServer, StubAasServer]):
+    repository, registry = servers
+
+    report = _sync(servers).sync()
+
+    assert report.complete
+    assert not report.failed
+    assert len(report.get_results(ReplicationAction.create)) == 7
+    shell_descriptor = registry.shell_descriptors["fluid40/aas_1"]
+    assert shell_descriptor["assetKind"] == "Instance"
+    assert shell_descriptor["endpoints"][0]["protocolInformation"]["href"].startswith(f"{repository.base_url}/shells/")
+    assert [descriptor["id"] for descriptor in shell_descriptor["submodelDescriptors"]] == ["fluid40/sm_1"]
+
+    # nothing changed, nothing is written
+    writes = registry.count("POST") + registry.count("PUT")
+    report = _sync(servers).sync()
+    assert len(report.get_results(ReplicationAction.skip)) == 7
+    assert registry.count("POST") + registry.count("PUT") == writes
+
+
+def test_002_changes_are_updated_and_deleted(servers: tuple[StubAasServer, StubAasServer]):
+    repository, registry = servers
+    _sync(servers).sync()
+
+    repository.shells["fluid40/aas_0"]["idShort"] = "renamed"
+    del repository.submodels["fluid40/sm_3"]
+
+    report = _sync(servers, delete=True).diff()
+    assert [result.identifier for result in report.get_results(ReplicationAction.update)] == ["fluid40/aas_0"]
+    assert [result.identifier for result in report.get_results(ReplicationAction.delete)] == ["fluid40/sm_3"]
+    assert registry.shell_descriptors["fluid40/aas_0"]["idShort"] == "aas_0"
+
+    report = _sync(servers, delete=True, requests_per_second=50).sync()
+    assert not report.failed
+    assert registry.shell_descriptors["fluid40/aas_0"]["idShort"] == "renamed"
+    assert set(registry.submodel_descriptors) == {"fluid40/foreign", "fluid40/sm_0", "fluid40/sm_1", "fluid40/sm_2"}
+
+
+def test_003_malformed_descriptors_are_skipped(servers: tuple[StubAasServer, StubAasServer]):
+    _, registry = servers
+    registry.submodel_descriptors["fluid40/no_id"] = {"idShort": "no_id"}
+    registry.submodel_descriptors["fluid40/bad_endpoint"] = {"id": "fluid40/bad_endpoint", "endpoints": ["http://other"]}
+
+    report = _sync(servers, delete=True).sync()
+
+    assert report.complete
+    assert not report.failed
+    assert len(report.get_results(ReplicationAction.create)) == 7
+    assert "fluid40/bad_endpoint" in registry.submodel_descriptors
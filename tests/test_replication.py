@@ -0,0 +1,133 @@
+from pathlib import Path
+
+import pytest
+
+from aas_http_client.classes.client.aas_client import create_by_dict
+from aas_http_client.classes.wrapper.replication import ReplicationAction, Replicator
+from aas_http_client.utilities.checkpoint import Checkpoint
+from aas_http_client.utilities.hashing import content_hash
+from tests.stub_server import StubAasServer
+
+SUBMODEL_COUNT = 30
+THUMBNAIL = b"\x89PNG thumbnail"
+FILE_CONTENT = b"%PDF-1.4 replication"
+
+
+def _submodel(index: int) -> dict:
+    return {"id": f"fluid40/sm_replication_{index}", "idShort": f"sm_replication_{index}", "modelType": "Submodel"}
+
+
+@pytest.fixture()
+def source():
+    server = StubAasServer().start()
+    for index in range(SUBMODEL_COUNT):
+        server.submodels[f"fluid40/sm_replication_{index}"] = _submodel(index)
+
+    server.submodels["fluid40/sm_replication_0"]["submodelElements"] = [
+        {"idShort": "manual", "modelType": "File", "contentType": "application/pdf", "value": "/aasx/files/manual.pdf"}
+    ]
+    server.attachments[("fluid40/sm_replication_0", "manual")] = FILE_CONTENT
+
+    server.shells["fluid40/aas_replication"] = {
+        "id": "fluid40/aas_replication",
+        "idShort": "aas_replication",
+        "modelType": "AssetAdministrationShell",
+        "assetInformation": {
+            "assetKind": "Instance",
+            "globalAssetId": "fluid40/asset_replication",
+            "defaultThumbnail": {"path": "thumbnail.png", "contentType": "image/png"},
+        },
+        "submodels": [{"type": "ModelReference", "keys": [{"type": "Submodel", "value": "fluid40/sm_replication_0"}]}],
+    }
+    server.attachments[("fluid40/aas_replication", "thumbnail")] = THUMBNAIL
+    yield server
+    server.stop()
+
+
+@pytest.fixture()
+def target():
+    server = StubAasServer().start()
+    yield server
+    server.stop()
+
+
+def _replicator(source: StubAasServer, target: StubAasServer, **kwargs) -> Replicator:
+    source_client = create_by_dict({"BaseUrl": source.base_url})
+    target_client = create_by_dict({"BaseUrl": target.base_url, "EncodedIds": False})
+    return Replicator(source_client, target_client, page_size=7, **kwargs)
+
+
+def test_001_content_hash_ignores_key_order_and_empty_values():
+    assert content_hash({"a": 1, "b": [1, 2]}) == content_hash({"b": [1, 2], "a": 1})
+    assert content_hash({"a": 1, "b": []}) != content_hash({"a": 1})
+    assert content_hash({"a": 1, "b": [], "c": {"d": None}}, ignore_empty=True) == content_hash({"a": 1}, ignore_empty=True)
+
+
+def test_002_replicate_with_thumbnails_and_attachments(source: StubAasServer, target: StubAasServer):
+    target.submodels["fluid40/sm_replication_1"] = {**_submodel(1), "idShort": "outdated"}
+
+    report = _replicator(source, target, include_thumbnails=True, include_attachments=True).replicate()
+
+    assert report.complete
+    assert not report.failed
+    assert len(report.get_results(ReplicationAction.create)) == SUBMODEL_COUNT
+    assert [result.identifier for result in report.get_results(ReplicationAction.update)] == ["fluid40/sm_replication_1"]
+    assert target.submodels == source.submodels
+    assert target.shells == source.shells
+    assert FILE_CONTENT in target.attachments[("fluid40/sm_replication_0", "manual")]
+    assert THUMBNAIL in target.attachments[("fluid40/aas_replication", "thumbnail")]
+
+
+def test_003_incremental_skips_unchanged(source: StubAasServer, target: StubAasServer):
+    _replicator(source, target).replicate()
+    source.submodels["fluid40/sm_replication_5"]["idShort"] = "changed"
+    writes = target.count("PUT") + target.count("POST")
+
+    report = _replicator(source, target).replicate()
+
+    assert [result.identifier for result in report.get_results(ReplicationAction.update)] == ["fluid40/sm_replication_5"]
+    assert len(report.get_results(ReplicationAction.skip)) == SUBMODEL_COUNT
+    assert target.count("PUT") + target.count("POST") == writes + 1
+
+
+def test_004_dry_run_diff_and_mirror(source: StubAasServer, target: StubAasServer):
+    target.submodels["fluid40/sm_extra"] = {"id": "fluid40/sm_extra", "idShort": "sm_extra", "modelType": "Submodel"}
+
+    diff = _replicator(source, target, mirror=True).diff()
+
+    assert len(diff.get_results(ReplicationAction.create)) == SUBMODEL_COUNT + 1
+    assert [result.identifier for result in diff.get_results(ReplicationAction.delete)] == ["fluid40/sm_extra"]
+    assert target.count("POST") == 0
+    assert target.count("DELETE") == 0
+
+    _replicator(source, target, mirror=True).replicate()
+    assert "fluid40/sm_extra" not in target.submodels
+
+
+def test_005_resume_from_checkpoint(source: StubAasServer, target: StubAasServer, tmp_path: Path):
+    checkpoint_file = tmp_path / "replication.checkpoint"
+    source.fail_cursors.add("14")
+
+    report = _replicator(source, target).replicate(checkpoint_file)
+
+    assert not report.complete
+    assert len(target.submodels) == 14
+    assert Checkpoint.load(checkpoint_file).cursor == "14"
+
+    source.fail_cursors.clear()
+    report = _replicator(source, target).replicate(checkpoint_file)
+
+    assert report.complete
+    assert len(report.get_results(ReplicationAction.create)) == SUBMODEL_COUNT - 14 + 1
+    assert len(target.submodels) == SUBMODEL_COUNT
+    assert not checkpoint_file.exists()
+
+
+def test_006_missing_attachment_fails_the_submodel(source: StubAasServer, target: StubAasServer):
+    del source.attachments[("fluid40/sm_replication_0", "manual")]
+
+    report = _replicator(source, target, include_attachments=True).replicate()
+
+    assert report.complete
+    assert [result.identifier for result in report.failed] == ["fluid40/sm_replication_0"]
+    assert target.submodels["fluid40/sm_replication_0"] == source.submodels["fluid40/sm_replication_0"]
@@ -179,3 +179,12 @@ def test_006d_copy(shared_sme_collection: model.SubmodelElementCollection):
 
     copied_sme_collection: model.SubmodelElementCollection = copied_element
     assert copied_sme_collection.id_short == shared_sme_collection.id_short
+
+def test_007_iter_submodel_elements():
+    file = model.File("manual", "application/pdf", "/aasx/files/manual.pdf")
+    items = model.SubmodelElementList("items", model.SubmodelElementCollection, value=[model.SubmodelElementCollection(None, value=[file])])
+    submodel = model.Submodel("fluid40/sm_iter", submodel_element=[model.Property("name", model.datatypes.String, "value"), items])
+
+    paths = [path for path, _ in sdk_tools.iter_submodel_elements(submodel)]
+
+    assert paths == ["name", "items", "items[0]", "items[0].manual"]
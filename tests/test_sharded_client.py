@@ -0,0 +1,96 @@
+import pytest
+
+from aas_http_client.classes.client.aas_client import create_by_dict
+from aas_http_client.classes.wrapper.sharded_client import HashRing, ShardedAasClient
+from aas_http_client.utilities.encoder import encode_base_64
+from tests.stub_server import StubAasServer
+
+
+def _submodel(index: int) -> dict:
+    return {"id": f"fluid40/sm_{index}", "idShort": f"sm_{index}", "modelType": "Submodel", "submodelElements": []}
+
+
+@pytest.fixture()
+def shards():
+    shards = [StubAasServer().start() for _ in range(3)]
+    yield shards
+    for shard in shards:
+        shard.stop()
+
+
+def _sharded_client(shards: list[StubAasServer]) -> ShardedAasClient:
+    return ShardedAasClient([create_by_dict({"BaseUrl": shard.base_url}) for shard in shards])
+
+
+def test_001_requests_are_routed_by_id(shards: list[StubAasServer]):
+    client = _sharded_client(shards)
+
+    for index in range(30):
+        assert client.submodels.post_submodel(_submodel(index)) is not None
+
+    # every submodel is stored on the shard of its id only
+    assert sum(len(shard.submodels) for shard in shards) == 30
+    assert all(shard.submodels for shard in shards)
+    servers = {shard.base_url: shard for shard in shards}
+    for index in range(30):
+        identifier = encode_base_64(f"fluid40/sm_{index}")
+        assert f"fluid40/sm_{index}" in servers[client.get_shard(identifier).base_url].submodels
+        assert client.submodels.get_submodel_by_id(identifier)["idShort"] == f"sm_{index}"
+
+    assert client.submodels.delete_submodel_by_id(encode_base_64("fluid40/sm_0"))
+    assert client.submodels.get_submodel_by_id(encode_base_64("fluid40/sm_0")) is None
+    client.close()
+
+
+def test_002_listings_are_merged_with_composite_cursors(shards: list[StubAasServer]):
+    client = _sharded_client(shards)
+    for index in range(30):
+        client.submodels.post_submodel(_submodel(index))
+
+    identifiers = []
+    pages = 0
+    cursor = ""
+    while True:
+        page = client.submodels.get_all_submodels(limit=6, cursor=cursor)
+        pages += 1
+        assert len(page["result"]) <= 6
+        identifiers.extend(submodel["id"] for submodel in page["result"])
+        cursor = page["paging_metadata"].get("cursor", "")
+        if not cursor:
+            break
+
+    assert sorted(identifiers) == sorted(f"fluid40/sm_{index}" for index in range(30))
+    assert pages > 1
+    assert client.submodels.get_all_submodels(cursor="invalid") is None
+    client.close()
+
+
+def test_003_rebalance_after_adding_a_shard(shards: list[StubAasServer]):
+    client = _sharded_client(shards[:2])
+    for index in range(30):
+        client.submodels.post_submodel(_submodel(index))
+
+    client = _sharded_client(shards)
+    report = client.rebalance(dry_run=True)
+    assert report.moves
+    assert not shards[2].submodels
+    # only submodels taken over by the new shard are moved
+    assert {move.target for move in report.moves} == {shards[2].base_url}
+
+    report = client.rebalance()
+    assert report.complete
+    assert not report.failed
+    assert len(shards[2].submodels) == len(report.moves)
+    assert sum(len(shard.submodels) for shard in shards) == 30
+    assert not client.rebalance(dry_run=True).moves
+    client.close()
+
+
+def test_004_hash_ring_moves_few_keys():
+    identifiers = [f"fluid40/sm_{index}" for index in range(1000)]
+    before = HashRing(["a", "b", "c"])
+    after = HashRing(["a", "b", "c", "d"])
+
+    moved = [identifier for identifier in identifiers if before.get(identifier) != after.get(identifier)]
+    assert all(after.get(identifier) == "d" for identifier in moved)
+    assert 100 < len(moved) < 400
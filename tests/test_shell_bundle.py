@@ -0,0 +1,90 @@
+import threading
+import time
+
+import pytest
+from basyx.aas import model
+
+from aas_http_client.classes.client.aas_client import create_by_dict
+from aas_http_client.classes.wrapper.sdk_wrapper import SdkWrapper
+from aas_http_client.classes.wrapper.shell_bundle import ShellBundle
+from aas_http_client.utilities import encoder
+from aas_http_client.utilities.concurrency import run_concurrently
+from tests.stub_server import StubAasServer
+
+SHELL_ID = "fluid40/aas_bundle"
+SUBMODEL_COUNT = 30
+
+
+def _reference(submodel_id: str) -> dict:
+    return {"type": "ModelReference", "keys": [{"type": "Submodel", "value": submodel_id}]}
+
+
+@pytest.fixture()
+def server():
+    server = StubAasServer().start()
+    submodel_ids = [f"fluid40/sm_bundle_{index}" for index in range(SUBMODEL_COUNT)]
+    for index, submodel_id in enumerate(submodel_ids[:-1]):
+        server.submodels[submodel_id] = {"id": submodel_id, "idShort": f"sm_bundle_{index}", "modelType": "Submodel"}
+    server.shells[SHELL_ID] = {
+        "id": SHELL_ID,
+        "idShort": "aas_bundle",
+        "modelType": "AssetAdministrationShell",
+        "assetInformation": {"assetKind": "Instance", "globalAssetId": "fluid40/asset_bundle"},
+        "submodels": [_reference(submodel_id) for submodel_id in submodel_ids],
+    }
+    yield server
+    server.stop()
+
+
+def test_001_run_concurrently_keeps_order():
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def work(item: int) -> int:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.01)
+        with lock:
+            active -= 1
+        return item * 2
+
+    assert run_concurrently(work, range(20), 4) == [item * 2 for item in range(20)]
+    assert 1 < peak <= 4
+    assert run_concurrently(work, [1, 2], 1) == [2, 4]
+
+
+def test_002_client_shell_with_submodels(server: StubAasServer):
+    client = create_by_dict({"BaseUrl": server.base_url, "MaxWorkers": 16})
+
+    content = client.shells.get_asset_administration_shell_with_submodels(encoder.encode_base_64(SHELL_ID), level="core")
+
+    assert content["shell"]["id"] == SHELL_ID
+    assert [submodel["id"] for submodel in content["submodels"]] == [f"fluid40/sm_bundle_{index}" for index in range(SUBMODEL_COUNT - 1)]
+    assert content["missing"] == [f"fluid40/sm_bundle_{SUBMODEL_COUNT - 1}"]
+    assert server.count("GET", "/submodels/") == SUBMODEL_COUNT
+
+
+def test_003_client_shell_with_submodels_decoded_ids(server: StubAasServer):
+    client = create_by_dict({"BaseUrl": server.base_url, "EncodedIds": False})
+
+    content = client.shells.get_asset_administration_shell_with_submodels(SHELL_ID)
+
+    assert len(content["submodels"]) == SUBMODEL_COUNT - 1
+    assert client.shells.get_asset_administration_shell_with_submodels("fluid40/unknown") is None
+
+
+def test_004_wrapper_shell_bundle(server: StubAasServer):
+    wrapper = SdkWrapper({"BaseUrl": server.base_url})
+
+    bundle = wrapper.get_asset_administration_shell_with_submodels(encoder.encode_base_64(SHELL_ID))
+
+    assert isinstance(bundle, ShellBundle)
+    assert isinstance(bundle.shell, model.AssetAdministrationShell)
+    assert len(bundle.submodels) == SUBMODEL_COUNT - 1
+    assert len(bundle) == SUBMODEL_COUNT
+    assert not bundle.complete
+    assert bundle.submodels[0].id_short == "sm_bundle_0"
+    assert bundle.missing_submodel_ids == [f"fluid40/sm_bundle_{SUBMODEL_COUNT - 1}"]
@@ -0,0 +1,137 @@
+import pytest
+from basyx.aas import model
+
+from aas_http_client.classes.wrapper.sdk_wrapper import SdkWrapper
+from aas_http_client.classes.wrapper.submodel_index import SubmodelIndex
+from aas_http_client.utilities import encoder
+from tests.stub_server import StubAasServer
+
+SUBMODEL_ID = "fluid40/sm_index"
+ELEMENTS_PATH = f"/submodels/{encoder.encode_base_64(SUBMODEL_ID)}/submodel-elements/"
+TEMPERATURE = "https://admin-shell.io/idta/temperature"
+
+
+def _property(id_short: str, value: str, semantic_id: str = "") -> dict:
+    data: dict = {"modelType": "Property", "valueType": "xs:int", "value": value}
+    if id_short:
+        data["idShort"] = id_short
+    if semantic_id:
+        data["semanticId"] = {"type": "ExternalReference", "keys": [{"type": "GlobalReference", "value": semantic_id}]}
+    return data
+
+
+@pytest.fixture()
+def server():
+    server = StubAasServer().start()
+    server.submodels[SUBMODEL_ID] = {
+        "id": SUBMODEL_ID,
+        "idShort": "sm_index",
+        "modelType": "Submodel",
+        "submodelElements": [
+            _property("count", "1"),
+            {
+                "idShort": "sensors",
+                "modelType": "SubmodelElementCollection",
+                "value": [_property(f"sensor_{i}", str(i), TEMPERATURE) for i in range(3)],
+            },
+            {
+                "idShort": "history",
+                "modelType": "SubmodelElementList",
+                "typeValueListElement": "Property",
+                "valueTypeListElement": "xs:int",
+                "value": [_property("", "7")],
+            },
+        ],
+    }
+    yield server
+    server.stop()
+
+
+@pytest.fixture()
+def wrapper(server: StubAasServer) -> SdkWrapper:
+    wrapper = SdkWrapper({"BaseUrl": server.base_url})
+    wrapper.set_element_index(enabled=True)
+    return wrapper
+
+
+def _submodel() -> model.Submodel:
+    semantic_id = model.ExternalReference((model.Key(model.KeyTypes.GLOBAL_REFERENCE, TEMPERATURE),))
+    sensors = model.SubmodelElementCollection(
+        "sensors", value=[model.Property(f"sensor_{i}", model.datatypes.Int, i, semantic_id=semantic_id) for i in range(3)]
+    )
+    history = model.SubmodelElementList(
+        "history", model.Property, value_type_list_element=model.datatypes.Int, value=[model.Property(None, model.datatypes.Int, 7)]
+    )
+    return model.Submodel(SUBMODEL_ID, submodel_element=[model.Property("count", model.datatypes.Int, 1), sensors, history])
+
+
+def test_001_lookups():
+    index = SubmodelIndex(_submodel())
+
+    assert len(index) == 7
+    assert index.get("sensors.sensor_2").value == 2  # type: ignore[union-attr]
+    assert index.get("history[0]").value == 7  # type: ignore[union-attr]
+    assert index.get("sensors.unknown") is None
+    assert index.paths_by_semantic_id(TEMPERATURE) == ["sensors.sensor_0", "sensors.sensor_1", "sensors.sensor_2"]
+    assert len(index.find_by_type(model.Property)) == 5
+    assert len(index.find_by_type(model.DataElement)) == 5
+    assert [element.id_short for element in index.find_by_type(model.SubmodelElementCollection)] == ["sensors"]
+
+    assert index.update_value("count", "5")
+    assert index.get("count").value == 5  # type: ignore[union-attr]
+    assert not index.update_value("count", "five")
+    assert not index.update_value("sensors", "5")
+
+
+def test_002_refresh_after_changes():
+    index = SubmodelIndex(_submodel())
+    sensors = index.get("sensors")
+    assert isinstance(sensors, model.SubmodelElementCollection)
+
+    sensors.remove_referable("sensor_0")
+    sensors.add_referable(model.Property("sensor_9", model.datatypes.Int, 9))
+    index.refresh("sensors")
+
+    assert "sensors.sensor_0" not in index
+    assert index.get("sensors.sensor_9").value == 9  # type: ignore[union-attr]
+    assert index.paths_by_semantic_id(TEMPERATURE) == ["sensors.sensor_1", "sensors.sensor_2"]
+    assert len(index) == 7
+
+
+def test_003_wrapper_reads_from_index(server: StubAasServer, wrapper: SdkWrapper):
+    identifier = encoder.encode_base_64(SUBMODEL_ID)
+    submodel = wrapper.get_submodel_by_id(identifier)
+    assert isinstance(submodel, model.Submodel)
+
+    # changes of the returned submodel do not affect the index
+    submodel.get_referable("count").value = 99  # type: ignore[attr-defined]
+
+    count = wrapper.get_submodel_element_by_path_submodel_repo(identifier, "count")
+    assert isinstance(count, model.Property)
+    assert count.value == 1
+    assert server.count("GET", ELEMENTS_PATH) == 0
+
+    assert wrapper.patch_submodel_element_by_path_value_only_submodel_repo(identifier, "history[0]", "8")
+    item = wrapper.get_submodel_element_by_path_submodel_repo(identifier, "history[0]")
+    assert isinstance(item, model.Property)
+    assert item.value == 8
+    assert server.count("GET", ELEMENTS_PATH) == 0
+
+    # structural changes discard the index
+    assert wrapper.delete_submodel_element_by_path_submodel_repo(identifier, "count")
+    assert wrapper.get_submodel_element_by_path_submodel_repo(identifier, "count") is None
+    assert server.count("GET", ELEMENTS_PATH) == 1
+
+    index = wrapper.get_submodel_index(identifier)
+    assert index is not None
+    assert "count" not in index
+    assert len(index.find_by_semantic_id(TEMPERATURE)) == 3
+
+
+def test_004_index_expires(server: StubAasServer, wrapper: SdkWrapper):
+    identifier = encoder.encode_base_64(SUBMODEL_ID)
+    wrapper.set_element_index(enabled=True, max_age=0)
+    assert wrapper.get_submodel_by_id(identifier) is not None
+
+    assert wrapper.get_submodel_element_by_path_submodel_repo(identifier, "count") is not None
+    assert server.count("GET", ELEMENTS_PATH) == 1
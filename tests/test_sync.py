@@ -0,0 +1,179 @@
+import copy
+from pathlib import Path
+
+import pytest
+
+from aas_http_client.classes.client.aas_client import create_by_dict
+from aas_http_client.classes.wrapper.delta import DeltaKind, plan_delta
+from aas_http_client.classes.wrapper.sync import SubmodelSync, SyncManifest, SyncStatus
+from aas_http_client.utilities.hashing import create_hash_tree
+from tests.stub_server import StubAasServer
+
+
+def _property(id_short: str, value: str) -> dict:
+    return {"idShort": id_short, "modelType": "Property", "valueType": "xs:string", "value": value}
+
+
+def _submodel(index: int) -> dict:
+    return {
+        "id": f"fluid40/sm_sync_{index}",
+        "idShort": f"sm_sync_{index}",
+        "modelType": "Submodel",
+        "submodelElements": [
+            _property("serial", f"S-{index}"),
+            {
+                "idShort": "status",
+                "modelType": "SubmodelElementCollection",
+                "value": [_property("temperature", "20.5"), _property("pressure", "1.0")],
+            },
+            {"idShort": "history", "modelType": "SubmodelElementList", "typeValueListElement": "Property", "value": [_property("", "a")]},
+        ],
+    }
+
+
+@pytest.fixture()
+def server():
+    server = StubAasServer().start()
+    yield server
+    server.stop()
+
+
+def test_001_hash_tree():
+    submodel = _submodel(0)
+    tree = create_hash_tree(submodel)
+
+    assert set(tree.hashes) == {"", "serial", "status", "status.temperature", "status.pressure", "history", "history[0]"}
+    assert tree.get_children()["status"] == ["status.temperature", "status.pressure"]
+
+    changed = copy.deepcopy(submodel)
+    changed["submodelElements"][1]["value"][0]["value"] = "21.0"
+    changed_tree = create_hash_tree(changed)
+
+    assert changed_tree.root != tree.root
+    assert changed_tree.hashes["serial"] == tree.hashes["serial"]
+    assert changed_tree.metadata["status.temperature"] == tree.metadata["status.temperature"]
+
+
+def test_002_plan_delta():
+    remote = _submodel(0)
+    local = copy.deepcopy(remote)
+    local["submodelElements"][1]["value"][0]["value"] = "21.0"
+    local["submodelElements"][1]["value"].append(_property("humidity", "40"))
+    del local["submodelElements"][0]
+    local["submodelElements"][1]["value"].append(_property("", "b"))
+
+    operations = plan_delta(local, create_hash_tree(remote))
+
+    assert [(operation.kind, operation.path) for operation in operations] == [
+        (DeltaKind.delete_element, "serial"),
+        (DeltaKind.post_element, "status"),
+        (DeltaKind.patch_value, "status.temperature"),
+        (DeltaKind.put_element, "history"),
+    ]
+    assert plan_delta(remote, create_hash_tree(remote)) == []
+
+    local = copy.deepcopy(remote)
+    local["idShort"] = "renamed"
+    assert [operation.kind for operation in plan_delta(local, create_hash_tree(remote))] == [DeltaKind.replace_submodel]
+
+
+def test_003_sync_sends_minimal_requests(server: StubAasServer, tmp_path: Path):
+    client = create_by_dict({"BaseUrl": server.base_url})
+    manifest_file = tmp_path / "manifest.json"
+    submodels = [_submodel(index) for index in range(10)]
+
+    report = SubmodelSync(client, SyncManifest(manifest_file)).sync(submodels)
+    assert len(report.get_results(SyncStatus.created)) == 10
+    assert manifest_file.exists()
+
+    submodels[3]["submodelElements"][1]["value"][0]["value"] = "21.0"
+    submodels[7]["submodelElements"][0]["value"] = "S-7b"
+    submodels[7]["submodelElements"][1]["value"][1]["value"] = "2.0"
+    request_count = len(server.requests)
+
+    report = SubmodelSync(client, SyncManifest(manifest_file)).sync(submodels)
+
+    assert len(report.get_results(SyncStatus.unchanged)) == 8
+    assert len(report.get_results(SyncStatus.updated)) == 2
+    new_requests = [(method, path) for method, path, _ in server.requests[request_count:]]
+    assert sorted(new_requests) == [
+        ("PATCH", "/submodels/Zmx1aWQ0MC9zbV9zeW5jXzM/submodel-elements/status.temperature/$value"),
+        ("PATCH", "/submodels/Zmx1aWQ0MC9zbV9zeW5jXzc/$value"),
+    ]
+    assert server.submodels["fluid40/sm_sync_3"] == submodels[3]
+    assert server.submodels["fluid40/sm_sync_7"] == submodels[7]
+
+
+def test_004_sync_without_manifest_fetches_once(server: StubAasServer):
+    client = create_by_dict({"BaseUrl": server.base_url, "EncodedIds": False})
+    remote = _submodel(0)
+    server.submodels[remote["id"]] = copy.deepcopy(remote)
+    local = copy.deepcopy(remote)
+    local["submodelElements"][1]["value"].append(_property("humidity", "40"))
+
+    report = SubmodelSync(client).sync([local])
+
+    assert report.results[0].status == SyncStatus.updated
+    assert server.count("GET", "/submodels/") == 1
+    assert server.count("PUT") == 0
+    assert server.submodels[remote["id"]] == local
+
+
+def test_005_failed_delta_replaces_submodel(server: StubAasServer):
+    client = create_by_dict({"BaseUrl": server.base_url})
+    manifest = SyncManifest()
+    local = _submodel(0)
+    SubmodelSync(client, manifest).sync([local])
+
+    # remote changed by someone else, the manifest is outdated
+    del server.submodels[local["id"]]["submodelElements"][1]
+    local["submodelElements"][1]["value"][0]["value"] = "22.0"
+
+    report = SubmodelSync(client, manifest).sync([local])
+
+    assert report.results[0].status == SyncStatus.replaced
+    assert server.submodels[local["id"]] == local
+
+
+def test_006_plan_delta_container_value_and_child_changed():
+    entity = {
+        "idShort": "device",
+        "modelType": "Entity",
+        "entityType": "SelfManagedEntity",
+        "globalAssetId": "urn:device:1",
+        "statements": [_property("serial", "S-1"), _property("firmware", "1.0")],
+    }
+    remote = {"id": "fluid40/sm_entity", "idShort": "sm_entity", "modelType": "Submodel", "submodelElements": [entity]}
+    local = copy.deepcopy(remote)
+    local["submodelElements"][0]["globalAssetId"] = "urn:device:2"
+    local["submodelElements"][0]["statements"][1]["value"] = "1.1"
+
+    operations = plan_delta(local, create_hash_tree(remote))
+
+    assert [(operation.kind, operation.path) for operation in operations] == [(DeltaKind.put_element, "device")]
+    assert operations[0].body["globalAssetId"] == "urn:device:2"
+
+
+def test_007_sync_does_not_batch_entity_statements(server: StubAasServer):
+    client = create_by_dict({"BaseUrl": server.base_url})
+    manifest = SyncManifest()
+    local = _submodel(0)
+    local["submodelElements"].append(
+        {"idShort": "device", "modelType": "Entity", "entityType": "CoManagedEntity", "statements": [_property("firmware", "1.0")]}
+    )
+    SubmodelSync(client, manifest).sync([local])
+
+    local["submodelElements"][0]["value"] = "S-0b"
+    local["submodelElements"][1]["value"][0]["value"] = "21.0"
+    local["submodelElements"][3]["statements"][0]["value"] = "1.1"
+    request_count = len(server.requests)
+
+    report = SubmodelSync(client, manifest).sync([local])
+
+    assert report.results[0].status == SyncStatus.updated
+    new_requests = [(method, path) for method, path, _ in server.requests[request_count:]]
+    assert sorted(new_requests) == [
+        ("PATCH", "/submodels/Zmx1aWQ0MC9zbV9zeW5jXzA/$value"),
+        ("PATCH", "/submodels/Zmx1aWQ0MC9zbV9zeW5jXzA/submodel-elements/device.firmware/$value"),
+    ]
+    assert server.submodels[local["id"]] == local
@@ -0,0 +1,72 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from aas_http_client.classes.client.aas_client import AasHttpClient, create_by_dict
+from aas_http_client.utilities import encoder
+from tests.stub_server import StubAasServer
+
+THREAD_COUNT = 64
+CALLS_PER_THREAD = 10
+
+
+@pytest.fixture()
+def server():
+    server = StubAasServer().start()
+    for index in range(THREAD_COUNT):
+        identifier = f"fluid40/sm_thread_safety_{index}"
+        server.submodels[identifier] = {"id": identifier, "idShort": f"sm_{index}", "modelType": "Submodel"}
+    yield server
+    server.stop()
+
+
+def _hammer(client: AasHttpClient) -> list[dict | None]:
+    def work(index: int) -> list[dict | None]:
+        identifier = encoder.encode_base_64(f"fluid40/sm_thread_safety_{index}")
+        return [client.submodels.get_submodel_by_id(identifier) for _ in range(CALLS_PER_THREAD)]
+
+    with ThreadPoolExecutor(max_workers=THREAD_COUNT) as executor:
+        return [result for results in executor.map(work, range(THREAD_COUNT)) for result in results]
+
+
+def test_001_bearer_auth_from_64_threads(server: StubAasServer):
+    server.expected_authorization = "Bearer static-token"
+    client = create_by_dict({"BaseUrl": server.base_url}, bearer_auth_token="static-token")
+
+    results = _hammer(client)
+
+    assert len(results) == THREAD_COUNT * CALLS_PER_THREAD
+    assert all(result is not None for result in results)
+    assert server.unauthorized == 0
+    assert "Authorization" not in client.get_session().headers
+
+
+def test_002_oauth_token_requested_once_from_64_threads(server: StubAasServer):
+    server.expected_authorization = "Bearer token-1"
+    configuration = {
+        "BaseUrl": server.base_url,
+        "AuthenticationSettings": {"OAuth": {"ClientId": "client", "TokenUrl": f"{server.base_url}/token"}},
+    }
+    client = create_by_dict(configuration, o_auth_client_secret="secret")
+
+    results = _hammer(client)
+
+    assert all(result is not None for result in results)
+    assert server.unauthorized == 0
+    assert server.token_requests == 1
+    assert "Authorization" not in client.get_session().headers
+
+
+def test_003_thread_local_sessions(server: StubAasServer):
+    client = create_by_dict({"BaseUrl": server.base_url, "ThreadLocalSessions": True})
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        sessions = list(executor.map(lambda _: id(client.get_session()), range(64)))
+
+    assert len(set(sessions)) <= 8
+    assert client.get_session() is client.get_session()
+
+    results = _hammer(client)
+    assert all(result is not None for result in results)
+
+    client.close()
@@ -0,0 +1,135 @@
+import time
+
+import pytest
+
+from aas_http_client.classes.client.aas_client import create_by_dict
+from aas_http_client.classes.wrapper.value_buffer import ValueWriteBuffer, ValueWriteError
+from aas_http_client.utilities.id_short_path import create_value_only_body
+from tests.stub_server import StubAasServer
+
+
+def _property(id_short: str, value: str) -> dict:
+    return {"idShort": id_short, "modelType": "Property", "valueType": "xs:string", "value": value}
+
+
+def _submodel(index: int) -> dict:
+    return {
+        "id": f"fluid40/sm_values_{index}",
+        "idShort": f"sm_values_{index}",
+        "modelType": "Submodel",
+        "submodelElements": [
+            _property("state", ""),
+            {"idShort": "sensors", "modelType": "SubmodelElementCollection", "value": [_property(f"sensor_{i}", "0") for i in range(10)]},
+            {"idShort": "history", "modelType": "SubmodelElementList", "typeValueListElement": "Property", "value": [_property("", "a")]},
+        ],
+    }
+
+
+@pytest.fixture()
+def server():
+    server = StubAasServer().start()
+    for index in range(2):
+        submodel = _submodel(index)
+        server.submodels[submodel["id"]] = submodel
+    yield server
+    server.stop()
+
+
+def test_001_create_value_only_body():
+    body = create_value_only_body({"state": "on", "sensors.sensor_1": "1", "sensors.sensor_2": "2"})
+    assert body == {"state": "on", "sensors": {"sensor_1": "1", "sensor_2": "2"}}
+
+
+def test_002_updates_are_coalesced(server: StubAasServer):
+    client = create_by_dict({"BaseUrl": server.base_url, "EncodedIds": False})
+    request_count = len(server.requests)
+
+    with ValueWriteBuffer(client, flush_interval=60) as buffer:
+        for step in range(100):
+            for index in range(2):
+                buffer.write(f"fluid40/sm_values_{index}", f"sensors.sensor_{step % 10}", str(step))
+                buffer.write(f"fluid40/sm_values_{index}", "state", "on")
+        buffer.write("fluid40/sm_values_0", "history[0]", "b")
+
+    methods = sorted((method, path) for method, path, _ in server.requests[request_count:])
+    # the type of the collection is requested once per submodel
+    assert [method for method, _ in methods] == ["GET"] * 2 + ["PATCH"] * 3
+    assert server.count("PATCH", "/submodels/Zmx1aWQ0MC9zbV92YWx1ZXNfMA/submodel-elements/history") == 1
+
+    for index in range(2):
+        submodel = server.submodels[f"fluid40/sm_values_{index}"]
+        assert submodel["submodelElements"][0]["value"] == "on"
+        assert [element["value"] for element in submodel["submodelElements"][1]["value"]] == [str(step) for step in range(90, 100)]
+    assert server.submodels["fluid40/sm_values_0"]["submodelElements"][2]["value"][0]["value"] == "b"
+
+
+def test_003_full_batch_is_written_before_interval(server: StubAasServer):
+    client = create_by_dict({"BaseUrl": server.base_url, "EncodedIds": False})
+    written = False
+
+    with ValueWriteBuffer(client, flush_interval=60, max_batch_size=3) as buffer:
+        for i in range(3):
+            buffer.write("fluid40/sm_values_1", f"sensors.sensor_{i}", "9")
+
+        for _ in range(100):
+            written = server.count("PATCH") == 1
+            if written:
+                break
+            time.sleep(0.05)
+
+    assert written
+
+
+def test_004_errors_are_reported_per_path(server: StubAasServer):
+    client = create_by_dict({"BaseUrl": server.base_url, "EncodedIds": False})
+    errors: list[ValueWriteError] = []
+
+    buffer = ValueWriteBuffer(client, flush_interval=60, on_error=errors.append)
+    buffer.write("fluid40/sm_values_0", "history[5]", "x")
+    buffer.write("fluid40/sm_values_0", "state", "on")
+    buffer.write("fluid40/unknown", "state", "on")
+    buffer.write("fluid40/unknown", "sensors.sensor_0", "1")
+    failed = buffer.close()
+
+    assert sorted((error.submodel_identifier, error.id_short_path) for error in failed) == [
+        ("fluid40/sm_values_0", "history[5]"),
+        ("fluid40/unknown", "sensors.sensor_0"),
+        ("fluid40/unknown", "state"),
+    ]
+    # the final flush of 'close' returns the errors instead of calling the callback
+    assert errors == []
+    assert server.submodels["fluid40/sm_values_0"]["submodelElements"][0]["value"] == "on"
+
+
+def test_005_back_pressure(server: StubAasServer):
+    client = create_by_dict({"BaseUrl": server.base_url, "EncodedIds": False})
+    buffer = ValueWriteBuffer(client, flush_interval=60, max_pending=2)
+
+    assert buffer.write("fluid40/sm_values_0", "state", "1")
+    assert buffer.write("fluid40/sm_values_0", "sensors.sensor_0", "1")
+    # replacing a buffered value needs no capacity
+    assert buffer.write("fluid40/sm_values_0", "state", "2")
+    assert not buffer.write("fluid40/sm_values_0", "sensors.sensor_1", "1", timeout=0.1)
+
+    assert buffer.flush() == []
+    assert buffer.write("fluid40/sm_values_0", "sensors.sensor_1", "1", timeout=0.1)
+    assert buffer.close() == []
+
+    with pytest.raises(RuntimeError):
+        buffer.write("fluid40/sm_values_0", "state", "3")
+
+
+def test_006_entity_statements_are_written_per_element(server: StubAasServer):
+    client = create_by_dict({"BaseUrl": server.base_url, "EncodedIds": False})
+    server.submodels["fluid40/sm_values_0"]["submodelElements"].append(
+        {"idShort": "device", "modelType": "Entity", "entityType": "CoManagedEntity", "statements": [_property("firmware", "1.0")]}
+    )
+
+    with ValueWriteBuffer(client, flush_interval=60) as buffer:
+        buffer.write("fluid40/sm_values_0", "state", "on")
+        buffer.write("fluid40/sm_values_0", "sensors.sensor_0", "1")
+        buffer.write("fluid40/sm_values_0", "device.firmware", "1.1")
+
+    assert server.count("PATCH", "/submodels/Zmx1aWQ0MC9zbV92YWx1ZXNfMA/$value") == 1
+    assert server.count("PATCH", "/submodels/Zmx1aWQ0MC9zbV92YWx1ZXNfMA/submodel-elements/device.firmware/$value") == 1
+    assert server.submodels["fluid40/sm_values_0"]["submodelElements"][3]["statements"][0]["value"] == "1.1"
@@ -0,0 +1,86 @@
+import pytest
+
+from aas_http_client.classes.client.aas_client import create_by_dict
+from aas_http_client.classes.client.implementations import sm_implementation
+from aas_http_client.utilities.encoder import encode_base_64
+from aas_http_client.utilities.id_short_path import find_value
+from tests.stub_server import StubAasServer
+
+SUBMODEL_ID = "fluid40/sm_values"
+
+
+def _property(id_short: str, value: str) -> dict:
+    return {"idShort": id_short, "modelType": "Property", "valueType": "xs:string", "value": value}
+
+
+@pytest.fixture()
+def server():
+    server = StubAasServer().start()
+    server.submodels[SUBMODEL_ID] = {
+        "id": SUBMODEL_ID,
+        "idShort": "sm_values",
+        "modelType": "Submodel",
+        "submodelElements": [
+            {"idShort": "sensors", "modelType": "SubmodelElementCollection", "value": [_property(f"sensor_{i}", str(i)) for i in range(20)]},
+            {"idShort": "history", "modelType": "SubmodelElementList", "typeValueListElement": "Property", "value": [_property("", "a")]},
+        ],
+    }
+    yield server
+    server.stop()
+
+
+def test_001_find_value():
+    value_only = {
+        "collection": {"property": "1", "list": [{"item": "2"}]},
+        "entity": {"statements": {"state": "on"}, "entityType": "SelfManagedEntity"},
+        "relationship": {"first": {}, "second": {}, "annotations": [{"note": "text"}]},
+    }
+
+    assert find_value(value_only, "collection.property") == "1"
+    assert find_value(value_only, "collection.list[0].item") == "2"
+    assert find_value(value_only, "entity.state") == "on"
+    assert find_value(value_only, "relationship.note") == "text"
+
+    for path in ("collection.unknown", "collection.list[1]", "collection.property.value"):
+        with pytest.raises(KeyError):
+            find_value(value_only, path)
+
+
+def test_002_few_values_are_read_per_element(server: StubAasServer):
+    client = create_by_dict({"BaseUrl": server.base_url, "EncodedIds": False, "MaxWorkers": 8})
+    assert client.submodels is not None
+
+    values = client.submodels.get_values(SUBMODEL_ID, ["sensors.sensor_1", "sensors.sensor_2", "history[0]", "sensors.unknown"])
+
+    assert values == {"sensors.sensor_1": "1", "sensors.sensor_2": "2", "history[0]": "a"}
+    assert server.count("GET", "/submodels/Zmx1aWQ0MC9zbV92YWx1ZXM/submodel-elements/") == 4
+    assert server.count("GET", "/submodels/Zmx1aWQ0MC9zbV92YWx1ZXM/$value") == 0
+
+
+def test_003_many_values_are_read_from_the_submodel(server: StubAasServer):
+    client = create_by_dict({"BaseUrl": server.base_url, "EncodedIds": False, "MaxWorkers": 4})
+    assert client.submodels is not None
+    paths = [f"sensors.sensor_{i}" for i in range(20)]
+
+    values = client.submodels.get_values(SUBMODEL_ID, [*paths, "history[0]", "sensors.unknown"])
+
+    assert values == {**{path: str(i) for i, path in enumerate(paths)}, "history[0]": "a"}
+    assert server.count("GET", "/submodels/Zmx1aWQ0MC9zbV92YWx1ZXM/$value") == 1
+    assert server.count("GET", "/submodels/Zmx1aWQ0MC9zbV92YWx1ZXM/submodel-elements/") == 0
+
+    # the submodel is known to be small, so it is read as a whole even for a single round of requests
+    assert client.submodels.get_values(SUBMODEL_ID, paths[:2]) == {paths[0]: "0", paths[1]: "1"}
+    assert server.count("GET", "/submodels/Zmx1aWQ0MC9zbV92YWx1ZXM/$value") == 2
+
+
+def test_004_remembered_sizes_are_bounded(server: StubAasServer, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(sm_implementation, "_MAX_VALUE_ONLY_SIZES", 2)
+    client = create_by_dict({"BaseUrl": server.base_url, "EncodedIds": False})
+    assert client.submodels is not None
+
+    for index in range(3):
+        submodel_id = f"fluid40/sm_values_{index}"
+        server.submodels[submodel_id] = {"id": submodel_id, "modelType": "Submodel", "submodelElements": []}
+        assert client.submodels.get_submodel_by_id_value_only(submodel_id) is not None
+
+    assert list(client.submodels._value_only_sizes) == [encode_base_64("fluid40/sm_values_1"), encode_base_64("fluid40/sm_values_2")]
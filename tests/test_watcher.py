@@ -0,0 +1,140 @@
+import asyncio
+import time
+
+import pytest
+
+from aas_http_client.classes.client.aas_client import create_by_dict
+from aas_http_client.classes.wrapper.watcher import SubmodelWatcher, ValueChange
+from tests.stub_server import StubAasServer
+
+
+def _property(id_short: str, value: str) -> dict:
+    return {"idShort": id_short, "modelType": "Property", "valueType": "xs:string", "value": value}
+
+
+def _submodel(index: int) -> dict:
+    return {
+        "id": f"fluid40/sm_watch_{index}",
+        "idShort": f"sm_watch_{index}",
+        "modelType": "Submodel",
+        "submodelElements": [
+            _property("state", "off"),
+            {"idShort": "sensors", "modelType": "SubmodelElementCollection", "value": [_property(f"sensor_{i}", "0") for i in range(5)]},
+            {"idShort": "history", "modelType": "SubmodelElementList", "typeValueListElement": "Property", "value": [_property("", "a")]},
+        ],
+    }
+
+
+@pytest.fixture()
+def server():
+    server = StubAasServer().start()
+    for index in range(20):
+        submodel = _submodel(index)
+        server.submodels[submodel["id"]] = submodel
+    yield server
+    server.stop()
+
+
+@pytest.mark.parametrize("etags", [True, False])
+def test_001_poll_reports_changes(server: StubAasServer, etags: bool):
+    server.etags = etags
+    client = create_by_dict({"BaseUrl": server.base_url})
+    watcher = SubmodelWatcher(client)
+    watcher.watch("fluid40/sm_watch_0")
+
+    assert watcher.poll("fluid40/sm_watch_0") == []
+
+    elements = server.submodels["fluid40/sm_watch_0"]["submodelElements"]
+    elements[1]["value"][2]["value"] = "7"
+    elements[2]["value"].append(_property("", "b"))
+
+    assert watcher.poll("fluid40/sm_watch_0") == [
+        ValueChange("fluid40/sm_watch_0", "sensors.sensor_2", "0", "7"),
+        ValueChange("fluid40/sm_watch_0", "history[1]", None, "b"),
+    ]
+    assert watcher.poll("fluid40/sm_watch_0") == []
+
+    del elements[0]
+    assert watcher.poll("fluid40/sm_watch_0") == [ValueChange("fluid40/sm_watch_0", "state", "off", None)]
+
+
+def test_002_paths_filter_changes(server: StubAasServer):
+    client = create_by_dict({"BaseUrl": server.base_url})
+    watcher = SubmodelWatcher(client)
+    received: list[ValueChange] = []
+    watcher.watch("fluid40/sm_watch_0", callback=received.append, paths=["sensors"])
+    watcher.poll("fluid40/sm_watch_0")
+
+    elements = server.submodels["fluid40/sm_watch_0"]["submodelElements"]
+    elements[0]["value"] = "on"
+    elements[1]["value"][4]["value"] = "1"
+    watcher.poll("fluid40/sm_watch_0")
+
+    assert received == [ValueChange("fluid40/sm_watch_0", "sensors.sensor_4", "0", "1")]
+
+    watcher.unwatch("fluid40/sm_watch_0")
+    with pytest.raises(ValueError, match="not watched"):
+        watcher.poll("fluid40/sm_watch_0")
+
+
+def test_003_background_polling(server: StubAasServer):
+    client = create_by_dict({"BaseUrl": server.base_url, "MaxWorkers": 4})
+    watcher = SubmodelWatcher(client, interval=0.05)
+    for index in range(20):
+        watcher.watch(f"fluid40/sm_watch_{index}")
+
+    async def collect() -> list[ValueChange]:
+        changes = []
+        async for change in watcher.changes():
+            changes.append(change)
+            if len(changes) == 2:
+                watcher.stop()
+        return changes
+
+    async def run() -> list[ValueChange]:
+        task = asyncio.create_task(collect())
+        watcher.start()
+        await asyncio.sleep(0.3)
+        server.submodels["fluid40/sm_watch_3"]["submodelElements"][0]["value"] = "on"
+        server.submodels["fluid40/sm_watch_17"]["submodelElements"][1]["value"][0]["value"] = "5"
+        return await asyncio.wait_for(task, timeout=10)
+
+    changes = asyncio.run(run())
+
+    assert sorted((change.submodel_identifier, change.id_short_path, change.new_value) for change in changes) == [
+        ("fluid40/sm_watch_17", "sensors.sensor_0", "5"),
+        ("fluid40/sm_watch_3", "state", "on"),
+    ]
+
+
+def test_004_rewatch_during_poll_keeps_polling(server: StubAasServer):
+    client = create_by_dict({"BaseUrl": server.base_url})
+    watcher = SubmodelWatcher(client, interval=0.05, jitter=0)
+    server.delay = 0.3
+    server.delayed_requests = 1
+
+    with watcher:
+        watcher.watch("fluid40/sm_watch_0")
+        for _ in range(100):
+            if server.count("GET", "/submodels/"):
+                break
+            time.sleep(0.01)
+
+        # replaces the state while its first poll is in flight
+        watcher.watch("fluid40/sm_watch_0", paths=["sensors"])
+        time.sleep(0.8)
+
+    assert server.count("GET", "/submodels/") >= 5
+
+
+def test_005_unwatch_and_watch_polls_once_per_interval(server: StubAasServer):
+    client = create_by_dict({"BaseUrl": server.base_url})
+    watcher = SubmodelWatcher(client, interval=0.1, jitter=0)
+
+    with watcher:
+        watcher.watch("fluid40/sm_watch_0")
+        watcher.unwatch("fluid40/sm_watch_0")
+        watcher.watch("fluid40/sm_watch_0")
+        time.sleep(1.05)
+
+    assert 6 <= server.count("GET", "/submodels/") <= 13